@@ -0,0 +1,284 @@
+import argparse
+import functools
+import importlib.util
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+# --------------------------------------------------
+# CONSTANTS
+# --------------------------------------------------
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+VARIANTS = {
+    "ur_game": "ur_game.py",
+    "bet": "ur_game_bet.py",
+    "pro": "versions/pro/ur_game_PRO.py",
+}
+PHASES = (
+    "import_qt",
+    "qapp",
+    "import_app",
+    "ui",
+    "pixmap",
+    "tiles",
+    "other_init",
+    "first_show",
+    "total",
+)
+DEFAULT_BASELINE = "bench_baseline.json"
+DEFAULT_THRESHOLD = 0.25   # 25 % slower fails the check
+DEFAULT_MIN_DELTA = 2.0    # ... but only if it is also 2 ms slower
+
+
+# --------------------------------------------------
+# CHILD PROCESS — one cold start + one warm start
+# --------------------------------------------------
+class PhaseTimer:
+    def __init__(self):
+        self.totals = {}
+        self._depth = {}
+
+    def wrap(self, phase, func):
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            # only the outermost call counts, nested calls are included
+            depth = self._depth.get(phase, 0)
+            self._depth[phase] = depth + 1
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._depth[phase] = depth
+                if depth == 0:
+                    elapsed = time.perf_counter() - start
+                    self.totals[phase] = self.totals.get(phase, 0.0) + elapsed
+
+        return timed
+
+    def take(self):
+        totals, self.totals = self.totals, {}
+        return totals
+
+
+def start_window(module, app, timer):
+    start = time.perf_counter()
+    window = module.UrGame()
+    constructed = time.perf_counter()
+    during_init = timer.take()
+    window.show()
+    app.processEvents()
+    shown = time.perf_counter()
+    # sprites are decoded on first paint, so most decoding lands here
+    during_show = timer.take()
+
+    result = {
+        "ui": during_init.get("ui", 0.0),
+        "tiles": during_init.get("tiles", 0.0),
+    }
+    init_pixmap = during_init.get("pixmap", 0.0)
+    show_pixmap = during_show.get("pixmap", 0.0)
+    result["other_init"] = (
+        constructed - start - result["ui"] - result["tiles"] - init_pixmap
+    )
+    result["pixmap"] = init_pixmap + show_pixmap
+    result["first_show"] = shown - constructed - show_pixmap
+    return window, result
+
+
+def run_child(variant):
+    t0 = time.perf_counter()
+    from PyQt6 import QtCore, QtGui, QtWidgets  # noqa: F401
+    t1 = time.perf_counter()
+
+    app = QtWidgets.QApplication([sys.argv[0]])
+    t2 = time.perf_counter()
+    sys.path.insert(0, ROOT)
+
+    # the app's own imports (sprite module and UI builders included)
+    import ur_pixmaps
+    import ur_uic
+
+    timer = PhaseTimer()
+    ur_pixmaps.SpriteAtlas._pixmap = timer.wrap(
+        "pixmap", ur_pixmaps.SpriteAtlas._pixmap
+    )
+    ur_pixmaps.PixmapCache.source = timer.wrap(
+        "pixmap", ur_pixmaps.PixmapCache.source
+    )
+    ur_uic.setup_ui = timer.wrap("ui", ur_uic.setup_ui)
+
+    path = os.path.join(ROOT, VARIANTS[variant])
+    spec = importlib.util.spec_from_file_location(f"bench_{variant}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    t3 = time.perf_counter()
+
+    # the apps import setup_ui by name, so patch their copy as well
+    module.setup_ui = ur_uic.setup_ui
+    module.UrGame.collect_tiles = timer.wrap(
+        "tiles", module.UrGame.collect_tiles
+    )
+
+    timer.take()
+    cold_window, cold = start_window(module, app, timer)
+    # everything from the first import to the first frame, patching included
+    cold["total"] = time.perf_counter() - t0
+    cold["import_qt"] = t1 - t0
+    cold["qapp"] = t2 - t1
+    cold["import_app"] = t3 - t2
+
+    cold_window.close()
+    app.processEvents()
+
+    _, warm = start_window(module, app, timer)
+    warm["import_qt"] = 0.0
+    warm["qapp"] = 0.0
+    warm["import_app"] = 0.0
+    warm["total"] = sum(warm.values())
+
+    to_ms = lambda phases: {k: v * 1000 for k, v in phases.items()}  # noqa
+    json.dump({"cold": to_ms(cold), "warm": to_ms(warm)}, sys.stdout)
+
+
+# --------------------------------------------------
+# PARENT PROCESS
+# --------------------------------------------------
+def measure(variant, runs):
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    samples = {"cold": [], "warm": []}
+
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child", variant],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(f"{variant} failed to start:\n{proc.stderr}")
+        sample = json.loads(proc.stdout)
+        samples["cold"].append(sample["cold"])
+        samples["warm"].append(sample["warm"])
+
+    return {
+        mode: {
+            phase: statistics.median(s[phase] for s in runs_)
+            for phase in PHASES
+        }
+        for mode, runs_ in samples.items()
+    }
+
+
+def run_suite(variants, runs):
+    from PyQt6.QtCore import PYQT_VERSION_STR
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "pyqt": PYQT_VERSION_STR,
+            "platform": platform.platform(),
+            "qpa": os.environ.get("QT_QPA_PLATFORM", "offscreen"),
+            "runs": runs,
+            "unit": "ms",
+        },
+        "variants": {name: measure(name, runs) for name in variants},
+    }
+
+
+def print_report(results, baseline=None):
+    header = f"{'variant':<9}{'mode':<6}" + "".join(
+        f"{phase:>12}" for phase in PHASES
+    )
+    print(header)
+    for name, modes in results["variants"].items():
+        for mode, phases in modes.items():
+            row = f"{name:<9}{mode:<6}"
+            for phase in PHASES:
+                row += f"{phases[phase]:>12.2f}"
+            print(row)
+            if baseline and name in baseline["variants"]:
+                base = baseline["variants"][name][mode]
+                row = f"{'':<9}{'base':<6}"
+                for phase in PHASES:
+                    row += f"{base.get(phase, 0.0):>12.2f}"
+                print(row)
+
+
+def find_regressions(results, baseline, threshold, min_delta):
+    regressions = []
+    for name, modes in results["variants"].items():
+        if name not in baseline["variants"]:
+            continue
+        for mode, phases in modes.items():
+            base = baseline["variants"][name].get(mode, {})
+            for phase, value in phases.items():
+                if phase not in base:
+                    continue
+                limit = base[phase] * (1 + threshold)
+                if value > limit and value - base[phase] > min_delta:
+                    regressions.append((name, mode, phase, base[phase], value))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ur startup benchmark")
+    parser.add_argument("--child", choices=VARIANTS, help=argparse.SUPPRESS)
+    parser.add_argument(
+        "--variant", nargs="+", choices=VARIANTS, default=list(VARIANTS)
+    )
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--save", metavar="PATH", nargs="?",
+                        const=DEFAULT_BASELINE,
+                        help="write results as the new baseline")
+    parser.add_argument("--check", metavar="PATH", nargs="?",
+                        const=DEFAULT_BASELINE,
+                        help="compare against a baseline, exit 1 on regression")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--min-delta", type=float, default=DEFAULT_MIN_DELTA,
+                        help="ignore regressions smaller than this many ms")
+    args = parser.parse_args(argv)
+
+    if args.child:
+        run_child(args.child)
+        return 0
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    results = run_suite(args.variant, args.runs)
+
+    baseline = None
+    if args.check:
+        with open(args.check, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    print_report(results, baseline)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"baseline written to {args.save}")
+
+    if baseline is not None:
+        regressions = find_regressions(
+            results, baseline, args.threshold, args.min_delta
+        )
+        for name, mode, phase, before, after in regressions:
+            print(
+                f"REGRESSION {name}/{mode}/{phase}: "
+                f"{before:.2f} ms -> {after:.2f} ms"
+            )
+        if regressions:
+            return 1
+        print("no startup regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,27 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ur_dice import DiceStream  # noqa: E402
+
+
+def test_seed_replays_root_stream():
+    stream = DiceStream("d6", 1234)
+    replay = DiceStream("d6", stream.seed)
+    assert [stream.roll() for _ in range(50)] == [
+        replay.roll() for _ in range(50)
+    ]
+
+
+def test_seed_replays_spawned_child():
+    parent = DiceStream("d6", 1234)
+    children = parent.spawn(3)
+    for child in children:
+        expected = [child.roll() for _ in range(50)]
+        replay = DiceStream("d6", child.seed)
+        assert [replay.roll() for _ in range(50)] == expected
+
+    # a child is not the parent sequence replayed
+    root = DiceStream("d6", 1234)
+    assert expected != [root.roll() for _ in range(50)]
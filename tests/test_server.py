@@ -0,0 +1,150 @@
+import asyncio
+import os
+import socket
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest  # noqa: E402
+
+import ur_record  # noqa: E402
+import ur_server  # noqa: E402
+
+
+def racing_match(variant=ur_record.CLASSIC):
+    match = ur_server.Match(1, variant)
+    match.seat(object())
+    match.seat(object())
+    match.commit(1)
+    match.commit(2)
+    assert match.phase == ur_server.RACING
+    return match
+
+
+def test_roll_twice_is_rejected():
+    match = racing_match()
+    first = match.roll(1)
+    with pytest.raises(ur_server.MatchError, match="Already rolled"):
+        match.roll(1)
+    assert match.state.last_roll == first
+
+    match.move(1)
+    match.roll(2)
+
+
+def connect(server):
+    ours, theirs = socket.socketpair()
+
+    async def start():
+        reader, writer = await asyncio.open_connection(sock=theirs)
+        task = asyncio.ensure_future(server.handle_client(reader, writer))
+        client = await ur_server.UrClient.connect(sock=ours)
+        return client, task
+
+    return start()
+
+
+@pytest.mark.parametrize("fields", [
+    {"variant": ["bet"]},
+    {"variant": {"bet": 1}},
+    {"match": [1]},
+    {"match": {"id": 1}},
+])
+def test_unhashable_join_fields_get_an_error(fields):
+    async def run():
+        server = ur_server.UrServer()
+        client, task = await connect(server)
+        reply = await client.request("join", **fields)
+        assert reply["type"] == "error"
+
+        # the connection survives and a proper join still works
+        reply = await client.request("join", variant=ur_record.BET)
+        assert reply["type"] == "joined"
+
+        await client.close()
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(run())
+
+
+def test_join_by_id_closes_the_open_match_of_its_variant():
+    async def run():
+        server = ur_server.UrServer()
+        a, task_a = await connect(server)
+        b, task_b = await connect(server)
+        c, task_c = await connect(server)
+
+        joined = await a.request("join", variant=ur_record.PRO)
+        reply = await b.request("join", match=joined["match"])
+        assert reply["type"] == "joined"
+        assert ur_record.PRO not in server.open_matches
+
+        reply = await c.request("join", variant=ur_record.PRO)
+        assert reply["type"] == "joined"
+        assert reply["match"] != joined["match"]
+
+        for client in (a, b, c):
+            await client.close()
+        for task in (task_a, task_b, task_c):
+            task.cancel()
+        await asyncio.gather(task_a, task_b, task_c, return_exceptions=True)
+
+    asyncio.run(run())
+
+
+def test_bool_bet_is_rejected():
+    async def run():
+        server = ur_server.UrServer()
+        a, task_a = await connect(server)
+        b, task_b = await connect(server)
+        await a.request("join", variant=ur_record.BET)
+        await b.request("join", variant=ur_record.BET)
+
+        reply = await a.request("bet", amount=True)
+        assert reply["type"] == "error"
+
+        for client in (a, b):
+            await client.close()
+        for task in (task_a, task_b):
+            task.cancel()
+        await asyncio.gather(task_a, task_b, return_exceptions=True)
+
+    asyncio.run(run())
+
+
+def test_players_can_join_again_after_game_over():
+    async def run():
+        server = ur_server.UrServer()
+        a, task_a = await connect(server)
+        b, task_b = await connect(server)
+        seats = {}
+        for client in (a, b):
+            reply = await client.request("join", variant=ur_record.BET)
+            seats[reply["player"]] = client
+
+        # both stake everything, so the loser is out of coins
+        for client in seats.values():
+            await client.request("bet", amount=ur_server.START_COINS)
+        player = 1
+        while True:
+            await seats[player].request("roll")
+            moved = await seats[player].request("move")
+            if moved["state"]["winner"]:
+                break
+            player = moved["state"]["current_player"]
+        finished = await a.next_event("finished")
+        assert finished["over"]
+        assert not server.matches
+
+        for client in (a, b):
+            reply = await client.request("join", variant=ur_record.BET)
+            assert reply["type"] == "joined"
+
+        for client in (a, b):
+            await client.close()
+        for task in (task_a, task_b):
+            task.cancel()
+        await asyncio.gather(task_a, task_b, return_exceptions=True)
+
+    asyncio.run(run())
@@ -0,0 +1,268 @@
+import math
+import time
+
+import ur_royal
+import ur_solver
+from ur_engine import BINARY4, ROLL_PROBABILITIES
+
+# --------------------------------------------------
+# CONSTANTS
+# --------------------------------------------------
+DEFAULT_BUDGET = 0.25          # seconds per move
+DEFAULT_TABLE_SIZE = 1 << 18   # transposition table slots
+MAX_DEPTH = 64
+CHECK_EVERY = 64               # nodes (leaves included) between clock checks
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+# --------------------------------------------------
+# GAMES
+# --------------------------------------------------
+# A game adapter tells the search how to play. Values are always
+# P(first side wins): LIGHT in the full game, player 1 in the race.
+class RoyalGame:
+    """Full-rules Ur. With an ur_endgame database, positions it covers
+    are scored exactly and the search stops there."""
+
+    rolls = tuple(ur_royal.ROLL_PROBABILITIES.items())
+
+    def __init__(self, endgame=None):
+        self.endgame = endgame
+
+    def moves(self, state, roll):
+        return ur_royal.legal_moves(state, roll)
+
+    def apply(self, state, move, roll):
+        return ur_royal.apply_move(state, move, roll)
+
+    def pass_turn(self, state):
+        return ur_royal.pass_turn(state)
+
+    def maximizing(self, state):
+        return ur_royal.side_to_move(state) == ur_royal.LIGHT
+
+    def terminal_value(self, state):
+        won = ur_royal.winner(state)
+        if won is not None:
+            return 1.0 if won == ur_royal.LIGHT else 0.0
+        if self.endgame is not None and state in self.endgame:
+            return self.endgame.win_probability(state, ur_royal.LIGHT)
+        return None
+
+    def evaluate(self, state):
+        # race progress in pieces, with a small bonus for holding the
+        # central rosette; squashed into a win probability
+        score = 0.0
+        for side, sign in ((ur_royal.LIGHT, 1.0), (ur_royal.DARK, -1.0)):
+            bits = ur_royal.board(state, side)
+            progress = ur_royal.borne_off(state, side) * ur_royal.END
+            while bits:
+                low = bits & -bits
+                progress += low.bit_length()
+                bits ^= low
+            score += sign * progress / ur_royal.END
+            if ur_royal.board(state, side) & ur_royal.CENTRAL:
+                score += sign * 0.3
+        if ur_royal.side_to_move(state) == ur_royal.LIGHT:
+            score += 0.15
+        else:
+            score -= 0.15
+        return 1.0 / (1.0 + math.exp(-1.2 * score))
+
+
+class RaceGame:
+    """The single-horse race of UrGame as a search problem.
+
+    States are (pos1, pos2, player to move); a position at or past
+    `board_size` has finished. There is never more than one move, so the
+    search is trivial, but it runs through the same machinery.
+    """
+
+    ADVANCE = 1
+
+    def __init__(self, board_size, dice=BINARY4):
+        self.board_size = board_size
+        self.rolls = tuple(ROLL_PROBABILITIES[dice].items())
+        self.table = ur_solver.odds_table(board_size, dice)
+
+    @staticmethod
+    def from_race(state):
+        return (state.positions[0], state.positions[1], state.current_player)
+
+    def moves(self, state, roll):
+        return [self.ADVANCE] if roll else []
+
+    def apply(self, state, move, roll):
+        pos1, pos2, player = state
+        if player == 1:
+            return (pos1 + roll, pos2, 2)
+        return (pos1, pos2 + roll, 1)
+
+    def pass_turn(self, state):
+        pos1, pos2, player = state
+        return (pos1, pos2, 2 if player == 1 else 1)
+
+    def maximizing(self, state):
+        return state[2] == 1
+
+    def terminal_value(self, state):
+        if state[0] >= self.board_size:
+            return 1.0
+        if state[1] >= self.board_size:
+            return 0.0
+        return None
+
+    def evaluate(self, state):
+        return self.table.p1_wins(*state)
+
+
+# --------------------------------------------------
+# TRANSPOSITION TABLE
+# --------------------------------------------------
+class TranspositionTable:
+    """Fixed number of slots; a slot is overwritten when it is empty,
+    left over from an earlier search, or holds a shallower result."""
+
+    __slots__ = ("size", "keys", "depths", "values", "ages", "age")
+
+    def __init__(self, size=DEFAULT_TABLE_SIZE):
+        self.size = size
+        self.keys = [None] * size
+        self.depths = [0] * size
+        self.values = [0.0] * size
+        self.ages = [0] * size
+        self.age = 0
+
+    def new_search(self):
+        self.age += 1
+
+    def get(self, key, depth):
+        slot = hash(key) % self.size
+        if self.keys[slot] == key and self.depths[slot] >= depth:
+            return self.values[slot]
+        return None
+
+    def put(self, key, depth, value):
+        slot = hash(key) % self.size
+        if (
+            self.keys[slot] is None
+            or self.ages[slot] != self.age
+            or depth >= self.depths[slot]
+        ):
+            self.keys[slot] = key
+            self.depths[slot] = depth
+            self.values[slot] = value
+            self.ages[slot] = self.age
+
+
+# --------------------------------------------------
+# SEARCH
+# --------------------------------------------------
+class SearchInfo:
+    __slots__ = ("depth", "nodes", "value", "elapsed")
+
+    def __init__(self, depth, nodes, value, elapsed):
+        self.depth = depth
+        self.nodes = nodes
+        self.value = value
+        self.elapsed = elapsed
+
+    def __repr__(self):
+        return (
+            f"SearchInfo(depth={self.depth}, nodes={self.nodes}, "
+            f"value={self.value:.4f}, elapsed={self.elapsed:.3f})"
+        )
+
+
+class Expectimax:
+    """Iterative-deepening expectimax under a wall-clock budget.
+
+    Depth counts dice rolls. Each finished iteration replaces the best
+    move; an iteration that runs out of time is thrown away.
+    """
+
+    def __init__(self, game, budget=DEFAULT_BUDGET, max_depth=MAX_DEPTH,
+                 table_size=DEFAULT_TABLE_SIZE):
+        self.game = game
+        self.budget = budget
+        self.max_depth = max_depth
+        self.table = TranspositionTable(table_size)
+        self.nodes = 0
+        self._deadline = math.inf
+
+    def choose(self, state, roll, moves=None):
+        """Best move for the side to move after rolling `roll`."""
+        start = time.perf_counter()
+        game = self.game
+        moves = game.moves(state, roll) if moves is None else moves
+        if not moves:
+            return None, SearchInfo(0, 0, game.evaluate(state), 0.0)
+
+        self.nodes = 0
+        self.table.new_search()
+        maximizing = game.maximizing(state)
+        children = [game.apply(state, move, roll) for move in moves]
+
+        if len(moves) == 1:
+            value = self._value(children[0], 0)
+            return moves[0], SearchInfo(0, 1, value, 0.0)
+
+        best_move, best_value, depth_done = moves[0], None, 0
+        for depth in range(self.max_depth):
+            # depth 0 is a static evaluation and always completes
+            self._deadline = start + self.budget if depth else math.inf
+            try:
+                values = [self._value(child, depth) for child in children]
+            except SearchTimeout:
+                break
+
+            pick = max if maximizing else min
+            best_value = pick(values)
+            best_move = moves[values.index(best_value)]
+            depth_done = depth
+            if time.perf_counter() - start >= self.budget:
+                break
+
+        elapsed = time.perf_counter() - start
+        return best_move, SearchInfo(depth_done, self.nodes, best_value,
+                                     elapsed)
+
+    def _value(self, state, depth):
+        # every node counts toward the clock check, leaves and table
+        # hits included, so the overshoot stays a few CHECK_EVERY nodes
+        self.nodes += 1
+        if self.nodes % CHECK_EVERY == 0:
+            if time.perf_counter() > self._deadline:
+                raise SearchTimeout
+
+        game = self.game
+        terminal = game.terminal_value(state)
+        if terminal is not None:
+            return terminal
+        if depth == 0:
+            return game.evaluate(state)
+
+        cached = self.table.get(state, depth)
+        if cached is not None:
+            return cached
+
+        maximizing = game.maximizing(state)
+        total = 0.0
+        for roll, prob in game.rolls:
+            moves = game.moves(state, roll)
+            if not moves:
+                total += prob * self._value(game.pass_turn(state), depth - 1)
+                continue
+            best = None
+            for move in moves:
+                value = self._value(game.apply(state, move, roll), depth - 1)
+                if best is None or (value > best if maximizing
+                                    else value < best):
+                    best = value
+            total += prob * best
+
+        self.table.put(state, depth, total)
+        return total
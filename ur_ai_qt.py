@@ -0,0 +1,56 @@
+import itertools
+
+from PyQt6.QtCore import QObject, QThread, pyqtSignal, pyqtSlot
+
+
+# --------------------------------------------------
+# WORKER (lives in the AI thread)
+# --------------------------------------------------
+class _SearchWorker(QObject):
+    done = pyqtSignal(int, object, object)  # request id, move, SearchInfo
+
+    def __init__(self, searcher):
+        super().__init__()
+        self.searcher = searcher
+
+    @pyqtSlot(int, object, int)
+    def think(self, request_id, state, roll):
+        move, info = self.searcher.choose(state, roll)
+        self.done.emit(request_id, move, info)
+
+
+# --------------------------------------------------
+# AI PLAYER (lives in the GUI thread)
+# --------------------------------------------------
+class AIPlayer(QObject):
+    """Runs an ur_ai searcher on its own QThread.
+
+    `request()` returns at once; the chosen move arrives later through
+    `moveReady(request_id, move, info)` on the GUI thread, so the window
+    keeps processing events while the search runs.
+    """
+
+    moveReady = pyqtSignal(int, object, object)
+    _think = pyqtSignal(int, object, int)
+
+    def __init__(self, searcher, parent=None):
+        super().__init__(parent)
+        self._ids = itertools.count(1)
+        self._thread = QThread(self)
+        self._worker = _SearchWorker(searcher)
+        self._worker.moveToThread(self._thread)
+
+        # cross-thread signals are queued, so think() runs on the worker
+        self._think.connect(self._worker.think)
+        self._worker.done.connect(self.moveReady)
+        self._thread.finished.connect(self._worker.deleteLater)
+        self._thread.start()
+
+    def request(self, state, roll):
+        request_id = next(self._ids)
+        self._think.emit(request_id, state, roll)
+        return request_id
+
+    def shutdown(self):
+        self._thread.quit()
+        self._thread.wait()
@@ -0,0 +1,310 @@
+import argparse
+import hashlib
+import json
+import math
+import os
+import time
+from multiprocessing import Pool
+
+import ur_record
+import ur_solver
+from ur_engine import ROLL_PROBABILITIES
+from ur_sim import wilson_interval
+
+# --------------------------------------------------
+# CONSTANTS
+# --------------------------------------------------
+CACHE_VERSION = 1
+RECORD_SUFFIX = ".urrec"
+MAX_ROLL = 15          # rolls are 4 bits in a packed event
+
+
+def analytics_cache_dir(directory=None):
+    return os.path.join(directory or ur_solver.cache_dir(), "analytics")
+
+
+# --------------------------------------------------
+# AGGREGATES
+# --------------------------------------------------
+class Stats:
+    """Mergeable totals over any set of records.
+
+    races[(variant, board_size, dice)] = [games, first mover wins, turns]
+    rolls[dice] = count of each roll value
+    bets[bet] = [bets placed, bets won, net coins]
+    """
+
+    __slots__ = ("games", "races", "rolls", "bets")
+
+    def __init__(self):
+        self.games = 0
+        self.races = {}
+        self.rolls = {}
+        self.bets = {}
+
+    def add(self, record):
+        self.games += 1
+        counts = self.rolls.setdefault(record.dice, [0] * (MAX_ROLL + 1))
+        for event in record.events:
+            counts[event >> 4] += 1
+
+        if not record.winner:
+            return
+        key = (record.variant, record.board_size, record.dice)
+        race = self.races.setdefault(key, [0, 0, 0])
+        race[0] += 1
+        race[1] += record.winner == 1
+        race[2] += len(record.events)
+
+        if record.variant == ur_record.BET:
+            for player, (bet, delta) in enumerate(
+                zip(record.bets, record.deltas), 1
+            ):
+                flow = self.bets.setdefault(bet, [0, 0, 0])
+                flow[0] += 1
+                flow[1] += record.winner == player
+                flow[2] += delta
+
+    def merge(self, other):
+        self.games += other.games
+        for key, (games, wins, turns) in other.races.items():
+            race = self.races.setdefault(key, [0, 0, 0])
+            race[0] += games
+            race[1] += wins
+            race[2] += turns
+        for dice, counts in other.rolls.items():
+            mine = self.rolls.setdefault(dice, [0] * (MAX_ROLL + 1))
+            for value, count in enumerate(counts):
+                mine[value] += count
+        for bet, (placed, won, net) in other.bets.items():
+            flow = self.bets.setdefault(bet, [0, 0, 0])
+            flow[0] += placed
+            flow[1] += won
+            flow[2] += net
+        return self
+
+    def to_json(self):
+        return {
+            "games": self.games,
+            "races": [[*key, *value] for key, value in self.races.items()],
+            "rolls": self.rolls,
+            "bets": [[bet, *flow] for bet, flow in self.bets.items()],
+        }
+
+    @classmethod
+    def from_json(cls, data):
+        stats = cls()
+        stats.games = data["games"]
+        stats.races = {
+            (variant, size, dice): [games, wins, turns]
+            for variant, size, dice, games, wins, turns in data["races"]
+        }
+        stats.rolls = {dice: list(c) for dice, c in data["rolls"].items()}
+        stats.bets = {row[0]: list(row[1:]) for row in data["bets"]}
+        return stats
+
+
+# --------------------------------------------------
+# PER-FILE PASS (runs in a worker)
+# --------------------------------------------------
+def cache_path(path, cache_root):
+    digest = hashlib.sha1(os.path.abspath(path).encode()).hexdigest()
+    return os.path.join(cache_root, f"{digest}.json")
+
+
+def _load_cache(path, cache_file, stat):
+    try:
+        with open(cache_file) as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    # record files only grow; anything else means start over
+    if (
+        cached.get("version") != CACHE_VERSION
+        or cached.get("inode") != stat.st_ino
+        or cached.get("position", 0) > stat.st_size
+    ):
+        return None
+    return cached
+
+
+def analyze_file(task):
+    """Stats for one file, reading only what the cache has not seen.
+
+    Returns (path, stats, records read this time).
+    """
+    path, cache_root = task
+    stat = os.stat(path)
+    cache_file = cache_path(path, cache_root) if cache_root else None
+    cached = _load_cache(path, cache_file, stat) if cache_file else None
+
+    if cached is None:
+        stats, offset = Stats(), None
+    else:
+        stats, offset = Stats.from_json(cached["stats"]), cached["position"]
+        if offset == stat.st_size:
+            return path, stats, 0
+
+    fresh = 0
+    with ur_record.RecordReader(path) as reader:
+        for record in reader.records(offset):
+            stats.add(record)
+            fresh += 1
+        position = reader.position
+
+    if cache_file:
+        os.makedirs(cache_root, exist_ok=True)
+        tmp = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump({
+                "version": CACHE_VERSION,
+                "path": os.path.abspath(path),
+                "inode": stat.st_ino,
+                "position": position,
+                "stats": stats.to_json(),
+            }, f)
+        os.replace(tmp, cache_file)
+    return path, stats, fresh
+
+
+# --------------------------------------------------
+# PIPELINE
+# --------------------------------------------------
+def record_files(root):
+    """Every record file under `root` (or `root` itself), in a stable order."""
+    if os.path.isfile(root):
+        yield root
+        return
+    for directory, dirs, files in os.walk(root):
+        dirs.sort()
+        for name in sorted(files):
+            if name.endswith(RECORD_SUFFIX):
+                yield os.path.join(directory, name)
+
+
+def per_file_stats(paths, workers=None, cache_root=None):
+    """Yield (path, stats, fresh records) as workers finish files."""
+    tasks = [(path, cache_root) for path in paths]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) <= 1:
+        yield from map(analyze_file, tasks)
+        return
+    with Pool(min(workers, len(tasks))) as pool:
+        yield from pool.imap_unordered(analyze_file, tasks)
+
+
+def analyze(roots, workers=None, cache_root=None):
+    """Merge the stats of every record file under `roots`.
+
+    Returns (stats, files, fresh records).
+    """
+    paths = [path for root in roots for path in record_files(root)]
+    total = Stats()
+    fresh = 0
+    for _, stats, new in per_file_stats(paths, workers, cache_root):
+        total.merge(stats)
+        fresh += new
+    return total, len(paths), fresh
+
+
+# --------------------------------------------------
+# REPORT
+# --------------------------------------------------
+def chi2_sf(x, df):
+    """P(X >= x) for a chi-square variable with integer `df`."""
+    if x <= 0:
+        return 1.0
+    half = x / 2
+    if df % 2 == 0:
+        term = total = 1.0
+        for i in range(1, df // 2):
+            term *= half / i
+            total += term
+        return min(1.0, math.exp(-half) * total)
+    total = math.erfc(math.sqrt(half))
+    for i in range(1, (df + 1) // 2):
+        total += math.exp((i - 0.5) * math.log(half) - half
+                          - math.lgamma(i + 0.5))
+    return min(1.0, total)
+
+
+def roll_check(dice, counts):
+    """(rolls, chi-square, p-value) against the theoretical dice."""
+    expected = ROLL_PROBABILITIES[dice]
+    n = sum(counts)
+    if n == 0:
+        return 0, math.nan, math.nan
+    chi2 = sum(
+        (counts[value] - n * p) ** 2 / (n * p)
+        for value, p in expected.items()
+    )
+    if any(counts[v] for v in range(len(counts)) if v not in expected):
+        chi2 = math.inf
+    return n, chi2, chi2_sf(chi2, len(expected) - 1)
+
+
+def report(stats, confidence=0.95):
+    lines = [f"games={stats.games}", "", "first-mover advantage"]
+    for (variant, size, dice), (games, wins, turns) in sorted(
+        stats.races.items()
+    ):
+        low, high = wilson_interval(wins, games, confidence)
+        odds = ""
+        if variant != ur_record.ROYAL:
+            # boards past MAX_EXACT_BOARD get the normal approximation
+            table = ur_solver.odds_table(size, dice)
+            label = (
+                "approx" if isinstance(table, ur_solver.LongRaceTable)
+                else "exact"
+            )
+            odds = f" {label}={table.start():.4f}"
+        lines.append(
+            f"  {variant:<8} board={size:<3} {dice:<8} games={games:<8} "
+            f"P(first wins)={wins / games:.4f} ({low:.4f}–{high:.4f})"
+            f"{odds} mean turns={turns / games:.1f}"
+        )
+
+    lines += ["", "rolls"]
+    for dice, counts in sorted(stats.rolls.items()):
+        n, chi2, p = roll_check(dice, counts)
+        histogram = " ".join(
+            f"{value}:{counts[value] / n:.3f}/{prob:.3f}"
+            for value, prob in ROLL_PROBABILITIES[dice].items()
+        ) if n else ""
+        lines.append(f"  {dice:<8} n={n} chi2={chi2:.2f} p={p:.3f}")
+        if histogram:
+            lines.append(f"    observed/expected {histogram}")
+
+    if stats.bets:
+        lines += ["", "coin flow by bet size"]
+        for bet, (placed, won, net) in sorted(stats.bets.items()):
+            lines.append(
+                f"  bet={bet:<5} placed={placed:<7} won={won / placed:.3f} "
+                f"net={net:+} per bet={net / placed:+.2f}"
+            )
+    return "\n".join(lines)
+
+
+# --------------------------------------------------
+# CLI
+# --------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ur game record analytics")
+    parser.add_argument("roots", nargs="+",
+                        help="record files or directories of *.urrec")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--cache-dir", default=None)
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--confidence", type=float, default=0.95)
+    args = parser.parse_args(argv)
+
+    cache_root = None if args.no_cache else analytics_cache_dir(args.cache_dir)
+    start = time.perf_counter()
+    stats, files, fresh = analyze(args.roots, args.workers, cache_root)
+    elapsed = time.perf_counter() - start
+    print(f"files={files} new records={fresh} {elapsed:.2f}s")
+    print(report(stats, args.confidence))
+
+
+if __name__ == "__main__":
+    main()
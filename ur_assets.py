@@ -0,0 +1,206 @@
+import argparse
+import base64
+import hashlib
+import os
+import sys
+import zlib
+
+from PyQt6.QtCore import QBuffer, QByteArray, QIODevice, Qt
+from PyQt6.QtGui import QImage, QPainter
+
+# --------------------------------------------------
+# CONSTANTS
+# --------------------------------------------------
+# sprite name -> source image
+SPRITES = {
+    "horse_white": "src/assets/horse_white.png",
+    "horse_blue": "src/assets/horse_blue.png",
+}
+TILE_SIZE = 40     # board tiles (ur_game.TILE_SIZE)
+WINNER_SIZE = 70   # <img> on the winner screen
+SIZES = (TILE_SIZE, WINNER_SIZE)
+SCALES = (1.0, 1.25, 1.5, 2.0)
+
+ATLAS_WIDTH = 512
+PADDING = 1
+OUTPUT = "ur_sprites_rc.py"
+HASH_MARKER = "SOURCE_SHA256 = "
+
+
+# --------------------------------------------------
+# PATH HANDLING
+# --------------------------------------------------
+def resource_path(relative):
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), relative)
+
+
+# --------------------------------------------------
+# STALENESS
+# --------------------------------------------------
+def source_hash():
+    digest = hashlib.sha256()
+    digest.update(repr((sorted(SPRITES.items()), SIZES, SCALES)).encode())
+    for name in sorted(SPRITES):
+        with open(resource_path(SPRITES[name]), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def compiled_hash():
+    try:
+        with open(resource_path(OUTPUT), encoding="utf-8") as f:
+            for line in f:
+                if line.startswith(HASH_MARKER):
+                    return line[len(HASH_MARKER):].strip().strip("\"'")
+    except OSError:
+        pass
+    return None
+
+
+def is_stale():
+    return compiled_hash() != source_hash()
+
+
+# --------------------------------------------------
+# RENDERING + PACKING
+# --------------------------------------------------
+def render(image, size, scale):
+    pixels = max(1, round(size * scale))
+    return image.scaled(
+        pixels,
+        pixels,
+        Qt.AspectRatioMode.KeepAspectRatio,
+        Qt.TransformationMode.SmoothTransformation,
+    ).convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+
+
+def pack(images, width=ATLAS_WIDTH):
+    """Shelf-pack images (tallest first); return ({key: rect}, height)."""
+    order = sorted(images, key=lambda key: -images[key].height())
+    rects = {}
+    x = y = shelf = 0
+    for key in order:
+        w, h = images[key].width(), images[key].height()
+        if w > width:
+            raise ValueError(f"Sprite {key} is wider than the atlas")
+        if x + w > width:
+            x, y = 0, y + shelf + PADDING
+            shelf = 0
+        rects[key] = (x, y, w, h)
+        x += w + PADDING
+        shelf = max(shelf, h)
+    return rects, y + shelf
+
+
+def png_data_uri(image):
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, "PNG")
+    buffer.close()
+    encoded = base64.b64encode(bytes(data)).decode("ascii")
+    return f"data:image/png;base64,{encoded}"
+
+
+def build():
+    sources = {}
+    for name, path in SPRITES.items():
+        image = QImage(resource_path(path))
+        if image.isNull():
+            raise FileNotFoundError(resource_path(path))
+        sources[name] = image
+
+    images = {
+        (name, size, scale): render(image, size, scale)
+        for name, image in sources.items()
+        for size in SIZES
+        for scale in SCALES
+    }
+    rects, height = pack(images)
+
+    atlas = QImage(
+        ATLAS_WIDTH, height, QImage.Format.Format_ARGB32_Premultiplied
+    )
+    atlas.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(atlas)
+    for key, (x, y, _, _) in rects.items():
+        painter.drawImage(x, y, images[key])
+    painter.end()
+
+    pixels = bytes(atlas.constBits().asstring(atlas.sizeInBytes()))
+
+    # the winner screen is rich text, which can only reference an image
+    winner = {
+        name: png_data_uri(render(image, WINNER_SIZE, max(SCALES)))
+        for name, image in sources.items()
+    }
+    return rects, height, zlib.compress(pixels, 9), winner
+
+
+def write_module(rects, height, data, winner):
+    lines = [
+        "# Generated by ur_assets.py from src/assets -- do not edit.",
+        "# Premultiplied ARGB32 sprite atlas, zlib-compressed.",
+        "",
+        f"ATLAS_WIDTH = {ATLAS_WIDTH}",
+        f"ATLAS_HEIGHT = {height}",
+        "",
+        "# (name, size, scale) -> (x, y, width, height)",
+        "SPRITES = {",
+    ]
+    for key in sorted(rects):
+        lines.append(f"    {key!r}: {rects[key]!r},")
+    lines += ["}", "", "WINNER_IMAGES = {"]
+    for name in sorted(winner):
+        lines.append(f"    {name!r}: (")
+        uri = winner[name]
+        for start in range(0, len(uri), 72):
+            lines.append(f"        {uri[start:start + 72]!r}")
+        lines.append("    ),")
+    lines += ["}", "", "ATLAS_DATA = ("]
+    for start in range(0, len(data), 48):
+        lines.append(f"    {data[start:start + 48]!r}")
+    lines += [")", "", f'{HASH_MARKER}"{source_hash()}"', ""]
+
+    path = resource_path(OUTPUT)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines))
+    os.replace(tmp, path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Pre-render sprites into a packed atlas module"
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help=f"only report whether {OUTPUT} is stale, exit 1 if so",
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="rebuild even if up to date"
+    )
+    args = parser.parse_args(argv)
+
+    stale = is_stale()
+    if args.check:
+        if stale:
+            print(f"stale: {OUTPUT}")
+        return 1 if stale else 0
+
+    if not (stale or args.force):
+        print(f"{OUTPUT} is up to date")
+        return 0
+
+    rects, height, data, winner = build()
+    write_module(rects, height, data, winner)
+    print(
+        f"wrote {OUTPUT}: {len(rects)} sprites, "
+        f"{ATLAS_WIDTH}x{height} atlas, {len(data)} bytes compressed"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
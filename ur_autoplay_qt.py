@@ -0,0 +1,108 @@
+import time
+
+from PyQt6.QtCore import QObject, Qt, QTimer, pyqtSignal
+
+# --------------------------------------------------
+# CONSTANTS
+# --------------------------------------------------
+TURNS_PER_SECOND = 1.0      # 1x
+SPEEDS = (
+    ("1x", 1), ("2x", 2), ("4x", 4), ("10x", 10), ("60x", 60),
+    ("max", None),
+)
+FRAME_MS = 16               # one tick per display frame at most
+FRAME_BUDGET = 0.008        # seconds of game logic per tick, leaves paint time
+
+
+class AutoPlay(QObject):
+    """Rolls and moves for both players from a timer.
+
+    Each tick plays every turn that is due (or, at "max", as many as fit
+    in FRAME_BUDGET) with `deferring` set, which the window's handlers
+    check to skip their label and board updates. `show_turn(roll)` then
+    brings the view up to date once, so fast playback costs one repaint
+    per frame instead of one per step.
+    """
+
+    stopped = pyqtSignal()
+
+    def __init__(self, window, roll, move, show_turn, button, speed_box):
+        super().__init__(window)
+        self.window = window
+        self.roll = roll
+        self.move = move
+        self.show_turn = show_turn
+        self.button = button
+        self.deferring = False
+        self.rate = SPEEDS[0][1]
+        self._due = 0.0
+        self._last = 0.0
+
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self.tick)
+
+        for label, _ in SPEEDS:
+            speed_box.addItem(label)
+        speed_box.currentIndexChanged.connect(self.set_speed)
+        button.toggled.connect(self.set_running)
+
+    @property
+    def active(self):
+        return self._timer.isActive()
+
+    def interval(self):
+        if self.rate is None:
+            return FRAME_MS
+        return max(FRAME_MS, round(1000 / (self.rate * TURNS_PER_SECOND)))
+
+    def set_speed(self, index):
+        self.rate = SPEEDS[index][1]
+        if self.active:
+            self._timer.start(self.interval())
+
+    def set_running(self, running):
+        if running == self.active:
+            return
+        if running and self.window.state.winner:
+            running = False
+        elif running:
+            self._due = 0.0
+            self._last = time.perf_counter()
+            self._timer.start(self.interval())
+        else:
+            self._timer.stop()
+            self.stopped.emit()
+        self.button.setChecked(running)
+
+    def tick(self):
+        state = self.window.state
+        now = time.perf_counter()
+        if self.rate is None:
+            steps = None
+        else:
+            self._due += (now - self._last) * self.rate * TURNS_PER_SECOND
+            steps = int(self._due)
+            self._due -= steps
+        self._last = now
+
+        # turns that do not fit the budget are dropped, not caught up on
+        deadline = now + FRAME_BUDGET
+        played = roll = 0
+        self.deferring = True
+        try:
+            while not state.winner and (steps is None or played < steps):
+                self.roll()
+                roll = state.last_roll
+                self.move()
+                played += 1
+                if time.perf_counter() > deadline:
+                    break
+        finally:
+            self.deferring = False
+
+        if state.winner:
+            # end_game has already shown the result
+            self.set_running(False)
+        elif played:
+            self.show_turn(roll)
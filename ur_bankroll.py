@@ -0,0 +1,266 @@
+import argparse
+import math
+from statistics import NormalDist
+
+import numpy as np
+
+import ur_odds
+import ur_solver
+from ur_engine import D6, DICE_MODELS
+
+# --------------------------------------------------
+# CONSTANTS (ur_game_bet.py)
+# --------------------------------------------------
+START_COINS = 1000
+BET_LADDER = np.array([1, 5, 10, 100, 200, 500, 800, 900, 1000])
+EVEN = "even"   # winner gains their own bet (the original 1:1 payout)
+FAIR = "fair"   # winner gains their bet times the fair-odds multiplier
+PAYOUTS = (EVEN, FAIR)
+DEFAULT_MAX_RACES = 10_000
+
+
+# --------------------------------------------------
+# LADDER HELPERS
+# --------------------------------------------------
+def snap_down(amounts, coins):
+    """Largest ladder bet <= amount that the player can afford.
+
+    Mirrors update_bet_display: buttons above a player's coins are
+    disabled. Never returns less than the smallest rung.
+    """
+    limit = np.minimum(amounts, coins)
+    index = np.searchsorted(BET_LADDER, limit, side="right") - 1
+    return BET_LADDER[np.maximum(index, 0)]
+
+
+# --------------------------------------------------
+# STRATEGIES
+# --------------------------------------------------
+# A strategy is called once per race with arrays over the sessions that
+# are still running and returns the bet for each of them:
+#     strategy(coins, last_bet, last_won, rng) -> bets
+# last_bet is 0 and last_won is False before the first race.
+def flat(value):
+    def strategy(coins, last_bet, last_won, rng):
+        return snap_down(np.full(coins.shape, value), coins)
+
+    strategy.__name__ = f"flat:{value}"
+    return strategy
+
+
+def all_in():
+    def strategy(coins, last_bet, last_won, rng):
+        return snap_down(coins, coins)
+
+    strategy.__name__ = "max"
+    return strategy
+
+
+def fraction(share):
+    def strategy(coins, last_bet, last_won, rng):
+        return snap_down(np.floor(coins * share).astype(np.int64), coins)
+
+    strategy.__name__ = f"fraction:{share}"
+    return strategy
+
+
+def random_rung():
+    def strategy(coins, last_bet, last_won, rng):
+        rungs = np.searchsorted(BET_LADDER, coins, side="right")
+        index = np.floor(rng.random(coins.shape) * rungs).astype(np.int64)
+        return BET_LADDER[index]
+
+    strategy.__name__ = "random"
+    return strategy
+
+
+def martingale(base):
+    def strategy(coins, last_bet, last_won, rng):
+        doubled = np.where(last_won | (last_bet == 0), base, last_bet * 2)
+        return snap_down(doubled, coins)
+
+    strategy.__name__ = f"martingale:{base}"
+    return strategy
+
+
+STRATEGIES = {
+    "flat": lambda arg: flat(int(arg or 100)),
+    "max": lambda arg: all_in(),
+    "fraction": lambda arg: fraction(float(arg or 0.1)),
+    "random": lambda arg: random_rung(),
+    "martingale": lambda arg: martingale(int(arg or 10)),
+}
+
+
+def parse_strategy(spec):
+    name, _, arg = spec.partition(":")
+    if name not in STRATEGIES:
+        raise ValueError(f"Unknown strategy: {spec!r}")
+    return STRATEGIES[name](arg)
+
+
+# --------------------------------------------------
+# RESULT
+# --------------------------------------------------
+class SessionResult:
+    __slots__ = (
+        "sessions",
+        "ruined",
+        "lengths",
+        "final_coins",
+        "trajectories",
+        "confidence",
+    )
+
+    def __init__(self, ruined, lengths, final_coins, trajectories,
+                 confidence=0.95):
+        # ruined[i] = player who hit 0 coins (1/2), or 0 if the session
+        # was cut off at max_races
+        self.sessions = lengths.size
+        self.ruined = ruined
+        self.lengths = lengths
+        self.final_coins = final_coins
+        self.trajectories = trajectories
+        self.confidence = confidence
+
+    def ruin_probability(self, player):
+        return float((self.ruined == player).mean())
+
+    @property
+    def unfinished(self):
+        return int((self.ruined == 0).sum())
+
+    @property
+    def mean_length(self):
+        return float(self.lengths.mean())
+
+    @property
+    def mean_length_ci(self):
+        z = NormalDist().inv_cdf(0.5 + self.confidence / 2)
+        half = z * self.lengths.std(ddof=1) / math.sqrt(self.sessions)
+        return (self.mean_length - half, self.mean_length + half)
+
+    def summary(self):
+        low, high = self.mean_length_ci
+        return (
+            f"sessions={self.sessions} unfinished={self.unfinished}\n"
+            f"P(player 1 ruined)={self.ruin_probability(1):.4f} "
+            f"P(player 2 ruined)={self.ruin_probability(2):.4f}\n"
+            f"mean session length: {self.mean_length:.2f} races "
+            f"(CI {low:.2f}–{high:.2f})"
+        )
+
+
+# --------------------------------------------------
+# SIMULATION
+# --------------------------------------------------
+def simulate_sessions(
+    sessions,
+    strategies,
+    board_size=20,
+    dice=D6,
+    payout=EVEN,
+    start_coins=START_COINS,
+    max_races=DEFAULT_MAX_RACES,
+    keep=16,
+    seed=None,
+):
+    """Play `sessions` betting sessions side by side until GAME OVER.
+
+    Each race is decided by a Bernoulli draw with the exact probability
+    that player 1 wins from the start (ur_solver), which is equivalent
+    to playing the race out. `keep` sessions record their full coin
+    trajectory, shape (keep, races + 1, 2).
+    """
+    if payout not in PAYOUTS:
+        raise ValueError(f"Unknown payout: {payout!r}")
+
+    rng = np.random.default_rng(seed)
+    p1_wins = ur_solver.load_table(board_size, dice).start()
+    if payout == FAIR:
+        odds = ur_odds.fair_odds(board_size, dice)
+        multipliers = np.array([odds.multipliers[1], odds.multipliers[2]])
+    else:
+        multipliers = np.ones(2)
+
+    coins = np.full((sessions, 2), start_coins, dtype=np.int64)
+    last_bet = np.zeros((sessions, 2), dtype=np.int64)
+    last_won = np.zeros((sessions, 2), dtype=bool)
+    ruined = np.zeros(sessions, dtype=np.int8)
+    lengths = np.zeros(sessions, dtype=np.int64)
+
+    keep = min(keep, sessions)
+    trajectory = [coins[:keep].copy()]
+    active = np.arange(sessions)
+
+    for race in range(1, max_races + 1):
+        if active.size == 0:
+            break
+
+        live = coins[active]
+        bets = np.empty_like(live)
+        for column, strategy in enumerate(strategies):
+            bets[:, column] = strategy(
+                live[:, column],
+                last_bet[active, column],
+                last_won[active, column],
+                rng,
+            )
+
+        p1_won = rng.random(active.size) < p1_wins
+        won = np.column_stack((p1_won, ~p1_won))
+
+        gains = np.rint(bets * multipliers).astype(np.int64)
+        live = live + np.where(won, gains, -bets)
+        coins[active] = live
+        last_bet[active] = bets
+        last_won[active] = won
+        lengths[active] = race
+
+        if keep:
+            trajectory.append(coins[:keep].copy())
+
+        # GAME OVER as in end_game: someone is out of coins
+        over = (live <= 0).any(axis=1)
+        ruined[active[over]] = np.where(live[over, 0] <= 0, 1, 2)
+        active = active[~over]
+
+    return SessionResult(
+        ruined,
+        lengths,
+        coins,
+        np.stack(trajectory, axis=1) if keep else None,
+    )
+
+
+# --------------------------------------------------
+# CLI
+# --------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ur betting sessions")
+    parser.add_argument("--sessions", type=int, default=10_000)
+    parser.add_argument("--p1", default="flat:100",
+                        help="strategy for player 1, e.g. flat:100")
+    parser.add_argument("--p2", default="flat:100",
+                        help=f"one of {', '.join(STRATEGIES)}")
+    parser.add_argument("--payout", choices=PAYOUTS, default=EVEN)
+    parser.add_argument("--board-size", type=int, default=20)
+    parser.add_argument("--dice", choices=DICE_MODELS, default=D6)
+    parser.add_argument("--max-races", type=int, default=DEFAULT_MAX_RACES)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    result = simulate_sessions(
+        args.sessions,
+        (parse_strategy(args.p1), parse_strategy(args.p2)),
+        board_size=args.board_size,
+        dice=args.dice,
+        payout=args.payout,
+        max_races=args.max_races,
+        seed=args.seed,
+    )
+    print(result.summary())
+
+
+if __name__ == "__main__":
+    main()
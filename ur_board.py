@@ -0,0 +1,325 @@
+from PyQt6.QtCore import QRect, QRectF, Qt
+from PyQt6.QtGui import QColor, QPainter, QPen, QPixmap
+from PyQt6.QtWidgets import QAbstractScrollArea, QFrame, QWidget
+
+
+# --------------------------------------------------
+# TILE LOOKS (formerly per-label stylesheets)
+# --------------------------------------------------
+class TileStyle:
+    __slots__ = ("background", "border", "border_width", "radius")
+
+    def __init__(self, background, border, border_width=2, radius=0):
+        self.background = QColor(background)
+        self.border = QColor(border)
+        self.border_width = border_width
+        self.radius = radius
+
+
+DARK_TILES = TileStyle("#2c2c2c", "#777", 2)        # ur_game.py, PRO
+SAND_TILES = TileStyle("#E7D3A8", "#444", 2, 6)     # ur_game_bet.ui
+
+# generated tracks (TrackView)
+TRACK_GAP = 16              # the .ui boards sit on a 60 px pitch
+TRACK_MARGIN = 8
+TRACK_MARK_EVERY = 10       # number every tenth tile
+MAX_TRACK = 100_000
+
+
+def track_length(argv):
+    """`--track N` on the command line: a generated track of N tiles."""
+    if "--track" not in argv:
+        return None
+    index = argv.index("--track")
+    if index + 1 >= len(argv):
+        return None
+    length = int(argv[index + 1])
+    if not 1 <= length <= MAX_TRACK:
+        raise ValueError(f"--track must be between 1 and {MAX_TRACK}")
+    return length
+
+
+def bounding_rect(rects):
+    bounds = QRect()
+    for rect in rects:
+        bounds = bounds.united(rect)
+    return bounds
+
+
+def paint_tile(painter, rect, style):
+    """One tile, border kept inside `rect` as the stylesheet border was."""
+    half = style.border_width / 2
+    shape = QRectF(rect).adjusted(half, half, -half, -half)
+    if style.radius:
+        radius = max(style.radius - half, 0)
+        painter.drawRoundedRect(shape, radius, radius)
+    else:
+        painter.drawRect(shape)
+
+
+# --------------------------------------------------
+# BOARD WIDGET
+# --------------------------------------------------
+class BoardWidget(QWidget):
+    """Every tile and horse in one widget, painted in one paintEvent.
+
+    `rects` are the tile geometries from the .ui file, so the hand-placed
+    layout is kept. Tiles are drawn once into a cached background pixmap;
+    `drawn` remembers which players are shown on each tile, so a move
+    only invalidates the tile a horse left and the tile it landed on.
+    Horses sharing a tile are drawn side by side, scaled to the tile the
+    way the old scaledContents labels were.
+    """
+
+    def __init__(self, rects, horses, pixmaps, tile_size, style=DARK_TILES,
+                 parent=None):
+        super().__init__(parent)
+        self.horses = horses
+        self.pixmaps = pixmaps
+        self.tile_size = tile_size
+        self.style = style
+
+        bounds = bounding_rect(rects)
+        self.setGeometry(bounds)
+        self.rects = [rect.translated(-bounds.topLeft()) for rect in rects]
+        inset = style.border_width
+        self.contents = [
+            rect.adjusted(inset, inset, -inset, -inset) for rect in self.rects
+        ]
+
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.drawn = {}
+        self._background = None
+        self._dpr = None
+
+    def __len__(self):
+        return len(self.rects)
+
+    def render(self, positions, dpr=1.0):
+        if dpr != self._dpr:
+            # the background and every horse were scaled for the old ratio
+            self._dpr = dpr
+            self._background = None
+            self.drawn = {}
+            self.update()
+
+        wanted = {}
+        for player, pos in enumerate(positions, 1):
+            if 0 <= pos < len(self.rects):
+                wanted.setdefault(pos, []).append(player)
+
+        for index in set(self.drawn) | set(wanted):
+            players = tuple(wanted.get(index, ()))
+            if self.drawn.get(index, ()) == players:
+                continue
+            if players:
+                self.drawn[index] = players
+            else:
+                del self.drawn[index]
+            self.update(self.rects[index])
+
+    def clear(self):
+        for index in self.drawn:
+            self.update(self.rects[index])
+        self.drawn = {}
+
+    # --------------------------------------------------
+    # PAINTING
+    # --------------------------------------------------
+    def _paint_background(self, dpr):
+        pixmap = QPixmap(round(self.width() * dpr), round(self.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        style = self.style
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(QPen(style.border, style.border_width))
+        painter.setBrush(style.background)
+        for rect in self.rects:
+            paint_tile(painter, rect, style)
+        painter.end()
+        return pixmap
+
+    def paintEvent(self, event):
+        dpr = self._dpr or self.devicePixelRatioF()
+        if self._background is None:
+            self._background = self._paint_background(dpr)
+
+        dirty = event.rect()
+        painter = QPainter(self)
+        source = QRectF(
+            dirty.x() * dpr, dirty.y() * dpr,
+            dirty.width() * dpr, dirty.height() * dpr,
+        )
+        painter.drawPixmap(QRectF(dirty), self._background, source)
+
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        for index, players in self.drawn.items():
+            if not dirty.intersects(self.rects[index]):
+                continue
+            assets = [self.horses[player] for player in players]
+            painter.drawPixmap(
+                self.contents[index],
+                self.pixmaps.group(assets, self.tile_size, dpr),
+            )
+        painter.end()
+
+
+# --------------------------------------------------
+# GENERATED TRACK (any length, painted per viewport)
+# --------------------------------------------------
+class TrackView(QAbstractScrollArea):
+    """A straight track of `length` tiles in a horizontal scroll view.
+
+    Nothing exists per tile: a tile's rect is arithmetic on its index,
+    so startup and memory do not depend on the length, and paintEvent
+    only draws the indices that fall inside the dirty part of the
+    viewport. Same render/clear interface as BoardWidget; when a horse
+    moves the view scrolls to keep it on screen.
+    """
+
+    def __init__(self, length, area, horses, pixmaps, tile_size,
+                 style=DARK_TILES, parent=None):
+        super().__init__(parent)
+        self.length = length
+        self.horses = horses
+        self.pixmaps = pixmaps
+        self.tile_size = tile_size
+        self.style = style
+        self.box = tile_size + 2 * style.border_width
+        self.pitch = self.box + TRACK_GAP
+
+        self.setGeometry(area)
+        self.setFrameShape(QFrame.Shape.NoFrame)
+        # the page shows through between tiles, as on the .ui boards
+        self.viewport().setAutoFillBackground(False)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setHorizontalScrollBarPolicy(
+            Qt.ScrollBarPolicy.ScrollBarAlwaysOn
+        )
+        self.horizontalScrollBar().setSingleStep(self.pitch)
+
+        self.drawn = {}
+        self.positions = ()
+        self._tile = None
+        self._dpr = None
+
+    def __len__(self):
+        return self.length
+
+    # --------------------------------------------------
+    # GEOMETRY (content x runs along the whole track)
+    # --------------------------------------------------
+    def track_width(self):
+        return 2 * TRACK_MARGIN + self.length * self.pitch - TRACK_GAP
+
+    def tile_rect(self, index):
+        """Tile `index` in viewport coordinates."""
+        x = TRACK_MARGIN + index * self.pitch
+        x -= self.horizontalScrollBar().value()
+        y = max(0, (self.viewport().height() - self.box) // 2)
+        return QRect(x, y, self.box, self.box)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        bar = self.horizontalScrollBar()
+        width = self.viewport().width()
+        bar.setRange(0, max(0, self.track_width() - width))
+        bar.setPageStep(width)
+
+    def follow(self, index):
+        """Scroll so tile `index` is on screen, centring it if it was not."""
+        bar = self.horizontalScrollBar()
+        rect = self.tile_rect(index)
+        width = self.viewport().width()
+        if rect.left() >= 0 and rect.right() < width:
+            return
+        centre = TRACK_MARGIN + index * self.pitch + self.box // 2
+        bar.setValue(centre - width // 2)
+
+    # --------------------------------------------------
+    # STATE
+    # --------------------------------------------------
+    def render(self, positions, dpr=1.0):
+        if dpr != self._dpr:
+            self._dpr = dpr
+            self._tile = None
+            self.viewport().update()
+
+        moved = [
+            pos for player, pos in enumerate(positions)
+            if player >= len(self.positions) or self.positions[player] != pos
+        ]
+        self.positions = tuple(positions)
+
+        wanted = {}
+        for player, pos in enumerate(positions, 1):
+            if 0 <= pos < self.length:
+                wanted.setdefault(pos, []).append(player)
+
+        for index in set(self.drawn) | set(wanted):
+            players = tuple(wanted.get(index, ()))
+            if self.drawn.get(index, ()) == players:
+                continue
+            if players:
+                self.drawn[index] = players
+            else:
+                del self.drawn[index]
+            self.viewport().update(self.tile_rect(index))
+
+        # follow the horse that just moved (both, on a reset: the first)
+        for pos in moved[:1]:
+            self.follow(min(max(pos, 0), self.length - 1))
+
+    def clear(self):
+        self.drawn = {}
+        self.positions = ()
+        self.viewport().update()
+
+    # --------------------------------------------------
+    # PAINTING
+    # --------------------------------------------------
+    def _paint_tile(self, dpr):
+        pixels = round(self.box * dpr)
+        pixmap = QPixmap(pixels, pixels)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(QPen(self.style.border, self.style.border_width))
+        painter.setBrush(self.style.background)
+        paint_tile(painter, QRect(0, 0, self.box, self.box), self.style)
+        painter.end()
+        return pixmap
+
+    def paintEvent(self, event):
+        dpr = self._dpr or self.devicePixelRatioF()
+        if self._tile is None:
+            self._tile = self._paint_tile(dpr)
+
+        dirty = event.rect()
+        offset = self.horizontalScrollBar().value() - TRACK_MARGIN
+        first = max(0, (dirty.left() + offset) // self.pitch)
+        last = min(self.length - 1, (dirty.right() + offset) // self.pitch)
+
+        painter = QPainter(self.viewport())
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        painter.setPen(self.style.border)
+        inset = self.style.border_width
+        for index in range(first, last + 1):
+            rect = self.tile_rect(index)
+            painter.drawPixmap(rect.topLeft(), self._tile)
+            players = self.drawn.get(index)
+            if players:
+                assets = [self.horses[player] for player in players]
+                painter.drawPixmap(
+                    rect.adjusted(inset, inset, -inset, -inset),
+                    self.pixmaps.group(assets, self.tile_size, dpr),
+                )
+            if index % TRACK_MARK_EVERY == 0:
+                painter.drawText(
+                    rect.left(), rect.bottom() + 2, rect.width(), 14,
+                    Qt.AlignmentFlag.AlignHCenter, str(index),
+                )
+        painter.end()
@@ -0,0 +1,29 @@
+import os
+
+from ur_engine import MAX_PLAYERS, PLAYERS
+
+# Command-line flags the windows read at startup. No NumPy or PyQt:
+# a window checks its opt-in flags here before importing what they turn
+# on (ur_record, and NumPy with it, only when recording).
+
+
+def record_path(argv):
+    """`--record PATH` on the command line, else $UR_RECORD, else None."""
+    if "--record" in argv:
+        index = argv.index("--record")
+        if index + 1 < len(argv):
+            return argv[index + 1]
+    return os.environ.get("UR_RECORD") or None
+
+
+def player_count(argv):
+    """`--players N` on the command line, else the classic two."""
+    if "--players" not in argv:
+        return PLAYERS
+    index = argv.index("--players")
+    if index + 1 >= len(argv):
+        return PLAYERS
+    players = int(argv[index + 1])
+    if not 2 <= players <= MAX_PLAYERS:
+        raise ValueError(f"--players must be between 2 and {MAX_PLAYERS}")
+    return players
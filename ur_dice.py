@@ -0,0 +1,111 @@
+import numpy as np
+
+from ur_engine import BINARY4, D6, DICE_MAX, DICE_MIN, ROLL_PROBABILITIES
+
+# --------------------------------------------------
+# CONSTANTS
+# --------------------------------------------------
+DEFAULT_BLOCK = 4096
+
+
+# --------------------------------------------------
+# DISTRIBUTIONS
+# --------------------------------------------------
+class Distribution:
+    """A user-defined die: roll values and their weights."""
+
+    __slots__ = ("values", "probs")
+
+    def __init__(self, weights):
+        if not weights:
+            raise ValueError("A distribution needs at least one value")
+        values = sorted(weights)
+        total = float(sum(weights[value] for value in values))
+        if total <= 0 or any(weights[value] < 0 for value in values):
+            raise ValueError("Weights must be non-negative with a positive sum")
+        if any(value < 0 for value in values):
+            raise ValueError("Roll values must be non-negative")
+
+        self.values = np.array(values, dtype=np.int64)
+        self.probs = np.array([weights[v] / total for v in values])
+
+    @property
+    def mean(self):
+        return float((self.values * self.probs).sum())
+
+    def as_dict(self):
+        return dict(zip(self.values.tolist(), self.probs.tolist()))
+
+
+def distribution(model):
+    if isinstance(model, Distribution):
+        return model
+    if isinstance(model, dict):
+        return Distribution(model)
+    if model in ROLL_PROBABILITIES:
+        return Distribution(ROLL_PROBABILITIES[model])
+    raise ValueError(f"Unknown dice model: {model!r}")
+
+
+# --------------------------------------------------
+# DICE STREAM
+# --------------------------------------------------
+class DiceStream:
+    """Seedable dice that roll in vectorized blocks.
+
+    `roll()` serves single rolls from a pre-generated buffer; `rolls()`
+    draws an array directly. The same seed always gives the same rolls,
+    and `spawn()` derives statistically independent child streams for
+    parallel workers. A stream can be passed as `rng` to
+    `ur_engine.roll_dice` / `play_turn` / `play_race`.
+    """
+
+    def __init__(self, model=D6, seed=None, block=DEFAULT_BLOCK):
+        if isinstance(seed, np.random.SeedSequence):
+            self.seed_seq = seed
+        elif isinstance(seed, tuple):
+            entropy, spawn_key = seed
+            self.seed_seq = np.random.SeedSequence(
+                entropy, spawn_key=spawn_key
+            )
+        else:
+            self.seed_seq = np.random.SeedSequence(seed)
+        self.model = model
+        self.dist = distribution(model)
+        self.block = block
+        self.generator = np.random.Generator(np.random.PCG64(self.seed_seq))
+        self._buffer = []
+        self._index = 0
+
+    @property
+    def seed(self):
+        """DiceStream(model, seed) replays this stream: the root entropy,
+        or (entropy, spawn_key) for a stream made by `spawn()`."""
+        seq = self.seed_seq
+        if seq.spawn_key:
+            return seq.entropy, seq.spawn_key
+        return seq.entropy
+
+    def rolls(self, shape):
+        gen = self.generator
+        if self.model == D6:
+            return gen.integers(DICE_MIN, DICE_MAX + 1, size=shape,
+                                dtype=np.int32)
+        if self.model == BINARY4:
+            return gen.binomial(4, 0.5, size=shape).astype(np.int32)
+        return gen.choice(self.dist.values, size=shape,
+                          p=self.dist.probs).astype(np.int32)
+
+    def roll(self):
+        if self._index >= len(self._buffer):
+            self._buffer = self.rolls(self.block).tolist()
+            self._index = 0
+        value = self._buffer[self._index]
+        self._index += 1
+        return value
+
+    def spawn(self, count):
+        return [
+            DiceStream(self.model, child, self.block)
+            for child in self.seed_seq.spawn(count)
+        ]
@@ -0,0 +1,355 @@
+import argparse
+import functools
+import mmap
+import os
+import struct
+import time
+
+import numpy as np
+
+import ur_royal
+import ur_solver
+from ur_royal import LIGHT, MASK14, PIECES, SIDE_BIT
+
+# --------------------------------------------------
+# CONSTANTS
+# --------------------------------------------------
+DB_VERSION = 1
+MAGIC = b"URDB"
+HEADER = struct.Struct("<4sHBxQ")   # magic, version, pieces, state count
+VALUE = struct.Struct("<H")
+SCALE = 65535                       # values are P(side to move wins) * SCALE
+DEFAULT_PIECES = 3
+PRACTICAL_PIECES = 4   # 5.2M states, about 15 minutes; 5 and up take hours
+TOLERANCE = 1e-10
+MAX_SWEEPS = 100_000
+
+# --------------------------------------------------
+# RANKING
+# --------------------------------------------------
+# A position splits into the shared lane (squares 5–12, each empty, light
+# or dark: 3^8 patterns) and each side's private squares (1–4, 13–14:
+# six bits). Positions are grouped into layers by pieces borne off, then
+# by lane pattern, then by the two private masks; the side to move is the
+# lowest bit of the rank. Every legal position gets a distinct index and
+# every index is a legal position.
+LANE = 3 ** 8
+
+
+def _private(bits):
+    return (bits & 0xF) | (bits >> 12) << 4
+
+
+def _unprivate(mask):
+    return (mask & 0xF) | (mask >> 4) << 12
+
+
+# private masks with at most `room` pieces, and their rank among them
+PRIV_LIST = [
+    [mask for mask in range(64) if mask.bit_count() <= room]
+    for room in range(PIECES + 1)
+]
+PRIV_RANK = [[-1] * 64 for _ in range(PIECES + 1)]
+for _room, _masks in enumerate(PRIV_LIST):
+    for _index, _mask in enumerate(_masks):
+        PRIV_RANK[_room][_mask] = _index
+
+# lane byte (squares 5–12) -> base-3 digits; dark digits are doubled
+TERNARY = [
+    sum(3 ** i for i in range(8) if byte >> i & 1) for byte in range(256)
+]
+
+# lane pattern -> (light bits, dark bits, light count, dark count)
+LANE_PIECES = []
+for _pattern in range(LANE):
+    _light = _dark = 0
+    for _i in range(8):
+        _digit = _pattern // 3 ** _i % 3
+        if _digit == 1:
+            _light |= 1 << (_i + 4)
+        elif _digit == 2:
+            _dark |= 1 << (_i + 4)
+    LANE_PIECES.append(
+        (_light, _dark, _light.bit_count(), _dark.bit_count())
+    )
+
+
+class Ranking:
+    """Perfect ranking of every position where each side has at most
+    `pieces` pieces left to bear off."""
+
+    def __init__(self, pieces=DEFAULT_PIECES):
+        if not 1 <= pieces <= PIECES:
+            raise ValueError(f"pieces must be 1–{PIECES}")
+        self.pieces = pieces
+        self.min_off = PIECES - pieces
+        self.layers = [None] * 64   # light_off * 8 + dark_off
+        base = 0
+        for light_off in range(self.min_off, PIECES + 1):
+            for dark_off in range(self.min_off, PIECES + 1):
+                offsets = [0] * LANE
+                count = 0
+                for pattern, (_, _, lc, dc) in enumerate(LANE_PIECES):
+                    offsets[pattern] = count
+                    room_l = PIECES - light_off - lc
+                    room_d = PIECES - dark_off - dc
+                    if room_l >= 0 and room_d >= 0:
+                        count += len(PRIV_LIST[room_l]) * len(PRIV_LIST[room_d])
+                self.layers[light_off * 8 + dark_off] = (base, offsets, count)
+                base += count
+        self.size = base * 2
+
+    def covers(self, state):
+        return (
+            (state >> 28) & 7 >= self.min_off
+            and (state >> 31) & 7 >= self.min_off
+        )
+
+    def rank(self, state):
+        light = state & MASK14
+        dark = (state >> 14) & MASK14
+        light_off = (state >> 28) & 7
+        dark_off = (state >> 31) & 7
+        light_lane = (light >> 4) & 0xFF
+        dark_lane = (dark >> 4) & 0xFF
+
+        base, offsets, _ = self.layers[light_off * 8 + dark_off]
+        room_l = PIECES - light_off - light_lane.bit_count()
+        room_d = PIECES - dark_off - dark_lane.bit_count()
+        position = (
+            base
+            + offsets[TERNARY[light_lane] + 2 * TERNARY[dark_lane]]
+            + PRIV_RANK[room_l][_private(light)] * len(PRIV_LIST[room_d])
+            + PRIV_RANK[room_d][_private(dark)]
+        )
+        return position * 2 + ((state >> 34) & 1)
+
+    def layer_states(self, light_off, dark_off):
+        """Every state of one layer, in rank order."""
+        off = light_off << 28 | dark_off << 31
+        for light, dark, lc, dc in LANE_PIECES:
+            room_l = PIECES - light_off - lc
+            room_d = PIECES - dark_off - dc
+            if room_l < 0 or room_d < 0:
+                continue
+            for light_mask in PRIV_LIST[room_l]:
+                light_bits = light | _unprivate(light_mask) | off
+                for dark_mask in PRIV_LIST[room_d]:
+                    state = light_bits | (dark | _unprivate(dark_mask)) << 14
+                    yield state
+                    yield state | SIDE_BIT
+
+
+# --------------------------------------------------
+# GENERATOR
+# --------------------------------------------------
+def _solve_layer(ranking, values, light_off, dark_off, tolerance):
+    base, _, count = ranking.layers[light_off * 8 + dark_off]
+    start, stop = base * 2, (base + count) * 2
+    states = list(ranking.layer_states(light_off, dark_off))
+
+    if light_off == PIECES or dark_off == PIECES:
+        won = LIGHT if light_off == PIECES else ur_royal.DARK
+        values[start:stop] = [
+            1.0 if ur_royal.side_to_move(s) == won else 0.0 for s in states
+        ]
+        return 0
+
+    # successors per roll, padded to 7 moves; a roll without moves (and
+    # every roll of 0) is a single pass to the opponent
+    rank = ranking.rank
+    n = len(states)
+    children = np.full((5, n, PIECES), -1, dtype=np.int32)
+    flips = np.ones((5, n, PIECES), dtype=bool)
+    for i, state in enumerate(states):
+        side = (state >> 34) & 1
+        passed = rank(state ^ SIDE_BIT)
+        children[0, i, 0] = passed
+        for roll in range(1, 5):
+            moves = ur_royal.legal_moves(state, roll)
+            if not moves:
+                children[roll, i, 0] = passed
+                continue
+            for j, frm in enumerate(moves):
+                child = ur_royal.apply_move(state, frm, roll)
+                children[roll, i, j] = rank(child)
+                flips[roll, i, j] = (child >> 34) & 1 != side
+
+    valid = children >= 0
+    gather = np.where(valid, children, 0)
+    weights = [ur_royal.ROLL_PROBABILITIES[roll] for roll in range(5)]
+
+    # value iteration: captures and passes make the layer cyclic, so
+    # sweep until no position moves by more than `tolerance`
+    values[start:stop] = 0.5
+    for sweep in range(1, MAX_SWEEPS + 1):
+        child_values = values[gather]
+        mover = np.where(flips, 1.0 - child_values, child_values)
+        best = np.where(valid, mover, -1.0).max(axis=2)
+        new = sum(w * best[roll] for roll, w in enumerate(weights))
+        delta = np.abs(new - values[start:stop]).max()
+        values[start:stop] = new
+        if delta < tolerance:
+            return sweep
+    raise RuntimeError(f"Layer {light_off}/{dark_off} did not converge")
+
+
+def generate(pieces=DEFAULT_PIECES, tolerance=TOLERANCE, log=None):
+    """Solve every endgame with at most `pieces` left per side.
+
+    States are enumerated one by one in Python, so PRACTICAL_PIECES is
+    the useful limit: 3 pieces take about a minute and 4 about fifteen.
+    The whole game (7 pieces, 276M states) would take many hours and
+    tens of GB of successor arrays.
+
+    Moves never take a piece back off the pile of borne-off pieces, so
+    layers are solved from the most borne off down; each layer only
+    depends on itself and on layers that are already final. Returns
+    (ranking, values) with values[rank] = P(side to move wins).
+    """
+    ranking = Ranking(pieces)
+    values = np.zeros(ranking.size)
+    offs = range(ranking.min_off, PIECES + 1)
+    order = sorted(
+        ((lo, do) for lo in offs for do in offs),
+        key=lambda layer: -(layer[0] + layer[1]),
+    )
+    for light_off, dark_off in order:
+        sweeps = _solve_layer(ranking, values, light_off, dark_off, tolerance)
+        if log:
+            log(f"layer {light_off}/{dark_off}: {sweeps} sweeps")
+    return ranking, values
+
+
+# --------------------------------------------------
+# FILE FORMAT
+# --------------------------------------------------
+def database_path(pieces=DEFAULT_PIECES, directory=None):
+    directory = directory or ur_solver.cache_dir()
+    return os.path.join(directory, f"endgame_v{DB_VERSION}_{pieces}.urdb")
+
+
+def save_database(ranking, values, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    quantized = np.rint(np.clip(values, 0.0, 1.0) * SCALE).astype("<u2")
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, DB_VERSION, ranking.pieces, ranking.size))
+        quantized.tofile(f)
+    os.replace(tmp, path)
+
+
+class EndgameDB:
+    """Read-only view of a generated database.
+
+    The file is memory-mapped, so opening it costs no load time, pages
+    are shared between processes, and a lookup is one rank plus one
+    two-byte read.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, pieces, count = HEADER.unpack_from(self._mmap)
+            if magic != MAGIC or version != DB_VERSION:
+                raise ValueError(f"Not an endgame database: {path}")
+            self.ranking = Ranking(pieces)
+            if count != self.ranking.size or (
+                len(self._mmap) != HEADER.size + count * VALUE.size
+            ):
+                raise ValueError(f"Truncated endgame database: {path}")
+        except (ValueError, struct.error):
+            self._mmap.close()
+            raise
+        self.pieces = pieces
+        self.path = path
+
+    def __contains__(self, state):
+        return self.ranking.covers(state)
+
+    def value(self, state):
+        """P(side to move wins) under optimal play by both sides."""
+        if not self.ranking.covers(state):
+            raise ValueError("Position is outside the endgame database")
+        offset = HEADER.size + self.ranking.rank(state) * VALUE.size
+        return VALUE.unpack_from(self._mmap, offset)[0] / SCALE
+
+    def win_probability(self, state, side=LIGHT):
+        value = self.value(state)
+        return value if ur_royal.side_to_move(state) == side else 1.0 - value
+
+    def best_move(self, state, roll):
+        """(move, P(mover wins)) for the best move, or (None, value of
+        passing) when the roll has no legal move."""
+        side = ur_royal.side_to_move(state)
+        moves = ur_royal.legal_moves(state, roll)
+        if not moves:
+            return None, 1.0 - self.value(ur_royal.pass_turn(state))
+
+        best_move, best_value = None, -1.0
+        for frm in moves:
+            value = self.win_probability(
+                ur_royal.apply_move(state, frm, roll), side
+            )
+            if value > best_value:
+                best_move, best_value = frm, value
+        return best_move, best_value
+
+    def close(self):
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+@functools.lru_cache(maxsize=8)
+def load_database(pieces=DEFAULT_PIECES, directory=None):
+    """Open the database for `pieces`. Generating one takes minutes, so
+    a missing file is an error rather than a silent rebuild."""
+    path = database_path(pieces, directory)
+    if not os.path.exists(path):
+        raise FileNotFoundError(
+            f"No endgame database at {path}; build it with "
+            f"`python ur_endgame.py --pieces {pieces}`"
+        )
+    return EndgameDB(path)
+
+
+# --------------------------------------------------
+# CLI
+# --------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ur endgame database")
+    parser.add_argument("--pieces", type=int, default=DEFAULT_PIECES,
+                        help="pieces left per side; 3 takes about a minute, "
+                             f"{PRACTICAL_PIECES} about fifteen")
+    parser.add_argument("--force", action="store_true",
+                        help=f"allow more than {PRACTICAL_PIECES} pieces "
+                             "(hours, tens of GB)")
+    parser.add_argument("--cache-dir", default=None)
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE)
+    args = parser.parse_args(argv)
+
+    if args.pieces > PRACTICAL_PIECES and not args.force:
+        parser.error(
+            f"--pieces above {PRACTICAL_PIECES} takes hours and tens of GB; "
+            "pass --force to run it anyway"
+        )
+
+    path = database_path(args.pieces, args.cache_dir)
+    start = time.perf_counter()
+    ranking, values = generate(args.pieces, args.tolerance, log=print)
+    save_database(ranking, values, path)
+    elapsed = time.perf_counter() - start
+
+    size = os.path.getsize(path)
+    print(f"{ranking.size} states in {elapsed:.1f}s -> {path} "
+          f"({size / 1e6:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+import random
+from array import array
+
+# --------------------------------------------------
+# CONSTANTS
+# --------------------------------------------------
+DICE_MIN = 1
+DICE_MAX = 6
+
+# DICE MODELS
+D6 = "d6"            # one real die, 1–6 (ur_game.py / ur_game_bet.py)
+BINARY4 = "binary4"  # four binary dice, 0–4, a 0 passes the turn (PRO)
+DICE_MODELS = (D6, BINARY4)
+
+# roll -> probability for each dice model
+ROLL_PROBABILITIES = {
+    D6: {roll: 1 / 6 for roll in range(DICE_MIN, DICE_MAX + 1)},
+    BINARY4: {0: 1 / 16, 1: 4 / 16, 2: 6 / 16, 3: 4 / 16, 4: 1 / 16},
+}
+
+PLAYERS = 2
+MAX_PLAYERS = 64
+
+
+# --------------------------------------------------
+# RACE STATE
+# --------------------------------------------------
+class RaceState:
+    """Everything needed to play a race of `players` horses, without any
+    Qt. Players are numbered from 1; positions[k - 1] is player k's, in
+    one contiguous array, and the turn passes round by index."""
+
+    __slots__ = (
+        "positions",
+        "players",
+        "current_player",
+        "last_roll",
+        "board_size",
+        "dice",
+        "winner",
+    )
+
+    def __init__(self, board_size, dice=D6, players=PLAYERS):
+        if board_size <= 0:
+            raise ValueError("board_size must be positive")
+        if dice not in DICE_MODELS:
+            raise ValueError(f"Unknown dice model: {dice!r}")
+        if not 2 <= players <= MAX_PLAYERS:
+            raise ValueError(f"players must be between 2 and {MAX_PLAYERS}")
+
+        self.board_size = board_size
+        self.dice = dice
+        self.players = players
+        self.reset()
+
+    def reset(self):
+        self.positions = array("i", [0]) * self.players
+        self.current_player = 1
+        self.last_roll = 0
+        self.winner = 0
+
+    def copy(self):
+        other = RaceState.__new__(RaceState)
+        other.positions = array("i", self.positions)
+        other.players = self.players
+        other.current_player = self.current_player
+        other.last_roll = self.last_roll
+        other.board_size = self.board_size
+        other.dice = self.dice
+        other.winner = self.winner
+        return other
+
+    def __repr__(self):
+        return (
+            f"RaceState(positions={list(self.positions)}, "
+            f"current_player={self.current_player}, "
+            f"last_roll={self.last_roll}, board_size={self.board_size}, "
+            f"dice={self.dice!r}, winner={self.winner})"
+        )
+
+
+# --------------------------------------------------
+# DICE
+# --------------------------------------------------
+def draw_roll(dice, rng=random):
+    if dice == D6:
+        return rng.randint(DICE_MIN, DICE_MAX)
+    if dice == BINARY4:
+        # same distribution as four random.choice([0, 1]) calls
+        return bin(rng.getrandbits(4)).count("1")
+    raise ValueError(f"Unknown dice model: {dice!r}")
+
+
+# --------------------------------------------------
+# STEP FUNCTIONS
+# --------------------------------------------------
+def switch_player(state):
+    state.current_player = state.current_player % state.players + 1
+
+
+def apply_roll(state, roll):
+    """Record a roll; a roll of 0 (PRO dice) passes the turn."""
+    state.last_roll = roll
+    if roll == 0:
+        switch_player(state)
+    return roll
+
+
+def roll_dice(state, rng=random):
+    """Roll for the current player.
+
+    `rng` is either a random.Random-like object, drawn from according to
+    `state.dice`, or a dice stream with its own `roll()` method.
+    """
+    roll = getattr(rng, "roll", None)
+    if roll is not None:
+        return apply_roll(state, roll())
+    return apply_roll(state, draw_roll(state.dice, rng))
+
+
+def move_piece(state):
+    """Move the current horse by the last roll.
+
+    Returns False when there is nothing to move (no roll yet, or the race
+    is already over). A finishing move sets ``state.winner`` and leaves the
+    positions untouched, exactly like ``UrGame.move_piece``.
+    """
+    if state.winner or state.last_roll == 0:
+        return False
+
+    index = state.current_player - 1
+    new_pos = state.positions[index] + state.last_roll
+
+    if new_pos >= state.board_size:
+        state.winner = state.current_player
+        return True
+
+    state.positions[index] = new_pos
+    state.last_roll = 0
+    switch_player(state)
+    return True
+
+
+def leader(state):
+    """The player furthest along (the lower number on a tie)."""
+    positions = state.positions
+    return max(range(state.players), key=positions.__getitem__) + 1
+
+
+def play_turn(state, rng=random):
+    roll_dice(state, rng)
+    move_piece(state)
+    return state.winner
+
+
+def play_race(board_size, dice=D6, rng=random, players=PLAYERS):
+    """Play a full race and return (winner, turns)."""
+    state = RaceState(board_size, dice, players)
+    turns = 0
+    while not state.winner:
+        play_turn(state, rng)
+        turns += 1
+    return state.winner, turns
@@ -1,17 +1,26 @@
 from PyQt6.QtWidgets import QApplication, QMainWindow
-from PyQt6.uic import loadUi
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QPixmap
+import random
 import sys
 import os
-import random
+
+import ur_cli
+import ur_engine
+import ur_perf
+import ur_solver
+from ur_autoplay_qt import AutoPlay
+from ur_board import (
+    BoardWidget, DARK_TILES, TrackView, bounding_rect, track_length,
+)
+from ur_perf_qt import PerfMonitor
+from ur_pixmaps import PixmapCache, horse_assets, image_src
+from ur_uic import setup_ui
 
 # --------------------------------------------------
 # CONSTANTS
 # --------------------------------------------------
 TILE_SIZE = 40
-DICE_MIN = 1
-DICE_MAX = 6
+PERF_HANDLERS = ("roll_dice", "move_piece", "update_board", "end_game")
 
 # --------------------------------------------------
 # PATH HANDLING
@@ -23,11 +32,16 @@ def resource_path(relative):
 # MAIN GAME CLASS
 # --------------------------------------------------
 class UrGame(QMainWindow):
-    def __init__(self):
+    def __init__(self, record=None, perf=None, track=None,
+                 players=ur_engine.PLAYERS):
         super().__init__()
 
         # LOAD UI
-        loadUi(resource_path("ur_game.ui"), self)
+        setup_ui(self, "ur_game.ui")
+
+        # INSTRUMENTATION (opt-in: --perf or $UR_PERF); before the
+        # signals so the connected handlers are the timed ones
+        self.perf = PerfMonitor(perf, self, PERF_HANDLERS) if perf else None
 
         # SIGNALS
         self.startButton.clicked.connect(self.start_game)
@@ -38,53 +52,88 @@ class UrGame(QMainWindow):
         self.quitButton.clicked.connect(self.close)
         self.playAgainButton.clicked.connect(self.go_home)
 
+        # AUTO-PLAY (both players from a timer, redrawn once per frame)
+        self.autoplay = AutoPlay(
+            self, self.roll_dice, self.move_piece, self.show_turn,
+            self.autoButton, self.speedBox,
+        )
+
+        # LOAD HORSE IMAGES (tinted copies past the first two)
+        self.horses = horse_assets(players)
+        self.pixmaps = PixmapCache(resource_path("src/assets"))
+
+        # BOARD (tile rects from the .ui, painted by one widget)
+        self.board_tiles = self.collect_tiles()
+        if not self.board_tiles:
+            raise RuntimeError("No board tiles found (tile_0, tile_1...)")
+
+        if track:
+            # generated track of any length (--track N) where the
+            # hand-placed tiles were; only the visible tiles are painted
+            self.board = TrackView(
+                track, bounding_rect(self.board_tiles), self.horses,
+                self.pixmaps, TILE_SIZE, DARK_TILES, self.boardWidget,
+            )
+        else:
+            self.board = BoardWidget(
+                self.board_tiles, self.horses, self.pixmaps, TILE_SIZE,
+                DARK_TILES, self.boardWidget,
+            )
+        self.board_size = len(self.board)
+        if self.perf:
+            self.perf.attach(self.board, self.pixmaps, self.GamePage)
+
         # GAME STATE
-        self.current_player = 1
-        self.positions = {1: 0, 2: 0}
-        self.last_roll = 0
-
-        # LOAD HORSE IMAGES
-        self.horses = {
-            1: QPixmap(resource_path("src/assets/horse_white.png")),
-            2: QPixmap(resource_path("src/assets/horse_blue.png")),
-        }
-
-        # BOARD TILES (QLabel)
-        self.board_tiles = []
+        self.state = ur_engine.RaceState(
+            self.board_size, ur_engine.D6, players
+        )
+
+        # WIN ODDS (one lookup per update; exact, or approximated far
+        # from the finish on long tracks). Two-horse races only.
+        self.odds_table = None
+        if players == 2:
+            self.odds_table = ur_solver.odds_table(
+                self.board_size, ur_engine.D6
+            )
+
+        # GAME RECORDING (opt-in: --record PATH or $UR_RECORD); records
+        # hold two-horse races. ur_record brings NumPy, so it is only
+        # imported when recording
+        self.recorder = None
+        if record and players == 2:
+            import ur_record
+            self.recorder = ur_record.GameRecorder(record, ur_record.CLASSIC)
+        self.rng = random
+
+        self.update_board()
+        self.stackedWidget.setCurrentWidget(self.StartPage)
+
+    # --------------------------------------------------
+    # BOARD TILES
+    # --------------------------------------------------
+    def collect_tiles(self):
+        """Tile rects from the .ui layout; the placeholder labels go."""
+        rects = []
         index = 0
         while True:
             tile = getattr(self, f"tile_{index}", None)
             if tile is None:
                 break
 
-            tile.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            tile.setScaledContents(True)
-            tile.clear()
-
-            tile.setStyleSheet("""
-                QLabel {
-                    background-color: #2c2c2c;
-                    border: 2px solid #777;
-                }
-            """)
-
-            self.board_tiles.append(tile)
+            rects.append(tile.geometry())
+            tile.deleteLater()
+            delattr(self, f"tile_{index}")
             index += 1
 
-        self.board_size = len(self.board_tiles)
-        if self.board_size == 0:
-            raise RuntimeError("No board tiles found (tile_0, tile_1...)")
-
-        self.update_board()
-        self.stackedWidget.setCurrentWidget(self.StartPage)
+        return rects
 
     # --------------------------------------------------
     # NAVIGATION
     # --------------------------------------------------
     def start_game(self):
-        self.positions = {1: 0, 2: 0}
-        self.current_player = 1
-        self.last_roll = 0
+        self.state.reset()
+        if self.recorder:
+            self.rng = self.recorder.start(self.board_size, self.state.dice)
         self.statusLabel.setText("Player 1 turn")
         self.diceLabel.setText("Roll the dice")
         self.update_board()
@@ -100,59 +149,66 @@ class UrGame(QMainWindow):
     # GAME LOGIC — REAL DICE (1–6)
     # --------------------------------------------------
     def roll_dice(self):
-        self.last_roll = random.randint(DICE_MIN, DICE_MAX)
-        self.diceLabel.setText(f"🎲 Dice Roll: {self.last_roll}")
+        roll = ur_engine.roll_dice(self.state, self.rng)
+        if self.recorder:
+            self.recorder.rolled(roll)
+        if self.autoplay.deferring:
+            return
+        self.diceLabel.setText(f"🎲 Dice Roll: {roll}")
         self.statusLabel.setText(
-            f"Player {self.current_player} rolled {self.last_roll}"
+            f"Player {self.state.current_player} rolled {roll}"
         )
+        self.update_odds()
 
     def move_piece(self):
-        if self.last_roll == 0:
+        if not ur_engine.move_piece(self.state):
             return
+        if self.recorder:
+            self.recorder.moved()
 
-        new_pos = self.positions[self.current_player] + self.last_roll
-
-        if new_pos >= self.board_size:
-            self.end_game(self.current_player)
+        if self.state.winner:
+            self.end_game(self.state.winner)
+            return
+        if self.autoplay.deferring:
             return
 
-        self.positions[self.current_player] = new_pos
-        self.last_roll = 0
         self.update_board()
-        self.switch_player()
+        self.statusLabel.setText(f"Player {self.state.current_player} turn")
 
-    def switch_player(self):
-        self.current_player = 2 if self.current_player == 1 else 1
-        self.statusLabel.setText(f"Player {self.current_player} turn")
+    def show_turn(self, roll):
+        """View after whole turns; auto-play calls this once per frame."""
+        self.diceLabel.setText(f"🎲 Dice Roll: {roll}")
+        self.update_board()
+        self.statusLabel.setText(f"Player {self.state.current_player} turn")
 
     # --------------------------------------------------
     # BOARD RENDER — IMAGES ONLY
     # --------------------------------------------------
     def update_board(self):
-        for tile in self.board_tiles:
-            tile.clear()
-
-        for player, pos in self.positions.items():
-            if 0 <= pos < self.board_size:
-                pixmap = self.horses[player].scaled(
-                    TILE_SIZE,
-                    TILE_SIZE,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation
-                )
-                self.board_tiles[pos].setPixmap(pixmap)
+        self.board.render(self.state.positions, self.devicePixelRatioF())
+        self.update_odds()
+
+    def update_odds(self):
+        if self.odds_table is None:
+            player = ur_engine.leader(self.state)
+            tile = self.state.positions[player - 1] + 1
+            self.hintLabel.setText(f"Leading: Player {player} on tile {tile}")
+            return
+        p1 = self.odds_table.p1_wins_state(self.state)
+        self.hintLabel.setText(
+            f"Win odds: Player 1 {p1:.0%} · Player 2 {1 - p1:.0%}"
+        )
 
     # --------------------------------------------------
     # END GAME — IMAGE + TEXT
     # --------------------------------------------------
     def end_game(self, winner):
-        horse_image = (
-            "src/assets/horse_white.png"
-            if winner == 1
-            else "src/assets/horse_blue.png"
-        )
+        if self.recorder:
+            self.recorder.finish(winner)
 
-        img_path = resource_path(horse_image).replace("\\", "/")
+        img_path = image_src(
+            self.horses[winner], resource_path("src/assets"), self.pixmaps
+        )
 
         html = f"""
         <div style="
@@ -178,6 +234,11 @@ class UrGame(QMainWindow):
 # --------------------------------------------------
 if __name__ == "__main__":
     app = QApplication(sys.argv)
-    window = UrGame()
+    window = UrGame(
+        record=ur_cli.record_path(sys.argv[1:]),
+        perf=ur_perf.perf_path(sys.argv[1:]),
+        track=track_length(sys.argv[1:]),
+        players=ur_cli.player_count(sys.argv[1:]),
+    )
     window.show()
     sys.exit(app.exec())
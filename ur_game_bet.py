@@ -1,14 +1,26 @@
 from PyQt6.QtWidgets import QApplication, QMainWindow
-from PyQt6.uic import loadUi
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QPixmap
+import random
 import sys
 import os
-import random
+from array import array
+
+import ur_cli
+import ur_engine
+import ur_odds
+import ur_perf
+from ur_autoplay_qt import AutoPlay
+from ur_board import BoardWidget, SAND_TILES
+from ur_net_qt import NetClient, server_address
+from ur_perf_qt import PerfMonitor
+from ur_pixmaps import PixmapCache, horse_assets
+from ur_uic import setup_ui
 
 TILE_SIZE = 40
-DICE_MIN = 1
-DICE_MAX = 6
+START_COINS = 1000
+ONLINE_VARIANT = "bet"      # ur_record.BET: the server's betting match
+PERF_HANDLERS = (
+    "roll_dice", "move_piece", "update_board", "end_game", "confirm_bet",
+)
 
 
 # 🔹 NEW: helper that also works inside a PyInstaller .exe
@@ -18,11 +30,16 @@ def resource_path(relative):
 
 
 class UrGame(QMainWindow):
-    def __init__(self):
+    def __init__(self, record=None, server=None, perf=None,
+                 players=ur_engine.PLAYERS):
         super().__init__()
 
         # Load correct UI file
-        loadUi(resource_path("ur_game_bet.ui"), self)
+        setup_ui(self, "ur_game_bet.ui")
+
+        # INSTRUMENTATION (opt-in: --perf or $UR_PERF); before the
+        # signals so the connected handlers are the timed ones
+        self.perf = PerfMonitor(perf, self, PERF_HANDLERS) if perf else None
 
         # -------------------------
         # NAVIGATION BUTTONS
@@ -36,6 +53,12 @@ class UrGame(QMainWindow):
         self.rollButton.clicked.connect(self.roll_dice)
         self.moveButton.clicked.connect(self.move_piece)
 
+        # auto-play: both players from a timer, redrawn once per frame
+        self.autoplay = AutoPlay(
+            self, self.roll_dice, self.move_piece, self.show_turn,
+            self.autoButton, self.speedBox,
+        )
+
         # -------------------------
         # BETTING BUTTONS
         # -------------------------
@@ -53,47 +76,98 @@ class UrGame(QMainWindow):
         # -------------------------
         # GAME STATE
         # -------------------------
+        # current_player tracks whose turn it is to bet; the race itself
+        # keeps its own turn in self.state
         self.current_player = 1
-        self.positions = {1: 0, 2: 0}
-        self.last_roll = 0
+        # the match server seats two
+        self.players = 2 if server else players
 
         # -------------------------
         # BETTING STATE
         # -------------------------
-        self.player_coins = {1: 1000, 2: 1000}
-        self.player_bets = {1: 0, 2: 0}
+        # one slot per player, player k at index k - 1
+        self.player_coins = array("q", [START_COINS]) * self.players
+        self.player_bets = array("q", [0]) * self.players
         self.current_bet = 0
 
-        # Horses
-        self.horses = {
-            1: QPixmap(resource_path("src/assets/horse_white.png")),
-            2: QPixmap(resource_path("src/assets/horse_blue.png")),
-        }
-
-        # Build tiles
-        self.board_tiles = []
-        i = 0
-        while True:
-            tile = getattr(self, f"tile_{i}", None)
-            if tile is None:
-                break
-
-            tile.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            tile.setScaledContents(True)
-            tile.clear()
+        # Horses (tinted copies past the first two)
+        self.horses = horse_assets(self.players)
+        self.pixmaps = PixmapCache(resource_path("src/assets"))
 
-            self.board_tiles.append(tile)
-            i += 1
+        # Build the board from the .ui tile rects
+        self.board_tiles = self.collect_tiles()
 
         self.board_size = len(self.board_tiles)
+        self.board = BoardWidget(
+            self.board_tiles, self.horses, self.pixmaps, TILE_SIZE,
+            SAND_TILES, self.boardWidget,
+        )
+        if self.perf:
+            self.perf.attach(self.board, self.pixmaps, self.GamePage)
+        self.state = ur_engine.RaceState(
+            self.board_size, ur_engine.D6, self.players
+        )
+
+        # SETTLEMENT: fair odds for a two-horse race (player 1 moves
+        # first, so backing them pays less); a pari-mutuel pool for more
+        if self.players == 2:
+            self.odds = ur_odds.fair_odds(self.board_size, self.state.dice)
+            self.settle = self.odds.settle
+            self.oddsLabel.setText(
+                f"{self.odds.describe(1)}\n{self.odds.describe(2)}"
+            )
+        else:
+            self.settle = ur_odds.pool_settle
+            self.oddsLabel.setText(ur_odds.describe_pool(self.players))
+
+        # GAME RECORDING (opt-in: --record PATH or $UR_RECORD); records
+        # hold two-horse races. ur_record brings NumPy, so it is only
+        # imported when recording
+        self.recorder = None
+        if record and self.players == 2:
+            import ur_record
+            self.recorder = ur_record.GameRecorder(record, ur_record.BET)
+        self.rng = random
 
         self.update_coin_labels()
         self.update_bet_display()
 
+        # ONLINE PLAY (opt-in: --server HOST:PORT); the server runs the
+        # rules and settles bets, the window only mirrors its messages
+        self.net = None
+        self.me = None
+        if server:
+            self.net = NetClient(*server, parent=self)
+            self.net.messageReceived.connect(self.on_server_message)
+            self.net.failed.connect(self.on_server_failed)
+            self.net.connect_to_server()
+            # the server paces online races
+            self.autoButton.hide()
+            self.speedBox.hide()
+
         # DEFAULT PAGE
         self.statusLabel_2.setText("Welcome! Click START")
         self.stackedWidget.setCurrentWidget(self.StartPage)
 
+    # ------------------------------
+    # BOARD TILES
+    # ------------------------------
+    def collect_tiles(self):
+        """Tile rects from the .ui layout; the placeholder labels go."""
+        rects = []
+        i = 0
+        while True:
+            tile = getattr(self, f"tile_{i}", None)
+            if tile is None:
+                break
+
+            rects.append(tile.geometry())
+            tile.deleteLater()
+            delattr(self, f"tile_{i}")
+            i += 1
+
+        return rects
+
     # ------------------------------
     # NAVIGATION
     # ------------------------------
@@ -104,8 +178,12 @@ class UrGame(QMainWindow):
         self.stackedWidget.setCurrentWidget(self.RulesPage)
 
     def go_betting_page(self):
+        if self.net:
+            self.go_online_betting_page()
+            return
+
         self.current_player = 1
-        self.player_bets = {1: 0, 2: 0}
+        self.player_bets = array("q", [0]) * self.players
         self.current_bet = 0
 
         self.update_bet_display()
@@ -118,15 +196,23 @@ class UrGame(QMainWindow):
     # LABEL UPDATES
     # ------------------------------
     def update_coin_labels(self):
-        self.coinsLabelP1.setText(str(self.player_coins[1]))
-        self.coinsLabelP2.setText(str(self.player_coins[2]))
+        if self.players == 2:
+            self.coinsLabelP1.setText(str(self.player_coins[0]))
+            self.coinsLabelP2.setText(str(self.player_coins[1]))
+            return
+        # a big field: the player betting now, and the pool so far
+        player = self.current_player
+        self.coinsTitleP1.setText(f" PLAYER {player}")
+        self.coinsLabelP1.setText(str(self.player_coins[player - 1]))
+        self.coinsTitleP2.setText(" POOL")
+        self.coinsLabelP2.setText(str(sum(self.player_bets)))
 
     def update_bet_display(self):
         self.betLCD.display(self.current_bet)
 
         for btn in self.bet_buttons:
             value = int(btn.text())
-            btn.setEnabled(self.player_coins[self.current_player] >= value)
+            btn.setEnabled(self.player_coins[self.current_player - 1] >= value)
 
     # ------------------------------
     # BETTING LOGIC
@@ -134,7 +220,7 @@ class UrGame(QMainWindow):
     def handle_bet(self):
         value = int(self.sender().text())
 
-        if value > self.player_coins[self.current_player]:
+        if value > self.player_coins[self.current_player - 1]:
             self.statusLabel_2.setText("Not enough coins")
             return
 
@@ -150,15 +236,22 @@ class UrGame(QMainWindow):
             self.statusLabel_2.setText("Select a bet first")
             return
 
-        self.player_bets[self.current_player] = self.current_bet
+        if self.net:
+            self.net.send("bet", amount=self.current_bet)
+            return
+
+        self.player_bets[self.current_player - 1] = self.current_bet
         self.statusLabel_2.setText(f"Player {self.current_player} bet locked")
 
-        if self.current_player == 1:
-            self.current_player = 2
+        if self.current_player < self.players:
+            self.current_player += 1
             self.current_bet = 0
             self.betLCD.display(0)
             self.update_bet_display()
-            self.statusLabel_2.setText("Player 2 — choose your bet")
+            self.update_coin_labels()
+            self.statusLabel_2.setText(
+                f"Player {self.current_player} — choose your bet"
+            )
             return
 
         self.start_race()
@@ -167,9 +260,9 @@ class UrGame(QMainWindow):
     # START GAME
     # ------------------------------
     def start_race(self):
-        self.positions = {1: 0, 2: 0}
-        self.last_roll = 0
-        self.current_player = 1
+        self.state.reset()
+        if self.recorder:
+            self.rng = self.recorder.start(self.board_size, self.state.dice)
 
         self.statusLabel.setText("Race started! Player 1 roll the dice")
         self.diceLabel.setText("Roll the dice")
@@ -178,67 +271,159 @@ class UrGame(QMainWindow):
         self.stackedWidget.setCurrentWidget(self.GamePage)
 
     def roll_dice(self):
-        self.last_roll = random.randint(DICE_MIN, DICE_MAX)
-        self.diceLabel.setText(f"🎲 Dice Roll: {self.last_roll}")
+        if self.net:
+            self.net.send("roll")
+            return
+
+        roll = ur_engine.roll_dice(self.state, self.rng)
+        if self.recorder:
+            self.recorder.rolled(roll)
+        if self.autoplay.deferring:
+            return
+        self.diceLabel.setText(f"🎲 Dice Roll: {roll}")
         self.statusLabel.setText(
-            f"Player {self.current_player} rolled {self.last_roll}"
+            f"Player {self.state.current_player} rolled {roll}"
         )
 
     def move_piece(self):
-        if self.last_roll == 0:
+        if self.net:
+            self.net.send("move")
             return
 
-        new_pos = self.positions[self.current_player] + self.last_roll
+        if not ur_engine.move_piece(self.state):
+            return
+        if self.recorder:
+            self.recorder.moved()
 
-        if new_pos >= self.board_size:
-            self.end_game(self.current_player)
+        if self.state.winner:
+            self.end_game(self.state.winner)
+            return
+        if self.autoplay.deferring:
             return
 
-        self.positions[self.current_player] = new_pos
-        self.last_roll = 0
         self.update_board()
+        self.statusLabel.setText(f"Player {self.state.current_player} turn")
 
-        self.current_player = 2 if self.current_player == 1 else 1
-        self.statusLabel.setText(f"Player {self.current_player} turn")
+    def show_turn(self, roll):
+        """View after whole turns; auto-play calls this once per frame."""
+        self.diceLabel.setText(f"🎲 Dice Roll: {roll}")
+        self.update_board()
+        self.statusLabel.setText(f"Player {self.state.current_player} turn")
 
     def update_board(self):
-        for tile in self.board_tiles:
-            tile.clear()
-
-        for player, pos in self.positions.items():
-            if 0 <= pos < self.board_size:
-                pixmap = self.horses[player].scaled(
-                    TILE_SIZE,
-                    TILE_SIZE,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation,
-                )
-                self.board_tiles[pos].setPixmap(pixmap)
+        self.board.render(self.state.positions, self.devicePixelRatioF())
 
     def end_game(self, winner):
-        loser = 2 if winner == 1 else 1
+        bets = self.player_bets
+        deltas = self.settle(winner, bets)
+        for index, delta in enumerate(deltas):
+            self.player_coins[index] += delta
 
-        win_amount = self.player_bets[winner]
-        lose_amount = self.player_bets[loser]
+        if self.recorder:
+            self.recorder.finish(winner, bets, deltas)
 
-        self.player_coins[winner] += win_amount
-        self.player_coins[loser] -= lose_amount
+        self.show_result(winner)
 
+    def show_result(self, winner):
         self.update_coin_labels()
 
         self.winnerLabel.setText(f"🏆 Player {winner} Wins!")
         self.statusLabel.setText(f"Player {winner} wins the race!")
 
-        if self.player_coins[1] <= 0 or self.player_coins[2] <= 0:
+        if min(self.player_coins) <= 0:
             self.playAgainButton.setText("GAME OVER")
         else:
             self.playAgainButton.setText("NEXT RACE")
 
         self.stackedWidget.setCurrentWidget(self.ResultPage)
 
+    # ------------------------------
+    # ONLINE PLAY
+    # ------------------------------
+    def go_online_betting_page(self):
+        self.player_bets = array("q", [0, 0])
+        self.current_bet = 0
+        self.stackedWidget.setCurrentWidget(self.bettingPage)
+
+        if self.me is None:
+            self.net.connect_to_server()
+            self.net.send("join", variant=ONLINE_VARIANT)
+            self.statusLabel_2.setText("Looking for an opponent...")
+            return
+
+        self.update_bet_display()
+        self.update_coin_labels()
+        self.statusLabel_2.setText(f"Player {self.me} — choose your bet")
+
+    def apply_snapshot(self, snapshot):
+        self.state.positions = array("i", snapshot["positions"])
+        self.state.current_player = snapshot["current_player"]
+        self.state.last_roll = snapshot["last_roll"]
+        self.state.winner = snapshot["winner"]
+
+    def on_server_failed(self, message):
+        self.statusLabel.setText(f"Server: {message}")
+        self.statusLabel_2.setText(f"Server: {message}")
+
+    def on_server_message(self, message):
+        kind = message["type"]
+        if "coins" in message:
+            self.player_coins = array("q", message["coins"])
+            self.update_coin_labels()
+
+        if kind == "joined":
+            self.me = self.current_player = message["player"]
+            self.update_bet_display()
+            self.statusLabel_2.setText(
+                f"You are Player {self.me} — waiting for an opponent"
+            )
+        elif kind == "ready":
+            self.update_bet_display()
+            self.statusLabel_2.setText(f"Player {self.me} — choose your bet")
+        elif kind == "bet_locked":
+            who = "Your" if message["player"] == self.me else "Opponent's"
+            self.statusLabel_2.setText(f"{who} bet locked")
+        elif kind == "start":
+            self.player_bets = array("q", message["bets"])
+            self.apply_snapshot(message["state"])
+            self.statusLabel.setText("Race started! Player 1 roll the dice")
+            self.diceLabel.setText("Roll the dice")
+            self.update_board()
+            self.stackedWidget.setCurrentWidget(self.GamePage)
+        elif kind == "rolled":
+            self.apply_snapshot(message["state"])
+            self.diceLabel.setText(f"🎲 Dice Roll: {message['roll']}")
+            self.statusLabel.setText(
+                f"Player {message['player']} rolled {message['roll']}"
+            )
+        elif kind == "moved":
+            self.apply_snapshot(message["state"])
+            self.update_board()
+            self.statusLabel.setText(
+                f"Player {self.state.current_player} turn"
+            )
+        elif kind == "finished":
+            if message["over"]:
+                # the server has closed the match; the next visit to the
+                # betting page joins a new one
+                self.me = None
+            self.show_result(message["winner"])
+        elif kind == "opponent_left":
+            self.me = None
+            self.statusLabel_2.setText("Opponent left the match")
+            self.go_home()
+        elif kind == "error":
+            self.statusLabel.setText(message["message"])
+            self.statusLabel_2.setText(message["message"])
+
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
-    window = UrGame()
+    window = UrGame(
+        record=ur_cli.record_path(sys.argv[1:]),
+        server=server_address(sys.argv[1:]),
+        perf=ur_perf.perf_path(sys.argv[1:]),
+        players=ur_cli.player_count(sys.argv[1:]),
+    )
     window.show()
     sys.exit(app.exec())
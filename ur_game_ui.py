@@ -0,0 +1,278 @@
+# Form implementation generated from reading ui file 'ur_game.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(1207, 799)
+        self.centralwidget = QtWidgets.QWidget(parent=MainWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.stackedWidget = QtWidgets.QStackedWidget(parent=self.centralwidget)
+        self.stackedWidget.setGeometry(QtCore.QRect(160, 20, 971, 701))
+        self.stackedWidget.setObjectName("stackedWidget")
+        self.StartPage = QtWidgets.QWidget()
+        self.StartPage.setObjectName("StartPage")
+        self.label = QtWidgets.QLabel(parent=self.StartPage)
+        self.label.setGeometry(QtCore.QRect(80, 20, 101, 20))
+        self.label.setObjectName("label")
+        self.startButton = QtWidgets.QPushButton(parent=self.StartPage)
+        self.startButton.setGeometry(QtCore.QRect(90, 70, 79, 24))
+        self.startButton.setObjectName("startButton")
+        self.rulesButton = QtWidgets.QPushButton(parent=self.StartPage)
+        self.rulesButton.setGeometry(QtCore.QRect(90, 130, 79, 24))
+        self.rulesButton.setObjectName("rulesButton")
+        self.exitButton_2 = QtWidgets.QPushButton(parent=self.StartPage)
+        self.exitButton_2.setGeometry(QtCore.QRect(90, 180, 79, 24))
+        self.exitButton_2.setObjectName("exitButton_2")
+        self.stackedWidget.addWidget(self.StartPage)
+        self.GamePage = QtWidgets.QWidget()
+        self.GamePage.setObjectName("GamePage")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.GamePage)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.rollButton = QtWidgets.QPushButton(parent=self.GamePage)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.rollButton.sizePolicy().hasHeightForWidth())
+        self.rollButton.setSizePolicy(sizePolicy)
+        self.rollButton.setObjectName("rollButton")
+        self.verticalLayout.addWidget(self.rollButton)
+        self.moveButton = QtWidgets.QPushButton(parent=self.GamePage)
+        self.moveButton.setObjectName("moveButton")
+        self.verticalLayout.addWidget(self.moveButton)
+        self.diceLabel = QtWidgets.QLabel(parent=self.GamePage)
+        self.diceLabel.setObjectName("diceLabel")
+        self.verticalLayout.addWidget(self.diceLabel)
+        self.boardWidget = QtWidgets.QWidget(parent=self.GamePage)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.boardWidget.sizePolicy().hasHeightForWidth())
+        self.boardWidget.setSizePolicy(sizePolicy)
+        self.boardWidget.setMinimumSize(QtCore.QSize(300, 300))
+        self.boardWidget.setAutoFillBackground(False)
+        self.boardWidget.setObjectName("boardWidget")
+        self.tile_5 = QtWidgets.QLabel(parent=self.boardWidget)
+        self.tile_5.setGeometry(QtCore.QRect(420, 90, 49, 40))
+        self.tile_5.setMinimumSize(QtCore.QSize(40, 40))
+        self.tile_5.setScaledContents(True)
+        self.tile_5.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.tile_5.setObjectName("tile_5")
+        self.tile_4 = QtWidgets.QLabel(parent=self.boardWidget)
+        self.tile_4.setGeometry(QtCore.QRect(360, 90, 49, 40))
+        self.tile_4.setMinimumSize(QtCore.QSize(40, 40))
+        self.tile_4.setTextFormat(QtCore.Qt.TextFormat.RichText)
+        self.tile_4.setScaledContents(True)
+        self.tile_4.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.tile_4.setObjectName("tile_4")
+        self.tile_3 = QtWidgets.QLabel(parent=self.boardWidget)
+        self.tile_3.setGeometry(QtCore.QRect(300, 90, 49, 40))
+        self.tile_3.setMinimumSize(QtCore.QSize(40, 40))
+        self.tile_3.setScaledContents(True)
+        self.tile_3.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.tile_3.setObjectName("tile_3")
+        self.tile_2 = QtWidgets.QLabel(parent=self.boardWidget)
+        self.tile_2.setGeometry(QtCore.QRect(250, 90, 49, 40))
+        self.tile_2.setMinimumSize(QtCore.QSize(40, 40))
+        self.tile_2.setScaledContents(True)
+        self.tile_2.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.tile_2.setObjectName("tile_2")
+        self.tile_1 = QtWidgets.QLabel(parent=self.boardWidget)
+        self.tile_1.setGeometry(QtCore.QRect(190, 90, 49, 40))
+        self.tile_1.setMinimumSize(QtCore.QSize(40, 40))
+        self.tile_1.setScaledContents(True)
+        self.tile_1.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.tile_1.setObjectName("tile_1")
+        self.tile_0 = QtWidgets.QLabel(parent=self.boardWidget)
+        self.tile_0.setGeometry(QtCore.QRect(130, 90, 49, 40))
+        self.tile_0.setMinimumSize(QtCore.QSize(40, 40))
+        self.tile_0.setScaledContents(True)
+        self.tile_0.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.tile_0.setObjectName("tile_0")
+        self.tile_7 = QtWidgets.QLabel(parent=self.boardWidget)
+        self.tile_7.setGeometry(QtCore.QRect(540, 90, 49, 40))
+        self.tile_7.setMinimumSize(QtCore.QSize(40, 40))
+        self.tile_7.setScaledContents(True)
+        self.tile_7.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.tile_7.setObjectName("tile_7")
+        self.tile_9 = QtWidgets.QLabel(parent=self.boardWidget)
+        self.tile_9.setGeometry(QtCore.QRect(680, 90, 49, 40))
+        self.tile_9.setMinimumSize(QtCore.QSize(40, 40))
+        self.tile_9.setScaledContents(True)
+        self.tile_9.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.tile_9.setObjectName("tile_9")
+        self.tile_6 = QtWidgets.QLabel(parent=self.boardWidget)
+        self.tile_6.setGeometry(QtCore.QRect(480, 90, 49, 40))
+        self.tile_6.setMinimumSize(QtCore.QSize(40, 40))
+        self.tile_6.setScaledContents(True)
+        self.tile_6.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.tile_6.setObjectName("tile_6")
+        self.statusLabel = QtWidgets.QLabel(parent=self.boardWidget)
+        self.statusLabel.setGeometry(QtCore.QRect(0, 0, 451, 16))
+        self.statusLabel.setObjectName("statusLabel")
+        self.hintLabel = QtWidgets.QLabel(parent=self.boardWidget)
+        self.hintLabel.setGeometry(QtCore.QRect(0, 24, 451, 16))
+        self.hintLabel.setObjectName("hintLabel")
+        self.quitButton = QtWidgets.QPushButton(parent=self.boardWidget)
+        self.quitButton.setGeometry(QtCore.QRect(562, 3, 391, 21))
+        self.quitButton.setObjectName("quitButton")
+        self.autoButton = QtWidgets.QPushButton(parent=self.boardWidget)
+        self.autoButton.setGeometry(QtCore.QRect(562, 30, 190, 21))
+        self.autoButton.setCheckable(True)
+        self.autoButton.setObjectName("autoButton")
+        self.speedBox = QtWidgets.QComboBox(parent=self.boardWidget)
+        self.speedBox.setGeometry(QtCore.QRect(763, 30, 190, 21))
+        self.speedBox.setObjectName("speedBox")
+        self.tile_8 = QtWidgets.QLabel(parent=self.boardWidget)
+        self.tile_8.setGeometry(QtCore.QRect(620, 90, 49, 40))
+        self.tile_8.setMinimumSize(QtCore.QSize(40, 40))
+        self.tile_8.setScaledContents(True)
+        self.tile_8.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.tile_8.setObjectName("tile_8")
+        self.tile_10 = QtWidgets.QLabel(parent=self.boardWidget)
+        self.tile_10.setGeometry(QtCore.QRect(680, 140, 49, 40))
+        self.tile_10.setMinimumSize(QtCore.QSize(40, 40))
+        self.tile_10.setScaledContents(True)
+        self.tile_10.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.tile_10.setObjectName("tile_10")
+        self.tile_11 = QtWidgets.QLabel(parent=self.boardWidget)
+        self.tile_11.setGeometry(QtCore.QRect(620, 140, 49, 40))
+        self.tile_11.setMinimumSize(QtCore.QSize(40, 40))
+        self.tile_11.setScaledContents(True)
+        self.tile_11.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.tile_11.setObjectName("tile_11")
+        self.tile_12 = QtWidgets.QLabel(parent=self.boardWidget)
+        self.tile_12.setGeometry(QtCore.QRect(560, 140, 49, 40))
+        self.tile_12.setMinimumSize(QtCore.QSize(40, 40))
+        self.tile_12.setScaledContents(True)
+        self.tile_12.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.tile_12.setObjectName("tile_12")
+        self.tile_13 = QtWidgets.QLabel(parent=self.boardWidget)
+        self.tile_13.setGeometry(QtCore.QRect(500, 140, 49, 40))
+        self.tile_13.setMinimumSize(QtCore.QSize(40, 40))
+        self.tile_13.setScaledContents(True)
+        self.tile_13.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.tile_13.setObjectName("tile_13")
+        self.tile_14 = QtWidgets.QLabel(parent=self.boardWidget)
+        self.tile_14.setGeometry(QtCore.QRect(430, 140, 49, 40))
+        self.tile_14.setMinimumSize(QtCore.QSize(40, 40))
+        self.tile_14.setScaledContents(True)
+        self.tile_14.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.tile_14.setObjectName("tile_14")
+        self.tile_15 = QtWidgets.QLabel(parent=self.boardWidget)
+        self.tile_15.setGeometry(QtCore.QRect(370, 140, 49, 40))
+        self.tile_15.setMinimumSize(QtCore.QSize(40, 40))
+        self.tile_15.setScaledContents(True)
+        self.tile_15.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.tile_15.setObjectName("tile_15")
+        self.tile_16 = QtWidgets.QLabel(parent=self.boardWidget)
+        self.tile_16.setGeometry(QtCore.QRect(310, 140, 49, 40))
+        self.tile_16.setMinimumSize(QtCore.QSize(40, 40))
+        self.tile_16.setScaledContents(True)
+        self.tile_16.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.tile_16.setObjectName("tile_16")
+        self.tile_17 = QtWidgets.QLabel(parent=self.boardWidget)
+        self.tile_17.setGeometry(QtCore.QRect(250, 140, 49, 40))
+        self.tile_17.setMinimumSize(QtCore.QSize(40, 40))
+        self.tile_17.setScaledContents(True)
+        self.tile_17.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.tile_17.setObjectName("tile_17")
+        self.tile_18 = QtWidgets.QLabel(parent=self.boardWidget)
+        self.tile_18.setGeometry(QtCore.QRect(190, 140, 49, 40))
+        self.tile_18.setMinimumSize(QtCore.QSize(40, 40))
+        self.tile_18.setScaledContents(True)
+        self.tile_18.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.tile_18.setObjectName("tile_18")
+        self.tile_19 = QtWidgets.QLabel(parent=self.boardWidget)
+        self.tile_19.setGeometry(QtCore.QRect(130, 140, 49, 40))
+        self.tile_19.setMinimumSize(QtCore.QSize(40, 40))
+        self.tile_19.setScaledContents(True)
+        self.tile_19.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.tile_19.setObjectName("tile_19")
+        self.verticalLayout.addWidget(self.boardWidget)
+        self.stackedWidget.addWidget(self.GamePage)
+        self.ResultPage = QtWidgets.QWidget()
+        self.ResultPage.setObjectName("ResultPage")
+        self.winnerLabel = QtWidgets.QLabel(parent=self.ResultPage)
+        self.winnerLabel.setGeometry(QtCore.QRect(110, 30, 471, 141))
+        self.winnerLabel.setScaledContents(True)
+        self.winnerLabel.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.winnerLabel.setObjectName("winnerLabel")
+        self.playAgainButton = QtWidgets.QPushButton(parent=self.ResultPage)
+        self.playAgainButton.setGeometry(QtCore.QRect(170, 260, 79, 24))
+        self.playAgainButton.setObjectName("playAgainButton")
+        self.exitButton = QtWidgets.QPushButton(parent=self.ResultPage)
+        self.exitButton.setGeometry(QtCore.QRect(170, 310, 79, 24))
+        self.exitButton.setObjectName("exitButton")
+        self.stackedWidget.addWidget(self.ResultPage)
+        self.RulesPage = QtWidgets.QWidget()
+        self.RulesPage.setObjectName("RulesPage")
+        self.rulesLabel = QtWidgets.QLabel(parent=self.RulesPage)
+        self.rulesLabel.setGeometry(QtCore.QRect(140, 40, 301, 231))
+        self.rulesLabel.setWordWrap(True)
+        self.rulesLabel.setObjectName("rulesLabel")
+        self.rulesBackButton = QtWidgets.QPushButton(parent=self.RulesPage)
+        self.rulesBackButton.setGeometry(QtCore.QRect(130, 200, 79, 24))
+        self.rulesBackButton.setObjectName("rulesBackButton")
+        self.textBrowser = QtWidgets.QTextBrowser(parent=self.RulesPage)
+        self.textBrowser.setGeometry(QtCore.QRect(240, 90, 321, 192))
+        self.textBrowser.setObjectName("textBrowser")
+        self.stackedWidget.addWidget(self.RulesPage)
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.menubar = QtWidgets.QMenuBar(parent=MainWindow)
+        self.menubar.setGeometry(QtCore.QRect(0, 0, 1207, 33))
+        self.menubar.setObjectName("menubar")
+        MainWindow.setMenuBar(self.menubar)
+        self.statusbar = QtWidgets.QStatusBar(parent=MainWindow)
+        self.statusbar.setObjectName("statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+
+        self.retranslateUi(MainWindow)
+        self.stackedWidget.setCurrentIndex(2)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "MainWindow"))
+        self.label.setText(_translate("MainWindow", "Royal Game of UR"))
+        self.startButton.setText(_translate("MainWindow", "START"))
+        self.rulesButton.setText(_translate("MainWindow", "RULES"))
+        self.exitButton_2.setText(_translate("MainWindow", "EXIT"))
+        self.rollButton.setText(_translate("MainWindow", "ROLL DICE "))
+        self.moveButton.setText(_translate("MainWindow", "move"))
+        self.diceLabel.setText(_translate("MainWindow", "    DICE"))
+        self.statusLabel.setText(_translate("MainWindow", "  STATUS"))
+        self.hintLabel.setText(_translate("MainWindow", "  ODDS"))
+        self.quitButton.setText(_translate("MainWindow", "quit"))
+        self.autoButton.setText(_translate("MainWindow", "auto"))
+        self.playAgainButton.setText(_translate("MainWindow", "play again"))
+        self.exitButton.setText(_translate("MainWindow", "exit"))
+        self.rulesLabel.setText(_translate("MainWindow", " RULES"))
+        self.rulesBackButton.setText(_translate("MainWindow", "BACK"))
+        self.textBrowser.setHtml(_translate("MainWindow", "<!DOCTYPE HTML PUBLIC \"-//W3C//DTD HTML 4.0//EN\" \"http://www.w3.org/TR/REC-html40/strict.dtd\">\n"
+"<html><head><meta name=\"qrichtext\" content=\"1\" /><meta charset=\"utf-8\" /><style type=\"text/css\">\n"
+"p, li { white-space: pre-wrap; }\n"
+"hr { height: 1px; border-width: 0; }\n"
+"li.unchecked::marker { content: \"\\2610\"; }\n"
+"li.checked::marker { content: \"\\2612\"; }\n"
+"</style></head><body style=\" font-family:\'Segoe UI\'; font-size:9pt; font-weight:400; font-style:normal;\">\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\">Royal Game of Ur — Rules</p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\">1. Each player starts at tile 0.</p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\">2. On your turn, roll four binary dice (each die is 0 or 1).</p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\">3. Move your piece forward by the total rolled.</p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\">4. If you roll 0, your turn ends immediately.</p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\">5. Players take turns.</p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\">6. The first player to reach the final tile wins the game.</p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><br /></p></body></html>"))
+
+
+UI_SOURCE_SHA256 = "4c934f8d9a0ce0660da6029be8aa6150f5e3cee92aa9d2c351e7f52b9c831512"
@@ -0,0 +1,251 @@
+import argparse
+import asyncio
+import os
+import resource
+import socket
+import time
+
+import numpy as np
+
+import ur_record
+import ur_server
+from ur_bankroll import BET_LADDER
+
+# --------------------------------------------------
+# CONSTANTS
+# --------------------------------------------------
+DEFAULT_STAGES = [10, 100, 1000]
+DEFAULT_RACES = 3
+PERCENTILES = (50, 99)
+MAX_FDS = 1 << 16          # soft fd limit when the hard one is unlimited
+
+
+def rss_bytes():
+    """Resident set size of this process (Linux), else peak RSS."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        # ru_maxrss is KiB on Linux, bytes on macOS; close enough here
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def raise_fd_limit():
+    """Each in-process bot holds two sockets; lift the soft fd limit.
+
+    An unlimited hard limit is not a valid soft limit (macOS also caps
+    it at OPEN_MAX), so aim for MAX_FDS then; if the system still says
+    no, keep the current limit and let large stages fail on their own.
+    """
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    target = MAX_FDS if hard == resource.RLIM_INFINITY else hard
+    if soft != resource.RLIM_INFINITY and target > soft:
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+        except (ValueError, OSError):
+            pass
+
+
+# --------------------------------------------------
+# CONNECTIONS
+# --------------------------------------------------
+class LocalServer:
+    """The real UrServer, fed over socketpairs: no listening socket and
+    no network, but the same framing, parsing and dispatch."""
+
+    def __init__(self):
+        self.server = ur_server.UrServer()
+        self._tasks = set()
+
+    async def connect(self):
+        ours, theirs = socket.socketpair()
+        reader, writer = await asyncio.open_connection(sock=theirs)
+        task = asyncio.ensure_future(
+            self.server.handle_client(reader, writer)
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return await ur_server.UrClient.connect(sock=ours)
+
+    async def close(self):
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+class RemoteServer:
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+
+    async def connect(self):
+        return await ur_server.UrClient.connect(self.host, self.port)
+
+    async def close(self):
+        pass
+
+
+# --------------------------------------------------
+# BOT
+# --------------------------------------------------
+class Bot:
+    """Plays like a person at ur_game_bet: pick a rung it can afford
+    (handle_bet), lock it (confirm_bet), then roll and move on its turn
+    until the race is won."""
+
+    def __init__(self, client, rng, latencies):
+        self.client = client
+        self.rng = rng
+        self.latencies = latencies
+        self.player = 0
+        self.coins = 0
+        self.turns = 0
+
+    async def timed(self, kind, **fields):
+        start = time.perf_counter()
+        reply = await self.client.request(kind, **fields)
+        self.latencies.append(time.perf_counter() - start)
+        if reply["type"] == "error":
+            raise RuntimeError(f"{kind}: {reply['message']}")
+        return reply
+
+    async def join(self):
+        reply = await self.timed("join", variant=ur_record.BET)
+        self.player = reply["player"]
+        self.coins = reply["coins"][self.player - 1]
+
+    async def play(self, races):
+        await self.client.next_event("ready")
+        for _ in range(races):
+            affordable = BET_LADDER[BET_LADDER <= self.coins]
+            await self.timed("bet", amount=int(self.rng.choice(affordable)))
+            start = await self.client.next_event("start")
+            finished = await self.race(start["state"])
+            self.coins = finished["coins"][self.player - 1]
+            if finished["over"]:
+                break
+
+    async def race(self, state):
+        client = self.client
+        while not state["winner"]:
+            if state["current_player"] != self.player:
+                event = await client.next_event("rolled", "moved",
+                                                "opponent_left")
+                if event["type"] == "opponent_left":
+                    raise RuntimeError("Opponent left mid-race")
+                state = event["state"]
+                continue
+            state = (await self.timed("roll"))["state"]
+            self.turns += 1
+            if state["last_roll"]:
+                state = (await self.timed("move"))["state"]
+        return await client.next_event("finished")
+
+
+# --------------------------------------------------
+# STAGES
+# --------------------------------------------------
+class StageResult:
+    __slots__ = ("matches", "turns", "requests", "elapsed", "latency_ms",
+                 "bytes_per_match")
+
+    def __init__(self, matches, turns, latencies, elapsed, bytes_per_match):
+        self.matches = matches
+        self.turns = turns
+        self.requests = len(latencies)
+        self.elapsed = elapsed
+        self.latency_ms = np.percentile(latencies, PERCENTILES) * 1000
+        self.bytes_per_match = bytes_per_match
+
+    @property
+    def turns_per_second(self):
+        return self.turns / self.elapsed if self.elapsed else 0.0
+
+    def row(self):
+        p50, p99 = self.latency_ms
+        return (
+            f"{self.matches:>8} {self.turns:>9} {self.elapsed:8.2f} "
+            f"{self.turns_per_second:11.0f} {p50:9.3f} {p99:9.3f} "
+            f"{self.bytes_per_match / 1024:10.1f}"
+        )
+
+
+HEADER_ROW = (
+    f"{'matches':>8} {'turns':>9} {'seconds':>8} {'turns/s':>11} "
+    f"{'p50 ms':>9} {'p99 ms':>9} {'KiB/match':>10}"
+)
+
+
+async def run_stage(target, matches, races, seed=None):
+    """`matches` concurrent matches (two bots each) for `races` races."""
+    rng = np.random.default_rng(seed)
+    latencies = []
+    baseline = rss_bytes()
+
+    clients = [await target.connect() for _ in range(matches * 2)]
+    bots = [Bot(client, rng, latencies) for client in clients]
+    # join in order so neighbours pair up in the same match
+    for bot in bots:
+        await bot.join()
+    per_match = max(rss_bytes() - baseline, 0) / matches
+
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(*(bot.play(races) for bot in bots))
+    finally:
+        elapsed = time.perf_counter() - start
+        for client in clients:
+            await client.close()
+
+    turns = sum(bot.turns for bot in bots)
+    return StageResult(matches, turns, latencies, elapsed, per_match)
+
+
+async def ramp(stages, races, connect=None, seed=None, log=print):
+    results = []
+    for index, matches in enumerate(stages):
+        target = RemoteServer(*connect) if connect else LocalServer()
+        try:
+            stage_seed = None if seed is None else seed + index
+            result = await run_stage(target, matches, races, stage_seed)
+        finally:
+            await target.close()
+        results.append(result)
+        if log:
+            log(result.row())
+    return results
+
+
+# --------------------------------------------------
+# CLI
+# --------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ur server load test")
+    parser.add_argument("--matches", type=int, nargs="+",
+                        default=DEFAULT_STAGES,
+                        help="concurrent matches per stage (two bots each)")
+    parser.add_argument("--races", type=int, default=DEFAULT_RACES,
+                        help="races per match")
+    parser.add_argument("--connect", default=None, metavar="HOST:PORT",
+                        help="load a running ur_server instead of the "
+                             "in-process stand-in")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    connect = None
+    if args.connect:
+        host, _, port = args.connect.partition(":")
+        connect = (host or ur_server.DEFAULT_HOST,
+                   int(port or ur_server.DEFAULT_PORT))
+
+    raise_fd_limit()
+    if connect:
+        print(f"server: {connect[0]}:{connect[1]}; memory is the bots' RSS")
+    else:
+        print("server: in-process; memory is RSS of server and bots")
+    print(HEADER_ROW)
+    asyncio.run(ramp(args.matches, args.races, connect, args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtNetwork import QAbstractSocket, QTcpSocket
+
+import ur_protocol
+
+
+def server_address(argv):
+    """`--server HOST:PORT` (or just HOST) from the command line."""
+    if "--server" not in argv:
+        return None
+    index = argv.index("--server")
+    if index + 1 >= len(argv):
+        return None
+    host, _, port = argv[index + 1].partition(":")
+    return (
+        host or ur_protocol.DEFAULT_HOST,
+        int(port or ur_protocol.DEFAULT_PORT),
+    )
+
+
+# --------------------------------------------------
+# SERVER CONNECTION (GUI thread)
+# --------------------------------------------------
+class NetClient(QObject):
+    """ur_server protocol over a QTcpSocket; messages arrive as
+    `messageReceived(dict)` from the Qt event loop, so no thread or
+    asyncio loop is needed in the window."""
+
+    messageReceived = pyqtSignal(object)
+    connected = pyqtSignal()
+    disconnected = pyqtSignal()
+    failed = pyqtSignal(str)
+
+    def __init__(self, host, port, parent=None):
+        super().__init__(parent)
+        self.host = host
+        self.port = port
+        self._buffer = bytearray()
+        self._socket = QTcpSocket(self)
+        self._socket.connected.connect(self.connected)
+        self._socket.disconnected.connect(self.disconnected)
+        self._socket.readyRead.connect(self._read)
+        self._socket.errorOccurred.connect(
+            lambda error: self.failed.emit(self._socket.errorString())
+        )
+
+    def connect_to_server(self):
+        """Connect unless already connected or connecting; messages sent
+        meanwhile are buffered by the socket."""
+        unconnected = QAbstractSocket.SocketState.UnconnectedState
+        if self._socket.state() == unconnected:
+            self._socket.connectToHost(self.host, self.port)
+
+    def send(self, kind, **fields):
+        self._socket.write(ur_protocol.encode({"type": kind, **fields}))
+
+    def close(self):
+        self._socket.disconnectFromHost()
+
+    def _read(self):
+        self._buffer += bytes(self._socket.readAll())
+        header = ur_protocol.HEADER.size
+        while len(self._buffer) >= header:
+            (length,) = ur_protocol.HEADER.unpack_from(self._buffer)
+            if len(self._buffer) < header + length:
+                break
+            body = bytes(self._buffer[header:header + length])
+            del self._buffer[:header + length]
+            try:
+                message = ur_protocol.decode(body)
+            except ur_protocol.ProtocolError as exc:
+                self.failed.emit(str(exc))
+                continue
+            self.messageReceived.emit(message)
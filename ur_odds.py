@@ -0,0 +1,71 @@
+import functools
+from array import array
+
+import ur_solver
+from ur_engine import D6
+
+
+# --------------------------------------------------
+# FAIR ODDS
+# --------------------------------------------------
+class FairOdds:
+    """Zero-edge payouts for a race from the starting position.
+
+    A winning bet on player k pays `multipliers[k]` coins per coin staked
+    (the stake itself is never taken), so each bettor's expected gain is
+    zero: p * m - (1 - p) = 0  =>  m = (1 - p) / p.
+    """
+
+    __slots__ = ("board_size", "dice", "win_probs", "multipliers")
+
+    def __init__(self, board_size, dice, p1_wins):
+        self.board_size = board_size
+        self.dice = dice
+        self.win_probs = {1: p1_wins, 2: 1.0 - p1_wins}
+        self.multipliers = {
+            player: (1.0 - p) / p if p > 0 else float("inf")
+            for player, p in self.win_probs.items()
+        }
+
+    def payout(self, player, bet):
+        """Coins won by a winning `bet` on `player`."""
+        return int(round(bet * self.multipliers[player]))
+
+    def settle(self, winner, bets):
+        """Coin changes (player 1, player 2) once `winner` has won; `bets`
+        is (bet 1, bet 2). The loser forfeits their bet."""
+        loser = 2 if winner == 1 else 1
+        deltas = {
+            winner: self.payout(winner, bets[winner - 1]),
+            loser: -bets[loser - 1],
+        }
+        return deltas[1], deltas[2]
+
+    def describe(self, player):
+        return f"P{player} wins pay {self.multipliers[player]:.2f} : 1"
+
+
+@functools.lru_cache(maxsize=None)
+def fair_odds(board_size, dice=D6):
+    table = ur_solver.odds_table(board_size, dice)
+    return FairOdds(board_size, dice, table.start())
+
+
+# --------------------------------------------------
+# PARI-MUTUEL POOL (fields of more than two)
+# --------------------------------------------------
+def pool_settle(winner, bets):
+    """Coin changes per player for a pari-mutuel race: every stake goes
+    into one pool, and the winner, the only backer of their own horse,
+    takes all of it. Zero-sum, in one pass over `bets`."""
+    deltas = array("q", bets)
+    pool = 0
+    for index, bet in enumerate(bets):
+        pool += bet
+        deltas[index] = -bet
+    deltas[winner - 1] += pool
+    return deltas
+
+
+def describe_pool(players):
+    return f"{players} horses: the winner takes the pool"
@@ -0,0 +1,140 @@
+import functools
+import json
+import os
+import time
+from collections import deque
+
+# --------------------------------------------------
+# CONSTANTS
+# --------------------------------------------------
+WINDOW = 512                # samples kept per metric for the rolling quantiles
+QUANTILES = (0.5, 0.99)
+DEFAULT_FILE = "ur_perf.jsonl"
+PROMETHEUS_SUFFIXES = (".prom", ".txt")
+
+# what a slow metric points at
+LOGIC = "logic"
+RENDER = "render"
+ASSETS = "assets"
+LOOP = "loop"
+
+
+def perf_path(argv):
+    """`--perf [FILE]` on the command line, else $UR_PERF, else None.
+
+    UR_PERF=1 (or a bare --perf) writes to DEFAULT_FILE; a file ending
+    in .prom or .txt gets Prometheus text instead of JSONL.
+    """
+    if "--perf" in argv:
+        index = argv.index("--perf")
+        if index + 1 < len(argv) and not argv[index + 1].startswith("-"):
+            return argv[index + 1]
+        return DEFAULT_FILE
+    value = os.environ.get("UR_PERF", "")
+    if value in ("", "0"):
+        return None
+    return DEFAULT_FILE if value == "1" else value
+
+
+# --------------------------------------------------
+# METRICS
+# --------------------------------------------------
+class Metric:
+    """Lifetime counters plus the last WINDOW samples, in seconds."""
+
+    __slots__ = ("name", "kind", "count", "total", "max", "samples")
+
+    def __init__(self, name, kind):
+        self.name = name
+        self.kind = kind
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples = deque(maxlen=WINDOW)
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.samples.append(seconds)
+
+    def quantiles(self, qs=QUANTILES):
+        if not self.samples:
+            return [0.0] * len(qs)
+        ordered = sorted(self.samples)
+        last = len(ordered) - 1
+        return [ordered[min(last, int(q * len(ordered)))] for q in qs]
+
+
+class Perf:
+    def __init__(self):
+        self.metrics = {}
+        self.started = time.time()
+
+    def metric(self, name, kind=LOGIC):
+        metric = self.metrics.get(name)
+        if metric is None:
+            metric = self.metrics[name] = Metric(name, kind)
+        return metric
+
+    def record(self, name, seconds, kind=LOGIC):
+        self.metric(name, kind).add(seconds)
+
+    def wrap(self, name, func, kind=LOGIC):
+        metric = self.metric(name, kind)
+
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                metric.add(time.perf_counter() - start)
+
+        return timed
+
+    def snapshot(self):
+        metrics = {}
+        for name, metric in self.metrics.items():
+            p50, p99 = metric.quantiles()
+            metrics[name] = {
+                "kind": metric.kind,
+                "count": metric.count,
+                "total_ms": metric.total * 1000,
+                "p50_ms": p50 * 1000,
+                "p99_ms": p99 * 1000,
+                "max_ms": metric.max * 1000,
+            }
+        return {"time": time.time(), "uptime": time.time() - self.started,
+                "metrics": metrics}
+
+    # --------------------------------------------------
+    # EXPORT
+    # --------------------------------------------------
+    def prometheus(self):
+        lines = [
+            "# HELP ur_perf_seconds Time spent per handler, paint and "
+            "event-loop delay.",
+            "# TYPE ur_perf_seconds summary",
+        ]
+        for name, metric in sorted(self.metrics.items()):
+            labels = f'name="{name}",kind="{metric.kind}"'
+            for q, value in zip(QUANTILES, metric.quantiles()):
+                lines.append(
+                    f'ur_perf_seconds{{{labels},quantile="{q}"}} {value:.9f}'
+                )
+            lines.append(f"ur_perf_seconds_sum{{{labels}}} {metric.total:.9f}")
+            lines.append(f"ur_perf_seconds_count{{{labels}}} {metric.count}")
+        return "\n".join(lines) + "\n"
+
+    def export(self, path):
+        """Prometheus text replaces the file; JSONL appends one snapshot."""
+        if path.endswith(PROMETHEUS_SUFFIXES):
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "w") as f:
+                f.write(self.prometheus())
+            os.replace(tmp, path)
+        else:
+            with open(path, "a") as f:
+                f.write(json.dumps(self.snapshot()) + "\n")
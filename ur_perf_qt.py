@@ -0,0 +1,135 @@
+import inspect
+import time
+
+from PyQt6.QtCore import QCoreApplication, QObject, Qt, QTimer
+from PyQt6.QtGui import QFont
+from PyQt6.QtWidgets import QLabel
+
+import ur_perf
+
+# --------------------------------------------------
+# CONSTANTS
+# --------------------------------------------------
+PROBE_MS = 100          # event-loop probe interval
+OVERLAY_MS = 500
+EXPORT_MS = 5000
+OVERLAY_STYLE = (
+    "background-color: rgba(0, 0, 0, 160); color: #9f9; "
+    "padding: 3px; border-radius: 3px;"
+)
+
+
+class PerfMonitor(QObject):
+    """Opt-in timings for one window.
+
+    Handlers are wrapped on the instance before the window connects its
+    signals, so button clicks, AI turns and internal calls are all
+    counted. `attach` adds board paint time, sprite decoding and an
+    event-loop probe (how late a PROBE_MS timer fires), shows rolling
+    p50/p99 on the game page and exports every EXPORT_MS and on exit.
+    """
+
+    def __init__(self, path, window, handlers):
+        super().__init__(window)
+        self.path = path
+        self.perf = ur_perf.Perf()
+        self.overlay = None
+        self.error = None
+        for name in handlers:
+            setattr(window, name, self.timed_slot(name, getattr(window, name)))
+
+        self._last = None
+        self._probe = QTimer(self)
+        self._probe.setTimerType(Qt.TimerType.PreciseTimer)
+        self._probe.timeout.connect(self._tick)
+        self._refresh = QTimer(self)
+        self._refresh.timeout.connect(self.update_overlay)
+        self._export = QTimer(self)
+        self._export.timeout.connect(self.export)
+        QCoreApplication.instance().aboutToQuit.connect(self.export)
+
+    def timed_slot(self, name, method):
+        """A timed stand-in for a bound method. PyQt drops surplus signal
+        arguments (clicked's `checked`) to fit a method's signature, but
+        not for a *args wrapper, so trim them here."""
+        timed = self.perf.wrap(name, method)
+        params = inspect.signature(method).parameters.values()
+        if any(p.kind == p.VAR_POSITIONAL for p in params):
+            return timed
+        positional = sum(
+            p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)
+            for p in params
+        )
+
+        def slot(*args, **kwargs):
+            return timed(*args[:positional], **kwargs)
+
+        return slot
+
+    def attach(self, board, pixmaps, page):
+        board.paintEvent = self.perf.wrap(
+            "paint", board.paintEvent, ur_perf.RENDER
+        )
+        # cache misses only: a source image decoded (atlas or PNG) or
+        # a pre-rendered size cut from the atlas; cached lookups and
+        # composites built from cached sources are not loads
+        pixmaps.load_source = self.perf.wrap(
+            "asset_load", pixmaps.load_source, ur_perf.ASSETS
+        )
+        if pixmaps.atlas is not None:
+            pixmaps.atlas.get = self.perf.wrap(
+                "asset_load", pixmaps.atlas.get, ur_perf.ASSETS
+            )
+        self.perf.metric("loop_lag", ur_perf.LOOP)
+
+        self.overlay = QLabel(page)
+        self.overlay.setFont(QFont("monospace", 8))
+        self.overlay.setStyleSheet(OVERLAY_STYLE)
+        self.overlay.setAttribute(
+            Qt.WidgetAttribute.WA_TransparentForMouseEvents
+        )
+        self.update_overlay()
+
+        self._probe.start(PROBE_MS)
+        self._refresh.start(OVERLAY_MS)
+        self._export.start(EXPORT_MS)
+
+    def _tick(self):
+        now = time.perf_counter()
+        if self._last is not None:
+            late = now - self._last - PROBE_MS / 1000
+            self.perf.record("loop_lag", max(late, 0.0), ur_perf.LOOP)
+        self._last = now
+
+    def update_overlay(self):
+        lines = [f"{'':<12}{'p50 ms':>8}{'p99 ms':>8}{'n':>6}"]
+        for name, metric in self.perf.metrics.items():
+            p50, p99 = metric.quantiles()
+            lines.append(
+                f"{name:<12}{p50 * 1000:8.2f}{p99 * 1000:8.2f}"
+                f"{metric.count:6d}"
+            )
+        if self.error:
+            lines.append(self.error)
+        self.overlay.setText("\n".join(lines))
+        self.overlay.adjustSize()
+        page = self.overlay.parentWidget()
+        self.overlay.move(
+            page.width() - self.overlay.width() - 4,
+            page.height() - self.overlay.height() - 4,
+        )
+        self.overlay.raise_()
+
+    def export(self):
+        """Write the counters to `path`. A failure stops the periodic
+        export and is shown on the overlay rather than raised, since an
+        exception escaping a Qt slot would take the window down."""
+        if self.error:
+            return
+        try:
+            self.perf.export(self.path)
+        except OSError as exc:
+            self.error = f"export failed: {exc.strerror or exc}"
+            self._export.stop()
+            if self.overlay is not None:
+                self.update_overlay()
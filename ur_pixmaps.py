@@ -0,0 +1,243 @@
+import base64
+import math
+import os
+import zlib
+from collections import OrderedDict
+
+from PyQt6.QtCore import QBuffer, QByteArray, QIODevice, Qt
+from PyQt6.QtGui import QColor, QImage, QPainter, QPixmap
+
+try:
+    import ur_sprites_rc
+except ImportError:  # atlas not built, fall back to the PNG files
+    ur_sprites_rc = None
+
+# --------------------------------------------------
+# CONSTANTS
+# --------------------------------------------------
+DEFAULT_MAXSIZE = 32
+WINNER_PIXELS = 140     # the 70 px winner <img>, sharp up to 2x
+
+# horses past the two classic sprites are "<asset>@<hue>": the asset
+# recoloured to that hue
+BASE_HORSES = ("horse_white", "horse_blue")
+TINT_SEPARATOR = "@"
+
+
+def horse_assets(players):
+    """Sprite name per player: the two classic horses, then the white
+    horse tinted at evenly spaced hues."""
+    horses = dict(enumerate(BASE_HORSES[:players], 1))
+    extra = players - len(BASE_HORSES)
+    for index in range(max(extra, 0)):
+        hue = index * 360 // extra
+        horses[len(BASE_HORSES) + index + 1] = (
+            f"{BASE_HORSES[0]}{TINT_SEPARATOR}{hue}"
+        )
+    return horses
+
+
+def tint(pixmap, hue):
+    """`pixmap` filled with one colour, keeping its alpha."""
+    tinted = QPixmap(pixmap.size())
+    tinted.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(tinted)
+    painter.drawPixmap(0, 0, pixmap)
+    painter.setCompositionMode(
+        QPainter.CompositionMode.CompositionMode_SourceIn
+    )
+    painter.fillRect(tinted.rect(), QColor.fromHsv(hue % 360, 200, 220))
+    painter.end()
+    return tinted
+
+
+# --------------------------------------------------
+# SPRITE ATLAS
+# --------------------------------------------------
+class SpriteAtlas:
+    """Sprites pre-rendered by ur_assets.py, unpacked on first use."""
+
+    def __init__(self, module):
+        self.module = module
+        self._atlas = None
+
+    def _pixmap(self):
+        if self._atlas is None:
+            module = self.module
+            pixels = zlib.decompress(module.ATLAS_DATA)
+            image = QImage(
+                pixels,
+                module.ATLAS_WIDTH,
+                module.ATLAS_HEIGHT,
+                module.ATLAS_WIDTH * 4,
+                QImage.Format.Format_ARGB32_Premultiplied,
+            )
+            # QImage only borrows `pixels`; detach before it is released
+            self._atlas = QPixmap.fromImage(image.copy())
+        return self._atlas
+
+    def get(self, name, size, dpr=1.0):
+        rect = self.module.SPRITES.get((name, size, dpr))
+        if rect is None:
+            return None
+        pixmap = self._pixmap().copy(*rect)
+        pixmap.setDevicePixelRatio(dpr)
+        return pixmap
+
+    def largest(self, name):
+        keys = [key for key in self.module.SPRITES if key[0] == name]
+        if not keys:
+            return None
+        key = max(keys, key=lambda key: self.module.SPRITES[key][2])
+        return self._pixmap().copy(*self.module.SPRITES[key])
+
+
+def default_atlas():
+    return SpriteAtlas(ur_sprites_rc) if ur_sprites_rc else None
+
+
+def png_data_uri(pixmap):
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    pixmap.save(buffer, "PNG")
+    buffer.close()
+    encoded = base64.b64encode(bytes(data)).decode("ascii")
+    return f"data:image/png;base64,{encoded}"
+
+
+def image_src(name, asset_dir, pixmaps):
+    """Something a rich-text <img src=...> can display for `name`.
+    Tinted horses have no pre-rendered image, so they are tinted by
+    `pixmaps` and inlined as a PNG data URI."""
+    if TINT_SEPARATOR in name:
+        return png_data_uri(pixmaps.source(name).scaled(
+            WINNER_PIXELS,
+            WINNER_PIXELS,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        ))
+    if ur_sprites_rc and name in ur_sprites_rc.WINNER_IMAGES:
+        return "".join(ur_sprites_rc.WINNER_IMAGES[name])
+    return os.path.join(asset_dir, f"{name}.png").replace("\\", "/")
+
+
+# --------------------------------------------------
+# PIXMAP CACHE
+# --------------------------------------------------
+class PixmapCache:
+    """Decoded and pre-scaled pixmaps keyed by (asset, size, dpr).
+
+    Assets are sprite names. Sizes pre-rendered into the sprite atlas are
+    cut straight out of it; anything else is scaled from a source image,
+    which is the largest atlas sprite or, without an atlas, the PNG in
+    `asset_dir`. Scaled copies are kept in a bounded LRU; a change of
+    device pixel ratio drops every scaled copy, and a change of tile size
+    simply stops hitting the old entries, which the LRU then ages out.
+    """
+
+    def __init__(self, asset_dir, maxsize=DEFAULT_MAXSIZE, atlas=None):
+        self.asset_dir = asset_dir
+        self.maxsize = maxsize
+        self.atlas = atlas if atlas is not None else default_atlas()
+        self._sources = {}
+        self._scaled = OrderedDict()
+        self._dpr = None
+
+    def source(self, asset):
+        pixmap = self._sources.get(asset)
+        if pixmap is None:
+            pixmap = self._sources[asset] = self.load_source(asset)
+        return pixmap
+
+    def load_source(self, asset):
+        """Decode the full-size image for `asset`, uncached: the largest
+        atlas sprite, else the PNG; tinted names recolour their base."""
+        base, _, hue = asset.partition(TINT_SEPARATOR)
+        if hue:
+            return tint(self.source(base), int(hue))
+        pixmap = None
+        if self.atlas is not None:
+            pixmap = self.atlas.largest(asset)
+        if pixmap is None:
+            pixmap = QPixmap(os.path.join(self.asset_dir, f"{asset}.png"))
+        return pixmap
+
+    def get(self, asset, size, dpr=1.0):
+        if dpr != self._dpr:
+            self.invalidate()
+            self._dpr = dpr
+
+        key = (asset, size, dpr)
+        pixmap = self._scaled.get(key)
+        if pixmap is not None:
+            self._scaled.move_to_end(key)
+            return pixmap
+
+        if self.atlas is not None:
+            pixmap = self.atlas.get(asset, size, dpr)
+            if pixmap is not None:
+                return self._store(key, pixmap)
+
+        pixels = max(1, round(size * dpr))
+        pixmap = self.source(asset).scaled(
+            pixels,
+            pixels,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+        pixmap.setDevicePixelRatio(dpr)
+        return self._store(key, pixmap)
+
+    def group(self, assets, size, dpr=1.0):
+        """One tile-sized pixmap showing several horses: side by side for
+        two, in a near-square grid for a crowd."""
+        assets = tuple(assets)
+        if len(assets) == 1:
+            return self.get(assets[0], size, dpr)
+        if dpr != self._dpr:
+            self.invalidate()
+            self._dpr = dpr
+
+        key = (assets, size, dpr)
+        pixmap = self._scaled.get(key)
+        if pixmap is not None:
+            self._scaled.move_to_end(key)
+            return pixmap
+
+        pixels = max(1, round(size * dpr))
+        columns = math.ceil(math.sqrt(len(assets)))
+        rows = math.ceil(len(assets) / columns)
+        slot = pixels / columns
+        row_height = pixels / rows
+        pixmap = QPixmap(pixels, pixels)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
+        for index, asset in enumerate(assets):
+            row, column = divmod(index, columns)
+            horse = self.source(asset).scaled(
+                max(1, int(slot)),
+                max(1, int(row_height)),
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+            x = int(column * slot + (slot - horse.width()) / 2)
+            y = int(row * row_height + (row_height - horse.height()) / 2)
+            painter.drawPixmap(x, y, horse)
+        painter.end()
+
+        pixmap.setDevicePixelRatio(dpr)
+        return self._store(key, pixmap)
+
+    def _store(self, key, pixmap):
+        self._scaled[key] = pixmap
+        if len(self._scaled) > self.maxsize:
+            self._scaled.popitem(last=False)
+        return pixmap
+
+    def invalidate(self):
+        self._scaled.clear()
+
+    def __len__(self):
+        return len(self._scaled)
@@ -0,0 +1,44 @@
+import json
+import struct
+
+# --------------------------------------------------
+# CONSTANTS
+# --------------------------------------------------
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_MESSAGE = 64 * 1024
+
+
+# --------------------------------------------------
+# WIRE FORMAT
+# --------------------------------------------------
+# Every message is a 4-byte big-endian length followed by a UTF-8 JSON
+# object with a "type". A request may carry an "id"; the message that
+# answers it echoes the id. Client -> server:
+#     join {variant, match?}   bet {amount}   ready   roll   move   leave
+# Server -> client:
+#     joined, ready, bet_locked, start, rolled, moved, finished,
+#     opponent_left, error {message}
+#
+# Standard library only, so the betting window can speak it without
+# loading the server (and NumPy behind it).
+HEADER = struct.Struct(">I")
+
+
+class ProtocolError(Exception):
+    pass
+
+
+def encode(message):
+    body = json.dumps(message, separators=(",", ":")).encode()
+    return HEADER.pack(len(body)) + body
+
+
+def decode(body):
+    try:
+        message = json.loads(body)
+    except ValueError as exc:
+        raise ProtocolError(f"Bad message: {exc}") from None
+    if not isinstance(message, dict) or "type" not in message:
+        raise ProtocolError("Message needs a type")
+    return message
@@ -0,0 +1,420 @@
+import argparse
+import mmap
+import os
+import random
+
+import ur_engine
+import ur_odds
+import ur_royal
+from ur_dice import DiceStream
+from ur_engine import BINARY4, D6
+
+# --------------------------------------------------
+# CONSTANTS
+# --------------------------------------------------
+RECORD_VERSION = 1
+MAGIC = b"URREC" + bytes([RECORD_VERSION])
+
+CLASSIC = "classic"   # ur_game.py
+BET = "bet"           # ur_game_bet.py
+PRO = "pro"           # versions/pro/ur_game_PRO.py
+ROYAL = "royal"       # ur_royal full rules
+VARIANTS = (CLASSIC, BET, PRO, ROYAL)
+DICE = (D6, BINARY4)
+
+# an event packs (roll, move) into one varint: roll << 4 | move. Race
+# moves are always ADVANCE; full-rules moves are from-squares 0–14.
+ADVANCE = 0
+NO_MOVE = 15
+
+# --------------------------------------------------
+# FILE FORMAT
+# --------------------------------------------------
+# A file is MAGIC followed by records. Each record is
+#     varint  payload length
+#     payload:
+#         varint  seed + 1 (0 = not seeded)
+#         varint  variant, board size, dice
+#         varint  event count, then one varint per event
+#         varint  winner (0 = none), bet 1, bet 2
+#         zigzag  coin change 1, coin change 2
+# Appending never rewrites earlier bytes, and a reader stops cleanly at a
+# record cut short by a crash.
+
+
+# --------------------------------------------------
+# VARINTS
+# --------------------------------------------------
+def put_varint(out, value):
+    if value < 0:
+        raise ValueError("Varints are unsigned; use zigzag for signed")
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def get_varint(buf, pos):
+    """Return (value, next position)."""
+    byte = buf[pos]
+    if byte < 0x80:
+        return byte, pos + 1
+    value = byte & 0x7F
+    shift = 7
+    while True:
+        pos += 1
+        byte = buf[pos]
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos + 1
+        shift += 7
+
+
+def zigzag(value):
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def unzigzag(value):
+    return value >> 1 if not value & 1 else -(value >> 1) - 1
+
+
+def pack_event(roll, move):
+    return roll << 4 | move
+
+
+# --------------------------------------------------
+# RECORD
+# --------------------------------------------------
+class GameRecord:
+    """One finished game. `events` holds packed (roll, move) ints;
+    `winner` is 1 or 2 (LIGHT is 1 under full rules)."""
+
+    __slots__ = (
+        "variant",
+        "board_size",
+        "dice",
+        "seed",
+        "events",
+        "winner",
+        "bets",
+        "deltas",
+    )
+
+    def __init__(self, variant, board_size, dice, seed=None, events=None,
+                 winner=0, bets=(0, 0), deltas=(0, 0)):
+        if variant not in VARIANTS:
+            raise ValueError(f"Unknown variant: {variant!r}")
+        if dice not in DICE:
+            raise ValueError(f"Unknown dice model: {dice!r}")
+        self.variant = variant
+        self.board_size = board_size
+        self.dice = dice
+        self.seed = seed
+        self.events = [] if events is None else events
+        self.winner = winner
+        self.bets = bets
+        self.deltas = deltas
+
+    def pairs(self):
+        """(roll, move) per event; move is NO_MOVE for a pass."""
+        return [(event >> 4, event & 0xF) for event in self.events]
+
+    def rolls(self):
+        return [event >> 4 for event in self.events]
+
+    def to_bytes(self):
+        payload = bytearray()
+        put_varint(payload, 0 if self.seed is None else self.seed + 1)
+        put_varint(payload, VARIANTS.index(self.variant))
+        put_varint(payload, self.board_size)
+        put_varint(payload, DICE.index(self.dice))
+        put_varint(payload, len(self.events))
+        if all(event < 0x80 for event in self.events):
+            payload += bytes(self.events)
+        else:
+            for event in self.events:
+                put_varint(payload, event)
+        put_varint(payload, self.winner)
+        put_varint(payload, self.bets[0])
+        put_varint(payload, self.bets[1])
+        put_varint(payload, zigzag(self.deltas[0]))
+        put_varint(payload, zigzag(self.deltas[1]))
+
+        out = bytearray()
+        put_varint(out, len(payload))
+        return bytes(out + payload)
+
+    @classmethod
+    def from_buffer(cls, buf, pos, end):
+        seed, pos = get_varint(buf, pos)
+        variant, pos = get_varint(buf, pos)
+        board_size, pos = get_varint(buf, pos)
+        dice, pos = get_varint(buf, pos)
+        count, pos = get_varint(buf, pos)
+
+        # nearly every event is a single byte: take them in one slice
+        block = buf[pos:pos + count]
+        if block.isascii():
+            events = block
+            pos += count
+        else:
+            events = []
+            for _ in range(count):
+                event, pos = get_varint(buf, pos)
+                events.append(event)
+
+        winner, pos = get_varint(buf, pos)
+        bet1, pos = get_varint(buf, pos)
+        bet2, pos = get_varint(buf, pos)
+        delta1, pos = get_varint(buf, pos)
+        delta2, pos = get_varint(buf, pos)
+        if pos != end:
+            raise ValueError("Corrupt game record")
+        return cls(
+            VARIANTS[variant],
+            board_size,
+            DICE[dice],
+            seed - 1 if seed else None,
+            events,
+            winner,
+            (bet1, bet2),
+            (unzigzag(delta1), unzigzag(delta2)),
+        )
+
+    def __repr__(self):
+        return (
+            f"GameRecord({self.variant}, board={self.board_size}, "
+            f"dice={self.dice}, events={len(self.events)}, "
+            f"winner={self.winner}, bets={self.bets}, deltas={self.deltas})"
+        )
+
+
+# --------------------------------------------------
+# WRITER / READER
+# --------------------------------------------------
+class RecordWriter:
+    """Append-only writer; every record is flushed as it is written."""
+
+    def __init__(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._file = open(path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(MAGIC)
+        else:
+            with open(path, "rb") as f:
+                if f.read(len(MAGIC)) != MAGIC:
+                    self._file.close()
+                    raise ValueError(f"Not a game record file: {path}")
+
+    def write(self, record):
+        self._file.write(record.to_bytes())
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class RecordReader:
+    """Streams records out of a memory-mapped file.
+
+    Only the pages being decoded are touched, so files with millions of
+    games iterate in constant memory. `position` is the byte offset just
+    past the last record read, so a later pass over the same (appended)
+    file can resume there with `records(position)`. `truncated` is set
+    when the file ends part-way through a record.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.truncated = False
+        self.position = len(MAGIC)
+        self._mmap = None
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"Not a game record file: {path}")
+            if os.fstat(f.fileno()).st_size > len(MAGIC):
+                self._mmap = mmap.mmap(f.fileno(), 0,
+                                       access=mmap.ACCESS_READ)
+
+    def __iter__(self):
+        return self.records()
+
+    def records(self, offset=None):
+        buf = self._mmap
+        pos = len(MAGIC) if offset is None else offset
+        self.position = pos
+        if buf is None:
+            return
+        size = len(buf)
+        while pos < size:
+            try:
+                length, start = get_varint(buf, pos)
+            except IndexError:
+                self.truncated = True
+                return
+            end = start + length
+            if end > size:
+                self.truncated = True
+                return
+            record = GameRecord.from_buffer(buf, start, end)
+            pos = self.position = end
+            yield record
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_records(path):
+    with RecordReader(path) as reader:
+        yield from reader
+
+
+# --------------------------------------------------
+# REPLAY / AUDIT
+# --------------------------------------------------
+def replay(record):
+    """Play the record back through the engine and return the final
+    state (a RaceState, or an int for full rules).
+
+    Raises ValueError when an event is illegal or the winner differs.
+    """
+    if record.variant == ROYAL:
+        state = ur_royal.INITIAL
+        for roll, move in record.pairs():
+            if move == NO_MOVE:
+                if ur_royal.legal_moves(state, roll):
+                    raise ValueError("Passed with a legal move available")
+                state = ur_royal.pass_turn(state)
+            elif move in ur_royal.legal_moves(state, roll):
+                state = ur_royal.apply_move(state, move, roll)
+            else:
+                raise ValueError(f"Illegal move {move} with roll {roll}")
+        won = ur_royal.winner(state)
+        won = 0 if won is None else won + 1
+    else:
+        state = ur_engine.RaceState(record.board_size, record.dice)
+        for roll, move in record.pairs():
+            ur_engine.apply_roll(state, roll)
+            if move != NO_MOVE and not ur_engine.move_piece(state):
+                raise ValueError(f"Illegal move with roll {roll}")
+        won = state.winner or 0
+
+    if won != record.winner:
+        raise ValueError(
+            f"Replay winner {won} does not match record {record.winner}"
+        )
+    return state
+
+
+def audit(record):
+    """Problems found in a record: empty when the rolls match the seed,
+    the replay reaches the recorded winner and the bets were settled
+    as the betting window pays them."""
+    problems = []
+    try:
+        replay(record)
+    except ValueError as exc:
+        problems.append(str(exc))
+
+    if record.seed is not None:
+        stream = DiceStream(record.dice, record.seed)
+        expected = [stream.roll() for _ in record.events]
+        if expected != record.rolls():
+            problems.append("Rolls do not match the recorded seed")
+
+    if record.variant == BET and record.winner:
+        odds = ur_odds.fair_odds(record.board_size, record.dice)
+        expected = odds.settle(record.winner, record.bets)
+        if tuple(record.deltas) != expected:
+            problems.append(
+                f"Settlement {tuple(record.deltas)} should be {expected}"
+            )
+    return problems
+
+
+# --------------------------------------------------
+# GUI RECORDING
+# --------------------------------------------------
+class GameRecorder:
+    """Collects one race at a time for a window and appends it to `path`
+    when it finishes. Rolls come from a seeded DiceStream so a record
+    can be audited against its seed; an unfinished race is dropped."""
+
+    def __init__(self, path, variant):
+        self.path = path
+        self.variant = variant
+        self.record = None
+
+    def start(self, board_size, dice):
+        """Begin a race; returns the dice stream to roll with."""
+        seed = random.SystemRandom().getrandbits(64)
+        self.record = GameRecord(self.variant, board_size, dice, seed)
+        return DiceStream(dice, seed)
+
+    def rolled(self, roll):
+        if self.record is not None:
+            self.record.events.append(pack_event(roll, NO_MOVE))
+
+    def moved(self, move=ADVANCE):
+        if self.record is not None and self.record.events:
+            roll = self.record.events[-1] >> 4
+            self.record.events[-1] = pack_event(roll, move)
+
+    def finish(self, winner, bets=(0, 0), deltas=(0, 0)):
+        record, self.record = self.record, None
+        if record is None:
+            return
+        record.winner = winner
+        record.bets = tuple(bets)
+        record.deltas = tuple(deltas)
+        with RecordWriter(self.path) as writer:
+            writer.write(record)
+
+
+# --------------------------------------------------
+# CLI
+# --------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect Ur game records")
+    parser.add_argument("files", nargs="+")
+    parser.add_argument("--show", type=int, default=0,
+                        help="print the first N records of each file")
+    parser.add_argument("--audit", action="store_true",
+                        help="replay every record and check its settlement")
+    args = parser.parse_args(argv)
+
+    for path in args.files:
+        games = failed = 0
+        with RecordReader(path) as reader:
+            for record in reader:
+                if games < args.show:
+                    print(record)
+                games += 1
+                if args.audit:
+                    problems = audit(record)
+                    if problems:
+                        failed += 1
+                        print(f"{path} #{games}: {'; '.join(problems)}")
+            tail = " (truncated tail)" if reader.truncated else ""
+        audited = f" failed_audit={failed}" if args.audit else ""
+        print(f"{path}: games={games}{audited}{tail}")
+
+
+if __name__ == "__main__":
+    main()
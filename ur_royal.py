@@ -0,0 +1,205 @@
+import random
+
+from ur_engine import BINARY4, ROLL_PROBABILITIES
+
+# --------------------------------------------------
+# RULES
+# --------------------------------------------------
+# Finkel rules: each side has 7 pieces running a 14-square track.
+# Squares 1–4 and 13–14 are private, 5–12 are the shared middle lane.
+# Rosettes on 4, 8 and 14 grant another turn; 8 is in the shared lane and
+# protects the piece on it. Landing on an enemy piece in the shared lane
+# sends it back to the start. Bearing off needs an exact roll (to 15).
+PIECES = 7
+TRACK = 14
+END = TRACK + 1
+
+LIGHT = 0
+DARK = 1
+
+ROLL_PROBABILITIES = ROLL_PROBABILITIES[BINARY4]
+
+# --------------------------------------------------
+# BIT LAYOUT
+# --------------------------------------------------
+#  bits  0–13  light pieces on squares 1–14 (square s -> bit s-1)
+#  bits 14–27  dark pieces on squares 1–14
+#  bits 28–30  light pieces borne off
+#  bits 31–33  dark pieces borne off
+#  bit  34     side to move (0 light, 1 dark)
+MASK14 = (1 << TRACK) - 1
+OFF_SHIFT = (28, 31)
+BOARD_SHIFT = (0, TRACK)
+SIDE_BIT = 1 << 34
+
+SHARED = sum(1 << (square - 1) for square in range(5, 13))
+ROSETTES = sum(1 << (square - 1) for square in (4, 8, 14))
+CENTRAL = 1 << (8 - 1)
+
+# per-roll tables (index 1..4)
+ENTRY_BIT = [0] + [1 << (roll - 1) for roll in range(1, 5)]
+BEAR_OFF_BIT = [0] + [1 << (TRACK - roll) for roll in range(1, 5)]
+ON_BOARD_FROM = [0] + [MASK14 >> roll for roll in range(1, 5)]
+
+INITIAL = 0
+
+
+# --------------------------------------------------
+# FIELD ACCESS
+# --------------------------------------------------
+def side_to_move(state):
+    return (state >> 34) & 1
+
+
+def board(state, side):
+    return (state >> BOARD_SHIFT[side]) & MASK14
+
+
+def borne_off(state, side):
+    return (state >> OFF_SHIFT[side]) & 7
+
+
+def waiting(state, side):
+    return PIECES - board(state, side).bit_count() - borne_off(state, side)
+
+
+def winner(state):
+    """LIGHT or DARK once a side has borne off every piece, else None."""
+    if borne_off(state, LIGHT) == PIECES:
+        return LIGHT
+    if borne_off(state, DARK) == PIECES:
+        return DARK
+    return None
+
+
+def encode(light, dark, light_off=0, dark_off=0, side=LIGHT):
+    """Build a state from square lists, e.g. encode([1, 5], [8])."""
+    state = side << 34 | light_off << OFF_SHIFT[0] | dark_off << OFF_SHIFT[1]
+    for square in light:
+        state |= 1 << (square - 1)
+    for square in dark:
+        state |= 1 << (square - 1 + TRACK)
+    if any(waiting(state, s) < 0 for s in (LIGHT, DARK)):
+        raise ValueError("More than 7 pieces on a side")
+    return state
+
+
+def decode(state):
+    def squares(bits):
+        return [s for s in range(1, END) if bits >> (s - 1) & 1]
+
+    return {
+        "side": side_to_move(state),
+        "light": squares(board(state, LIGHT)),
+        "dark": squares(board(state, DARK)),
+        "light_off": borne_off(state, LIGHT),
+        "dark_off": borne_off(state, DARK),
+        "light_waiting": waiting(state, LIGHT),
+        "dark_waiting": waiting(state, DARK),
+    }
+
+
+# --------------------------------------------------
+# MOVE GENERATION
+# --------------------------------------------------
+def legal_moves(state, roll):
+    """From-squares that can move `roll` (0 enters a new piece).
+
+    States are plain ints, so undoing a move is just keeping the
+    previous value around.
+    """
+    if roll == 0:
+        return []
+
+    side = (state >> 34) & 1
+    own = (state >> BOARD_SHIFT[side]) & MASK14
+    opp = (state >> BOARD_SHIFT[side ^ 1]) & MASK14
+    blocked = own | (opp & CENTRAL)
+
+    moves = []
+    off = (state >> OFF_SHIFT[side]) & 7
+    if PIECES - own.bit_count() - off > 0 and not blocked & ENTRY_BIT[roll]:
+        moves.append(0)
+
+    movable = own & ON_BOARD_FROM[roll] & ~(blocked >> roll)
+    movable |= own & BEAR_OFF_BIT[roll]
+    while movable:
+        low = movable & -movable
+        moves.append(low.bit_length())
+        movable ^= low
+    return moves
+
+
+def apply_move(state, frm, roll):
+    """Return the state after moving the piece on `frm` by `roll`."""
+    side = (state >> 34) & 1
+    shift = BOARD_SHIFT[side]
+    to = frm + roll
+
+    if frm:
+        state &= ~(1 << (frm - 1 + shift))
+
+    if to == END:
+        state += 1 << OFF_SHIFT[side]
+        return state ^ SIDE_BIT
+
+    bit = 1 << (to - 1)
+    state |= bit << shift
+
+    # capture: same physical square in the shared lane
+    opp_shift = BOARD_SHIFT[side ^ 1]
+    if bit & SHARED and state >> opp_shift & bit:
+        state &= ~(bit << opp_shift)
+
+    if bit & ROSETTES:
+        return state  # extra turn
+    return state ^ SIDE_BIT
+
+
+def pass_turn(state):
+    return state ^ SIDE_BIT
+
+
+def is_capture(state, frm, roll):
+    side = (state >> 34) & 1
+    to = frm + roll
+    if to >= END:
+        return False
+    bit = 1 << (to - 1)
+    return bool(bit & SHARED and state >> BOARD_SHIFT[side ^ 1] & bit)
+
+
+def gives_extra_turn(frm, roll):
+    to = frm + roll
+    return to < END and bool(1 << (to - 1) & ROSETTES)
+
+
+# --------------------------------------------------
+# PLAY
+# --------------------------------------------------
+def draw_roll(rng=random):
+    return bin(rng.getrandbits(4)).count("1")
+
+
+def step(state, roll, choose):
+    """Play one roll: `choose(state, roll, moves)` picks among the moves."""
+    moves = legal_moves(state, roll)
+    if not moves:
+        return pass_turn(state)
+    frm = moves[0] if len(moves) == 1 else choose(state, roll, moves)
+    return apply_move(state, frm, roll)
+
+
+def random_choice(rng=random):
+    return lambda state, roll, moves: rng.choice(moves)
+
+
+def play_game(choose_light, choose_dark, rng=random, state=INITIAL):
+    """Play to the end; returns (winner, turns)."""
+    choosers = (choose_light, choose_dark)
+    turns = 0
+    while winner(state) is None:
+        roll = rng.roll() if hasattr(rng, "roll") else draw_roll(rng)
+        state = step(state, roll, choosers[side_to_move(state)])
+        turns += 1
+    return winner(state), turns
@@ -0,0 +1,505 @@
+import argparse
+import asyncio
+import itertools
+
+import ur_engine
+import ur_odds
+import ur_record
+from ur_bankroll import BET_LADDER, START_COINS
+from ur_dice import DiceStream
+from ur_engine import BINARY4, D6
+from ur_protocol import (  # noqa: F401
+    DEFAULT_HOST, DEFAULT_PORT, HEADER, MAX_MESSAGE, ProtocolError, decode,
+    encode,
+)
+
+# --------------------------------------------------
+# CONSTANTS
+# --------------------------------------------------
+BOARD_SIZE = 20             # tile_0 … tile_19 in the .ui files
+DICE_BLOCK = 64             # small roll buffer: one stream per match
+
+# variant -> (dice, betting)
+VARIANTS = {
+    ur_record.CLASSIC: (D6, False),
+    ur_record.BET: (D6, True),
+    ur_record.PRO: (BINARY4, False),
+}
+LADDER = frozenset(int(bet) for bet in BET_LADDER)
+
+WAITING = "waiting"     # one player seated
+BETTING = "betting"     # both seated, collecting bets (or ready signals)
+RACING = "racing"
+OVER = "over"           # a player ran out of coins
+
+
+# --------------------------------------------------
+# PROTOCOL (framing in ur_protocol)
+# --------------------------------------------------
+async def read_message(reader):
+    """Next message, or None once the peer has closed the stream."""
+    try:
+        header = await reader.readexactly(HEADER.size)
+    except asyncio.IncompleteReadError:
+        return None
+    (length,) = HEADER.unpack(header)
+    if length > MAX_MESSAGE:
+        raise ProtocolError(f"Message of {length} bytes is too large")
+    try:
+        body = await reader.readexactly(length)
+    except asyncio.IncompleteReadError:
+        return None
+    return decode(body)
+
+
+# --------------------------------------------------
+# MATCH
+# --------------------------------------------------
+class MatchError(Exception):
+    pass
+
+
+class Match:
+    """Two seats, one race at a time, the same rules as the windows.
+
+    Methods raise MatchError for anything the windows would not allow
+    (wrong turn, bad bet) and never touch a socket, so a match can be
+    driven directly.
+    """
+
+    __slots__ = (
+        "match_id",
+        "variant",
+        "betting",
+        "state",
+        "stream",
+        "odds",
+        "seats",
+        "coins",
+        "bets",
+        "phase",
+        "recorder",
+    )
+
+    def __init__(self, match_id, variant, board_size=BOARD_SIZE,
+                 record=None):
+        if variant not in VARIANTS:
+            raise MatchError(f"Unknown variant: {variant!r}")
+        dice, betting = VARIANTS[variant]
+        self.match_id = match_id
+        self.variant = variant
+        self.betting = betting
+        self.state = ur_engine.RaceState(board_size, dice)
+        self.stream = None
+        self.odds = ur_odds.fair_odds(board_size, dice) if betting else None
+        self.seats = {1: None, 2: None}
+        self.coins = [START_COINS, START_COINS]
+        self.bets = [0, 0]
+        self.phase = WAITING
+        self.recorder = (
+            ur_record.GameRecorder(record, variant) if record else None
+        )
+
+    # ---------------- snapshots ----------------
+    def snapshot(self):
+        state = self.state
+        return {
+            "positions": list(state.positions),
+            "current_player": state.current_player,
+            "last_roll": state.last_roll,
+            "winner": state.winner,
+        }
+
+    def describe(self):
+        return {
+            "match": self.match_id,
+            "variant": self.variant,
+            "board_size": self.state.board_size,
+            "dice": self.state.dice,
+            "coins": list(self.coins),
+            "phase": self.phase,
+        }
+
+    # ---------------- seating ----------------
+    def seat(self, client):
+        for player in (1, 2):
+            if self.seats[player] is None:
+                self.seats[player] = client
+                if all(self.seats.values()):
+                    self.phase = BETTING
+                return player
+        raise MatchError("Match is full")
+
+    def unseat(self, player):
+        self.seats[player] = None
+        self.phase = WAITING if any(self.seats.values()) else OVER
+
+    # ---------------- betting (handle_bet / confirm_bet) ----------------
+    def commit(self, player, amount=0):
+        """Lock a bet (or, without betting, signal ready). The race
+        starts once both players have committed."""
+        if self.phase != BETTING:
+            raise MatchError("Not taking bets now")
+        if self.bets[player - 1]:
+            raise MatchError("Bet already locked")
+        if self.betting:
+            if amount not in LADDER:
+                raise MatchError(f"Bet must be one of {sorted(LADDER)}")
+            if amount > self.coins[player - 1]:
+                raise MatchError("Not enough coins")
+        else:
+            amount = 1   # marker only; nothing is staked
+
+        self.bets[player - 1] = amount
+        if not all(self.bets):
+            return False
+        self.start_race()
+        return True
+
+    def start_race(self):
+        self.state.reset()
+        self.phase = RACING
+        if self.recorder:
+            self.stream = self.recorder.start(self.state.board_size,
+                                              self.state.dice)
+        elif self.stream is None:
+            self.stream = DiceStream(self.state.dice, block=DICE_BLOCK)
+
+    # ---------------- race (roll_dice / move_piece) ----------------
+    def _check_turn(self, player):
+        if self.phase != RACING:
+            raise MatchError("No race in progress")
+        if self.state.current_player != player:
+            raise MatchError("Not your turn")
+
+    def roll(self, player):
+        self._check_turn(player)
+        if self.state.last_roll:
+            # one roll per turn: no re-rolling for a better number
+            raise MatchError("Already rolled")
+        roll = ur_engine.roll_dice(self.state, self.stream)
+        if self.recorder:
+            self.recorder.rolled(roll)
+        return roll
+
+    def move(self, player):
+        """Returns the settlement dict once the move wins the race."""
+        self._check_turn(player)
+        if not ur_engine.move_piece(self.state):
+            raise MatchError("Roll first")
+        if self.recorder:
+            self.recorder.moved()
+        if self.state.winner:
+            return self.settle(self.state.winner)
+        return None
+
+    # ---------------- settlement (end_game) ----------------
+    def settle(self, winner):
+        bets = tuple(self.bets) if self.betting else (0, 0)
+        deltas = self.odds.settle(winner, bets) if self.betting else (0, 0)
+        self.coins[0] += deltas[0]
+        self.coins[1] += deltas[1]
+        if self.recorder:
+            self.recorder.finish(winner, bets, deltas)
+
+        self.bets = [0, 0]
+        over = self.betting and min(self.coins) <= 0
+        self.phase = OVER if over else BETTING
+        return {
+            "winner": winner,
+            "bets": list(bets),
+            "deltas": list(deltas),
+            "coins": list(self.coins),
+            "over": over,
+        }
+
+
+# --------------------------------------------------
+# SERVER
+# --------------------------------------------------
+class Client:
+    __slots__ = ("writer", "match", "player")
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.match = None
+        self.player = 0
+
+    def send(self, message):
+        self.writer.write(encode(message))
+
+
+class UrServer:
+    """Hosts any number of matches on one event loop.
+
+    `handle_client` serves a single connection and works with any
+    asyncio stream pair, so tests can use loopback or a socketpair.
+    """
+
+    def __init__(self, board_size=BOARD_SIZE, record=None):
+        self.board_size = board_size
+        self.record = record
+        self.matches = {}
+        self.open_matches = {}    # variant -> match waiting for a player
+        self._ids = itertools.count(1)
+        self.server = None
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT, sock=None):
+        if sock is not None:
+            self.server = await asyncio.start_server(self.handle_client,
+                                                     sock=sock)
+        else:
+            self.server = await asyncio.start_server(self.handle_client,
+                                                     host, port)
+        return self.server
+
+    @property
+    def port(self):
+        return self.server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+
+    async def handle_client(self, reader, writer):
+        client = Client(writer)
+        try:
+            while True:
+                try:
+                    message = await read_message(reader)
+                except ProtocolError as exc:
+                    client.send({"type": "error", "message": str(exc)})
+                    break
+                if message is None:
+                    break
+                try:
+                    self.dispatch(client, message)
+                except (MatchError, ProtocolError) as exc:
+                    reply = {"type": "error", "message": str(exc)}
+                    if "id" in message:
+                        reply["id"] = message["id"]
+                    client.send(reply)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.leave(client)
+            writer.close()
+
+    # ---------------- dispatch ----------------
+    def dispatch(self, client, message):
+        kind = message["type"]
+        request_id = message.get("id")
+        if kind == "join":
+            self.join(client, message, request_id)
+            return
+        if kind == "leave":
+            self.leave(client)
+            client.send(self._reply({"type": "left"}, request_id))
+            return
+
+        match, player = client.match, client.player
+        if match is None:
+            raise MatchError("Join a match first")
+
+        if kind in ("bet", "ready"):
+            amount = message.get("amount", 0)
+            # JSON true/false arrive as bool, which is an int subclass
+            if isinstance(amount, bool) or not isinstance(amount, int):
+                raise MatchError("Bet must be a whole number")
+            started = match.commit(player, amount)
+            self.broadcast(match, {"type": "bet_locked", "player": player},
+                           client, request_id)
+            if started:
+                self.broadcast(match, {
+                    "type": "start",
+                    "bets": list(match.bets) if match.betting else [0, 0],
+                    "state": match.snapshot(),
+                })
+        elif kind == "roll":
+            roll = match.roll(player)
+            self.broadcast(match, {
+                "type": "rolled",
+                "player": player,
+                "roll": roll,
+                "state": match.snapshot(),
+            }, client, request_id)
+        elif kind == "move":
+            settlement = match.move(player)
+            self.broadcast(match, {
+                "type": "moved",
+                "player": player,
+                "state": match.snapshot(),
+            }, client, request_id)
+            if settlement:
+                self.broadcast(match, {"type": "finished", **settlement})
+                if match.phase == OVER:
+                    self.close_match(match)
+        else:
+            raise MatchError(f"Unknown message type: {kind!r}")
+
+    @staticmethod
+    def _reply(message, request_id):
+        if request_id is not None:
+            message["id"] = request_id
+        return message
+
+    def broadcast(self, match, message, origin=None, request_id=None):
+        """Send to both seats; the requester's copy carries its id."""
+        for seated in match.seats.values():
+            if seated is None:
+                continue
+            if seated is origin:
+                seated.send(self._reply(dict(message), request_id))
+            else:
+                seated.send(message)
+
+    # ---------------- matchmaking ----------------
+    def join(self, client, message, request_id):
+        if client.match is not None:
+            raise MatchError("Already in a match")
+        variant = message.get("variant", ur_record.BET)
+        if not isinstance(variant, str):
+            raise ProtocolError("variant must be a string")
+        if variant not in VARIANTS:
+            raise MatchError(f"Unknown variant: {variant!r}")
+
+        match_id = message.get("match")
+        if match_id is not None and not isinstance(match_id, (str, int)):
+            raise ProtocolError("match must be a string or an integer")
+        if match_id is not None:
+            match = self.matches.get(match_id)
+            if match is None:
+                raise MatchError(f"No match {match_id}")
+        else:
+            match = self.open_matches.pop(variant, None)
+            if match is None:
+                match = Match(next(self._ids), variant, self.board_size,
+                              self.record)
+                self.matches[match.match_id] = match
+                self.open_matches[variant] = match
+
+        client.player = match.seat(client)
+        client.match = match
+        # a join by id can fill a match opened for another variant
+        if (match.phase != WAITING
+                and self.open_matches.get(match.variant) is match):
+            del self.open_matches[match.variant]
+
+        client.send(self._reply({
+            "type": "joined", "player": client.player, **match.describe()
+        }, request_id))
+        if match.phase == BETTING:
+            self.broadcast(match, {"type": "ready", **match.describe()})
+
+    def leave(self, client):
+        match, client.match = client.match, None
+        if match is None:
+            return
+        # a match cannot continue one player short: release the other
+        match.unseat(client.player)
+        self.broadcast(match, {"type": "opponent_left"})
+        self.close_match(match)
+
+    def close_match(self, match):
+        """Drop `match` and free whoever is still seated, so they can
+        join another."""
+        for player, seated in match.seats.items():
+            if seated is not None:
+                seated.match = None
+                match.unseat(player)
+        self.matches.pop(match.match_id, None)
+        if self.open_matches.get(match.variant) is match:
+            del self.open_matches[match.variant]
+
+
+# --------------------------------------------------
+# CLIENT
+# --------------------------------------------------
+class UrClient:
+    """Minimal asyncio client: `request()` waits for the answer to its
+    own id; every other message lands in `events`."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.events = asyncio.Queue()
+        self._ids = itertools.count(1)
+        self._pending = {}
+        self._task = asyncio.ensure_future(self._read())
+
+    @classmethod
+    async def connect(cls, host=DEFAULT_HOST, port=DEFAULT_PORT, sock=None):
+        if sock is not None:
+            reader, writer = await asyncio.open_connection(sock=sock)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def _read(self):
+        try:
+            while True:
+                message = await read_message(self.reader)
+                if message is None:
+                    break
+                future = self._pending.pop(message.get("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(message)
+                else:
+                    self.events.put_nowait(message)
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("Connection closed"))
+            self._pending.clear()
+
+    async def request(self, kind, **fields):
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        self.writer.write(encode({"type": kind, "id": request_id, **fields}))
+        await self.writer.drain()
+        return await future
+
+    async def next_event(self, *kinds):
+        while True:
+            message = await self.events.get()
+            if not kinds or message["type"] in kinds:
+                return message
+
+    async def close(self):
+        self._task.cancel()
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+# --------------------------------------------------
+# CLI
+# --------------------------------------------------
+async def serve(host, port, record=None):
+    server = UrServer(record=record)
+    await server.start(host, port)
+    print(f"Ur server on {host}:{server.port}")
+    async with server.server:
+        await server.server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ur match server")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--record", default=None,
+                        help="append finished races to this record file")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.record))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+import argparse
+import math
+from statistics import NormalDist
+
+import numpy as np
+
+from ur_dice import DiceStream
+from ur_engine import D6, DICE_MODELS
+
+# --------------------------------------------------
+# CONSTANTS
+# --------------------------------------------------
+DEFAULT_BATCH = 1_000_000
+# upper bound on rolls held in memory per chunk (games x rounds)
+MAX_CELLS = 32_000_000
+
+
+def wilson_interval(wins, n, confidence=0.95):
+    """Wilson score interval for a win rate of `wins` out of `n`."""
+    if n == 0:
+        return (math.nan, math.nan)
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    p = wins / n
+    centre = (p + z * z / (2 * n)) / (1 + z * z / n)
+    half = (
+        z
+        * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n))
+        / (1 + z * z / n)
+    )
+    return (centre - half, centre + half)
+
+
+# --------------------------------------------------
+# RESULT
+# --------------------------------------------------
+class SimResult:
+    __slots__ = (
+        "board_size",
+        "dice",
+        "games",
+        "first_mover_wins",
+        "length_counts",
+        "confidence",
+    )
+
+    def __init__(self, board_size, dice, confidence=0.95):
+        self.board_size = board_size
+        self.dice = dice
+        self.games = 0
+        self.first_mover_wins = 0
+        # length_counts[t] = number of games that lasted t turns (rolls)
+        self.length_counts = np.zeros(0, dtype=np.int64)
+        self.confidence = confidence
+
+    def add(self, first_mover_wins, lengths):
+        self.games += lengths.size
+        self.first_mover_wins += int(first_mover_wins)
+        counts = np.bincount(lengths)
+        if counts.size > self.length_counts.size:
+            counts[: self.length_counts.size] += self.length_counts
+            self.length_counts = counts
+        else:
+            self.length_counts[: counts.size] += counts
+
+    def merge(self, other):
+        if (other.board_size, other.dice) != (self.board_size, self.dice):
+            raise ValueError("Cannot merge results for different races")
+        self.games += other.games
+        self.first_mover_wins += other.first_mover_wins
+        size = max(self.length_counts.size, other.length_counts.size)
+        counts = np.zeros(size, dtype=np.int64)
+        counts[: self.length_counts.size] += self.length_counts
+        counts[: other.length_counts.size] += other.length_counts
+        self.length_counts = counts
+        return self
+
+    # -------------------------
+    # STATISTICS
+    # -------------------------
+    @property
+    def _z(self):
+        return NormalDist().inv_cdf(0.5 + self.confidence / 2)
+
+    @property
+    def win_rate(self):
+        return self.first_mover_wins / self.games if self.games else math.nan
+
+    @property
+    def win_rate_ci(self):
+        return wilson_interval(
+            self.first_mover_wins, self.games, self.confidence
+        )
+
+    @property
+    def length_distribution(self):
+        if self.games == 0:
+            return self.length_counts.astype(np.float64)
+        return self.length_counts / self.games
+
+    @property
+    def mean_length(self):
+        turns = np.arange(self.length_counts.size)
+        return float((turns * self.length_counts).sum() / self.games)
+
+    @property
+    def mean_length_ci(self):
+        turns = np.arange(self.length_counts.size)
+        mean = self.mean_length
+        var = float((((turns - mean) ** 2) * self.length_counts).sum())
+        var /= max(self.games - 1, 1)
+        half = self._z * math.sqrt(var / self.games)
+        return (mean - half, mean + half)
+
+    def summary(self):
+        low, high = self.win_rate_ci
+        mlow, mhigh = self.mean_length_ci
+        pct = int(round(self.confidence * 100))
+        return (
+            f"board={self.board_size} dice={self.dice} games={self.games}\n"
+            f"first mover wins: {self.win_rate:.6f} "
+            f"({pct}% CI {low:.6f}–{high:.6f})\n"
+            f"mean length: {self.mean_length:.3f} turns "
+            f"({pct}% CI {mlow:.3f}–{mhigh:.3f})"
+        )
+
+
+# --------------------------------------------------
+# SIMULATION
+# --------------------------------------------------
+def finish_rounds(stream, games, board_size):
+    """Own-turn index (1-based) at which each of `games` horses finishes.
+
+    A horse finishes on the first roll that takes it to `board_size` or
+    beyond, as in `UrGame.move_piece`. The two horses never interact, so
+    each one can be rolled forward independently in large blocks.
+    """
+    mean = stream.dist.mean
+    if mean <= 0:
+        raise ValueError("The dice never move a horse")
+    chunk = int(math.ceil(board_size / mean * 1.25)) + 2
+    chunk = max(1, min(chunk, MAX_CELLS // max(games, 1)))
+
+    rounds = np.zeros(games, dtype=np.int64)
+    pos = np.zeros(games, dtype=np.int32)
+    active = np.arange(games)
+    offset = 0
+
+    while active.size:
+        rolls = stream.rolls((active.size, chunk))
+        track = np.cumsum(rolls, axis=1, dtype=np.int32)
+        track += pos[active, None]
+        hit = track >= board_size
+
+        finished = hit[:, -1]  # positions never go down
+        first = hit.argmax(axis=1)
+        rounds[active[finished]] = offset + first[finished] + 1
+
+        still = ~finished
+        pos[active[still]] = track[still, -1]
+        active = active[still]
+        offset += chunk
+
+    return rounds
+
+
+def simulate_batch(stream, games, board_size):
+    """Return (first_mover_wins, lengths) for one batch of races."""
+    t1 = finish_rounds(stream, games, board_size)
+    t2 = finish_rounds(stream, games, board_size)
+
+    # player 1 rolls first, so it wins ties on own-turn count
+    p1_wins = t1 <= t2
+    lengths = np.where(p1_wins, 2 * t1 - 1, 2 * t2)
+    return int(p1_wins.sum()), lengths
+
+
+def simulate(
+    games,
+    board_size,
+    dice=D6,
+    seed=None,
+    batch_size=DEFAULT_BATCH,
+    confidence=0.95,
+):
+    """Play `games` races; `dice` is a model name or a Distribution and
+    `seed` may be an int, a SeedSequence or a ready DiceStream."""
+    if board_size <= 0:
+        raise ValueError("board_size must be positive")
+
+    if isinstance(seed, DiceStream):
+        stream = seed
+    else:
+        stream = DiceStream(dice, seed)
+    result = SimResult(board_size, dice, confidence)
+
+    remaining = int(games)
+    while remaining > 0:
+        batch = min(batch_size, remaining)
+        wins, lengths = simulate_batch(stream, batch, board_size)
+        result.add(wins, lengths)
+        remaining -= batch
+
+    return result
+
+
+def sweep(board_sizes, games, dice=D6, seed=None, **kwargs):
+    """Simulate every board size with independent dice streams."""
+    streams = DiceStream(dice, seed).spawn(len(board_sizes))
+    return {
+        size: simulate(games, size, dice, seed=stream, **kwargs)
+        for size, stream in zip(board_sizes, streams)
+    }
+
+
+# --------------------------------------------------
+# CLI
+# --------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Monte Carlo Ur races")
+    parser.add_argument("--games", type=float, default=1e6)
+    parser.add_argument("--board-size", type=int, nargs="+", default=[20])
+    parser.add_argument("--dice", choices=DICE_MODELS, default=D6)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH)
+    parser.add_argument("--confidence", type=float, default=0.95)
+    args = parser.parse_args(argv)
+
+    results = sweep(
+        args.board_size,
+        int(args.games),
+        args.dice,
+        seed=args.seed,
+        batch_size=args.batch_size,
+        confidence=args.confidence,
+    )
+    for result in results.values():
+        print(result.summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+import argparse
+import functools
+import math
+import os
+from array import array
+from statistics import NormalDist
+
+from ur_engine import D6, DICE_MODELS, ROLL_PROBABILITIES
+
+# --------------------------------------------------
+# CONSTANTS
+# --------------------------------------------------
+TABLE_VERSION = 1
+MAX_EXACT_BOARD = 400       # longer tracks: see LongRaceTable
+
+
+def cache_dir():
+    base = os.environ.get("UR_CACHE_DIR")
+    if base:
+        return base
+    return os.path.join(os.path.expanduser("~"), ".cache", "ur_game")
+
+
+# --------------------------------------------------
+# WIN TABLE
+# --------------------------------------------------
+class WinTable:
+    """P(player 1 wins) for every (pos1, pos2, player to move)."""
+
+    __slots__ = ("board_size", "dice", "values")
+
+    def __init__(self, board_size, dice, values):
+        if len(values) != board_size * board_size * 2:
+            raise ValueError("Table size does not match board size")
+        self.board_size = board_size
+        self.dice = dice
+        self.values = values
+
+    def p1_wins(self, pos1, pos2, player=1):
+        return self.values[(pos1 * self.board_size + pos2) * 2 + player - 1]
+
+    def win_probability(self, player, pos1, pos2, to_move=1):
+        p1 = self.p1_wins(pos1, pos2, to_move)
+        return p1 if player == 1 else 1.0 - p1
+
+    def start(self):
+        return self.p1_wins(0, 0, 1)
+
+    def p1_wins_state(self, state):
+        """Live odds for a RaceState, including a rolled but unplayed move."""
+        if state.winner:
+            return 1.0 if state.winner == 1 else 0.0
+
+        pos1, pos2 = state.positions
+        roll = state.last_roll
+        if roll == 0:
+            return self.p1_wins(pos1, pos2, state.current_player)
+
+        # the pending move is forced, so resolve it first
+        if state.current_player == 1:
+            if pos1 + roll >= self.board_size:
+                return 1.0
+            return self.p1_wins(pos1 + roll, pos2, 2)
+        if pos2 + roll >= self.board_size:
+            return 0.0
+        return self.p1_wins(pos1, pos2 + roll, 1)
+
+
+class LongRaceTable(WinTable):
+    """Odds for tracks too long to tabulate (the table grows with the
+    square of the length).
+
+    The race only depends on the distance each horse has left, so once
+    both are within reach of the `exact` table that table answers. Before
+    that, the turns each horse still needs are close to normal, and
+    P(player 1 finishes first) is read off their difference.
+    """
+
+    __slots__ = ("exact", "mean", "spread")
+
+    def __init__(self, board_size, dice, exact):
+        self.board_size = board_size
+        self.dice = dice
+        self.values = None
+        self.exact = exact
+        probs = ROLL_PROBABILITIES[dice]
+        self.mean = sum(roll * p for roll, p in probs.items())
+        variance = sum(roll * roll * p for roll, p in probs.items())
+        variance -= self.mean * self.mean
+        # variance of the turns needed per square of distance
+        self.spread = variance / self.mean ** 3
+
+    def p1_wins(self, pos1, pos2, player=1):
+        left1 = self.board_size - pos1
+        left2 = self.board_size - pos2
+        reach = self.exact.board_size
+        if left1 <= reach and left2 <= reach:
+            return self.exact.p1_wins(reach - left1, reach - left2, player)
+
+        lead = (left2 - left1) / self.mean
+        # moving first wins a tie on turns
+        lead += 0.5 if player == 1 else -0.5
+        sigma = math.sqrt((left1 + left2) * self.spread)
+        return NormalDist().cdf(lead / sigma)
+
+
+# --------------------------------------------------
+# SOLVER
+# --------------------------------------------------
+def solve(board_size, dice=D6):
+    """Exact backward induction over the (pos1, pos2, to_move) chain.
+
+    Positions only grow, so every state depends on states further along
+    the track, except for a roll of 0 which hands the same positions to
+    the other player. That two-state cycle is solved in closed form:
+
+        a = A + q*b,  b = B + q*a  =>  a = (A + q*B) / (1 - q*q)
+    """
+    if dice not in DICE_MODELS:
+        raise ValueError(f"Unknown dice model: {dice!r}")
+    if board_size <= 0:
+        raise ValueError("board_size must be positive")
+
+    n = board_size
+    probs = ROLL_PROBABILITIES[dice]
+    q = probs.get(0, 0.0)
+    steps = [(roll, p) for roll, p in probs.items() if roll > 0]
+    values = array("d", bytes(8 * n * n * 2))
+
+    for pos1 in range(n - 1, -1, -1):
+        for pos2 in range(n - 1, -1, -1):
+            a_part = 0.0  # player 1 to move, non-zero rolls
+            b_part = 0.0  # player 2 to move, non-zero rolls
+            for roll, p in steps:
+                new1 = pos1 + roll
+                if new1 >= n:
+                    a_part += p
+                else:
+                    a_part += p * values[(new1 * n + pos2) * 2 + 1]
+
+                new2 = pos2 + roll
+                if new2 < n:
+                    b_part += p * values[(pos1 * n + new2) * 2]
+
+            a = (a_part + q * b_part) / (1.0 - q * q)
+            index = (pos1 * n + pos2) * 2
+            values[index] = a
+            values[index + 1] = b_part + q * a
+
+    return WinTable(board_size, dice, values)
+
+
+# --------------------------------------------------
+# DISK CACHE
+# --------------------------------------------------
+def table_path(board_size, dice, directory=None):
+    directory = directory or cache_dir()
+    name = f"win_v{TABLE_VERSION}_{dice}_{board_size}.bin"
+    return os.path.join(directory, name)
+
+
+def save_table(table, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        table.values.tofile(f)
+    os.replace(tmp, path)
+
+
+def read_table(board_size, dice, path):
+    values = array("d")
+    count = board_size * board_size * 2
+    with open(path, "rb") as f:
+        values.fromfile(f, count)
+    return WinTable(board_size, dice, values)
+
+
+@functools.lru_cache(maxsize=32)
+def load_table(board_size, dice=D6, directory=None):
+    """Return the table for (board_size, dice), solving it at most once."""
+    path = table_path(board_size, dice, directory)
+    try:
+        return read_table(board_size, dice, path)
+    except (OSError, EOFError, ValueError):
+        pass
+
+    table = solve(board_size, dice)
+    try:
+        save_table(table, path)
+    except OSError:
+        # a read-only cache is not fatal, the table is still usable
+        pass
+    return table
+
+
+@functools.lru_cache(maxsize=32)
+def odds_table(board_size, dice=D6, directory=None):
+    """Exact table up to MAX_EXACT_BOARD, a LongRaceTable beyond it."""
+    if board_size <= MAX_EXACT_BOARD:
+        return load_table(board_size, dice, directory)
+    exact = load_table(MAX_EXACT_BOARD, dice, directory)
+    return LongRaceTable(board_size, dice, exact)
+
+
+# --------------------------------------------------
+# CLI
+# --------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Exact Ur race odds")
+    parser.add_argument("--board-size", type=int, nargs="+", default=[10, 20])
+    parser.add_argument("--dice", nargs="+", choices=DICE_MODELS,
+                        default=list(DICE_MODELS))
+    parser.add_argument("--cache-dir", default=None)
+    args = parser.parse_args(argv)
+
+    for dice in args.dice:
+        for size in args.board_size:
+            table = load_table(size, dice, args.cache_dir)
+            print(f"board={size} dice={dice} "
+                  f"P(player 1 wins)={table.start():.9f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1239 @@
+# Generated by ur_assets.py from src/assets -- do not edit.
+# Premultiplied ARGB32 sprite atlas, zlib-compressed.
+
+ATLAS_WIDTH = 512
+ATLAS_HEIGHT = 277
+
+# (name, size, scale) -> (x, y, width, height)
+SPRITES = {
+    ('horse_blue', 40, 1.0): (275, 223, 40, 30),
+    ('horse_blue', 40, 1.25): (224, 223, 50, 38),
+    ('horse_blue', 40, 1.5): (122, 223, 60, 46),
+    ('horse_blue', 40, 2.0): (347, 141, 80, 61),
+    ('horse_blue', 70, 1.0): (0, 223, 70, 54),
+    ('horse_blue', 70, 1.25): (258, 141, 88, 67),
+    ('horse_blue', 70, 1.5): (0, 141, 105, 81),
+    ('horse_blue', 70, 2.0): (141, 0, 140, 108),
+    ('horse_white', 40, 1.0): (183, 223, 40, 40),
+    ('horse_white', 40, 1.25): (71, 223, 50, 50),
+    ('horse_white', 40, 1.5): (428, 141, 60, 60),
+    ('horse_white', 40, 2.0): (106, 141, 80, 80),
+    ('horse_white', 70, 1.0): (187, 141, 70, 70),
+    ('horse_white', 70, 1.25): (388, 0, 88, 88),
+    ('horse_white', 70, 1.5): (282, 0, 105, 105),
+    ('horse_white', 70, 2.0): (0, 0, 140, 140),
+}
+
+WINNER_IMAGES = {
+    'horse_blue': (
+        'data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAIwAAABsCAYAAAC4hFq8AAAACX'
+        'BIWXMAAA9hAAAPYQGoP6dpAAAgAElEQVR4nO2deXxU1fn/3+duswYSdmSXsMUqFkEE2VFERN'
+        'GvdUP8qdW6YauVIrW4VCl1q1atVSxuQNVKi62Aa9GKbG5fN6igWEVZ+hUEQjLr3c7vjzszmY'
+        'SEJGRCJsDzeoUZ5t77ueece87znOc5n/Nc4bquJCXRaBTTNAHQdZ1wOJw+xO7duzPfQ6EQhm'
+        'EAYJom0Wg0c6yoqCjz/TDewYenkCVSSnIph/EOPjyl9lPqJ/lYycN4uRNRXl4u06CapqEoXh'
+        '9yXRfbtjMnplUUgG3buK4LgKIoaJqWOZZWeYfxDk48LRvQMIxKtsuyrMyxbHuXfUzX9Uo3y7'
+        'Z3h/EOPryKrnOwS2418yEroqysLNOU+agCc40XjSbRdZG35ct3PJHtVkcikUqqqK5uVyQSQQ'
+        'jvIWS7cfmGJ6Vg5UqX009vhRD5V77mgJcTLykNlivJGZ5M43newpYtCh984I2c9ES/4t+63z'
+        'Nv63sA8Oo0h6mPayalrLXABwJv0yabO+9MkkgIund3ueACg1/9Cs48M8jf/x7jgw8cOnQQtG'
+        'wJ7dvbDBvmO6Dla654YufOnZmz9xXhKywszNy4JtUmpaS0tJSmx4tx4YUOS5aEGTIkyrVTBc'
+        '/+RfLSUh9LlkSZO9dg8eIgquoyZUqEq67SKCyUFBS4BAKeXS8sKkTQXOp7YPCgHl5SXdRcfV'
+        'RhzvAkIGTGoDgOrFzpsmqVRjgc55e/VLnmGsnWrUEMI0FxL52PPnIAieMI5s/3M3++Z5JaFp'
+        'qMHWPQr1+UmTMlPt++798k9W1CPMiaw+R7hLEmPCm8hx1PwPz5MQYMiDBhgp9du/wEgoJf/1'
+        'qydWsAv9/h6qtNBJKtWzXScxYpjdSfhqoIVM1lxAg/PkOplyfeXNuvviISiUQGqTm6e/G4ZP'
+        '68JA88qPL11wG8jpAeLRWNpCguU6bEmDXL4PG5Fr+904fj6Jnz+vaLcfVVCqrqkki4KIpCOC'
+        'w48kjo21elTRuRF/VtSjwhRG7c6ppWR3OLJ4lEYlhmEhC4ro8Ff5bcdx9s3eojXGBSVAibN6'
+        'c7TVXxqtmzOMbcuSrbtsKPfywwTaOac7PFQVUtRo5yGH+K4Jj+DgOPc0hr8Marb37i5Xzxsf'
+        'EkNcKlxl//pnBMf8kNNwTYti3A9ddH2bBesmqlJBBIUn1Y19M8//kyyOkTBQUFMHeugxD2Xu'
+        'dU+hMweLDLsGEu0ahDiwINcQiHjfPYJAkQEkP38KRU+OADkxkzHFavDgJqRSUUi1/8Ik6P7g'
+        'o//amRMjX7msRJClokeOtNydzHHebMCVc6Pxg0GTnKofMRLmeeJRg1SkNN3a45mZDGwKuzW1'
+        '0X1VYfN642vHShPvm4jIULJW+9pfLeewauW5MJkVQOwO27wwD07RvlX/8KcMr4OJ9+Espcoy'
+        'gORx0Vo00bjVatJIMHJzn7bElhoWi0+jYHPMjx4mPuIozeg//kY5MRI1TatpXs2qXiunoN50'
+        'LdOkpaBCDZsCHEnXdGefABnTFjbKTUAYnrqqxdG0ZRHM48M0GXLgoBf7pDpoJhNK8Iba4kf+'
+        'cwEm66KUEsGqBPH5O//tUF7GpOzPaK6tNA3nV/+pNGt24qEycmq2AI2rZ1OOlkQYcO8Nl6l+'
+        'efV3nmGVi71kTK3D+M5iB56yVJqTJihMNnnxVx9NFRzjwTZs0KkPs+Lrn66ghnnCE59dQAUF'
+        'WLScBJffcmMkLY9D82ydgxce65p23GY8qn9mssvDzmw0gKi3yAZO3aIGvXQv00SN3lhRcEs2'
+        'cb9Otnsn59dWZPBSRFRXEuvNAhGEzSvbvO6NG+RipR/krOO0xdFrvqggEwaGCSZMImHneIxT'
+        'S2bdMwTR+VzVCtaBiGhWnW5DkJvvvOx4YNJhMmSNav33vl+rTToky5SOXksT7CBQ7RqAW4gE'
+        'QiM2tOuZBctF9j4uU5p1dk8KRU+OgjwemnC8rLK1aWPZPh4pmqqg0jGT48wpFHKsybF6zmeP'
+        'p6uOuucjq0F1xyabjKeZLbbitj2jQv/iLyxL09zOmtAS8SibFmDdx3n8Ly5b6MJ6NpFhMmmI'
+        'wY7nDUDyTLlmncf3/FcUUxOf98k4GDBNNuMKhZI3ke02efqQwYYOLNVyor3kfn6ASDFmPGuB'
+        'iGihASgULfkgBWNJpZAM3H9jvkOL2bN0umToVvv02PfEn/YyM88keVPn1sQCIEjBsXZuLEBG'
+        '+8EaeoCH7wA4XXX5fcOL2iE+3LjO3cKShsmdZW2SLY/l2AGTMCCOE1ouchSQYcF+HCCxwu+n'
+        '86ilL1uoNTNF2vmOS5rptRYa7rkn0sWxMpipI5pihKpWO5xuvZU+ettxTuvDPGl/+B4cMcpk'
+        '3zo+sutp3q7wIsy2TQIJ1NmxzefBN+8xvB7t2hrKruy44LSkslvoCRYedVnO8ghIOUEAzajB'
+        '7lMnykxNAFfj/07hXA7/c6UD62X67xtGxVlI8c0qKiIsJheGyOJBKNYVkOlhVBCMPDSwUFvt'
+        'texrXXwqJFYfbH9dZ1Bddx94qvdO+e5DezHQb8UKNL5wC6YRONlCOFN9XNdw5urvFyYpIOSI'
+        'Qy67eqx5OW5MorJYsXF7C/cZrCQigr06g6ed60KchFUyy6dk3QpUuMVq0EvXopnH22Qu/eOe'
+        'KY5HmENxuvTq1bXw5p4+HJrM8UAQrJtBuiDegsXsi/UyeXnTuhqocELlJqfPNNmHffU4lEFR'
+        'YvVhkzVjJrVpy6VOXAt1/F8Vw/j+bN6Y1EeXq+yrQbgjRMWUoeeKCcSMTl5ptbkp5cB4Mmf3'
+        'hYkkw4JBI2Y8cKevTQCAaDWBboOuzZU7cI6QFrP8MgHArlDq+K6arzkMwnTmq6h3/4kcpNNx'
+        'lkUx32TxyOO06waZNKtoaJxQyuucZh4cIYxT0tOnVyABchwDAkSj0UWmO3nwTiccE7a6KYpm'
+        'wwXk3StJxeKb2/unC9q5imRELhZz9TMJN+GrZkICkoMDnmmABffqlkfgMYPTrG66/pLFoUZs'
+        'hQvWJZUlTzwBrSftVcW188gSTgl3Tt6mfmzO/YscOphNHsOb3JpMO2bZJNm+C//7U499wAml'
+        'ZXPMHs30ruvitILhYjR4yIsHSpzpFH2nz/fToi7M1fRo406dfP5phjJBMn6rRpI3IecS0rcw'
+        'gG03h6A/EkW7bYnHd+nAXzwxQXKw3Eq8zp1bIr3OgRQ90AAYmEZPypMd5ZE0BKDfCzZWucm3'
+        '8VwrRqx/viC5UHfm+Qm5VrydChDhs3OuzcmeYDp1eoVZYv97N8uQPCZfr0OJMn29x4o0KrVn'
+        'Wobx3bb8eOCBs22AwdGqRjx1CNeLqeihMB0WgkNfcXGbxvvrGZMSNJ69aSnTuDXH21yVtvtc'
+        'g4mLl4vgc00pveEjJ/fow1q1tQsYgoefQRyYwbU+dRs5FxXYUZMyCZ9NVwRn3FYdQol7ffFq'
+        'mIsCcXTC5n8PE6ZWUOw4ardOyooKoGmuojHE6yd0R4/6XjEQq6HmD2byPcf18BuuG1iW1rLF'
+        '1q8+67gnhc4PPFad3aZPhwg759DMIFdoZfLKXk9ddNFi4M0r59nJ07BcGA9Cx+Dr3sA26S9p'
+        'QpDBpo8u23Vdn9Dg89lODyyzVs26oR79lnba64IkSFdmlYa7RqFWHjRo2f/MTmhRcqaJrg0K'
+        'dPjBOHCkaMhPPOCyCE06iLgGvWuDzzrMtjc8KYpuTss2MsW5YdiKwoWyiUZNw4h4kTXcaPD9'
+        'C6tcL//dehuBdMnWrx859r+HxQVJQ7kwQHiNMrpcSyLL7/PsGUiyRv/atFlQbwxOdP8Nqrku'
+        'HD/RnVW7q7FIkEKVi71sdZZymUlvr2unZ/5ewfRXn2mRCdOkf4fkeYfiVxBh7n8Prr4LqCdu'
+        '1sNF0wckSEW28NYhhajjmzBuFQECkE778XZ8gQwauvmjy/EJ58omAf9UzrYZdwQYKRwx0Ki+'
+        'CZZ4IYhsW6dSrFPXV2l+aWaNX4nF7p/e44Kldemd1ZwOczMS0F6XrubDLhZ/LkGCtXOnTrpm'
+        'bpUsH69SqTJgnKynLXWUBy4omCDz9M8P0OPwDrPzPw+eLccYfg0ktDqCpEo3GSyTAVzLt91L'
+        'eeIpBIAbt3uUyb5iKlj5Wr4jz1VLa227vcFccUIuUBXnq5AtE0Fd5/P0FxcXVksIZJo3N6pQ'
+        'DXhVtvi/HSSxUjplu3OP/+t8q9d6fnA17Eddu2ABMmJNmwwc4EXEp3q1x8iUpZWUNd6KoiWP'
+        'yiy6uvehPcVIlp2VKQSLhYlpO6nYOipDav5ZhiJxFs2uQyfHiMVauClJQkWPQ3HemmV9irE5'
+        'e+/WKMHZtg0KAYgUAChIXXoS1KSso5+eTaNujtnzQep1dKIrEoZsLh17fDww+HSVMdi4tjPP'
+        '+8S/fuNq5UmHGj4MknC9JFAiThcILZsy2uvbYF106N8OicfY24hoiLYbiYpoaqWjz6qM1llw'
+        'UozbEqr6n9kkmbsWNjrF7tDaaWLZPs2bMv/g506Rrjip/YnDpe0L27wPD52LrVIhIBsOjUSe'
+        'DzOTkp3wHh9ErPDmEmNa7/ucOf/5yeuEkGDIiwZEkQv78MACFc7rsvyKpVMT7/PJhVuQDXXa'
+        'fzzjtRliyp2DyfexGYptcM51+Q5LLLwjn1KmqTr/7jsGaNP/P/PXtq9/42fxvkllskt95qMn'
+        'q0yejRMUIhja7dBKeM85NMRmms9mokTi9IVzJlSpJXX62YswwaFOO110IUtlTYnZorCiAQED'
+        'z4oMr48Wm2W7qyGs89lw7X1y9LVN0ljSnp01sihMfSras0lDP77bekYlH1wUi70j7efNPgzT'
+        'crAo0TT49yz90a7dq5Xl2aB6dXsH695IQTvFQaaTnjjCiPP64S8NvoVfAcBwaf4LJhfdr0pC'
+        '1l9vyiMYe+pFWrJPPmuYwcCYZRUafGDDe8/77L2LH1XTxN52JzUl8FR/ZMUNwT1rwjMQyTFx'
+        'ZpDB7sz3mEXklH8izLQlGUTJRPUZTM75ZlZX43DAPXdTO/u65b6ZhlWZhmknffdSoFwgAWLw'
+        '4yc2aCpGnvhWfbCc4/r7IX0rIwzqWXxuvRkA0Rwa5dfs46S+PJJy103UCvY30b0n69einoen'
+        'Ub9PZdVhAcVWIyZ06cF1+MsnqVy7PPWnz1pcbWza0YNqwFhq43uHxV69s4XpLw8spVjoZ6o2'
+        'LxEm8HQJWfkRKOP96hwnUVnDZBEI1Wtxug8cS2da6/PsQll5QTj8o68V0aIoWFMHCgx02un0'
+        'j+/e8AP7tO5y9/0XjgAZvt21V8fgfDSEUkGmEy1mic3mOP1VAUC9etMCc9esSZ97QPn8/dC8'
+        '8wDAYO1GjVKsmuXRogad3awbKqbrJvbBGAyoIFYT78MMZddymMGqWRbgo155xZlVNPtVmzZv'
+        '9KayZ9PPecRFEU5s+3uOsum3PPtUh3wFw/30bJ0yuRfPyRxXEDBaTMkhAm770nGXCct1tw9+'
+        '7dSClYv0HQppVB7z4BBPD6P+PceKPNp2t9nHuOyZgxClddVVOSoAMhNqecEufWWw1OOMGHZe'
+        'WeM/vvdXEGDfbjOvVZH/Mm6D2L40y9Bi65JMjq1Qn8fpf+/c2cJjxq3Dy9UiJdwe13mCA1wK'
+        'VlyygXTE7ywx/6EDIzx+eNN2DUSB9H/UBhyNAIf1sU48QTNd54A1auiDFxYpI+fVQ8M9VUSX'
+        'w0XnstzLBhCkOHRnjssSSlpVoFWVzKrJLtX6fu1h2GDrFqPa+qSKAgrPDhh7Bzp8P48QFOPF'
+        'HPuSVqPE6vFLz3/h4uuqiMxS96WqFDhzjz50umXuOwfXsiDYiUKr9/QMNxfLiuwXvvhjj3XD'
+        '+dOptcconCsmXQtq1KNOqgKAfSJFUn3kr2u++Gue66MCUlOldeqfLSSwpl5S7IVBvVUMTa2k'
+        '8Il/PPt6nfCrgAKfjoIz8LFgTof2yCfy6L7nVW/nJ6pRe/+P77cubOhZtvDmfdxtMQt9xSxv'
+        'XXe330601BBg0UldzurCpkXefNKfZRXRo3TlP1Punv3mcwmGTIUIehQxxGjtQYMCBIixYC26'
+        '5f+23fbtO5i41tVQTxai6DJBQy0TSXcNhh5kxJ164Og08Q+A2VULPI05vap6NpNi1bVo2baI'
+        'DND49VM5RMX6afVO3dIuuzLsUTVT4bS0Q13wWxWIA3lkneWAazZrkoapIjjrAZO1YyfbpKx/'
+        'YOiNqDZ23bapT0i/Ppp9V1GJtOneIUFjpomuDooxVmzQrQubM354nHIxnnQGancmsETm/mie'
+        'SS0/vFxrRqTQcEk1z6Y5NhwxWkcBBI+vUzOOqoGOvWGaR5tUVFJps3+/aK39QuHm2z6cxWxc'
+        'qx6/jZslky72lYuiTOTTdJLr64bhHhVq2qDhBJ795x7r9fMGpUgEQi5t1NOBQWqpXnKrUo2L'
+        'zm9D7zjMXSpQqhkEv//jYTJyp06aLuhTd9ustjj3lLB5demuCRR3S+/NJiwQKLR+dolGdWp/'
+        'fVGpJRo5J89ZWd2n+db+LwP2dHefSPBoGgl+xR09Qq7eeZ3uOPt9iwoWXWtS6TJkVZu1ZgWS'
+        '4jRioUFTrE4irjToYJExTAPQjy9KYQo9EoSdNz8XTdIBwOZeHtYtEijSuu8FZpp0yJM39+IO'
+        'XGRfnuO43bbpMseiGAdCvSf+wtkilTEmzYYPPBBwXVHM8HkYwcWc6TT0BhkVON2xrFcTX69F'
+        'YpLQ1S/XyJSr8JYXHWWTEefljQqlWgeefplcKbp6Q4yulfq5wl6NwpHQ2WRKIValMA7dtbzJ'
+        'njsnSJQ/cesX3er29fB9PM1+wJ3sNfvryA8RMU1q2tvPcpLZ98DKV7qssyUTFf0nWH7t2j3H'
+        'lnjPnzE5wxSWIY6SDFgQk7aPWN4EJ9IoZiH3gGrdukMzmp/N//OViWpzL1zFYLwdixCu+9K5'
+        'g9O8Ljj2tEo5VJVIpicdJJGnMea6o4TW1S8cA3fhFm/KkJbr/d5KKLBC1bKji2YNk/FW6Ypm'
+        'SCnDVhdOlq8dxzGv2PEanNah6/yHVdLNPTHI2d5aEJ8/QWsmWLTbduHi2xU+dynv+LQ2mpQq'
+        '9eBj16+FFVKN2929NYUlBaGuCRP9r84x+Cr772ASrn/KicPzys0q27QjIRqKHB800kPl8Sn1'
+        '9iW94Oy+ozaO19Xbt2SS6/3ORnPw3Rtr2CQBzQPL05NUn15V0UFekIxTNJW7eEGTYsxMSJIf'
+        'r2FbzwQgxSpk3gueydOyvc+7swn38eYsUKk3nzSrnnXoltuxxzdEXeOU/yVeN4kkz6KdsTIB'
+        'YL4GmKqi5PtjhceGGC006LsWu35O3lgh07TUQtqV8Pujy9fj8UtoSKxtIBFSkVSkoUKiUbTH'
+        '0VAlQNBg3SmDgRWrRwCARs3n67gN//Pp7aM5TfnaX+ZCmFzz4zueMOWLfW5u//kJT08zdJFK'
+        'FJ8/RKqTL0RMkXn2e7kiBEkk8+SdKpk1OnFPNCktlO8c03KrfcAq+8Eqghc3g+SfZK/N4apr'
+        'g4yX++UpCuAqgYRpybbzaZObPwgHGO8+xtJi59ekNFw3nfpdRZsMBl164UH2UfCkNk/vGkWz'
+        'eHvy3y8+abDscPjlB1a0j+iCQYMlm0yKJr1zjVuc/+gMU/Xzd57bVy7rqrlL8tEkyZ4qMp36'
+        'aS8w5Tr4UsIZk9W6Fr13KqNti9vwvy+ecq1167m03fOPUiMglgxHAfq1eGWbgwydHHpDtOPp'
+        'kqQSwm6NbN4uE/2LRqHaNi4HjlXLc2xBtveKlIpl6jc9qEAN27B+pFjMp1Vo68yNMbiTg8+Z'
+        'TJ7+412L7dW0s57rgo992nMXq0yplnxpk3T0PTlP0qnxA+lr1hcv/9Dive1lNvRGnK1e+0uC'
+        'xcGOeMM3R271Z5+ukk99wtCIYc2rWDjz4KoSg2r75qMmyYWlFfQea1QHAI5uk1jAg/vtRl/C'
+        'k2kyYl+PprPwMHSu6910FKP++9lySZtDEM/36VLxxWmXhagImnwaef7mHpSwlWrVJ5+22FWC'
+        'auU4+FmZyJJBj0si+0ay+5cUaQI4/cw2N/kjzyR5VPP43x3XaFSMRFUfTK9Q0d4nl6hYAjOl'
+        'n86BzJvff4eeyx9IsovNcDN9RDTO/V7trV5eqrJFdfJbHtAC++GGfFCoVVqx2+2aSnJsrZux'
+        'Yaq+N4yalLSkSlhclWrRLcPNOgTRuLM84IZzSJaZn7Ajtgknd5evsfkyla6lMyerTAMJQclc'
+        '9bHQcIBiUXX6xz8cXgOCqbvrbYsMHhq68lH3/sJTvavt1m61aDWFwDqVK3AFtt4t1/8GCbdu'
+        '20SiO9Qwcf3boZgOvV1zqcp7d6vNRIKios56ZfRXnowfQygMPkyQahkEE0Gm3U8vUrCdO3n0'
+        'fZ2VO6J/VYFXw+g23/tdn8rcv118O6dfsiOdVFPA124YUCTVMqla+kpKjBr9M5JPL0poOWY0'
+        '/yc8IJEYac4HLhhdCnj8WQIQUNGtP1Kd+3m5OMGVNOly4Behc7tG1n0blzkt69VUaP9jNoUJ'
+        'x16xo+xykqijF5cgCwK5VPiIZjN2ae3jp1mPrmma2twNXhVVzhLQeceKLD44/H+cFRQUQtzn'
+        '/uyifp2sVHz542y/4Z4u3lWfRuYfLJJ0k6drSAhmgYD/O666BFC4FZZWpSl4xRB+J51CT5ma'
+        'c3FPboEQc6728K7+9/F1x+eQsqh6kks2eXoeuCG2/cV6KfmqRCc3TsGGX1GocWBU7T5jk+aP'
+        'L0CoD6vbgql+WbOFGhb7+9OTgL/6rSo4dg//Lbpe/tMGuW11mqDuwDlee4Iec2bZ7efYqoNI'
+        'gPZPl03eHBB1QUJdteCD75OEA0ptCiRbLGa2u5K2PHxjjnnPS7I/evfPt153zm9B4ceBaPPG'
+        'Lzy5tCKXfae7q9eyfYvVthx476ZniSaJrJihUW/fvnY33zMU9vM8O7/HLBf/8b5aEHw8hU/O'
+        'WLL/Y33atg0iSLXr1sFCU/61sXvPx9b3UeiBCSW26BmTdHqTxv2T+3dflyjU8/bd5Nftgk1Q'
+        'FPVXV++tNkKg9fw2Ic/UoirFppZFLF52N9mzxPb3PGk0A0EmHnTknPnjquWzUGI2ndOsnOnW'
+        'lebk2Bt/TvLj+/PsLMmx2EkKntN/lT333hQRNzepsDXvqKUEiiG9WzuaZNs7hjVjnBYKIOSA'
+        'p/eNjPypXqXrn08qG+tUnzNqgHUgQEagjwfr1JMvUal1WrYcBxtbP8bFvn8p9ofLmxMbODNo'
+        '40Kae3OeGpqkHr1olUcunKMm5cjFdeCRKNRonHHF562eWJJ1TeeceH46TpEtniNXlhYZznn5'
+        'cMHGiSNln5Ut885fQ2H4lEXLLaLUskO3ZYme+a5jDpDMkrryisXy8oKYlSmbMMacJWaWmQH1'
+        '/m4Lp7m6d8lSbl9DYnvHfeSaS0RSU0WrdOcM/dWbEZgbeNAUlxsc7Sl/x06VJdJlCvHIZeeQ'
+        '91vtS3JskLTm++4+3aBSNHWmzcGMy61uLcc01uuUXSuZOCRNaAJ/jkE8mpEzQi5X6qbrS/4o'
+        'ooDz3kI91h8qG+ec/pzWc8KWHGjHI2bgyTJj6NGhVlzhwfvXqF2V26C9MS+8CTlJQInn5K5Z'
+        'xzbKT09kMDtGkTZ/p0jezX9jV1fWvDyxtOb96J9LJQ/OMfCf7854pX+510UoQXXwzj9wMita'
+        'IuKwhgNcmECX5atEiwZ4+XUlZVLR58yKZ9eyWlc5o6j1/dJO84vXmDZ5ls2SK48kpS7wKA4l'
+        '4xnn7aQFUt0oOzbniCl1+OsWdPOlmA5Je/THL6RBVFEVj5UN864jVKnt6DAe/rr8uZNEmybp'
+        '2XpMgfMFnxtuDoo6kfXipZ5FlnlbN4sWfWSkqifPhhCMOQmKaVF/Vtujy9zRlPem//2LDe4v'
+        'TTRaqzeNf++laXAQPSSarrUT4h2PilxcsvpzfPufxiuvei9LQda07tl9s8vXU8Ny/xhMfxW7'
+        'QoweAhDp99VvmtKitWVf8CidruLaXklpuT2LY3Yo84IsbZ/5PaPCf2vjbf2y8/Ob1NhLdkSY'
+        'ILLvBj29nxFq/TGEacLVscAn6FUCgIQtSpfCtWKJx1VjAzD7rt1zF+cYPETHlQ+7v42FSc3t'
+        'zl6a3jOfmIJyVs3Ci4+hot1Vm8TiKEQ7+SJKNGOhx1lIOiCC8iK+p2z7IyjZtuUlJpZCUIm3'
+        'PP1ZGkJ5H7v/jYVJzeRsnT21zwpIR588p5+WXB0qU68XiAdM7fghZJnv8LjBsXIhaLei8MrT'
+        'aXy97lk0AioXDJJZL167OyYkqN398f5f77an84+dp+hziBymXcOJfVqz1394gjYjz1lI7rSD'
+        'p0TNCzp7qf5VOYOtVhwYK0Ks/uIDavvZZk5Ei92bXfoc3plZLNm5P87/+m90pLduwwuPXWJL'
+        '16qVx2mYtpOQhEHfHAMk1M0+a55xQWLAhSuaM4tGsXp1cvQSisousGQjS/9juEV6sFTz3tkE'
+        'z6Mv+3LO+NJUuWSjp0qD6fbk0iBSRNlT/9SWHaND/ZL9Ro2zbOc89FWLtW8uKLNgOPUw7om2'
+        'tzKYesSZJS8MMB5WxY35KKcePQunWSJ56QjBlT4VLXhheLwd13J3juWZVvN6eXEbxz/H6L11'
+        '+HY4+VdcbL5/Y7NDm9qRqXlfn4/AvB1m0CQ3do29bbdN+ypZvC8yarteHZtkbv3hp79njxlf'
+        '7948yda5NImBg+heJiaHUQtB/kePGx2UQsUx8dj9Do2t1zoy3TJBo1SW8nqcum+DTemjUue/'
+        'ZUuOPrN+hMnmzRo0eA885L0Ku4bvXI9/aDQ3oO40k6afRevwvvaG3iuioPPSTInrOYSZUvvy'
+        'xg2TKdtm329XKw5ieHOb0NxPv8cx8nj3OJRvxUjD+Jz2dx++0206eHQUhKd+fWNDRVfQ/zYR'
+        'oogwcH+e47ydpPk2zbahON27RsAX376hQXh1O59ZqpS1SN5LzD1CWBzcGEB5JgQDB4sN8bwa'
+        'YEIdF1SZUpU/9FpdcAAAA2SURBVJOUL9d4hzm9h/HqhXeY03sYr154h7yXdFjqJ6KsrCzjJe'
+        'WjCjyMl194h93qw3j1wvv/vaJRmcCaF0sAAAAASUVORK5CYII='
+    ),
+    'horse_white': (
+        'data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAIwAAACMCAYAAACuwEE+AAAACX'
+        'BIWXMAAA7EAAAOxAGVKw4bAAARBklEQVR4nO2deXxb1ZXHv+fJsh0oJLEkJ6HpsIWQBj4DbQ'
+        'OUTlv2UphQKExd1hJgIC22nJS9tDQbZQsNYDn0Y6YQOh9gaIDQMnSAAQKFsnzYGQilIbQBQh'
+        'JbkhNnw9byzvzxlODYkizJWp6S+/0n8Xv33nNs/fTeXc49FwwGg8FgMBgMBoPBYDAYDAaDwW'
+        'AwGAwGg8FgMBgMBoPBYDAYDAaDwWAwGAwGpNQGlFkWAd80bOsabO/Bsm56T6ltGkqHVcrGFR'
+        'UCvmmo3InoXniTe5bSnqH0lFQwBEIHo9Kx7WdN7l9Se4aSU1rB2HI9UPP5zwRKas9QckomGB'
+        '1924EIR29/VUreZzKUlqILRlFRf2gKHusGwDvg9oZi2zOUl5qhiwyNMqsGf8NBYJ0E7T8Avk'
+        'y6EZgl7xTDnqFyDEswGlg4FluPQ/RS4KAhKySJbquLCsxOiWq2CqLD8cVQHgrqUyizagn4z0'
+        'H5DYNfO9n4CItLScpYxP42yETAi7Ac5UE8NU/RubZbmJMoxC9D6clbMDq6YySe2DPAV0rgTx'
+        'xYjehlhIMPmaeO+8hLMDrmN40k40+C/HOpHNpqClgFugibX0t3q+ksu4ScBaPMsvD7loCcXE'
+        'qH0rAGuB8PIekM/mOowjqhrY6NMlE6g6aDXQJyEoyigm/hFYhen2udEtAL8hCqDyK8wiiNsq'
+        'LOZkKfRTcBYDIeORKlCVgnkeAhFfJzh2bID1/HzN+VZP3NwPRcypcP2Qh2H8juQO12t1SulW'
+        'jLNZXxa8cm47BaUaExtA9JeQncOKWvu4HslubGMkbb134+gDcUE0+6i8osC9+yK4AHgN3L69'
+        'KwWI7WHCeftqyrtCM7KoNeMTr2lr1I1NwDfCPdfZfSAzKbpHeRibcpLdsEoajgX3gBojeg+C'
+        'rpVI4oyoPAfVjWUxJu3lRph3YGamBrx7Z9HjADLXHIQzGxCNMrz8tGI5ZyITqhrY71cjdweq'
+        'WdKZAu0Jl4655kzer1MDvpXJ4tcIDAMjFLDcVD1N92Bsh9lXakSCwHliPEUB0J4gP+SqT2XG'
+        'F6vNLO7QjUAFMq7UQRmQhMRCHVPXsOT++FQtCIpUjUgDXGWbrZoUiA3EYkfLUwJ1aMBhUVdl'
+        'vYQK0eBEwB+aIzFwSI9qDSiYcPSOhfsT77hMgVm0q5eOoE2N++K/AFPLF6bPmMhPUZ3cGNpb'
+        'Qr6m+/B/SsUhkoMwngdUTmSrjlf4bbmO61qJ7Nmw9F9STQI0AmA7sOWVGIAh9gyyvAs9jepc'
+        'Ua7isdXnzxqYheCBwGjObz0W4P8H8ICwlHHhDm2MWw2R9Rf+hG4Io86sRA30bkXmyJIboPig'
+        '/RXUHqQRuASan+QznncVaAXkIk+thwOrnKrBpGN0zC8pyE6DSc19xw6QYeQniYpL5QyOq7E4'
+        'PUeDSanAsyhex/WxtYRH08KKsu+axQp9Mh6g99D/hjVl9hM7AK5M94dOFQK8HON3NTB8pZZJ'
+        'hNLhHrgOuwPEvYZcRqVk7ry+XxrCz2MCbqIxk/DLgmhw9kOKwGnU2ybnEuTx1llkWDbxIeuR'
+        'XluDxtvU4s/h3ZcEl3gb4OQpywBf+TMDDCnz6EN1D9FZGxjwtNyXwbV3/oDuDConiaP1tAH0'
+        'WshVie9+lcux7nleUwwedlvfhAjwJpBQ4ts389qJxLtPmRTKJWZtXi998AzKRwAf+DWHxKsU'
+        'QjADp+wQh6vecAFwFrgZtJJN5i/cye4XSgdPcFDdR6XwP2LoazhboBxEBioHEERREQL2g9+Y'
+        'WYFhsblZep9Z4sa6ZHtl50vsSBJtD5wBcZ7tNOeBePHi1rW8PD9LcMe6t9oVMQHi61nSrnE5'
+        'SrScrzeJiK6Hk4IbDFnHV/E5gqkeDq4TRSesGMXzCC3pqXyxDWWe0okKRIW38y8DYkTpDIT9'
+        'cU2kBZRjHqbzsCZCml3pq749EHrAaWgS5HJYxoErXGIzoZ+CrQkGebK9CaIyX6k08Lcag8gn'
+        'HWqz7EeR8bhkQ2AvehchvRi9/P2CkeeftovMn5wI/Iqy8mGyFxCJEZy/Pto5ZtnkT97VNBHy'
+        'mnzSrmJokEr8y1sDa0H46lzwB1ediIo3xXosGl+ThWPsGw2IO/8+/AP5XLZhXzMZHaCfksmK'
+        'qv/WREFzMwvjk7fcAiPL2XSeflm3OpUNZvu/ra5yH6i3LarFJi2LqvdLeuyqeS+kJ3IZxXgL'
+        '2PEe5F5W7qY5/0nx3WCW11dHsaEfsIKLdgxnX4icfew5VB5S5DmCnh4G35VNHd2n3U8QJooY'
+        'mbbOBThB6UzaAjQEbi9D0txPrXso5aZM30CMJj5bRZxZyuzMrr85GNLVGUZpxFyEKwgC+hHA'
+        'gclpoK2RNneWeehJsfL/8w17ba6T9Fb0iPygEEGnfJt5pEW55G5TygWIuOMUR/SSQyFyowYn'
+        'GCzUNPghxTbttVh5UcK10zOwupqo1tB2HLC+QSjpGZNVh6gnS1vr3NpWE0VhCCKCL/UW67VU'
+        'nCm8+IZzukq/VtEonxKFcC+YrufVSmwZb9+4sFKjQnkkoZ8g7wpUrYrxoSspesb/louM04E3'
+        'yJbyJyOCpfR9kb0RGgHpBeoAf0DUReRe0XGSXvyorWvnRtVWwSTf1tl4PcVCn7VcEwXknZUB'
+        'Z7CIRHEBMvgcSWTOJIRykXurJjsQSb6ylvgFU1sQm7b0spGhaakoRx9nLlOZ6q3GJg19iVIM'
+        '9VzL77+ZDIlqKGVxaDiglGaEoi8kucySLDQFR/68YNeJUNN7C2vAmYba6D6cNjP1BpJ9JRWc'
+        'F0XrYF+FNFfXAnL9G1R2ToYuWnooJx5mR0Pk72TIPDOmoS5xUSdF8OKh8BFw6+BQw7OHkHIY'
+        'lyk6z96cpKO5KJigvGifiSv1XaD1eg8rBEgzdU2o1sVFwwACgvVdoFF/A6al9QaSeGwh2Csf'
+        'QvlXahCCjCk8AHBdTtgeRZ1ZDA2h2CSSSXASWZ1SwTnwBnE46ciK1HA+vzqq20SGRmVbyWK7'
+        'c00J91I9bgj60H8o7/qDz6KlbN6dJ18d8B6GaV+ttaQH4L1OfUhCSeLqGDRcUVT5hUsHPRF9'
+        'nKwAaQU7aJJYVEWu9F9FfkPF3gmeocB+R+XCGYFAXvxqsYojdm2noq4dZrgavJaelDFuJv+2'
+        'pxnSsNbhLMq5V2IG9kiOmASGQB6NkMneLLC9b9OrbN9cHx7hFMn4SAZZV2Iy9szRpmKsyxiU'
+        'R/j3IsTo6dbEwgIXcrHZXMJjEkrhGMbGyJAtNAK7mGsg5lEfBojuV/oOMXjMhWQJhjO7sLk1'
+        '8D3s5WFjiBQGxBjrYrgmsEAyCR4GsIp1L+02c/RrgeT80kiQbPp0+m4QyVh0B8xOr3y8WARG'
+        'b+jWTtEag8SOZ+jaBM10DoArd2gl0lGAAJtz6P6JGpxIKlxEZlJXAJ9fFJEg5eLZ0/6YLU00'
+        '70LIaeTxHsxPG5GpR103uIhn8IzMXZppoOL0o7jSFXpkdxpYoBdGxbgIS8irORqth0Y+sZdE'
+        'efypZpUgMLx6L2a2TLOqGykmh433wzVqYSLS0h42cgG4lbe0rPxa46mcV1T5ityNrWMMnag0'
+        'A6KHpUntp0R58d6kOWcPNaxJoEvJ65kO6Jz39k3i5EW/6IaBMZR1BajzeZtX9UCVwrGEg9wi'
+        'ONzaj8G1CUBM2plv00+CbkVDLcvIlk7TE4iX3SFsHi3LxdGH3H7qicT/onzGbE+h6RFtfNTb'
+        'laMJCK/Y02/wHReUVt2LLOz9mHddN7UEIZCyinakPb5Fzb08a2ffHE/hs4Ic3t91A9WsLNj7'
+        'vxGGbXCwZSMTPKkCfK5oc267gOf87FR+stQKb0G1/AkpzOmNRA+7ex5WngWwNuxRD+k7jnmx'
+        'JtfSVnv8pMVQjGQY7KctMGHmHoybH+1BPv+37OpVcEYwjZPsh/yVZdUdFA2zRUn2BwRz6MxZ'
+        'mEW6a5rZM7kKoQTCrtRbYPZCWRyGnU6N7AHUBvbi3LVcqs3Fbsfe3zULIJLN2BpcDWMzQX3o'
+        'rKnQxewX6OZO1+0hV8yI2voIFUhWAYt0cDMD5zAVkozEnI2tYwkZYfUx9vQKxxYE9Bskbz7Y'
+        'PPf1E20zqhrU79oacRriLjEFgjiF6a9o6Tzft3iAbZ/u+9HpVTiUSOqaZzKl07D9OfVOqKtz'
+        'Lc3gBbxkvkyo1p647r2IV4/H7QkzLUX0EkckC6Y3K0oW0ylvwByDSb+wbozcQST6RLza7Mqs'
+        'EfaAe9iO3/1n9CrJkSbl6RoV3XUh1PGLWypeBamkksALJm+hbYfBbC/2YoMoGA//JBJhtDx2'
+        'PJ8wwWi6LyIsr3iUQOl0jrf2XM4+/3zRggljjKzxilp1WjWKBanjD+0HzgsjS3NmHpwdLV+u'
+        'GQbYzr8BPvezpDRvLV1McnbE0GqP7QmcBdDE5jugqYR2TMnUPtG3Lyzelytk+8fIlEgrcM5a'
+        'ubcUeIZhZSHd5j09+UxdIVzCoWHb9gBH11I+lLeLFoBdJlJN+DXm9I0Qvxt18I3M72WSUUdC'
+        'mxRFPOp4LUciIDs3SrFJwgyC24XjD4/BOBAwZdF6LU2Fdlq6qjO0bSG3sf7AAWFs4oJNNr+G'
+        'z87VHgUgaKRZhBeOztee1GtPScQZP+oj8Cbsy5DRfifsGInuEcVTMQnTvkcS418eNRxvD5q3'
+        'frv704B0H0z/9WB1zO9q/pzxBOI9yS16yrstiDdn45za2VubbhVlzd6U3FhJyS5sY74Lkra9'
+        '2Rt4/G1iYG99M2kLQPQeUcBocY9C+7CaRJwsHH8s/H35QEfXfwDa36DXuuFgyjbh0JkiYPns'
+        'yXcHPaNCE6rmMXDYSux2t/hHDagNvdWJwo62a8K9GWh1H5NZlWi1Wuk0hLrpF3g7GtuQycQN'
+        'SinB9ZUVwumFG9pN3gZo8cmPTYmWC7dX9isbtRrtp2RPDnhFFpkq7gC9uuWPIAmUInLDufZY'
+        'ZBSHfLSyC/G9DooW6NpMsV1zufOp/g52zvaxL4CFiFUIvSCPhwpufTfQk+guTxA3cXqj90DU'
+        '70Wzp6sfUo6W59uWDfnSCwd4HG1KVPiIzZ262pPHLB3U8YgGh4DvD7AVc9wD7At1G+nvr/SN'
+        'L9PsIv8NZOTrsVVfhKFsv1WLJUG0NZFxWzIWtbw6ic2e/SxmoWC1SBYIQ5Cerj5wPTyRzENJ'
+        'BeVK5Da8YTbrnOme1Ng8qoNFf755Ubgc1S9bX/LN+8/9uIhp9BpSVl8M8FteEiXP9K6o/S4c'
+        'UfCyD2rtiWM1fi8cRIJGJ4vTF6NU795hi71SVyyT2r/valzjHEKYSXSSR/iMeaD9K0nWllCd'
+        'TMKOToO+esqLXfxbJfK0Xe3XJSVYIpNhoILekXsrABKzlRumZ2OuEI/ssQrmX7o/HWIHo14e'
+        'h96RYrdwZc/0oqKTbvpf63BZGTtn77U5vPbkL1xNT5i1sZh8pd+P1vauNt3yj4NVXF7HS/8A'
+        'DuAdZjcaqEWwYlmZZo61NYif2A/lFwAkzGtv5Cg2+PcjnqFnZqwUg0+D718T2kK/hExjJdMz'
+        'tJJPaBQTHFipWs6hFPIezUfZh8SG1qexT4Wr/Lz2Prj6W79b1M9XY0duonTD6kNrVNBfoPjb'
+        '+FJa9pIPTzSvlVbswTJk9SZ0S/OOByEjhWIsFnK+BSWTFPmLyx0wVse1A9sOyuVAAjmHxRO9'
+        '0quaIsL7svFcAIJl9U0+WueYPusVWTCXM4GMHky/r1m4Cuflc2INa/V/uiYq4YweTN7CQqWw'
+        'Or3kD0SAk3Z9ozZTAYDAaDwWAwGAwGg8FgMBgMBoPBYDAYDAaDwWAwGAwGg8FgMBgMBoPBYD'
+        'DsiPw/n/zV0pD1DycAAAAASUVORK5CYII='
+    ),
+}
+
+ATLAS_DATA = (
+    b'x\xda\xec]\x07xS\xe5\xf7nF\xd3\xb4I\x9b.\xf6\x90\xbde\x8a\x82( (\x88\x80\x82 \n\x88\xb2\x97 \x08\n\xca\x92\xad\x80\x03\x1c8~*\xe2F\xc5'
+    b'\xbf\x13\x04A\xdc\xa0\x88\x0b\x11D\x05Qd\xb6\xcd\xb8Y\x1d\xe9\xf9\xdf\xf7&7\xdc\xa4I\x9a\xa4I\x9b\xa4\xdf\xfb<\xf7io\xc6\xc9\xbd\xdf\xbd\xf7;\xe7;\xe3'
+    b'=II\x0c\x0c\xa1\xa1\xb4\xb4\x94\xc4\x8d\xe38\xca\xcf\xcf\x176\x93\xc9D\xd2\xf7\xc4\xd7\xb1\xd9\xedv\xf7\xeb\xf8_\xfa\x1e\x93\x97\xd8\xf2\xd8\x13\xc3\xc0\xc0\xc0\x90x'
+    b'\xfa\x1f:!\x92\xfa\x86\xc9K<y\xec\x89a````\xfa\xdf\x97~p8\x1cL^\x02\xcbcO\x0c\x03\x03\x03Cb\x00>a\xe8\x02lV\xabU\x98\xef'
+    b"\xb1\xe1\x7f\xf1ul\xe2\xeb\xd8\xccf\xb3\xfbu\xfc/}O\xfa\x1d&/\xf1\xe4\xb1'\x86\x81\x81\x81!1\xc0\xfc\xdcL^(\xf2\xd8\x13\xc3\xc0\xc0\xc0\xc0\xf4\x7f"
+    b'\\\xe9/\x87sc\xfa\x9f\xe9\x7f\x06\x06\x06\x06\x86\xa4\xa4\xea\xe6\xbf6\xbat\x1a\xf3\xff3\xff?\x03\x03\x03CuF$\xd6\x91yyy\x11]\x97FK^\x01'
+    b'\xff7\xef\xddw\xa9\xd4\x95\x13\x97\xe8\xe7\x1b\ry\xec\x89a````\xfa?\xe6\xfd\xdc\x0e\x97\xfe\xe2_\x83\x0e3\xfc\xf4\x13\x9d[\xb4H\xd0\xff\xc8\x8bw\xca'
+    b'\xcb\x13\xde\xe7X\x9e\x00\xcb\xffg````\xfa\xdfC?@WF\xb2\xde\xac2\xe4\x15\x1d;F\xdc\xa4Id\x1e3\x86\xce-^L\x86\xdf~#\xc3u\xd7'
+    b'\x91\xf9\xd9g\xc9\xfc\xf6\xdbd\xbc\xf7^2\xad_O\xf9\x9b6\xd1\x99m\xdb<\xf4\x7f<\x9eoe\xc9cO\x0c\x03\x03\x03Cb \x11\xf5\x9c\x99\x97a\x1c<'
+    b'\x98\x1cIId\xea\xde\x9d\xb8W^%\xd3\xa0\x81T\xc8\xef\x17|\xf0\x01\x99\xaf\xbf\x9eJ\xf9\xffK\x14\n2\xdc~;\x99\xf7\xee%\xee\xf0a2\x9e<yA'
+    b"^i\xf5\xd2\xeb\xc1\xf2\x04\xb0'\x86\x81\x81\x81\xa1z\xe9\xff\x98\xf5K\xe7\xe5\x0b\xfe{\x87\xc3\xf5\x9d\xe2b2\xf1\xebyKv6\x99\xb5Z\xb2\xbc\xf7\x1e\x99\xeb"
+    b'\xd5\x13l\x01\x8bJE\xdc\x11^\xcf7h \xecc\xb3\xcbdd\xe37\xfc5ee\x127l\x18\x9dY\xb4\x88Jl6\x96\xff\xcf\xf4?\x03\x03\x03C\xc2\xeb'
+    b'\x7f\xc4\xc7#\xa9o*K^^\xbe37\xcda\xb1\x90\xf9\xc5\x17\xc9t\xf1\xc5T\xe4\xd2\xed\x96\x9a5\xc8\xdc\xa9\x93\xf0\x7f\x91ZM\xfaY\xb3\xc8t\xe4\x08Y'
+    b"\xe4ra\xfd\x8f\xd7\xc5\xbf%\xfc\xc6\xe5\xe4\x90\xf1\xe6\x11d\xd8\xb9\xd3Y/X\xea\x88\xb9\xf3\xadjy\xec\x89a```H\x0c\xc4{]\x9aM\xaf'\xc3\xfa"
+    b'\r\xc45n,\xe8pQ\xa7\x8bz]\xdc\x8ay\x9do\xbc\xed6\xb2\x9d8A\xa6E\x8b\xa9P\xa1\xf0\xf8\x1c\xd7\xba\x15Y6\xf0r\x9ex\x82\x8c\x0f=D\xdc'
+    b'#\x8f8s\x05v\xed"\xdb\xc9\x93\xacN\x90\xdf\xc0\x15\xc9\x9e\x18\x06\x06\x06\x86\xc4@\xbc\xf8\xa5\x1d\xe8_\xc7\xcb\xc8\xcbs\xfa\xfc\xcd\xe7\xce\x0b:\x9a\xabWO'
+    b'X\xef\x9b\xd3\xb5dv\xf9\xf5K}l\xa2\x1d\xc05kJ\xd6=\x9f\x92\xf5\x95W\xc8\xa6Ry\xd8\x08\xbe6\xc8\xb6\xf0\xb6\x82\xa9o\x1f\xe2\xd6\xae%\xc3\x8e\x8f'
+    b"\xf9\xdf\xcfc\xf9\xff\x0c\t\x8d\xe4$\xb5\xba\xb3\xea\xe6\x9b\x15I*\x15\x1b\r\x06\x06\xa6\xff\xabZ\x7fA\xff\x1b\xce\x9f'\xfd\xd3O\x13W\xa7\x8e\xb0\xde/\x91\xc9"
+    b'H?{6q\xfc\x1a\x9d;\xf1\x0fYSS\xfd\xda\x00\xa2\x1d`\xd3h\xc8\x8a\xbc\x80\xcd\x9b\xa9\x90\xff\xbe\xc3\xcbo \xdd\x8ad\xbc\xcdp\xf9\xe5d\xb8\x7f\t'
+    b'\xbf\xddO\xe6o\xbeq\xda L\xff3$(\xe4I\n\xc5\xcd\x9a\xa7\x9ez(\xc7l\xae\xadh\xdd\x9a\x8d\x08\x03Cb"V\xfd\xcd\xd0\xf5&\xee\x82\xbc"\x9b'
+    b'\x8d\xcc_~IF^\x17\x17{\xe9\xe8B\xb9\x8c\x0c\xf3\xee!\xd3\xc6\x8dd\xe7\xd7\xea\x81\xf4\xbfh\x03X2\xd2\xc9\xfc\xfd\x012N\x9dZ\xe6\xf3\xf6\xb44\xb2'
+    b"\\7\x80\xb8\x89\x93\xc8\xfc\xd1Gd\xb7X\x98\xff\xdf\xb5\xb1'&\xf1\xd1N5x\xf0\xa39\x85\x85\x8f\xe58\x1c-\x92\xfb\xf4a#\xc2\xc0\x90\x98\x88\xe4:2"
+    b'\x94z\xb3\xf2\xe59\x84\xcd\xf0\xc3\x0f\xa4G\xad~\xb7ndw\xe5\xed\xf9\xd3\xe9%\x12\xbf}y\xfa_\xa8\rl\xd5\x8a\x8aO\x9f&S\x87\xf6\x1e\xdf\x11r\x05'
+    b'.\xbe\x98,W]E\xe6a\xc3(\x7f\xedZ\xca\xfb\xeb\xaf(\x9fo\xec\xcb\x8bt\xfe\x9f*I\xa3\x19\x98\xb6|yMy\x8b\x16\xecI\x8c\r\xe0\x9aL\xcf\xd8'
+    b'\xb1\xe3\xf1\\"\xe8\xff\x96\xc9W_\xcdF\x85\x81\x81\xe9\xff\xca\xf2K;\\\xfa\xdf\xce\xeb~N\xab%S\xe3\xc6d\xd1\xe9|\xeau\x87W\x1e\x7fi\x90\x9b\xdb'
+    b'\x06\xb8\xf3N\xb2\xed\xd9#\xc4\x01\xbck\x02\x8ax;\xc0t\xe3\x8d\xa4\x7f\xfdu*\xf8\xef\xd4\x85\xe3\x13\xf8\x03Y\xfd_\xc5|\xccJ\xe5\x18\xed\xe6\xcd\xd01W'
+    b'\xa9\xef\xba\x8b=\x89U\x07eRJ\xcaE\xca\xae]\x87j\x1e~xQ\xe6\xe1\xc3\x1brJJ\xa0\xff\x1f\xca\xe1\xb8Z\x8aV\xad\xd8\x08100\xfd_\xa9\xfa'
+    b'\x9f\xd7\xb1\x86\xfe\xfd\xa9D&\xa7\xbck\xaf%n\xe7N\x81\xbf\xa74\xc2\x9bU\xad\x16\xb8\x02M\x83\x07\x97y\xcfV\xab\x16qOm$=o\x1f\xe4\xed\xdaE'
+    b"\x86\x8d\x1b\xc9\xf4\xd4Sd\xfb\xe9'*-q0\xfd_\x01tI\x199r}Nq1\xf4\xccp\xcd\xe3\x8f\xb3'\xb1j\xf4~\xb7\x94\xf1\xe3\xef\xd1\xed\xdf/"
+    b'\xea|\xe9\xf6p\x8e\xd9\xdc%\xe5\x96[\xea*\xda\xb7o\xaf\x1a2\xa4\x93j\xc4\x88\x06\x8a.]\x92\x93RS\xd9\xe810\xc4?bU/\x19\x90c\xdf\xa6\x8d'
+    b'\xa0\x87\xb9\x8b/&n\xf1b\xc1\xbf\x1fi\xfd\x8fu\xbeq\xda42l\xdf\xee\xd3\xbe\x10k\x00\x8a$>\x03\xf8\nL\x9d:\xd2\xd9\xb9s\xdd\xbd\x84X\xfe_'
+    b"(>\xe6\xb4\xb49\xbao\xbe\x11\xf5\xccH\xed\xb3\xcf\xb2'\xb1r\x91&\xcb\xce\x9e\x92\xf1\xe1\x87\x8f\xe5\x96\x96z\xeb\xfd@\x1b>\x7f\x7f\xd6_\x7f\rJ[\xb9"
+    b'2K\xde\xb0!\x1bI\x06\x06\xa6\xff#\xado\xf4\xbc\xfe7\xf7\xb8\xdc\xa3\x16\xaf4J\xfa\xdf\xc4\xaf\xf3m\x05\x05\xc4\xb5n\xed7N\x00\xdb\xc3\x9c\x95E\xc6\x19'
+    b"3\xe8\xdc\xbcy\xa4\xdf\xb8\x91\x0c\x87\x0f\xbbx\x82\x98\xfe\x0fn\xbd\xa9V_\xa4\xbc\xf4\xd2\x1b5\x8f>\xfaH\x8e\xdd.\xea\x94!i\xeb\xd6\xb1'\xb12\xd7\xfd"
+    b'j\xf5\xf4\x8c\x8f?\x0eE\xef\xfb\xdaP\x1f\x00\xdb\xad\xb6\xa2M\x9b@v\x06\x1bq\x06\x86\xea\xa1\xff\x1d\x11X\x0f\x83\xab\x0e\xfa?\x7f\xd6,2t\xe9"\xf8\x01'
+    b'\x8c\x8d\x1a\t\xfc\xbd%a\xc4\xf9\xed\xae:\x7f\x7f\x9f\xc1\xba\x9f\xfb\xe6\x1b2\xf1\xeby\x87/\xfb`\xe0@\xb2\xbc\xf1:\x15\x9f\xcfs\xf7\x13tr\x0fF\xe6|'
+    b"#=~\xd1\x94\x17\xea\xfd%K\x92\xcbs\xe5M\x9b\xf6O]\xb8\xf0\xde\xcc\x9f~z8\xc7b\xf1\xd6#\xf0-\xb3'\xb1\xf2t\xff0\xcd\x86\r\xa1\xae\xfb\x03"
+    b'm\x88\xe3\xcc\xc8\xf8\xe4\x93^\xea\x993Q;\xd0Q5|x?\xfez\xcf\xd2}\xfe\xf9\xcc\x8c\xdd\xbbq\x0f\xb0\x91\x8f\x7f\xe0:vS\x8f\x1f\xbf,\xeb\xf8\xf1'
+    b'T\x99N\xc7F$\xfe\x01N\xb7X\xadK+\xe47\xceU\x0bh1\x1a\xc9\xfa\xd9gdKO/\xa3\x9f\x8b\xfd\xd8\x04\x82o\xff\xca+\x89\xbb\xfd\xf6ry\x81'
+    b'\x0c\x0f>H\xc6M/\xfa\xd4\xff\xfa\xfb\xefw\xd6#\x9a\xb8\x84\xad\xeb\x0bV^(\xf7V]\xc5\xc5\x17OL\xdf\xba\xf5Q\xc9Z\xdf\xd76#c\xd7\xae\x0e\xaa'
+    b'\xa1C\xafPO\x9bv}\xda\x03\x0f\xdc\x90\xb6vm\x0f\xf5\x94)\xf5\x14\x1d:0\xfe\x99\xc8\xa1\x86\xbcys\x8c\xf5c9\x91\xd3\xfd\x1e\xb1\x01^\xae\xb89\xed'
+    b'\x82\xa2\xa2\xb6\xc9\xd7]\xc7F>\x11t\xbfL\x06\xdd/^\xebz\xca\xf6\xed\xd9\xa8\xc4?b\xdd/\r?\x80\xfe\x83\x0f\xc8\xd8\xbb\xb7\xd0\xa3\xc7\xdd\xb7G\xa9$'
+    b'\xd3\xf5\xd7\x93~\xddCT\xb0}\xbb\xb0v\x97\xe6\xf0\xdbP\xc37j\x14\x99\x1e}\xc4\xfdz \x1f\x01w\xdbm\x94\xbfs\xa7\x10\xe7\xf7~\xcf\\\xab&\xe9\xd7'
+    b'\xac\xa1\xfc\xfd\xfb\xc9\xf0\xf3\xcf\xc4\xfd\xf2\x0bY~9H\xa5%\xc5\x1e=\x88X\xfe\xdf\x05tP\xddx\xe3\xaa\xec\xd3\xa7\xc3]g\xe2{\xc8?\xc7\x1a\xf2\xd2\x94'
+    b'\xdbnC\xce\x00{Z\xc3\x03\xf8|\xba\xa7L\x98\xb0:\xfb\xdc\xb9H\xae\xfb\x03\xd9\x01K\xb3\x8e\x1d\xeb\xa8\xba\xe9&6\xfa\x89\x81\xfa\xcaN\x9d6\xe4:\xf3u'
+    b'\xb1uJa\xd7\x96\xe9\xff\xe8\xeb\x9b\x82\x1f\x7f\xa4\x82\x86\r=\xea\xf2\x8c\x1d;\x90\xf9\xeb\xaf\xa9\x001\x02\x17\x17/\xf2\xf0\xac{\xf6\x90a\xd1"2<\xfc0'
+    b'\x99v\xec \x03o\x13\xc0N(\xaf6P\xd0\xf1\x03\x07R\xde\xb7\xdf\x91=\x80\x8f\xc0\xee\xea\x13\x88x\x01>g\xea\xd2\x99\xce=\xf40\xe9\xcf\x9d\x13\x8e\x83\xe9'
+    b'\x7f\'\xda\xf0k\xbeGr\xac\xd6H\xeb\x93\xab\xd4\xb3g\xeb\xe4\xf5\xea\x05\xd6uJ\xa5")9\x99=\xd9Nhe5k\x8eK\x7f\xe3\x8d\r9\x17\xe6\xeeh'
+    b'n\xf7g\xfd\xf9g\'^\xef3\xffpb\xc1;_\xe4J\xf5\xf4\xe9lT\xe2\x1f\xb1\xeeo\x16|\xff\xc7\x8e\x117i\x12q}\xae"\xc3\x92%dG,@'
+    b'*\xcf\xc5\x13X\xcc\x7f\x97\xdb\xb4\x89\xb81c\x84\\\xbdP\xf2\x06\xb9\x1e=\xc8\xf4\xcb\xcfn\x1f\x83\x9b\x0bH\xd4\xfb\xb0\x114\x1a2\r\x1cD\xc6\xb5k\xc8\xf4'
+    b'\xe8\xa3B- \xb7k7\x99]1\n\xe6\xffOJ\xaa\xa9h\xd9rQ\xd6\x91#QYW\xf2k\xd7\xe5Y\xff\xfc\x83|\xc1\xc6\xca\xcb/\x07W\r\xf4=b'
+    b'\xda\xf8\xdd\xcbR\xc6\x8eEN{\xdb\xe4\x81\x03\xd9\x93\x9d\x94\x94-\xbf\xe8\xa2{3\x7f\xfe9Z\xfe~_\x1b\xf2;n\xd4<\xf2H\x8e\xbcqc1\xee\x0f\xdf'
+    b'1\xcb\x01\x88_\xd4Q\xb4k\xb7>\xb7\xa8Hz\x9d{\xaa\xef\xb8\x83\x8dL\xfc#\x12\xeb\xc8\xbc\x08\xf7\xc3\xf1%\x0f|;\x9cK\x1e\xdew\xcbs87\xc3\xe9'
+    b'\xd3d\x186,\xec\x1aAK\xef\xde\xc4\xfd\xf8\xa3\xb0\xb6\x97\xea\x7fs\xa3Fd|\xf5\x15\xb2\xfc\xf6\x1b9L\x9c\x90\x93\xe0\xe4\xff\xcf\x8b\xea\xf9\xc6\xaa<\x7f\xf7'
+    b"\x11\xe6wp\xc5-\xcb\xfa\xfb\xefh\xeb\x1b\xc8GN\xc1\x83\xd9yy+\xb2\xfe\xfd\x17\x7f\xa1w\xc0%\xb42\xfb\xbf\xffr\xe4M\x9a\xb0';)i\xb4\xf6\x85"
+    b'\x17*\xc3\xdf\xef\xeb\xfa\xac\xc9.(\x98\xab\xfb\xf6\xdb;2v\xee\xbcS\xf7\xd9g\x9dX, \xee\x00\xbb\xad\xa1\xf2\x92K\xa6\xf26\xb5\xf75\xbe4e\xcc\x18'
+    b'6BL\xffWv\xff\x9f2\xf2x\xdd\xef\xb0\xdbH\x7f\xfd\xf5\x15\xe2\x07\xb0\x0c\x19B\xb6\xcf?/\xd3[\xa0\xd4U\xefo\xbc\xe8"\xe2\xae\xb8\x82\xcc\xfc\xef\x14'
+    b'\xcc\x9dK\x86o\xbe\x11r\x13X\xff\x9f\xa4$\xb5L\xa7\x1b\x9c\xf6\xc0\x03\xa8\x07\xabl]\xe3]\x8f\xd6\x95\xcdKn\xcc\xd1\xed\xdd[\x95\xd7\x03\xdb\xba\x1c\x93\xa9'
+    b'O\xea\x9c9\xf0\xd3\x04{\xdc\xc8\xf5\x00\xef rB\xb1\xce\xec\xad\x9e=\xbb[\xca\x84\t\xad\x93\xaf\xbd\x16\xaf\xabe\x19\x19\xbcv\x92\x853&\xb8W!\x03\x9c'
+    b'F\xa8Ka\\F\x9e\xc0uj\xa0\xec\xd2\xe5\xba\xb4\xa5K\x17f\x1d:\xe4\xcf~\xac\xaf\xec\xd8\x91\x8dV\xf5\xd0\xff\xa1\xf0\xc8\x07SoVQy\xc8\xb5\xe3\\'
+    b"\xf2\xf0\xbei\xfa\xf4\xb0u\xbf\xbb/\xf0\x1dw\x90\xed\x9dw<\xe4x\xf7\x14\xb0\xaa\x92\xc9\xda\xb7\x0f\x19\x9b7'}\xaa\x9aN\xcd\x9a\x15\x14\xffOe\x8f_^"
+    b'\x14\xaf\x87\xd7\nA\x86\xb9b.\xafg\xb0\xf6\xae\n\xfd\x82\xb5\xe6#96\xdb\x1c\xdd\xd7_;\xb9\xea\xc3\xd3\x0b\x89\x88\xd9\xba/\xbf\x0c4n\xf0\x9b\x80\x87i'
+    b'I\xd6\xd1\xa3+\xb2N\x9e| \xfb\xdc9\xa1\xefO\x04|\x06\xc8\xff\xb8]\xfb\xea\xab\xf5\x95\x9d;\x07s\xac\xe0"l\xac\xec\xde\x1d\xb5\x89\x0b3\x7f\xfb\r\xc7'
+    b'\xe1\xbb\xd6\xb0\xa8\x08>\xa6\xf1\xe9o\xbduI\xca\xa8Q\xe9\xb2Z\xb5\x82\xb9\xe6ZY\x8d\x1a\xa8AE~\x82\x98\x0b\x01\x1f\xd2\xdd\xba\xef\xbek\xae\xbc\xea\xaa\xea'
+    b"~\xafd\xc8k\xd7\xc6\x9a\x1e5\xba\xc1\\\xdf,y\x83\x06R?\x01\xfc\x7f\xce\x8d=\x7f\xf1\x84X\xd2\xeb!\xcb\xcb\xcb'\xc3#\x0f\x97\xc9\xd9\x0f\xc7\x060\xac"
+    b'_O\x05+Wz\xe4\x19\xda\xd2\xd2\xc8\xfa\xc2\xf3\xc4m\xdcH\xfaG\x1e\x11r\xff\x11\xeb/-)\xa1R\x9bM\xf8\x1bk\xe3\xc7q\xd1\xbb\x1e\xd2\xfc?\xe4\xd8'
+    b']\x95z\xd7]k\xb3\r\x86\xaaZ[BOMN\x7f\xef\xbd\x8b\x94\x97]&KR(\xd8\xd3\xec\x89\x1b\xd2\xd6\xac\x91\xc6b\xc0\xf1\xfb@\xf6\xf9\xf3\xd32\xb6'
+    b'm\xc3\xbaZ\x9c\xc31oc\xcd\x9d&\xcb\xcaB^\x05tbEc8\xe0\x04\x98\x9e\xb1}{G\xd5\xb0a\xe9\xb2\x9a5}\xad\xffq\x0f\xe5\xca\x9b5\xbb:'
+    b"u\xfe\xfc\xf9\x99?\xfc\xe0\x8b\x83\xb8\xbc\r\xe7\x83^\xc55\x15\xe8!UV\xf7\xc0\xae@-\xe9\xf2\xac\x13'\xfc\xd95\xf0QTW\x7f6\xeak\xbb\xab'L"
+    b'\xf0\x8e\xef\x97\xb7-\xcb\xfe\xfb\xef\x8e)\xc3\x86\xe1>\x1a\x97\xbee\xcb\xfc\xcc\x1f\x7f\\\x90\xf5\xeb\xaf\x133\xdeyG\xb0\xcb\xe4\xbe\xaf9C|\xea\xff\xd8\xf2K'
+    b";\x84\xff\r\x9f|B\xd6\x14U\x85\xb9\x01a?\x18\xd1[x\xe2\xc4\xb2~\x01u\n\x9d\xed\xdd\x9b\xce\xbd\xf7\xbe\x90\xe3/\x1c\x9f\xd0\xff'\xd6\xf8\xff\xf3\xa8\xe0"
+    b"\xe4I:\xb3s'9$\xdf\x8bF\xfe?|\xa67i\x9e|r}%\xe5\x94\x07\xce\x07<q\x02\xb5m\xc8\x01dO\xb3'Ry}>6\xfd\xf5\xd7Q;"
+    b'1J\xfb\xfc\xf3\xa8\xc5O\x95ef\x96\xf7=\xe4O \x8f"rq\x19\x8e\x9b\xab\xdb\xb7o\x8c\xf6\xe5\x97\xc1\xfd\x88\xfc\xc0\xdb\xb4\xaf\xbc2\x8f\xd7\xf9\xe5qC'
+    b'\x04\xbb\xad\xcd6\x1a\xafM]\xb2D\xf4\xe7\xc3\xa6i\xa4\xec\xde\x1d>\x90`l\x19\x1cG\xf7\x94\x89\x13\xab\xd7\xfd\xa1\xd3\xc1\xee\x8a\xc6\xb3\t{\xc2i#\x0c\x1f'
+    b'\xce|\x02\xb1\xaf\xff\xf3"\\\xbf\x16\x8c<\xe4\xf4aC\xfe~(\xf2\x1c\xbc\xfe/2\x18\xc8\xe4\x83\xaf7\x9c\xb5\xbf9=\x9d\x8a\x8cF\xe2x=\xef\xa1\xfb\xaf'
+    b'\xba\x8a\xec\x9f\x7fN\x16\xf0\x11\x9f?/\xf8\x1b*r\xbe~\xfb\x1d9*./\xcf\xc5C`8r\x84N\xcd\x9dK\xc5g\xcfz\xac\xff#u}q\xcf \x9e'
+    b'[\x15ye\x81|\xd9K\xb2\xfe\xf8c\x84f\xe3\xc6kR\xef\xbb\xaf_\xea\x82\x05\x83\xd3V\xadb\xbd\xeb\xc3\x07\xb8\xfc*\xb3n R\xf7\xc1l\xdd\x17_`'
+    b"M:)\xfd\xff\xfe\x0f\xb1\x82P}\x16\x97\xab'O\xae\x0e\xd7\x17\xebs\xd4\x86T\x8a\x8d\x9e\xfd\xcf?\xd7\xa5-[\xe6\xcc\xdb`\x88%TU\x1d\x19\xf8\xfc\xcc"
+    b'\x87\x0f\x93y\xfbv\xd2\xbf\xf0\x02\xd9]\xef\x07#O\xe0\xe2\xbbw~\xc4\xfa\x01\x99z\xf6$\x1b\xe4\xe6\xe6z\xf8\xff\x91\x0bh\xe9\xd5\x8b\x8cS\xa7\n\xbd\xff,'
+    b'\xff\xfc\x13\x95:<\xee\xcc\x197\xcfaE\xe5\xd9 \xef\xe8Q:\xd7\xb9\x13Y\x7f\xfd5\xa2u\x82\xe0\x8a\xc4=\x03\x9f{L\xeb\x01~\xce\x19\xad\xdd\xb4\xa9\xa2'
+    b'\xf3\rb\n\xf0\x8fb\xabn\xf1\x05\xe4\xc9-\xce\x8cN\x1dge\xda\x03\xab\xb2\xcf\x9c\x99\x9c\xfe\xfe\xfb#4O>\x89^\x05\xc8w\xf0\x97[\xe0\x8c\x91\x14\x17'
+    b'\xf7T\xcf\x98\x91\xc8y$\xf0\x8dL\xcax\xf7\xdd\xca\xbe\x1e\xab\xb2O\x9d\x12jC\x15\x8d\x1b\x07s\x9cJYJJ]\xe5\xc5\x173-\x1d=T\xaa_\xdf\xb5'
+    b'\xceu\xf0:\xa5\xe0\xf2\xeed\x93\xc9\x04\x1d\x0b=\xce\xadX.\xbc\x1f\x8c<\xc3\xde\xbddMI\x89X\xff\x1f\xfd\xbd\xf7\x92\xfe\xc0\x01\xa1\xce_\xda\xf3\xcf!\xf9'
+    b'\xdf.\xe3?\xa7\xd1\xd0\xf9I\x93(\xff\x8f?"\xea\xd7?w\xf0 \x9dz\xeb-2\xfc\xf7_9\xe3\xe7p\xc7?\xf2\x845\xbd\xa7\xbc\xa2\xe3\xc7\x89\x1b1\x82'
+    b"L\xd3\xa6\x91\xf9\xa2\x86d\xb8\xf2\xca\x88\xf7'\xc4=3K\xf7\xd9g\xb1:\xdf\xaf\xe4\xe7\x98>\xa9s\xe7\x86\xca\x01\x04\x1f\xa5F\x96\x9b\xdb*\xf9\x9ak\x06\xa5"
+    b'\xadX\x01\xbe\x93EY\x87\x0f#/\x0e\xdb\xa2\xcc\xc3\x87\xef\xd4\xed\xd9\x83\x9a\xba^\xea;\xefl\xa4\xec\xd6\xcd\xd9\xdb&<=\x81\xd8h}E\xc7\x8e\xf0U\xdc'
+    b'\xc2\xeb\xa5Q\xda\xe7\x9eC\xbc\x1e\xdc\x05\xb1\xc2u\xd8[=kV,\xf9yB\xd9p\xcdZ&\xf7\xed\xeb\x8c\x07\\\xb8F\xd0}\xe8A5/\xf3\xfb\xef\x03\xd9'
+    b'\x00X\xaf&"\xf74\xee\xf3kR\xe7\xcf\xaf\xca\xeb\x8a|\xdd\xdb\xd3_y\x05}?t\xf2\xbau\xa1\xe7\xf1\xbc\xe2o\xa6\xbc~\xfdV\xc9\xfd\xfa\r\xd6\xac^'
+    b'\x8d\\\xcd{2\xf7\xefgZ:1\xf4?\xfc\xf6\xd0]\xdc\xd3O{\xf4\xf1\x11z\xec\xd4\xa9C\xa5\x85\x85.y\xfe\xeb\xd7\xe1\x877\xf0\xeb\xf5H\xf5\x03\x84n'
+    b'\xcf\xff\xf8c*x\xf4Q\x8f\xe3\xc9\x1f5\x92L\xeb\xd7\x93~\xf9r2\xed\xf9\x94\xccG\x0e\x93\xe5\x8f\xa3d=v\xcc\xc9\xf7\x17\xc9\xfaz\xfe|\xf5G\x8e\xd0'
+    b"\xc9;\xa6\xbbb\xf7\x0ea\xac\xac\x05\x05T\xb0y3\xe9\xa7O'n\xdc8\xb2L\x9dJ\xfa\x85\x0b\xc9\xc2\x1f\xaf\xe9\xf8\xdfN\xfeC\x97<\xf8\xfa\xcd\xcf<\xe3"
+    b'\xe2+\xaeE\x16\xa5\x92\xf4\xadZ9s\x15#\xac\xff\xe1[\r&\xe6;1\xfd\x9dw\xc0\xe7?F\xbby3|\x06\xa8\x05G~q\xa4b\xbe\xdes\nb\xcb'
+    b"\xb9!\xd6\xfe''\xa9\xd5\xd0\x13\xb7h\x9fy\x06}m\x83\xadc\x80\x8eX\x9cu\xf4\xe8\xcd\xda\xa7\x9fF]Zr\x08:\x1b5\xd5\x98\xff0F\xbe|\xd0S"
+    b'3>\xfa\x08\xf3`\x95\xfb\x88e\xb5j\x81_!\x1e\xf5?\xf2\x02a\xcf\xf9;7\xf0H.\xc8\xfc\xf5W\xff\xb6\xa4\xc3\x81{\xd6_o\xc3x\xe43R\xc94'
+    b"\x9a\x9b\xb5O=\x15k6\xddC9&\x13\xae\xd7\xfa\xdc\xb2~\x19\xd8\xe2LK'\x8e\xff\xbf\xe8\xdcY2K\xf8|\xa5<{\xdcc\x8f\t\xfe\xeb@\xf2\x0c\xcf"
+    b'>\xeb\xee\xf7\x13\t\x1b\xc0\x94\x9dMV\xe8\xc3\x1bo,\xc3\xfbgl\xd9\x92L\xe3\xc6\x93\xe9\xc5\x17\xa9\xd8f\x8b:\x0f\x9fa\xc7\x0e*\xb8\xfd6*\xe2\x7f\xab'
+    b'\xd0h$\xfd\xd5W\xfb<\xd7b\x17\x17\xa1q\xe8P\xd2?\xff<\xd9\xff\xfb\x8f\x8a\xe0\xfb\xe7m\x02\x1b\xfa"\xcc\x9aE\xd6\xbf\xff&\xeb\xe9\xd3\x11\xe7\t\xc4='
+    b'\x03\xee\xcf\r\x12=\x89u7b\xad\xab\xb3\xcf\x9c\x81\xeeB\xbd6z\xcdH\xf3\x7f\xe5\x82/=9\x19k\xdb\xe6\xc9\xbd{\xa3\xe6,\x92\xf1e\xc8\xc2\xef\xa3~'
+    b"\xac\x99\xb2gO\x8d,'\xc7w\xfe\xb1L\x06]\x8dy}@\xea\xfd\xf7C\x07T\xd4\x1e\x81?\x19\xb1\xd4\xcbS&MJ\x91\xa5\xa7\xfb{\xd6\xa0\xd3\x87i\xd6"
+    b'\xafG\xbey\xa09\x18\xefA^\x1dE\xd5\xfb>\x87\xa4\xad]\x1b\x9f\xbe\x7f\x87\xa3<\xce\xa1\x16\xbc\xdd\xe7\xab\x1f\xa5g^\xa1\xc10)\xfd\xddw\xfb\xa7.Z'
+    b'\xd4S=s\xe65\xa9\xf7\xde{\xabv\xd3\xa6Ai+W\xc6\xd3\x9a?W\xd1\xb4)\xea;\xe3\xe9\x1a\xa2\x9e\x00>\x01\xa6\xa5\xa3\x9f\xff\x17\x89\xfcp\x7f\xf5f'
+    b'x]\xc8\xd7?y\x92\xf4W\xf5\xf6\xab\xbb\xad\xea\x14\xb2|\xf6\x99\xf0y\x87+\xcf\xcfY\xef\xef\xe4\xf97\xef\xd9C\xd6\xcc\xcc\x88\xad\xfd\x05\xde\xdf\xe1\xc3\x04\xbf'
+    b'\x83\xa9F\xae\x93\x07\xa8Mk2\x8d\x19C&~\r\xcd\xd5\xa8A\xfa\xb6m\xc9\xd0\xb1\x03\x9d\xbc\xf3Na\xbd\x1dn\xbd\x9e\xbf\xf1\xe3\xdc\xf9\x7f\x0e\xb2\xec\xdbG'
+    b"V\x99L\xb0\x03\x0c\x13\xc6\x97\xdb\xb3\xa0\xd4\x15;1\xa7k\xc9x\xdd@2\x8e\x1e-\xd8\x06V\x95\x8a\n\x8f\x1e\x15\xe2)\xd1\xc8\xff\x07\xef\xeeM\x9a'\x9e\x80"
+    b'\xbe]\x9au\xfc\xf8-\x9ag\x9ei\xa7\x1a4\x085\xd6\xc1\xdewM\x95W\\\xe1k\xfd\x1b\xa9\xf8?\xe2\x00wd\xec\xd8\x81:\x85\x01\xa9K\x96\xf4K\xbd\xef'
+    b'>\xcc\xd9\xb7j7o\x9e\x1f%\x1f\x04l\x10\xe4\xb9C\xafx\xac\xbb\xf8\xf1B\x8d\x82\xc0\x8d\x18\xc2\xda\x0b\xfeO\xf4@\xac\xca\xf9\xa1\x96\xa2uk\xac\xcf\xe2\xd1'
+    b'\x06\x18\xaey\xec\xb1\xf2\xe2\xe0\xe0\x04\x08\xa5\xee\x10\xd7\x186c,\xf8g\x82\x8d\xf5\xc3\xdf\x1f\x8d\xfb=\x9a\xdb\xe2\xac\xdf\x7f\xcf,\xa7\xd7\x07Cl\xe9\x7f\x9f~'
+    b'dW\xcc\xbf\xd8b!\xfd\xc0\x81n\xdd/\xf4\xd3II\xa1"\xb9\'\xdf\xbe\xb9n]*:v\xccU_\'\xea\xd7<2|\xf9%Y22"\xaa\xfb\x05_'
+    b'\xf9\xa3\x8f\x90u\xef^7\x87\x00\xf4\xa7\xa9SG\xe2\x9ey\x86J\x8b\x8a\x84\xf8\xb9\x05ks!\xff?/\nq\x11N\xb0sJx\xd9\xe8A \xc4#\x96,'
+    b'&\xbb\\V\xae\xee\xf7\xaeU\x94\xc6/,\xaf\xbe\x1a\xd5\xfe?X\xcfg\xc8j\xd7v\xfaX\xc3\x89\x81\xcbd\x98\x9f\xe3-\xc7<(\xce\xbbl\xa3\x11z\x05\xfc'
+    b"\xfb]RF\x8eD\rZ\xa8\xb9\xe8\x17\xe6\xc1\xa3G\xeb+:u\xaaJ\xfd1!\xfd\xed\xb7\xe3\xf1: \xdeT\xde\xf9\xc1'\x85\x1c\x8cuA\xd88\xd0\xa1\xe0"
+    b'\x1dB\xcc:\x1e\xe6\xf6lE\xa3Fw\xe9\xbe\xfa*\x9er8\xd6\xe6\x18\x0cW\xa5\xce\x9e\xcd\xfaG%\x88\xfeG\xcc\xbf\xa4\x84\x8cw\xcfu\xe7\xeb\x0bz\xf7\xa2'
+    b'\x8b\xa8\xf8\xcf?\x89[\xf7\x90\x87\x8f[\xa8\xbbk\xd5\x8a\n\x0f\x1d\x12t\xaf\x90\xef\x87\xcf5m\x12Q\xdd\xef\xf6\xff\x83\xf7\xff\xfe\xfb\xdd\xb2\xa1\x7f\xb9\xde\xbd\xc8'
+    b'\xb8a\x83`\xb3\xe0\xf8=\xce\x97\x8b\xac\xfe\xc7\xfa\xbf\xf8\xd8_B-\xa3\x90\x07\xd1\xa6\x8d\xb0\x05\x8ao\x08\xfe\xff\xd6\xad\xc8\xda\xb7/\x99\xbbv%Kj\xaa\x90'
+    b'\x9f\x88cG\xff\x02\x03\xff\xfd\xe2s\xe7\xaa\xb4\xffoP\xf3\x93\xbcQ#\xac\xd3\x13M\xff\x8b>\x08\xac+\xa5s\xaf\xd8\xb7\x00\xdc\xf8k\xb3\xf5\xfa`\xb9\xf6\xe0'
+    b'7h\xa8\xec\xda\xb5\xaa\xe6\x88\x96\xc9\xd7\\\x13\x0e7OUow\xeb\xbe\xfd6X[\x146\x16r9\xc0\x95\xf0p\x8e\xd9\x0c{\r\x1b8\xa5\x91\x17\x02\xbf\x11'
+    b"\xf2D\xe2\x81\xd3\x06\xfe\xfe\xcb\xd5\x13'>\x98\x93\x97\x17/\xcf\xca\xf8\xf47\xdfD>`\x8aL\xabeZ9\xfe\xf3\xff\xc4\xba~\xfd\xf9<\xd2\xcf\x98\xe1\xe6\xd5"
+    b'\x17\xf4{\xb3fd<p@\xf8\xbc>\xef<\x19\xc6\x8f/\xbb~\xd5j\xc9\xc0\xeb`\xd8\x00\xa6\xa9\xd3\xa2\xa2\xfbE\xffy\x91J\xe5\xe4\xf9W(\xc8\xf2\xec\xb3'
+    b'n\xbb\xa32x}\x10\xeb7\\~\xb9\xfb\xfcl:]\xb9\xe7jn\xd8\x80\x0c+V\x90q\xff\xf7d\xe2\xc7\xb7\x10\xf1|\xd4R\xee\xdfOz~3\x9c:U'
+    b'\xa9\xfc\xff\x15\x99\xa7\x86\xa6=\xfcp"\xfa\x00\xbc\xf9\xe5\x903y\x85z\xda4\xe4\x9e\x83w\x1e[\x13e\x8f\x1e\xc8AX\x95}\xfat06\x00\xf8q\xabb'
+    b"\x8e@\x0e\xfd\xbc\xcc\x03\x07\xe2m\xdc\xd1w(\xe4\x1c\xb9$\x8d\xa6\xa6\xbcE\x0b\\'l\xc8c\xc1k\xf1\x94\xe3\x87\x1a\xbb\xc7r\xab\x86\x8f;\\\xfd?B\xfb"
+    b'\xe4\x93\xc8\xd9a\x1a9\xfe\xf5\xbf\x98\xe7o\xcd\xe3u\xff\xad\xb7z\xac\xef\x8d\x9d;S\xf1\x7f\xffI\xbe\x93G6\xbd\x9e\xb8\x96-=\xf4\xbf{->r$Y'
+    b'y[\xa04J\xfa_\xaakM\xb7\x8ev\xd7\xcbU\x96\xfe\xb7\xfdz\xa8L\xcf\xe1`\x8f\x1b\xf5\x93\xc6>}H\xcf\xdb\x02\xdc#\x8f\x90y\xeb\xdbd\xe3\xb8\x88'
+    b'\xf7\xff\x8b\x96\xfe\x070\xbf\x82\x87>Qu\xff\xc39Vk\xf3d\xf0\xcb\xfb\x8f\x91 \x96\x8c\\\x85@v\x90\xc8\xd7\x0fn\xd5\xaa\xe0"\xb8J={v\xbc\xd5'
+    b'\x02"O\xaf:\xcd\xe5\xc8\x95\x03\xdfc\xbc>+\xab\xb3\xcf\x9eE\xbcL+\xcf\xcd\x85\x9f\xc5\xd9W\xc0\xd9[\x00\xf1F\xc6\'\x1c\xfb\xfa\xdf\x9d\xbbW\xe2 \xfd'
+    b'\xb5\xd7z\xfa\xf5\xbbv\xa5\x92\x82\x02\x9fyi\xd6\x8f?\xf6\xc9\xe3\xef\xf0\x13\xf3\x8e\x86\x1d`\\\xbe\\8\xf6\x0by\x07\x91\xe3\xcd\xf7\xab\xff\xb7m\x0f\x99\xc7\xc8'
+    b'\xe1c\\D\xbe"\xc3\xe0Ad\xf8\xed7wm\xa0#\n\xf5\xff\x11\xf6V\xcaP\x1f\x98\xa8\xfa\x1fy\xe8\xc1\xf4J\xcf\x90\xd7\xa9\x13\x0c\x17+\xea\x1co\xd2<'
+    b"\xfe8b'\xfed\xc9\xa3`\x1f\xc0FY\x17Gy\x80\xb0\x97\x90sY\x9d\xe6r\xe8\xceDyn\x90\xff7%\xe3\x83\x0f&fl\xdd:C\xb7k\x17\xfa\x0b"
+    b'\x8cM\x7f\xed\xb5Py=\x18\x02\x03\x9cn\x91\xe4\xf5s\xf3\xf3}\xfb\xad\x9bO\xc7\x9dk\x7f\xfd\xf5d=wN\xc8y\xf3\x96g6\x1a\xc9\xd4\xba\x95\x87>\xf3'
+    b'\xe6\xe1\x89\xb6\xfe\xb7fg\x93\xf9\x83\x0f\x84\x1e?\x95U\x17i\xd8\xbd;\xe4\xfeE\xee\xb1q\xc5\xfc\x85\xda\xc9\xa6M\x88\xeb\xd7\x8fL\x19\xe9\x94\x97\x9bC\x86\xcf'
+    b'?\x8f\noc4\xeeAp\xe9\xc4[~r(\x1b\xb8\x84\x82\x99\xb7\x9a*\xaf\xbc\xb2\xbcz4\xa9/\xe0v\xedk\xaf]\xa5\x9e3\xe7\xd2\x94\xdbn\xbb,e'
+    b'\xecX\xd4\xa6\x8dO\xdf\xb2e`\xda\xf2\xe5\xd1\xc8\x03\x0c\x86\xf7!v\xea\xff\xcf\x9ds\xf6\x06\xac>\x18\xaay\xf8\xe1D}\x86f\xe9>\xff\x1c\xb1\r\xa6\xb1c'
+    b'?\xff\x0f\xfeg\xfdc\x8f\xf9\xccS/\x984IX\x9b\xfa\xe2\xaf\xd7/]\xea\xa1\xff\xcd\x99:2\x8e\x1bW)\xfa_\xdc\xec\xe0\xcdY\xbf\xde\x15\x07pD\x9f'
+    b'\x17\t\x9c\xc2\xc9\xc9a\x1d\xab\xb9m[2>\xfd4\x19\xde{\x8f\x8cg\xce\x08\xe3j=w\x9eJmvW\x8f\xa2\xd8\xce\xff\x13\x01\x9e\xb5\x19\x19\xbbv%\xea'
+    b'\xdc\x05\x0eZ\xf4\xc0\x0b&\x1fb@\xda\x92%\xe1\xd6\n\xc0?\xbf0\xf3\xd0\xa1\x1cyp\xfc\xaa\xa1\xa2k\xca\xad\xb7\xc6\xc3x\x83\x9b\x02\xdc\x85\xd5m.\x07\xa7'
+    b'T\xa2=;\x1br\x8b\x8b\x87j\x1ez(\x92\\\x8cN\xae\xcf\x9c\x1c\xf4\x07\xb9:u\xde\xbc\xe1\x9a\r\x1b\xc0\xeb\x89\r\x1cb\xb0\xa3\xd1\xdb\x10\x1c!\xe0\xf3\x88'
+    b'v\xff"\xc8G\xde#z0\xa3f#]^\xab\x16\xb8\xcb+\xa3oRt\xe2\xdcy\x94\xff\xfe\xfb\xee\x9c?\xe9\x9a\xb5\xa0v-\xa1\x96\xce\xfd\x1d\x87K\xff\xf3'
+    b'\xba+o\xdb6\x8f\xb5\xb0e\xd4(\x81\xcf\xb6\xb4\x12\xf5\xbf\xe8s0\x8e\x19C\x0e\xce\xec\xcc?\x8c2/\xa2\xa9{\xf7\xb0\xe2\xff\x82\xcf"EE\xe6\x91#)'
+    b'\xff\xde{\xc9\xf8\xdbo\x82\xef\xa5\xd4Q\x1a\xd5\xfe\x7f\xd1\x00\xe2\xdaU\xddO0Z\x1b\xce+\xd8\x1a>\xf0\x11\x0e\xd5<\xf2H\xa8c\x818\x03\xb8\xedk*Z'
+    b'\xb6\x8c\xd65B=v \xee\xfcX\xc9%\x9b\x90\xbeuk"r\xf7V\'\xfd\x0f\xbd?7s\xdf\xbe\xb6\xaa\xeb\xae\x8bH\x0e\xabL\xadn\x96\xdc\xb3\xe7\x10\xcd'
+    b'\xbauwg~\xf7\x1dj<\x829\x0e\xd4P\xcc\xcd\xdc\xbb\x176B\x07\xd5\xd0\xa1\x91\xacK\x84O\x102\xd1\x8f{MN~\xbe4\xbf\x06u\x90\xe8e\xd59'
+    b"\xe5\xe6\x9b\xa3\xc95\x19i\xff\xb0[\x16\xd6\xb5r\xb9\x87\xce\xb24nL\x96\xcf\xbf\xf0\xdb\xe7\x06\xb1\x01.;\xfb\x02'\xf0\xcc\x99B\xef\x9d\xca\xd2\xfdez\xff"
+    b'\xf2\xebk\xcb\x07\x1f\x90U\x12#1\x9b-\x11\xf5\xff[\xf8\xff\x85\xbc\x830\x8f\xd1\xe1\xaaa\xc0X\x1b\xeb\xd6%\xfdK/Qa\x14\xfb6E\xeb>D_\xda'
+    b'\x85\x99\xbf\xfd\x96\xa8>\x00p\x04\x87\xe2kG\xec\x1ak\xf9\xf2\xea\xee\xb0\xd6E\xcd\x1a\xd6,\xd1\xee\xaf\x86\xfc+\xf0\x11T\x95^G\x9dDyv\x11z\nk'
+    b'\x83\xf0\xb5$"n\xd0\xacY\x13Z\x8f\xde\xc2B\xe8\xc2\xde\xa9\xb3f]\xa9\x9e6\r\xba\x11k\xe0q\xe9[\xb6L\xcex\xef=\xf0V\x80\x97\xb7\xb2\xf3>\xd1'
+    b'\xcb\xb3\x9dj\xf0\xe0\x8a\xe6\xfb\xe1\xfbu\x14\xed\xda\x81\xfb\x0b\xf9\x04\x9186\xe8i\xf4\x91j\xa3\x1a0 \xdc\xe7\r\xb6i\x1b\xd5\xb5\xd7b\xec\xcb\x1b[\xd4q'
+    b'\xa07H\xb2\xcc\xd9\xd7:\x16\xf3\xff\xbc\xf3\xcd\x91\xffo?p\x80\ne\x12\xbf\xbaLF\xb6\xfd\xfb\xdd>u|\x16\xfej\xfdW_\x92\xe5\xb7\xc3N\x7f;\xbf'
+    b'n\x05\xb7\xbd\xb1}{\xa1\x9e\xdd\xc4\xaf\xfd\xcdO?]\xe9\xfa\xdf\xbb?\x80\xb1\x7f\x7f\xb2}\xfd\xb5p\x8c\xbe\xce\xb7\xa2\xe3\xa7\xff\xfe\x00\xd9\x14\xf2\x90\xf5\x7f\t'
+    b'?\xa6\\\xf3f\xc4\xa1w\x81^O\x96\x8f>"n\xf7n\x81\xa7(\xa2\xfd\t$\xf2\xa29\x7f]\x9b\xbaxq\xbc\xf6\x9b)o\xbbXu\xc3\r\xa1\x8e\x07|'
+    b'\x94]Rn\xb9e\x8c\xf6\xa5\x97\xc09\x87\xfchp\x07 \x9e\x80>\n#\xb5\xff\xfb_g\xd5\xcd7\x83\x87\xa9r4\x8cLV\x15\xbd\x1f\xe1s@\xff>\xf0'
+    b'\xee\x80w2PndSe\xcf\x9e\xd55\x96{\xb1\xea\xfa\xeb\xcb\xb3\xa1\xc0\xb9\x89\xbeV\xb7h\x9f~:\x98\xdezX7\x8fI\xdf\xbcyCn\xe5\xf2?\xac'
+    b'\xc9)(\xe8\x9bz\xf7\xdd\xb9\x8a&Mp\x0c\xc1\xfa\xc2\x91\xfb\x8a\xde\xc6\xb0\x1f\x82\xd1\xaf\x15\xd9Vf\xff\xf7\xdf\xe5\xeaI\x93\x82\xf5\t\xc0\xaeGL\xe1\x0e\xdd'
+    b'\xce\x9d\xa1\xfe\x16\xfaU9\xfb\x8d\xc5\x9e\xfe\xf7\xcc\x87/\x15\xf8~L7\\\xef^\x9br:\x1d\x19G\x8fr\xf6\xa2q\\\xe8_W\xb0e\x0bY\x15\n\xb2\xf1'
+    b'kW\xd3e\x97\x92\xf9\xcd7\xa9\x90_k\x1b\xcf\x9f\xa7\x82\xaf\xbe\xa2\xf3\xfcZ\xd6\xb6g\x8f;\x07\xb0\xaal\x00\xfcv!\xafkM\x97]&\xf0\x02\x81\x8f\xe8'
+    b'B~}\xa9\xdb\xa6\xe1\xc2\xd5\xff\xe0\x15\xbc\xe2\x8a0\xf4\x7f\x12Y:u"n\xcc\x18*\xe2\x8fI\xb4O"Y\x9f\x18\xfd\xfc\x7f\xa9\x7f\xb9A\x03p\xe7%^'
+    b'\r@ii\xb3\xe4^\xbd"\xe1/D-zU\xd6AUv\x8e\x19\xfc\x1b\xf0m\x885\x8f\x88\xc7\xce\xc8\xf8\xe4\x13\x7f<\x0bU\xc9\x95X\xd5\x80~\x99\xa9\xdb'
+    b'\xbd\xdb\x17o\xe1\x9c\xcco\xbei\xab\x1a80\xdc\xda\x10\xacy\xab\xae\x86\xd6b\x81O\x02\xfe{\xe8vg?n\xb9\\\xdcP\xf7\x08\xdb\xf0\x92\x94\xd1\xa3\xef\xce'
+    b'\xfc\xf6\xdb\xaa\xe0,l\xcf\xdb\xf7\x81l\x14\x1c\xb3\x93\x97!|{\x04~\xbeH\xdb\x00\x15\xe1\xf5\xf7\xd6\x0f\x05y\xfc\xb6o\x1f\x19F\x8et\xc7\xfe\xb9\xda\xb5\xc9'
+    b"\xf4\xde{T\xc0\xaf\x9f\xad\xa7N\t\xfa\x1f\xf2\x04\x9d\xd7\xbd[\x19?6\xa7\xcb n\xe0@*X\xba\x94\n\xb6o'\xf3\x87\x1fR\xa1\\^e\xba\xdf\x97\xde"
+    b'\xb5\xa8Td\x1c6L\xf0\xb5\x17\x1b\x0c\xae\\;\x07q\\\xf8\xe3W\xf0\xc4\x13a\xd7\x01\xe2{&\xad\x86\xb8\x1d\x1f\x87U\x9f\x18J\x1f\x83h\xcf_\xc8_O'
+    b"D\x0e\x80\x9a\x8a\x16-\x12A\xc7\x80\xc3\xa8\xb2\xfb\xf8z\xcfy\xd8\x9f\x9e\xb1}\xbb/\xbe\x84Y\xba/\xbePWc\xeeX\xf8\x89{\xa8'O\xc6zqj\xc6"
+    b'\x87\x1f\xa2\xd7\x16bk\x15\xcd%\xc3\x98C\xffTun\x07l\x19\xf4\xa3\x80\x1f\x1e\xb1y\xfc\xc5\xfe\xfa\xdc\xf0rf#wl\xc8\xbf\xf9\xfakp\x17x\xcfi'
+    b'\xf0\xe1\xad\xc8\xfe\xf7\xdfH\xf8"\x16d\x1d<\xa8\x95\x07\xdfg%R\xf9\x7f\xe5\xe9\x11a\x1d\xcc\x7f\xc6x\xf6,\x19W\xae\xf4\xd0\xeb"/\xed\xf9\xc5\x8b\xdd\xdf'
+    b'\xb3\x1d\xf8\xbeL}`\xa9\x8f\xda\xbf\xe2 \xf9{*\xa3>\xd0\x97\xde\xb5\xa4\xa5\x91\xe9\xea\xbe\xa4\xe7\xcf\x8d\xdb\xb5\x8b\x1c\xe07()\ty\xfc\x8a\xce\x9c!k'
+    b'\xb22\xe8s\xb5i4d\xd1\xe9\xc8T\xaf\x1e\x197n\xa4\x02\xdeN\x02\x97"j+\xc3\xd1\xeb\xc1\xf2\x04D{\xfej\x9b<hP\xb8\xf9\xef1\xdb\xc7,\xf3'
+    b'\xe0\xc1@}\x01\xe3\t\xe0)X\x91\xf5\xdf\x7f\x91\x9e\xd7\xfd\xf5]F\xcc\xc3W\x1d_JRz:\xf8}\xbc\xf3#`\x13\xa0\x973\xe3\x8a\x89<\xc0\xcf\x9b\xc8'
+    b'<\x9d\x91\xd8\x96g\xff\xf3\x0f\xead\xd0\xfb\x03\xbc\x1f\xb0\xc3"\xcd\xc5\x08\x9e\x90H\xf5\xa0\x88F\xfe\xbf\xe1\xf1\xc7\xcb\xe8c\xe8\xf2\x82\xad\xefP~\x9eK\xff\x1f'
+    b"<\xe8\xe6\xbds\xf8\xe1\xb4\x89\x97\xcd!\xe1\xdf\xb1*\xe4djP\x9f\x8cco'\xc3\xa1_\x85\xf3\xcd\x0bf\xfc`;\xb5o\xef?\x07\x81\xd7\xf3\x05m\xdb\x92"
+    b'\xbeC\x072\xdez+\x15\x1d?N\xa5\xc5\xc5\xc2\x16\xed\xfa\x84\xca\xd4\xffXg,\xca<|8\x91|\xffC\xd2\xd6\xadK\xaa\x84Z\x9e\xca\x02\xf8\x0c\x91\x87\x10'
+    b'\x89\xb1Y\x95}\xea\xd4\rik\xd68\xeb?\xca\xda}\xf0\xff\xb7I\x1e0\xc0_<\x04\xb1\x01\xef\\n\xe4\x08^\xa5\xbe\xeb.\xa6\xb1#\xef[@_j\xa6'
+    b'\xe7\x83\xe8\xfd\x91\x1b\xddZ&\xe4\xff\xc0\x16\x8f\x94\xfeG\x8eW\xa4\xf4\x7f\xc1\x9d3=t\xbaU\xa9$\xc3\xe4Id8wN\xa8\r\x84>t\xf0kd\xae]'
+    b'\xbb\x0b\xeb\xd9\xf4t26l\x18\x16\x17nI\x8c\xd8\x0c\xde\xdcE\xe6\x9c\x1c\xd2?\xf4\x10\xe9\xcf\x9f/\x7f}\x8d>\x83\xbd{\x97\xedO\xd8\xa2\x05Y\xf8\xb5}'
+    b'\x91\xd9L\x06\xfe\x1aa+\xf0\xb5^\xcf\x0b\xac\xff#u}+c\x9e\x19\xa6Y\xbf>Qz\x02@\xbfE\xb3&\xaf\xaa\xd0*\xb9_?\xac\xcd\xc3\xf1ib\xad'
+    b'\x8f\x9e:\xa8\xbd\x96\xae\xed\xb1\xef\x8b\x07\n\xb1\xe7@\xc7\x82\\\xafU^}\xa4\x103\x0e\xa5\xe6\x82!8 \x8f%\x9ez\x0b\xc4\xca\x86\xfb\x1a\xf1\x13p\x1a"'
+    b"\x87\x06vk\xdf\xd4{\xeeA]\xe1\x0c\xdd'\x9f \x8e\x11N\x9dDE{$G\x83\xe7\x8e{\xfey\xb2\x0c\x1dJ\x1c\xbfN\xd5\xaf[GF\xf4\xa6\xf1!\xcf"
+    b"0e\x8a[\xd7Y\xc7\x8d\xa3b\x9b\x8d\xac\x07\x0f\x92q\xde<\xb2d\xa4\x07\xe5\x0f\x10\xec\x0b^o\x9ax\xdb!\x16}\x03\x02'\xef\xb0\x1b\xc9z\xe6\xac\x9b\x1b"
+    b'\xd1{\xfc\xf0\x1a8\x07\xf5\xadZ\x95\xb1k\x8c7\xdc@\xa6&M\xc8\xd0\xa0\x81\xd0\x9f\x00\xbd\x94L\x13\xc6\x93\xe9\x8d7\x84\xefD\xban3\x90<pEV\xc6'
+    b'\x1c\xd3"\xb9o\xdf\r9\xf1?\xc7\xc07}e\x10\xdc\xbf\xf1\x8az\x8a\xf6\xed\xef\xd6}\xf7]\xa8\xb6\xda\x82\xccC\x87\x10\x93\xf6\xe7c\xf6\xce\x01\xf5\x95\x03\xe0'
+    b"\r\xf4G\x04\xe7\x9ft\r\x16N\xff\x1f\x86\xc0@\xae\xdd\x8a\xec\x93'\x99N\x0fnCn\x02j-j+Z\xb7\x0e\x94\x83\x91&\xcb\xcaB\x9d_\xa8y\x0c\x90"
+    b'\x8f\xf5E\xb8\xf9\x1dQ\xe9\xff\xe7pn\x9c\x89s\xd7\xa2q^\xf2\xe0\x030<\xfb\xac[\xb7[x[\xc1-\x8f\xff\x8e\xf1\xd0!2\x0c\x1fN\x85rY@\xfe'
+    b'?\x87\xeb\xbb\xc6K.\x89\xe9\xf8\x80\xa1W/2\xfc\xf9\x97\xef\xf1\xc3\xf9\x9e;K\xe6\xccL\xbf\xb9\x06\xde\xaf\xc1ORp\xe3\x8d\xa4?u*\xaa\xfd\x89*3'
+    b"\xffO\x04\xeai\xd6d\xeb\xf5\xf1\xce\xfb\x7f\x9b\xf6\xe5\x97\x95I))\t\xed\x13NJK\x1b\xc3\x9fg\xa8\xf9\xdc\xa8\xcb\xf6'\xb3\xa7z\xc6\x0ci>\x00\xfe\xef"
+    b'\x962n\\\xa0\xe3\xe8\xa0\xba\xf1F\xa9\xdd\x00\x1d\xd5Xy\xf9\xe5LcG\x1e\xedT\x83\x06%j\x9dn\xa47p2\x842\xb6\xe8\xf1\x19*\x17:l\x06p'
+    b"\x19\xc6\x8a\xfew\x04Y\x0fW\xf0\xd16wo@\xcb\xd0!\x82O\xdb\xa9\x0f\x9d\xfej\x81\xcf\x165\xed\x8d\x1b\x05\xd4\xff\xa6\x95+I\xef'v\x1eK1\x01S"
+    b'\x8b\xe6d\xf8\xecs\x81\x9f\xa7\x8c\xfe\xdf\xb9S\xe0Kp\x04\x90Q\x9c\x9cL\\\xa3F\xc4=\xf0\x00\x19^~\x99\xf27\xbf(\x8c\x11d\x88c\x9e\x08\xfa\x1f\x98'
+    b'\xab\xdb\xb7/\xd6bz\x0ff#\xd7\x98\xe3\x82\xed=\x1b\x8dz\xddX\x04j\xee\xcb\xe3)*3/\xa6\xf9\x9f\x17\xd1o\xd8\x9b\xaf\x05\\Hx\xdd\xfb\xb3\xc8\xf3'
+    b'\xeb\x97\xba`\x818g\xc2V\x00\x9fZ\x96\xbcaC\xa6\xa9\xa3\x03\xd4\x10.\xcf>q\x82\xe9\xf7`\xf2\x01O\x9c\x08\xb5g\x11j\t\xc1\xcd\x14j|\xe1f\xed'
+    b"SO\x85\xda#\xa1\xb2\xfa\xdcx\xcb\x83mP\xf0\xed\xb7B]\x80\xd0{\xb7{7A/z\xf8\x9b]\xf2l\xe7\xce\x91q\xd6,\xb2h4e\xf4\xa3].'"
+    b'\xeb\xbe}dlP?.r\x05\xad\xa9\xa9\xc4\xad]KE\xa7OS\t\x7f\xae\x85&\x8e\xf4\xaf\xbfA\\\xdd\xba\xe5\x7f\xb7i\x13\xb2}\xf7\xadg\x9f\xa5J\xf4'
+    b'\xffc\xab\xac9f\x94\xf6\x85\x17bI\xf7\xdf\x91\xb1sg}E\xe7\xce=\xd53g\x96\xb7\xf6)o}\x9bh\xe8\xa1\x9e2E:&\x88\x07\\\x9f\xf6\xe0\x83'
+    b"\xe0\n\x02'\x8f\xbf\xba>\xad\xcc\xb3VJ\x04\xea\xf7\xe6\xea\xf6\xee\xf5\xe6\x00\xaa\xa7\xe8\xd8Q\xfa9\xd4T\xdc\xae}\xf5U1V\x84\x9c\xc4^\xea;\xef\xac\x8e"
+    b'\xdc\xbf\x95\x8dAi+V0\xfd\x1e\x1c\xc7"zg\x86:\xbe\xa3\xc3\x9c\xff`o\x0c\xd6\xac^\x8dzco\xce@\xc4n\xb2\xe4\r\x1a\xa0>\x01\x9b4\xff/'
+    b'\x12\xf9\xe1!\xd5\x9b\xf1\xaf\x15\xfe\xf3\x8f\xd0\xc3\x1e\xba\xcdX\xbf\x9e\xc0\xf9c\xf8\xf0C\xb2\xfe\xfe;\x95\x16\x15\t9q\xce\xfc\xf9<a\x8dl\xfd\xf3O2\xdd'
+    b'5\x87\xb8\xc6M\xdc\x9c@\x86\xe17\x11w\xe6\x0cY\xd4)qU/`MI!\x8b.C\xa8\x1f,\x0e2\x7fQ\xf8^\xcd\x9adX\xb0\x80\x8aO\x9fq\xaf'
+    b'\xf9#q=b)\xff\x0f@nL\xacp\xf7C\x97\x89~|\xac}\xf0l\x06\xcaO@}N4z\xf0\xc6*\xd0\x8f\xd83&i6\xa3\x07\x11j\x9f1\xf7'
+    b'!\x0fob\xfa;\xefx\xfa\xf4KK\x91\x03\xe5-\xab\x96\xa2U+\xf8~\xa49\x05\xf0\xb9\x80\x03Q\x9a3\x00\xdf\nx\x80\xf09l33>\xfd\xb4\x8e\xa2'
+    b'|>;\x86\xc8\x00u\xee\xd2|\x0b\xb6\xf9\xdf\xc0\xaf\x1c\xea\xf8\x82\xfbsq\xd6\x91#\x15\xe1#@-"\xf8\x02\xd0G\x01u\x1b\xcb\xb2\xff\xfe\x1bu\tx\x0f'
+    b'\xfc\xc3\x91\xd6\xff!\xf1\x04\xe2u\x8e#\x8bB\xee\x8eo\x17\xba\xf2\xe5`\x13\x98\xdfxC\xd0o\xee\xef\xe4\xb9\xe4!\xef\xbd\xa8\x98\xcc_~I\xf9\x9b7\x93\xfe'
+    b"\xf8q2\x9e<I\x86\xae]=\xea\x00\x1c1\xae\xffCy_\xa8+\x1c=Z\xe0E\xb2$+\xc9\xd8\xe3\n\xb2\xfcz\xd0\xdd\xe7'\x91\xea\xffDtR\xddt"
+    b"S,<\xbbw\xe9\xbe\xfaJ\x99\xa4V{\xe6'df\x82\x8f\xcc_\xde\x1bl\x86.\xaa[n\xa9\x1e\x9a@&C\x9f\x12\xe9\xf9\xa3O\xb0w\xbd#|\xf7c"
+    b'\xb4\x9b7K\xc7le\xf6\xa9S\xe9\x12\xee\xe2V\xc9\xd7\\\x83<~\xf13k\xb2\xf3\xf3\xd1\x8f\rk\x19i\x0f\x14\xac\xef\xa7\xb9\xf8\x7f\xe0k\xe9\x9f\xbap!'
+    b'x\x11\x99V\xae\\\x80\x17\x98\xe9\xf7\xf27\xf4\x0f\n\xa7\x87O\xcb\xe4\xbe}\xc1-\x18i_\xe6uiK\x97\x8a\xbfQ\xa5\xfa\xbf\xb8\x98,\x92~?\xa2\xbe\x83'
+    b'\x1d`\xfd\xe5\x97\xa0\xe4\xe5\x89\xf2l6\x81\x07\xdf\xaa\xd5Vj\xbf\xe0\xca\xe2\x1a2\x80\xe7\xf7\xc0\x012\x1e9"\xf4O\x0c\x96\xaf\'^\xf5\x7f]E\xfb\xf6\xe0'
+    b's\xad\xeag\x17\xb5\x88\xbe\x8eO\x95\x94\x96&\xe4\xeb\xfa\xe9G\x03\xdd\xd6Py\xc9%\x89\xae\x03\xb0NA_\x9e\x0b\x1c\xfcVk\x13\xe5\x15W\xf8\xfa,z\x9c'
+    b'N\xcd\xf8\xe8#1V\xe0\x8c\x138\xf3\x00\xba\xa4\x8c\x1c)\xe6V \x97`|\xfa\x9bo\xfa\xab\x9b\x04W\x80h#\x0cN[\xbd:\x91\xb8\x15\xe2\t\x17)\xbb'
+    b'v\x8dv\x9d{\xa2\xd4\x00\xe0\xde\x0fg\x8c\xd1\x1f\x10\xcfT\xa4b\x11\xfd\xd3\x16-\x92\xda"Q\xc9\xff\x0f\x96\'\x08\xfd\x7fZ\xb6(\xa3\xff\xb0\xfe7\xf0\xfa?'
+    b'8y\xce\xbeA\xe2\xeb\x86\x1f~ \x03\xbfN\x8e%\xce\xe0\x80\x1c\xfe>l\x157oB\xb3fd\x97\xcb\xdc\xb1\x0e\xb3JE\x05\xcb\x97;\xe3"Ud\xb7U'
+    b'^\x8e\x91R9L\xb3a\xc3cQ\xae\x03\xdc\xc0\xeb\xef@\xf5kXg\xfa;F\xf8\x05\xaeM]\xb2\xc4\xdf\xf39?\xf3\xc7\x1f3d\x15\xe7\xe8\x88e`\xcd'
+    b'.\xda@\xd0\xeb\xf0\xd3{\xd7"\xe1Z"\x86\x82\x98>\xfa\x07Js\x05\x90\xb3?0m\xf9rq\x0ca\x03\\\xa1\x9e:\xd5\x7f\xce\x14z\x10\xbd\xfb\xae\xf8\xfd'
+    b'[\xb5/\xbe\xc84q\x15y~\xf8k1C\xb7k\x17\xd3\xf1\xe5o\xe9\xf2\xb2\x1c\x96\xc1\xa2\x9e\xb2C\x87`\xfb\x15\x07\xe2!\x81\x1co\xd9U\xa9\xff\x85\xfe\x7f'
+    b'\x83\x07\x97\xe1\xfe\x83N,\xb8\xe7\x1e\xca\xfb\xe3\x0fw_\xc0\xd0\x8e\xcfF\xd6\xcf>\x13z\n\x15\xc7\xb0\xee\xb7i\xd2\xc8\xb6u+\x99\x1b6\xf4i\x03\x18/n'
+    b"G\xa6]\xbb(\x7f\xc7\x0e\xca\x7f\xf0A\xb2|\xf0>Y\x8e\x1d\x13\xb8\x96\x13]\xff;\xf3\xc0\xd2\xd3'\xf1s}\xa4\xb9\x80 \x0f\xb9\xfc\xc35\x8f?\xdeH\xd9"
+    b'\xad[\xa0\x9evX\xdb\x06\xd2\xe1\xe8K\x03~o\x81\x0b\xc7\xeb8\xa1\xe7\x10\xf7Nd\xdf\xf4(\xed\xf3\xcfK\xb9zk\xc8\x9b5\xf3\xfeL\xae\xbciS\xf8\xe9'
+    b'\xc51AL\x05\x1c\x00n\xee\xdf\\\xd1\xdf\xaf\xd7\xfb\xe3\xfa\x93\xda\x12R~\xc8\x11\x9a\x8d\x1b\x99&\xae:\xa0?=\xd3\xef\xe5o\xc8\xbb\xab\xc88#\xe6\x08~'
+    b'\xac\xd5\xd9g\xce\x84\xf2\xbb\xe8\xf5xY\xca\xed\xb7\xfb\xe3\x1f\x8f|\xff\xbf\xd0\xfc\xd2F~\x9do\xe0\xf5_\x89\xd7\xda\x17\xfd\x7f\xf5\x1f~H\xf9\xd3\xa6Q1\xaf'
+    b'\xf3`\x07\x84r|B?\x82\xe2\x12\xa1\xa7\xa0\xa9\xfd\xc5A\xe7\xd8U\xe6&\xf48\xfe\xfe{2\xbc\xf7>q9\xd9e\xb8\x901&\xfa\xfb\xee\x13\xec$\x81\xd7'
+    b'_2\xb6\xd1\xba\x1e\xb1\xa4\xff\x9d\xf7}V\xd6\x84\xf4\xb7\xde\n\xb5\xbe\xcc\x9f\xde_\x9au\xfc\xf8ui\xcb\x96e\xcb\x1b5\xba\xa0\x9f\x9a4A\x7f]_y\xfd'
+    b'\xf8]\xe8\xf7\xf2\x8e\xb3\x81\xb2K\x97y\x99\x07\x0e\xf8\xfa>\xfa\xaa\'"\x1f=\xceiq\xe6\x85:=\xe4\x01z\xaf\x0f\xbb\xa5\x8c\x1f\xbf0\xf3\xb7\xdf\x84<='
+    b"A\xf7\x7f\xfd58\xff0^k\xb3=c\x9b\x88\x01\x04\xf3\xbb\xe8\x0b+^+\xa6\xff\xab\x16\xe0\xea@\x9e\x19\xd3\xf1\x817\xf4\x03\x88\xc4x\x83'\x08|\x97\xc8"
+    b'\xf1\xbfS\xf7\xe9\xa7\xcb\xf8\xf9\x0c6\xc1\x03\xd9\xe7\xcf\xa3\xc7\xd0\x82\xac_\x7f\x1d\x93\xfe\xd2K\xbdRg\xce\xc43\x86\x9c\xff@\xf2\xc0\xe9f\xaa\x82:2\xe9w'
+    b',\xf0\x03\xac[K\x96\x9a5\xdd\xba\xcf\xd4\xa5\x8b\xb0\x86G\xdf]\xc3\xd0\xa1\x02\xd7]\xb8\xc7Wl\xb1\x90\xe5\xfd\xf7\xc8\xd4\xbb\x97\xd0k8V\xec\x00\xa1\xdf!'
+    b'o\x9f\xe0\x98\x8bO\x9f&\xf3\x03\x0f\x90%3K\xe8\xe9c\xea\xd4\xc9\x99\x13\xc9\x1f/\xb7s\xa7\xe7\xf9r\xd1\xbd\x1e\x81\xe4U\xc5\x1c\xa3\x96ed\x0c\xd3<\xfa'
+    b'(\xf8\xe1\xc3\xe5\x1d\x81\x1eF\xac\xd8_\xdf\x0c<\x9f\xe8\x97\xe6k\r?.\xfd\xcd7eA\xe4\xf3#\xd7}\xb6\xee\xcb/\xbde$n_z\x99L\xea\x9f\x99'
+    b'\xa3\xdb\xbb\xb7\x93j\xc4\x88\x0e\xaaa\xc3\xba\xa7L\x9cx{:j\xf3\x9cv\x1b\xe28\xa8\xa1\xccp\xe5\xfba\x1e[\xe9\xd5Gh@\xea\xd2\xa5\xc1\xe4I!\x97'
+    b"\xf0\xbe\xcc_~\xc1\xb5\x99\x92\xfe\xfe\xfbL\x0bW-b\xa5V'Q\xfd\xff\x81mp\x85\x02\xb9\x05x\x9e\xca\xd3\xf5\xbePU~\xe42\xf2\xc0\x81\xf3\xcb/d"
+    b'i\xdc\xd8\xe9\xfb\x9e2E\xc8w\x17\xb8\x01x}\x88\x9c\xb7\n\x1d\x9f\x10Gp\x90\xfe\xc7\x1fI\xbfr\x05\x99\x06\\KfM\x9a\xdf\xf8{eq\x03\xa3\xbf\xf1'
+    b"\x05\xce$\xfe\xf8\xb6l\xa1\x82\xbe}\x84<?\xd8\x06\x96'\x1e'\xe3;\xefT\xfe\xf5\xa8\xe2\xfc?_\xba\x06v\xef\xfdY\x7f\xfe\x19\xee\xda\x7f@\xea\xfd\xf7\x97"
+    b'\xa7W\xa0\xa3\xca\xf4\xf7\xe6\xd7\xa9\xbe\xfc\xda\xbe\x80\xbaZiN t\x14x\xbas\x83\xfc~\xbc!\x8b\xb7\x9b\x90\xe7\xe0/F\x83\xd7\x91\x0b\x89~<\xc9\x92:'
+    b'\x8a\x06\xca\xce\x9d\xc5\xdc\x0e\xd17\x80\x9a\xca\xfe\xa9\x8b\x16\x05\xe3+A\xee\x19\xf2CQ\x87\xc14p\xd5"W\xd1\xb4\xe9\x86\xdc\x8a\xfb\xe7\x127\xff\x8f\xe3b\xb5'
+    b'\xffg\xcc\xe8\xff|g\x9d\xbfa\xde=\xee\xde\xbf\xa2n6\xb4j%\xe4\nV\xfc\xf8\x1c\xee^8\xf0\xa9\xdb\xce\x9c!\xee\x99g\x04\xfe`S\x93\xc6\x82o\xa0'
+    b"\xc4\x0f\xe7nT8\x00\x94JW<\xff\x82\x8f\xfe\xf4'\x9fP\xfe\xa7\x9f^\xe8\xd7\xe3\xe2Rf\xfa\xdf\x89f\xfc:\xda_\xce}\xf9=\xb3~\xfe\x19\xbe\x84@"
+    b'\xf2\xc1#\xef\xcd?\x0f\xdd48m\xd5\xaa\xf2\xec\x93\x8e\xaa\x9bn\xf2\xae\x89\xc6\x9a\xb8n\x82\xd7\xa5\xa7$i\xb5\x17\xabn\xb8\x01\xdcH\xbdSg\xcf\x06\x7f/'
+    b'\xd6\xff\xb0\x85\xc0\xcb\xeb\x8b\xeb\xdf\xd9G\xc6i3L\xcb\xf8\xe8#\xe8\xf1\x0b\xfe\x967\xde\xf0\xc7\r$\x05r\x05X\x8f\x9fX\x88\x03)\x14\xf0E3]\xef\xbf'
+    b'W_\xac\xc6\xff"\xed\x1f\xae\xa8<\xd3+\xaf\x94\xa9\x7f3N\x9b\xe6\xb3oN\xb8\xbc\x83\xbe\x8e\xcfn\xb1\x10\xf7\xeb!2\xbf\xbd\x95\xb8u\xeb\xc84z4\x99'
+    b'z\xf4\xa0\x82\xe6\xcd\xc9\x9c\x96&\xc4\xea#\x95C\xe0\x8eq\xf0\xf2\xad^\xc7Wp\xf0`\xa5\xf7\xf5\x89u\xff\xbf\xb7\x8f\xddW\x9fX\xf0\xc3\x95W+\x00_4'
+    b'|\x08\x01\xb5x\x92\\.\xea"\xe9\x86\xf8\x9a\xbf~\x9b\xa8\x05\xbcN\x92\xc3.\xda\xfcC5\x0f=T\x9e\xbdQ]Q[\xd1\xa6\r\xae\xc7\xf2\xac\x13\'\xc4\xdc'
+    b'\xa8\xde\xeaY\xb3\xc0c\n\x7f\x00\xf8\x01\xc1\xf9\xcf\xb8\xfc\xe2\x03M\x93\xaf\xb8\x82\xf5\x05\xf4\xbd\xc1\x1e\x8e\xd5\xeb\x16\x89ud\x9e\xab\xc7O\x85\xd6\xa5\xaeu\xae\xf1'
+    b'\xc3\x8f\xc8\xb4\xe0>\xb2j4\x82\xae\x84\x1f\xc0\xf6\xe5\x97\xc2\x1a\xb9R\x8e\x0fk\xf1\x92\x12\xd2\xe7\xe5\xf3\x9b\xb3\xdfn\x11\xc7\x91\xf5\xe8\xefd\xdd\xb5\x8b\xac\xae\x9e'
+    b'\xc5\x91\xb0\x01\xb8\x8d\x1b\xcb\x1e_\x04\xf2\xf5"r=\xfc\xc8\xab\xea\xfb\xb5ur\xff\xfe\xbe|\xcc\xe0\xb4\x18\x94\xb6r%\xf4F\xa0z\x01\xf8\xf7\x03\xd5\x8bc\xad'
+    b':%\xe3\xc3\x0f}q\xfa\xb4L\xbe\xfa\xea\xb2\xf98\xd9\xd9N\x0eZW\x9c\x9b_\xbf"?\x1d\xebRY5\xe2\x00\x0c\x15\xa8\x89\x98\x98\xbeuk}E\xa7N'
+    b'\xd2\xd7\xdb%\x0f\x1e\x0c\x1e_1g\xc0\xc9%\xc4\x10\xf3\xd7S\xa6\xd1\xac\xcb\xf1\xf4\x9b\xb1\xcd\xc9\xcb\x1f\xad\xd8\x7f\xac\xe8\xff\xc8\xf8\xa5\x9d\xf1\xefBW\xff\x1f\xc3'
+    b"\xfb\xef\x935=\xdd\xd9\xd7\x8f\xd7\xc7\xb0\r*\xe3\xf8l\x7f\x1f\xa7sM\x1a\x13\xd7\xab'\x19&L\xa4\xf3\xf7\xddG\xdc\x93O\x92\xf5\x93O\x84\xe3\xb0\x8c\x1b\x17"
+    b'\x11\x1f\x00\x97\x95E%\x06\x83o^\xa4\x98\xb8\x1e\xb1\x91\xff\xef\r\xe4~\xfb\x8a\xaf9}\xec2\x99F\x96\x9b\x8b\x1eZ\xbd\xd43g\xa2g\x8c\xb7-\x00=\xde'
+    b",\xd9w.^\ry\xf3\xe6\xe0\xb2\xf3\xe0\xa9\xe5\xf59\xf2\xf7ff\xec\xde\xed\xcd\xe3\x8d\\B'\x07\xad\xf3\xf3\xf8\xdc\x08\xcdSOeH8\xed\x18\x02\xfb\x8d"
+    b'}\xbd\xdeD\xd9\xa3\x07\xea\x95\x85\xfa\xa5\xcc#G*\xda\xe3\x9c!\xfa@\xad\xc7\xd8\xf4\xd7^c:\xdf\xbb\x0f\xd8\x9e=\xb1\xcc\x05\x1eq^\xff \xd6\xafA\xcb'
+    b'\xdb\xb2\x85l\xbf\x1er\xd9\x06\xd1?>\x87k\xfd\xcf]su\x99\xde\xbb\xe0$\xb2\xa1Vq\xc1\x82\n\xe9\x7fQ\x1e\xb7t\xa9\xf0{Q\x1d\xbf(\xc8\xab\xea\xfb'
+    b'\xf56\x1f\xbdf\xa1\x9b}=c\xa8\xf1\xf3\xae\xc9s\xf6\xf2\xd9\xb1\xc3\xb3/\xafL\x06\xbf\xc2\xb2\xac\xbf\xff\xf6\xb6+\xc6\xa6\xbf\xfe:b\xd5\xde|4\xa8KD'
+    b'\x8f?\xb1~\x1dy\x89\x1dU\xc3\x87\x87\xc3\xf3\xc9P\x16\xc8\xc3\x00\xf7\x82\x98?\x88\x9e\xb3lTb\x1b\xf5\x95\x9d:\x85\xda\xbf>\x91\xb759\x05\x05\xd9\x8a\x0b'
+    b'u\xc6\xb1\x88\xaa\xd2#\x01\xe59\xaaV\xcf\x15<\xf7\x9c\x9b\x8f@\xaa\xb7\xf5\xabV\x91a\xed\xda\xb0\xf4\xbf\xf4;\\\x9d:d\xf8\xfbxL\xe9\xf5`y\x02\xaa'
+    b"\xf2^E~\xfe\xbc\xcc\x1f~\xf0\x8e\xe9_\xac\xba\xfez\x7f\xdf\x01\x87,j\xd4\xa5~\x00\xe4\n\\\xc8\x03\x90\xc9\xba\xa6\x8c\x19\x03\xee\x19)' 8\xe6\xa0\x83"
+    b'|\xe7\xed\xc8d\xe0\xa5\x17e\xce\xd3\x1d8\x90\xa8\xf9\xfdU\t)/\xd3,\xdd\x17_\xb0\x11\x89}\x1f\xc0\xcal\xcf\x9a\xce\xea\xba\xa1\x1e\xc2W\x7f\xabx\xd5\xff'
+    b"\x95\x1d'p\xae\xc5\xab\xc6\xcfm8s\x86L\xad[\x95\xd1\xdf\xa6\x8e\x1d\xc8\xf8\xd6[\x15\xe2\x14\xc4w\r\xbc}\xe1\xeci\x94\x173~\xfdx\xc8\xff\x87.\x17"
+    b'c\xc3\xe26]X\xcb{\xf6\xe7\x11\x81X@=E\xfb\xf6\xe8O\xeb\xcd\xd1\x8b\x9a5\xe4\xe6!\xe7\xec\x11\xb1w<\xbf\x8e_\x96u\xe2\x04\xf2\xd6\x03\xad\xe3\xd1'
+    b'\xb3\x06\x9f\x13e\x8d\xd4>\xfb,\x9b\xfd#\x8f\xd1\xdaM\x9b\xc41\x06\xaf0\x1b\x91\xd8\x07\xab\x03pn\xe0,\x8b\x87\xeb%\xce\xf3y\x11\xa9\xaf\xbb\xa0o\xe2]'
+    b'\x9ee\xc7\x0e\xb2{\xf5\x10\x80\xee\xe66\xbfH\xe6\x8c\x8c\xb0}\xff\xc6\xbe}\x893\x1a\xe3v\xfc\xaa\xf2^\xed\x9e2~\xbc46\x0f\xff|3e\xaf^\xbe>'
+    b'[G\xd1\xb6\xed\xa2\xac#G\xa0\xf7\x11\x97\xf7\xae\r\x10\xe3\x00\xd2\xfe\xf4\xb0\tj+Z\xb7.\xef8:\xaa\x86\r\x93\xf2\x11"\xc6\xc0f\xfe\xc8\x03\xf9\x9cB'
+    b"O\xf3\xac\x7f\xfe\t\xe6\xba0T=P'[\xddu\xff\xbc\xcc\xef\xbf\x8f\x97\xba\x9f\xaa\xaa#\x8buy\xa8\x13\xd4?\xf8 \x15\xc9<}\xf7\xd6\x16-\xc8^\xa3"
+    b'Fx|\xffJ%\x99\xf6\xee\x8d\xdb\xf1\x03WdU\xdd\xa7\x88\xbf\xcf\xf4Z[\x8c\xd0<\xf9\xa4\xccg.?xg\xc7\x8d\x93\xfa\xfcQ\xbf\x07\xfe?iOA'
+    b'i\x1f:\xd4\x05he5j\x04s,\x97\xa7L\x9a$\x95\r\x0e<6\xf3G\x1e\r\x14\x9d;\xa3o\x10\xd3\xfd\xf1\x836\xaa\x01\x03\xe2]\x7f\x0bk\x03\xdd\xce'
+    b'\x9dK\xb2\x8e\x1e\r\xf5\xbb\xe8\xd7\xeb\xafoe,\xa24\xc6\xf3\xcd\xab\xbc?\xd1\xacY\xfc\xba_\xe6\xd1\x9f(\xdc\xfc?\xd3\xb0a\x82\xccx\x1e\xbf\xaa\xbaO\xd1'
+    b"gV\xea\xfb\xc7\xba\xde\x17'\x1fr\xefo\xd6<\xf5\x94\xb4'-\xf8\xfb\xda\xab\x86\x0c\x81O\xbf_\xea\x82\x05\xde\x1c\xc2\x8b\xb3~\xff\x1d\x9c\xf4\xc1\x1e\x0b\xf2\xfe"
+    b'\xa5<\x84S\xd2?\xf8\x80\xcd\xfc\x0c\x0c\xe0\x83l\xd8P\xec\xf5\x14\x8f\x1bz\x19\xa0\xbf4\xf2~P\xef\xb36\xe7B^P0\x1bb\x87\xf1t\xbd\x98\xfe\x0f,'
+    b'O\xe0\x00X\xb4\xc8\x1d\xf3\xafH\xee\xbf57\x97\x0c\x9f~\xca\xf4\x7f\x18HIJO\xbf?\xeb\xaf\xbf\xa4u\xb5-\x93\xaf\xb9\x06z\x1b\x1b\xf8\xfb\xc1A\x87\xfc'
+    b'@\xe9\xda\x1c=\xe9\xf0\xbaX\xf3_W\xd1\xbe\xbd7O\t\xfa\xd3\xc0\xbe\x08\xe5x\xe0_\xd8\xe0\xe2!D\xef \xd6\x83\x9e\x81\xc1\xe9\xa7\x8b\xd7\x1c\xc0\xbb3\xbf'
+    b'\xfb.W\xd1\xa4\x89\xf4|.I\x19=Z\x1a#,o\xf3\xc7\x11\xc6\xfc\xff\xf1+\xcff\xb1\x90a\xfc\xf8\x88\xd4\xfd\x9b\xda\xb4&{AA\xdc\x8e_U\xde\xab'
+    b'\xc8\xd3\x97\xae-\xd6\xe7\x14\x16>\x98\x9d\x97\x07\xbf\x80w\x8c\x1f\\\xf2\xe8\xc5\x83\x1c~\xa9\x0c\xf0\x02\xf8\xe2\x0f\x9a\x9a\xb1m[\xb0\xfe\x7fq\x9e\x9b\xe4\xeaC\x0f'
+    b'\xfb\x81\xe9\x7f\x06\x06\'\xe6{\xd5\xe8\xc4\xc3\x06\xee"\x7f\xbd\xc1\xfa\xa7-Z\x14l]\xe3\xe5\xeaI\x93dq4\x17Dr\x1d\x19J\xbdY\xfc\xc8s\xf2\x0e\x1a'
+    b"\x8f\x1f'\xabW>\xa0\x9b\xc7?'\xc7\xa3\x7fq\xa0\xfa?|\xce0\xfb.!\xf7?/\xce\xc6\xaf\xaa\xf3\xff\xc0\xa7\x87\xfer\xe8\x1d\x0f\x8e~\xe4\xffaCL"
+    b'\x1f\xfb\xf0\xf3\xc3\x16\x00\xdfv\x17\xd5\xc8\x91\xaa$\xad\xd6[\xc6P\xcd\xc3\x0fK\xeb\xfc\xf0}\xa1\xffL\x8e\xb37m\x8d\x10\xea\xf8\xe0\xebD\xce \xfa\x06\xb2Y'
+    b'\x9f\x81\xc1\x89\xa9\x19\x1f}\x14o\xfa\xbf_\xda\x82\x05\x81\xce\xc9\xd9s\xba|~c\xd8\t\xe8\xbb[\x1d\xf5\x7f"\xc7\t\x0c\xe7\xce\x91E\x9d\xe2\xb3W\xa0q\xf5'
+    b'j\xd2\xafXN\xd6\xb4\xb4\xa0|\x04v\xa5\x92\x0c\xef\xbe\xcb\xff\x0e\xab\xff\x0b\x07\xe0\xfa\xd1\xcaj\xd6\x04\xbf\x0f6\x9d\xbc^=\xac\xdd\x91s\x8bZ\xc0@\xb5{'
+    b'R\xfd\x8f\x1a\x7f\xd4\t\xcc\xc8\xd8\xb5K\xe4\xf1Y\x91\xf5\xef\xbf\x97\xa6\x8c\x19\x13l\xbf\x8e\x0cY\x9d:9rO\x9f!\x03Cu\x06\xb8\xb8\xe3M\xffwL\x19'
+    b"6,\xf0\xdaC.\xef\x922rd0\xfd\xc7\xd1\xefS+\x0f\xde\x97\xc8\xf4\x7f\x1c\xe8\xff\xf3\xbc\xfe\xcf\xcc\xf4\xa9\xff\r\x93'\t\xdf\xb1\xfe\xf4#\x19\xbbt."
+    b'\x97\x1f\x00\xdf1\xd7\xc8%\xe3\xbe}B\x9d\x01\xd3\xff\x95\x87^\xeaY\xb3\xc4:\xff\x1cy\xe3\xc6xM-\xd3\xe9\x903(\xc6\xf3\xd1_\x08\xbc\xf3\xf5\x14\x1d;'
+    b"2\xbf>\x03Ch@.\xcd\x82\xac_\x7f\x8d'\xfd?B\xbbqc\xf9\xfeG\xb9\xbcEr\x9f>\x0f\xe7\x98\xcd\xe5\xc9\x83\x0f\xc4\x9b34\x16\xc1\xf2\xff\x82\x94"
+    b'W\\LV?u\xff\xe6~\xfd\x9c\xbc\xc1\xb0\x13\xce\x9c\xa5\x82\x17^ c\x8f\x1edW(|\xfa\x03\xc4\x1a\x023oOp;v\xb8z\x1f\xb3\xfc\xbf\xca@'
+    b'-E\xeb\xd6\xa8\xcf\xad/\xe8v\xcfg\xbb\x8fz\xce\x1c)O\x10x\x02;\xa8\x86\x0ee3:\x03Chh\xa8\xbc\xe4\x12\xd4\xdcV%\xf7\xeeh\xed\x0b/L'
+    b'\xc9\xf8\xe0\x83`>\x8fcM\x96\xa5\xa6\x06sn\xa8\xefC\x8c\xb1\xbc\x1a\xc2\x9b\xb4\x8f?\xce\xf4\x7fb\xc8+\xd1\xeb\xc9\xca\xebs_\xba\\\xdf\xa9\x93\xa0\xff\x05'
+    b'yy\xf9\xc2\x06[\xa0\xf0\xe8Q2\xb5i\x13\xb0f\xd0P\xbf\x1e\x19\xce\x9f\x17b\x01L\xffW\x0e\xfcqs o\xa7{\xca\x84\t\x0fI\xec\xfb^\xea;\xef'
+    b'd\xb39\x03C\xe8h\x9a|\xe5\x95\x95\xdd\x13py\xf6\x89\x13\x835\xabW\xa7\xcbk\xd6\x14}\x11\xa8\xe9\x0b\xa6\xe6\xbf\x9e\xb2}\xfb`\xcf-U\xa6\xd3\x81\xe3'
+    b"/PN\x00r\x01\xba\xab'L\x88\xe5|\xc0H\xeb\x07G\x04\xfa\xd7\xc6\xa2<\xf3\xf6\xede\xfc\xfa\xd0\xe9\x96\x9c\x1c\xb2\xee\xfc\xe4\x82\xfew\xad\xe5EyE\xc7"
+    b"\x8f\x91\xb9A\x03\x9fq\x03\xfc56n,\xe8\xff<\x97\xfe\x8f\xf5\xf1\xab\x0e\xf3\x16\xd6\xfc\xc8'tr\x0c\x9aLC4k\xd7\xa2/0\x9b\xd1\x19\x18B\x03z"
+    b'\x02=\x98\x93\x97\x17]\xbe\x1e\x87cY\xd6\xf1\xe3W\xa5\xdeu\x97\xaf5<\xec\x90`\xea\xf8\xfb\xa6\xdesO(\xe7\x06\x9f\xe1\x80\xb4\xfb\xef\x7f\xd4\xc5\x1f\xeek'
+    b'C]R=e\x87\x0e\xb1z}\xc0\xe9V]\xeb\xfa\x82\x95g?u\x8a\xb8\xe6\xcd=\xfa\x01"\x87\xcf4j\x14\x19\x0f\x1f\xe6\xd7\xfa\x9c_y\xf0\x03\x98\xbe\xfc'
+    b'\x92\xac\xe9\xda2\xf5\x01BO\x81\xc9\x93\x85\x9e\xc7\xf12~\xd5e\xde\x02O\x90tm\x00\xaeA6\x9b30\x84\x0e\xe4\xc2-\xcb\xf6\xec\xad\x199?\x7f~~'
+    b"\xab\xe4~\xfd\xca\xeb\xbb\x99!\xaf]{E\xf6\xc9\x93\x81d\xc1\x86\x08\xa7\x7f'\xb8\xc5\x02\xe5\x05b\r\x91&\xcb\xca\x8a\xc5k\xc3\xf2\xff\xca\x91\xc7\xaf\x9f\x8dc"
+    b'\xc6x\xf0\xff\x99z\xf7\xa6\xc2#G\x84\xf7\xc4u\xbb?yb\\\xdf\xf2\xf6\xdbT$\x93y\xd8\x10\xe6\xdc\\\xb2\xfe\xf1\x07\xcb\xff\x8bAtR\xddt\x93\xf4\x19'
+    b'\x9e\xa3\xdb\xbb\x97\xcd\xe4\x0c\x0c\xe1\x01\xfe\xf2[\xb4O?\x1dL\r](\x1b\xe2\xf6\x8a$\x95*\x98cH\x91i\xb5\xc8\xfd\t\x14\x03@~_\xa8\xe7\x06\xff~'
+    b'\xc7\x94\xe1\xc3\xfd\xd9\x00\x88\x03\xf8\xe3\x16`\xfa?F\xe59\xd0\x83\xd0A\x96\xad[\x05\xbd\xed\xae\xf5\xbb\xfajrX,\x82_\x1d\xef;\xfb\xf8\xe5\x0b\xf1\xfb@'
+    b'\xfa\xdf\xc1\xaf\xb7-:\x9d[\x0er\x03\r\xaf\xbd\xea:>\x87\xb3\xdf!\xd3\xff1\x83\x16\xc9}\xfbJ\x9f\xe1!\x9a\x87\x1eb\xb38\x03C\xf8@\xdd.bk'
+    b'\xebs\x0b\x0b#i\x03\xd4V\xb4i\x13\x8a\x1d\x12\x88\x9fpL\xfa\xe6\xcd\xe1\xd86\xd32\xb6m\xf3%\x0f\xb5\x02mT\xd7^\x1b\xab9\x00\xd5\x99\xd7\xaf<y'
+    b'\x85\x7f\xfeI\x16~\x8d.\xfa\xeb\xb9\xe6\xcd\xc8v\xf2d\xe8}s\xb0\xf1\xeb\xff\x12\t\x07\x90q\xe1B\xe1\xf5x\x1b\xbf\xea2W\xd5U\\|1\xf8\x05\xc1\x0b'
+    b't_\xe6\xc1\x83\xe0\x18`38\x03C\xc5\x00=\x08>\xbdH\xea\xff\xa1!\xda\xe6\xd7\xa4\xde{\xaf\x7f_=\xc7\x85bO\xe4*\x9a6\x9d\xad\xfb\xe2\x0b_\xb2'
+    b'\x16f\x1d:t\x91\xf2\xd2Kc\xf9zDb\x1d\x89\xde\xb2\x91\\\x97\xc6\x82<\xe3_\x7f\x91\xa1];\xb7\xaf\xde\x96\xaa&\xfb\xfe\xfd!\xcbs8\\1\x84\xeb'
+    b'\xafw\xc7\x10\xb86m\xa8\x94\x97\xe3\x88\xc3\xf1\xab.\xf3\x14\xe2u\x13\xd3\xb7n\xbdM\xfb\xca+\xe0\x18b37\x03Cd\x00N\xfdH\xea\x7f\xe4\xd8i\xe5\xb9'
+    b'\xb9\xc1\xfe\xbeR\x96\x92\xb2"\xfb\xdf\x7f\xfd\xc9\x1b\x9b\xfe\xfa\xeb\xc1\xc8i\x96\xdc\xb3\xa7\xaf\xbc\x06\xf87\xe0G\x88\xd5\x98\x7f\xa4\xf5\x7f\xa2\xc4\t\xa0\xab\xe1\xd7/'
+    b'<\xf4\x9b\xbbn\xcf\x9d\xe7\xff\xc0\x83\xc2{\xe1\x1c_\xe1\xefG\x84\xde\xbf\xe2\xda\x9f\xdb\xf4\x82\xd3\xdf\xef`\xfd\x7f\x18\x18\x18\xaa\x17Fi\x9f{.P.\xff\xe4'
+    b'\x8c\xf7\xde\x0b\x86c\xc7\x9bw?\x14\x1f\xc4\xc4\x8c\xad[\x03\xf5\x00,\xef\xfb\x97\xa9\xc7\x8e\xf5\xd5\x17\xe8\x81\xecs\xe7\xc0%\x18/=\x00"\xcd#\x1fL\xbdY'
+    b'L\xca\xe3L\xc2:\xdd\xf2\xe6\x9bd\xcdH/\xd3\xef\xd78h\xa0O\xfd_\xde\xf1\xe1}\xd3M7\xb9\xe5\x99\xea\xd6\xa5b\xa3\xd1\xf9^\x1c\x8e\x1f\x9b\xbd\x18\x18'
+    b'\x18\xc2\xf7\xff\xcb\xe5\x8b\xb2\x0e\x1f\xf6\xa7{\xd1\xe3\x13\xdc\xdb\xa8\x19\xb8E\xfb\xcc3\xc1\xf6\xde\x13\xbf\x17\xcc1\x0cJ[\xb92P\xbe>j\x05\x03\x1d\xffp\xcd'
+    b'\x86\r\xbe\xf2\x18g\xe9>\xff\x1c\xb9\x00\xf1t=\x12^\xaf\x87 \xcf\xf0\xd6[B]\x9f4G\xdf\xcd\xd7\xabR\x91\xf1\xdc9\xa1\xd6O\xf0\xe9\x07y|\xfaw'
+    b'\xdf\xa5BI\xde?\xb7\xf4~\xfe\x98\xb82<\x01\xf10~\xd5)\xff\x8f\x81\x81!\xf2\x80\x9f\x1e1v\x7f\xba\xb7O\xea\x9c9\xd2u6\xea\xf9Q\xbb\x87\x9e:'
+    b's2\xbf\xf9&\x90\rp\xa5z\xfa\xf4\xf2\xfc\xfe3u\xbbwo\xc8-)\tTO\xd0M=~\xbc\xaf\xef\xa3\xce\xe0\xb6\xf4\x97_\xf6\xb6\x1d`/ \xaf1'
+    b'X\xfb#\x1e\xf5\x7fB\xc7\t\xe0\xf3?xP\xe0\xe4\x97\xea|\xe4\xfdsm\xdb\x90a\xfat\xca\x7f\xf2I*\xc8s\xf6\xebq\x04y|\xe8\x19\xc8\xb5n\xed\x96'
+    b'W(K"\xfbo\x87\xe2z\xfc\xd8\x0c\xc6\xc0\xc0\x10.\xc0\x85\x13\xa8\x07o\x8a,=\xdd\xdfwU\xb2\xb4\xb4)\x19\xef\xbf\x1f\xa8\xef\x8e\xbfZ@\xe4\xf4-\xc9'
+    b':z\xd4\xdfw\xe7e\x1e8\x80\xfe>i\xb2\xecl_\xdf\x87nw\xd6/z\xea~\xf4\xfe\xac\xa1\x08\xbegh\xac\xea\x7f\xe4xER\xdf\xc4\x85<\x9b\x8d\x8c'
+    b'\x9b6\t\xfey[j\xaa\xa0\xa3\x8b]1zKF:Y\xb6m\xa3\xd2\x92\x12!O_\xfc\x1e\x17\xd4\xf19\xa8\xc8` C\xaf^e\xfc\x08\xa6\x89\x13\x893'
+    b'\xc6\xef\xf8\xb1\x19\x8c\x81\x81!\\tN\x191\xc2\x9f\x0e\x9e\x94\xf1\x7f\xffW\xde\xf7a\x1f\xdc\xa1\xdb\xb1\xc3\x9f\x8c\xfei\x0b\x17z\x7f\xa7\xb5\xaa\x7f\x7f\xf0\x04\xf9'
+    b"\xaa\xf7\x9f\xa3\xfb\xfak\xf0\xf7\x94\xc7!\xd0'u\xee\\\xa9\xeeGM?\xea\x08\xe0S\x88\xe7\xebQ\x9dy\xfd\xac\xbc\x0c\xf3\xe5\x97_\xf0\xcd\xd7\xadK\xf6\x1d;"
+    b'\xc8\xb6m;\xe9\x7f\xfc1\xec\xe33\xf3\x9b\xc8\x19\xe4\xcd\xfb[\x84\xdf\xe1\x7f#\x1e\xc7\x0f\\\x91l\x06c``\x08\x17C4\xeb\xd6\xf9\xab\xbbC-]\xb01'
+    b"\x84{3\x7f\xfe\xd9\x97\x1c\xd4\xf6K9\x80/I\x195\xca\x17?/\xf2\xff{\xa8'O\x06'Ay\xbf\x87\x1e\x02\xde\xf6\x03\xb8\x86\x13\xe1zT\xd7\xfc\x7f\xc4"
+    b'\xf0\xc1\xbdgMI\xb9\xe0\x9fON&\xd3e\x97\x91\xe5\xd6[)\x7f\xcf\x1e7\xb7_p<\x81\xa5B\\\x1f1\x02\xc3\xe3\x8f\x0bz^\xaa\xf7\xe1W0\xd5\xac'
+    b'I\\\x8f\x1ed\xfd\xfa+!\xe6\x10\x8f\xe3\xc7f0\x06\x06\x86p\x80\xdc\xb9\xf9\x99?\xfe\xe8Ko\x8f\xd6>\xff|y\xdf\x17s\x01\xb2\xe4\r\x1a4K\xee\xd5'
+    b'\xcb\x1f\x97 \xea\x0b\x90;\x00\xfd\xee\x1d\xeb\xc7\x1a~\x86n\xd7.\x7f~~_\xb84e\xcc\x18\xef\xdf\xb8&u\xfe|\xa6\xff\xe3\x99\xd7\xb7\x94\xb8\x85\x0b|\xf6'
+    b"\xe53g\xea\xc8p\xf8\xb0\xbb'_p\xc7\xe7 \x0bt\xff\xea\xd5dW\xa9<\xe4Zj\xd4 \xfd\xeb\xaf\x93\xf1\xecY\xd2G\xd8\xaf\xcf\xf4?\x03\x03C<\xa0"
+    b'\x96\xa2U+\xf8\xcd\xbdu)\xfa\x03!\xdf?\xd0w\x91W\xbf*\xfb\xf4i\xe8s\xe8\xf0@<\xc2X\xef\xdf\xa0Y\xb3\xc6\x97\xee\xef\x95:sf0k~)'
+    b"\xee\xd0\xed\xdc\xe9\x8b\xdb'\x11\xaeIu\xf5\xff\x17\xdal\x94\xd7\xba\x95\xb0.\x17\xfd\xf4\x82o>'\x87L\xef\xbe\xeb\xec\xdb\x13\xac\xbc\x82\x022\xcc\x9fO\\\x83"
+    b'\x86B\xee\x80\xe0Kpmf\xb5\x9a\xcc_|\x11\x9a\xbc\x18\x1e?6\x8b100\x84\x83\xeb\xd2\x96-\xf3\xa5\xaf{\xa5\x96\xdfc\x1by\x03\xbej\xf6P\x1f\xe8'
+    b"\x8b+\xc0\xfb\xb3\x8f\xe4X\xadmT\x03\x06\x84Z\x97\x0f[\xc1\x17W\xd0\xd4\x8c\x8f>J\x84k\x12\xc9ud(\xf5fU*/\xcf\xb9\x99\x8f\x1d'\xcb\xc7\x1f"
+    b'\x93\xf5\x85\xe7\x89{\xf9e\xca\xe3\xff\xd7\x1f;\xe6\x96\xe7\x08R\x1e\xd6\xf5\xe0\xf6\x17\xd7\xfc\x96\x0e\x1d\xc8\xf8\xddwt\x9e\xd7\xfb\xf9\xdf\xee\x13\xfc\x08\x890~,'
+    b'\xff\x8f\x81\x81!<\xdf\xbfL\xe6+f\x7f_\xe6/\xbf\xa0/O\xa0\xef\x82GoB\xfa\xdbo\xfb\xaa\x17\xa8\xa3h\xd7\x0e\xb5w\x81z\xf0"\xb7\xa0\x9dj\xd0'
+    b'\xa0p\x8f}Z\xc6\xf6\xede\xf3\x0c\x17-b\xfa?\xfe\xe3\x04\xe8\xe1\x03\xdf}\xd9\xfe?\x8er\xf5\xbf(\x0f5\xfeE\xd2\xba\xc1\x14\x15\x19\x9a5#\xf35\xd7'
+    b'P\xdes\xcf%\xd4\xf8\xb1\x99\x8c\x81\x81!T\xa4\xca23\xd7\xe4\x14\x14x\xebQ\xc4\xd6\xfd}\x07\xf5~\xd7k\x1ex\x00\xfds}\xf5\xfdm\x92\xdc\xa3\x87\xf8'
+    b"\xd9\xc1i\xabV\xf9\xe3\xf4\xe9\x97z\xdf}\x159\xf6\xc6\xca\xee\xdd\xbdy\x88\xc6\xa4\xbf\xf4\x12\xd3\xff\xd5\x93'X\xfa\x9e\xe1\xfcy2\xf4\xe9S\x86/\xd0Y\xef"
+    b'/\xe3m\x83\xf7\x98\xfeg``\xa8\xd6H\x96\xa9\xd5+\xb2O\x9e\xf4\xd6\xcd=\xd53f /P\xfaY\xd4\xd4\xd5T\xb4l9>\xfd\xcd7}s\xf4\x9c;'
+    b'\xd72\xb9o_\xe9w\xea+;v\xf4\xc7\xeb\x13L|\xa1<\xa0\xf6_*sq\xd6\x91#\xf1\xc2\xf1\x1b\x08L\xafWL\x9e\xf9\x9bo\xc8\xa4\xd5\x08\xeb\xff\x12'
+    b'\xd7\x86\x9c\x02\xd4\x15\x98\x1e|\xd0\xe5Gp$\xcc\xf9\xb2\x99\x8c\x81\x81!\x1c\x0cJ[\xb1\xc2{\x8d\x0e\x9d\r\xee^p\xe7\xce\xcd\xdc\xbb\x17\xff\xaf\xcd1\x18\xfc'
+    b"\xe5\xf7\xa1\xdf\x0el\x03o\xd9\xd7\xa6-^\x1c\xa8?P#e\xb7n\x159v\xe4'\xae\xce>{V\xda# \xd4<B\xa6\xff\x13P\x1e\xf4\xbb\xc5L\xd6\xbd"
+    b'{\xc9\xf4\xf6V*x\xf9%*x\xef=\xe2~\xff\xdd]\xe3W\xca\xf4?\x03\x03C5\x078\xf4\xd0[/\xdc>\x7f\xe0\xf6AL\xc0\x97\xec\x89\x19\xef\xbc\x13'
+    b'\xb8G\xa0\xd5*\x8d\x17\x84\x03\xf8\x1c\x12-\xff?\xd2\xfa!X\x1e\xf9\x84\x95\x97W\x96\xd7?\x91\xce\x97\xcdb\x0c\x0c\x0c\xe1\xc7\x01RSQ\x97\x0f\x9e\x9e`{'
+    b'\xfb"\xb6\x9f)\xafW/\x90\xbf\xfdN\xdd\xa7\x9fz\x7fwCnq\xb1w_^\xe4\x02x\xc7\x1b\x82\x05\xbe\xd7S}\xc7\x1d\x905B\xbbqc"\\\x0fp'
+    b'\xba%\x1a\xaf\x1f\x93\x17=yl\x06c``\xa8(\x14I\xc9\xc9:y\xdd\xba5\x14\xcd\x9b\x83\x17\x00[\xae\xa2I\x93Ly\xfd\xfa\xe9\xf2\x9a5\x91\xf3\xaf\x92'
+    b"i4\xc1\xf2\xebz\xeb\x7f\xc4\x12\xb2\xe4\r\x1b\x8eK\xdf\xb2\xc5\xbb.\x10\xb5\x04\xb0'\xc2\xf3a(\x14mU\x03\x07\xa6\xcbk\xd5J\x84\xeb\xc0\xfc\xfaL\x1e\xcb"
+    b'\xffc``\x88gH\xfd\xff\xa8\x0b\x14\xf53\xd6\xecW\xa7\xce\x9b\xe7\xcd;\xb4*\xfb\xd4\xa9\xcb\xd4c\xc7\x96\xc7\xfb\x9f\xe8`\xfa\x90\xc9c\xfa\x9f\x81\x81!\x9e'
+    b'1(m\xe5J\xe8\xf5\x87s,\x96f\xc9={z\xbf\xdf2\xf9\xea\xab\xbd\xeb\x08\xe1\x0b@\x1c\xbfq\xf2\xe5\x97\x87\x1b\x13\x88w0\x7f8\x93\xc7\xfc\xff\x0c\x0c'
+    b'\x0c\xf1\x0c\xc4\x0f\xd6\xe6\xe8\xf5\xe8\xf5\xe7\xef3\xf0\t\xf8\xe2 \x80\x1d\x80\xb8Cu\x1c7\xb6\xcee\xf2X\xfe\x1f\x03\x03C\xbcC\xda\xf7\xcf\x1f\xc0C\xb44\xeb'
+    b'\xd81O\xfd\xefpd\xc8\xeb\xd4a#\xc8\xc0\xc0\xc0\xc0\xc0\x90\xb8@\x0f\xc1y\x99\xdf\x7f/\xb5\x01f\xeb\xbe\xf8\xa2\xb6\xa2M\x1b6:\x0c\x0c\x0c\x0c\x0c\x0c\x89'
+    b'm\x03\xcc\xd2}\xf6\x997G\x008\x06\xd8\xe8000000$.\xc0\xeb_\x963\xa0\xa4\xa4yr\xef\xdelt\x18\x18\x18\x18\x18\x18\x12\x13\xf0\xf7\xfb\xe2'
+    b'\x1cBO\x026:\x0c\x0c\x0c\x0c\x0c\x0c\x89\t\xf0\x03\xf9\xaa\x05h\x95\xdc\xaf\x1f\x1b\x1d\x06\x06\x06\x06\x06\x86\xc4\x04j\x01\xbc\xf5?\xf2\x02\x13\xa1\xaf\x0f\x03\x03\x03'
+    b"\x03\x03\x03\x83o\xa0\x1f\x91\xb4\xa7\x1fx\x03\xd1G\x98\x8d\x0c\x03\x03\x03\x03\x03C\xe2\x02\xfd\x84Fk\x9f\x7f\xde\xb9\xee?p\xa0\xbe\xb2S'6*\x0c\x0c\x0c\x0c"
+    b'\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c'
+    b'\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c'
+    b'\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c'
+    b'\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c'
+    b'\xa1\xa3\xb4\xb4\x94\xb0Y,\x16\xca\xcf\xcf\x176\xf6Zl\xbd\xc6\xeeR\x86\xca\x9a\x07\n\n\n\x84{\xae\xa8\xa8H\xd87\x99L\xc2\xbe\xcdf\xf3\xb8/\xcdf\xb3'
+    b'\xb0o\xb7\xdb\x85}\xa3\xd1(\xec\x17\x17\x17\x0b\xfb\x90\xe3-\x13\xefa\x1f\x9f\xc5>\xbe\x8b}\xc8\xc2>dc\x1f\xbf\x85}\xfc6\xf6q,\xde2\xc5g\xa3\xa4'
+    b'\xa4D\xd87\x18\x0c\xc2~aa\xa1\xb0\xcfq\x9c\xb0o\xb5Z\x85}\xfc\xf5%S\xaf\xd7\x0b\xfb\x0e\x87\xc3-\x13\xff\xe35\xbc\xe7k,\xbce\xe2\xb7\xb0\x8f\xdf'
+    b'\xc6>\x8e\x05\xfb86\xe93,}M\xfc\x8c\xf8\x1dQ\x86(S\xfc\r\xf17\xc5c\x10\x8f\t\xc7(\x1e\xb3x\x0e\xe29\x89\xe7\xe8-K\x1c\x13q\x8c\xc41'
+    b'\x13\xc7P:\xc6\xde\xb2\xc4k"^#\xf1\x9a\x89\xd7P\xbc\xa6\xe25\x96\xceg\xe2=!\xde#\xe2=#\xdeC\xe2=%\xdec\xde\xe7,\xde?\xec)e\xfa'
+    b"\x9f\xe9\x7f\x06\x86\xe8\xcc\x03\xd0'\xde\xfa_\x9c\xd7C\xd5\xff\xde:*\x1c\xfd/\xca\x94\xea\x7fo\x99\xf1\xa4\xff\xb1\x0fY\x90\x8bs\xc3>\xc6\x00\xfb\x18\x03\xecc"
+    b'\x0c\xb0\x0f\xd9\xd8\x87l\xecC6\xf6\xf1=\xecc,\xb1Ie\xe13\xd8\xc7w\xb0\x0f\x19\xd8\x87L\xec\xe37\xb0\x8f\xdf\x94\xca\xc21a\x1f\xff\xe3\xd8\xa5\xb2p'
+    b'\xce\xd8\xc75\xf1%\x0b\xafc\x1f\x9f\xf3\x96\x85Mz\xce\xde\xb2\xbc\xcf\xd9[\x96x\xce8&\xec\xb3\xa74\xf2\xc0\xd8\xb3-\xb67v\x972D\x1b\xd0\xad\xd8\xa0'
+    b'SD\xdd\x80}QW@\xa7`_\xd4K\xf8\x8b}Q\xd7`\xae\xc6\xbe\xa8?\xb0\x892\xc5}\xbc\x87}q^/O&~\x1b\xfb\xa2~\xc3\xb1y\xcb\x84^'
+    b'\xc0\xbe\xa8w\xa0;\xb0/\xea\x12<?\xd8\x17u\x8d\xb7L|\x0f\xfb\xa2\xae\xf2%\xd3{, \x0b\xfb\xa2.\xc4oa_\xd4o\xde2aO`\x8c}\xad\xaf'
+    b"E\x1b'\x94\xf5\xb5\xd4V\tg}-\xca\xf2^_W\x95\x7fB<\xe7\xf2\xfc\x13\xec)\x8d<\xc4\xfbH\xbc\x06R\xdf\r{-6^cw)Ce\xcc\x03"
+    b'yyy\x1e\xebi\xec{\xaf\xa7\xc5\xfb2\xdc\xf54d\x06\xb5\x9ev\xb8tO\x9e\xef\xf5\xb4(\x13\xbaK*\xb3"\xfe\n\xe93\x08\x99\x91\xf0WH\x9fa\xbc'
+    b'\x8fs\xc6\xfb\x90\x85}\x9c+\xf6q\xee\xd8\x87L\xec\xe3/\xf6!\x1b\xfb\xf8\x1c\xf6\xf1=\xec\xe3\x7fl\xbed\xe1;\xbed\xe17\xb0o2\x1a<d\xe1\x98D'
+    b'Y\x18s\xe9q\x8a\xb2p\xce\xbed\xe1u_\xb2 \xc7[\x96x\x9c\xa2,\xefs\x16e\x89\xe7,\x95\x85}\xf6\x942\xfd\xefp0\xfd\xcf\xc0\x10i\x88\xfed'
+    b'\xd1\xd7\x8a9\x17\xfb\xa2\xff\x19s2\xf6E_-\xe6j\xec\x8b\xbe\\\xcc\xd5\xd8\x17}\xbd\x90\xe3-\x13\xefa_\xf4\xef\x8a2E_2dKe\x1a\xfe\xfd\x97'
+    b'\xac\xa7O\xbb}\xd1R\x99\xa2\x7fY\x94)\xfa\xb2\xa1c\xa42\xa1c\xb0/\xfa\xc2q>\xd8\x17\xfd\xee\xf8\x9e\xb7Lq\xdf[\xa68\x16\xa2L\xef\xb1\xf0\x96)'
+    b'\x8e\x85\xe8\xbb\x16m\x18\xd8\x16\xfe\xd6\xd7\xa2\xbd\x12\xee\xfa\x1a\xb2}\xae\xaf\x1d.\x1b\x0e\xbf\xbd}\xbb\xf0]\xc1\xc6\x0b\x10\xff\x87\xacp\xfc\x13\xbe\xe2\xffRY\xe1'
+    b"\xfa'\xd8S\xca\xe2\xff\x05xV~\xfc\x91\xc5\xff\x19\x18\xa20\x0fD:\xfe/\xd5\x05\xc1\xac\xa7\x8b\xcf\x9f'\xcb\xfe\xfdT\xc0\xeb\xfe\xf3\xcb\x97S\xd1\xc9\x93d"
+    b'\xfb\xe7\x1f\xd2\x9f=Kz\x1f2\xe3)\xfe\x8f\xf3\xc58\xe2\xf38g\xecC\x06\xf6q\xee\xd8\xc7_\xec\xe3u\xec\xe3s\xd8\xc7\xf7\xb0\x8f\xff\xc5}Q\x166\xa9'
+    b",o\xd9V^\xa6u\xf6l2N\x9cH\xc6\xe7\x9f'n\xf92\xb2L\x9aD\xa6Yw\x92\xe1\xc0\x01\xb2{\xc9\x8e\xe4qFR\x16{J\xab\xa1\xfe\xe7\xed\xd6"
+    b'R\xc4\xd8\x10s\xe3mH\xfd\xbe}d|q\x13\xff\x9aC\xb8\xaf\xf3\xf3\xf3\x98\xfeg`\xa8 \xa0\xb3\xb0\x89\xbeV\xe8:\xec\x8b\xbeX\xcc\xc9\xd8\x17}\xb5\x98'
+    b'\xab\xb1/\xfar1Oc_\xf4\xf5b\x13e\x8a\xfb\xa2L\xd1W,\xca\x14}\xc96\xe4\xbb\xb4mK\x96>}\xc80y\nq\xcd\x9b\x13\xb7b\x05\x15%%'
+    b'QA\xf7\xee\xa4\x7f\xfdu2\xfd\xfc3\x99\x0cz\xb7L\xd8\x12R\x99\xd0\x13R\x998^\xe9q\xe2|\xb0/\xfa\xcaq\xbe\xd8\x17\xfd\xdfR\x99\xe2X\x882\xcb'
+    b"\x1b\x0bQ\xa68\x16R\x99\x95\x1e\xff\xcfs\xdah\x0e\xe8\xd7\x17\x9e'kZ\x1aY\xee\xbe\x9b\x8a\x15\n2l\xd8@Er9\x15\xebtdm\xd6\x8c\xac\x97^"
+    b"J\xf9K\xef'GI1\x8b\xffW3\xc4z\xee\x9b\xf5\xf7\xdf\xc9\\\xaf\x1e\x19\x1a4\xa0\x82\xe7\x9e's\x87\xf6d\xde\xb1\x83\x0c\x8d\x1b\x93\xe5\xe2\x8b\xa9`\xc6"
+    b'\x0c2\x9f8!\xd8\x02,\xff\x8f\x81\xa1bq\xc0\xf2\xe2\xff\x15]O{\xc7\xff\xf3x=\x85g\xd7\xfe\xf5\xd7d\x1d>\x8c\x8ad22\xdep\x03\x95\xf0:\xdf'
+    b'\xc4\xafW\xcdC\x87\x92\x83\xff_\xdc,Z-\xe5\xcd\x9cI\x0e\xc1\x97\xe0\x88\xab\xf8\xbf{N\xe3\xc7\x0e\x9bt\xdfc\xce\x0b\xb0\xef\xeb\xbb\xbedq\xe7\xce\x11\xf7'
+    b'\xd0Cd\xbf\xe8"a\xdcJ\xf8q-\xe1u\xbf\xadF\r\xe2>\xfa\x88\xec-[:_\xe77n\xd80\xe2\x9e|\x92\xec[\xb6\x90\xf5\xab\xaf\xc8\xcc\x9f{\xa8'
+    b'\xc7\x15\xccqVT\x16{J\xabA\xfc?\xefB\xbc\xaa\x04v\xf5\xacYdOI!\xf3\xb3\xff#[\xcd\x9adW*H\xff\xf1\xc7\xc2\x9a\xc0\xc1\xdf\xd3\xd6V'
+    b'\xad\x88k\xd1\x92\xcc=z\x90q\xc9\x122\xee\xff\x8e\x1c,\xfe\xcf\xc0\x10\x12\xc4|-1\xe7\n\xba\x0e\xfbbN\x16\xe6_\xec\x8b\xf9_\xf8\x8b}1\x87\x0b\xf6'
+    b"\x01\xf6\xc5\x1c/\xc8\xf1'S\xcce\xc3z\x9f\xfb\xe0\x03\xb2\\y\xa5\xa0\x87\x1c^\x9be\xf4h\xb2\xf0k\xfe\xc2\x9c\x1ca\xbfX\xad&\xeb\xd8\xb1d\x99:\x85"
+    b'l\xd3\xa7\x93u\xc5\n\xe2\xb6}D\x85\x9c\xf9\x82L^\x17K\x8f\xdb\xfb8\xf1:\xf6\xc5\xbc6\xe9q\x8a9u\xde\xc7\xed-\xd3{,\xbcez\x8f\x056i'
+    b'\xfc?\x9a\xeb\xeb\x82S\xa7\xc8\xb4z5\xd9k\xd5"\xf3-\xb7\x10\xc7\xdbP\x18\xbbR\xd7\x86\xff\x8b4\x1a\xb2>\xf5\x14\xd9:u*3\xe6\xf0\x0f\x18\xfb]C'
+    b'\xc6\x17^\x10r\x05"\x15\xff\x8fD}\x02{J\xab\x81\xfe\xc7}\xc1\xdf\xc3\x16\xfe\x1e\xb6\xd6\xa9#\xdc\x93\x85\xbc\xcdo\xafWO\xf8\xdft\xc7\x1d\x94\xcf\xcf\t'
+    b'\xe2|Q\xea\xb2a\xcd\xdd\xba\x91\xe9\x81\x07\xc8\xce\xdb\xbd\xa5^1B\xa6\xff\x19\x18b(\xfeo0\x92\x1ez\xbfkW*\xe2m{\xc3\xca\x95d\\\xbc\xd8C'
+    b'O\x89\xba\xca\xd6\xa4\tY\xb7n\xa5\xc2\xcc\xcc2\xba\xaa(9\x99\xac7\xdc@\xfa\xb9s\xa8\xe0\xaf\xbfb>\xfe\x8f1\xc3\x86\xb1\xc4w\xf1?\xc6\xd3\xd7>\xfe'
+    b'b\x1f\xafc_\xfc\xae\xf7\xbe\xf8]\xcb\xbf\xff\x92e\xd3&\xb25o\xee\x1eG{\xc3\x86d\xbd\xe6\x9a2\xe3\x8a\xadH\xa5"3\xff\xf9\xc2\xecl\xa7\xdeW*'
+    b'\xc94x0q\x9b7\x93\xc5\x15/\tt\\\xc1\x1c\xa7\xf8\xddH\xc8\xc2~\xa8\xf7tJ\x92V\xcb\x9e\xec\xd8\x8f\xff\xe7\x89\xf3\x03\xaf\xbb-\xfc<`\xe3\xef\xc9'
+    b'b\x89~\xf7\x98\x0f22\xc8\xca\xdf\xb7\xd6\xf5\x8fR\x11o\xab\n\xfa?YI\xf6\xcb.%{\x97.di\xd7\x8e\xac\x9d;\x93y\xf8p\xb2<\xfc0\x15\x1d'
+    b"?NV\xd7\\\xc0\xe2\xff\x0c\x0c\xbe\x01\xdd\x86M\xcc\xb9\xc2\xbc\x8b}1'\x0b\xf7#\xf6\xc5\x9c-\xbc\x8e}1\xa7\x0b\xdf\xc3\xbe\x98\xf3\x85M\x94)\xee[\xf8"
+    b'\xf5\xa4y\xfbv\xb2\xdcx#\x15\xcbd\xeeg\xda~QC\xb2\xf1\xb6\x80/=\x85\xd7\xac\xc8\t\xe0\xd7\xa3\xe2w\x8ay\xbdo\xe4ep\xcf<C\xe6\xd3\xa7#'
+    b'~\xdc\xf8?\xd22#\x19\xff\xf7\\_;\xa8p\xe7N2\xb6lI\x85\xbc\xbewH\xc6\xcd\xe1c\x0e\x95\x8e+b\x03\x98G\xc5\xcf!F`\x9d3\x87\xce\x1f'
+    b'<H&\xd8E\xbc\x1d\x14\xaf\xf1\xff\xde\xeaY\xb3n\xd3\xbe\xfc2{\xb2c_\xff\xebO\x9e$\xe3}\xf7\x91\x9d\xb7\xf1\x8b4i\xa4_\xb7\x8e\x0c\x9f}N\x85'
+    b"\xfcs\xee\xeb\xde\x15\xd6\xfbw\xcd&\xeb\xff\x9e\xf5i'`+\xe4\xedY\x0bo\xcf\xea\xc7\x8e\xa5\x02~\xcea\xfa\x9f!T\xe8\xe4\xf5\xea5Tv\xedZ]\xe3"
+    b'\xff\x91\\O\x97\x9c?O\x1c\xaf\xc7\xcd\x97\\R\xc6\x1f\x1dHO\xb9m\x80\xa9S\xc8z\xcb-\x1e\x9f\xb7\x8e\x1aEy\xbbw\x0b~jA\xff8"\x17\xff\x8f'
+    b'\x14_\xa1\xd4\x87\'\xc6\x04D\xdb@\x8c\x19\x88\xb6\x83\x18S\x10m\r1\xe6 \xda"b\xecDjS\t6\xd6\xed\xb7\x93-7\x87l\x83\x06\x06\x1cG_\xe3'
+    b'\xca=\xf8 \xd9\x1a5\xba\xb0\xbe\xaaU\x8b\xac\xad[\xf3\xf2r\xc9\xd2\xaf\x9f\x90+ \xc6OD\x9b\xc7\xd7qJ\x8fK\x8c\x9d\x88\xb1\x15\xefs.O\x96\xf79'
+    b'\x8b\xb2\x82\xbd\x97\xb3\xe5\x8d\x1a=\x9cc6\xdf\xa5\xfb\xea+6\x8b\x05F\x95\xe5\xf5\xc1vF=\xee\xcb/\x93\xa5qc\x0f\xbb\xd5\xda\xbc9\x99\xe7\xceq\xdb\xfb'
+    b"\xfel\x00\x8e\xb7\x13\xcc\x93\xa7x|\x97\xeb\xd8\x81\xcc\xf3\xe6\x91\xed\x87\x1f\x12&'\x90\xdd\xa5\x95\x0f\xb5,#cA\xe6\xc1\x83c\xd3_{\xad:\x9c\xafXO"
+    b'\xe6\xeds\xf5\xf6\xc9z\xfbl\xfd\xf9x\xc5}Q\xa6\xe1\xd9g\x85g\xd6x\xff\xfdB\x8e_i\x08zJ\xf4Ws\xef\xbe\xeb\xf6\xf9\x89\xb1\x01s\xdf\xbedk'
+    b'\xd7\x8el\xbdz\x91\x95\x9f\x0f,\xa7O\x07\xf4-\xfb;no\x9fz\xa0\xb1\x08V\xa6t?Z\xf1\x7f\xf8N\x8d\x8b\x16\x91\xa5^=\xc17Z\x12`\x0cK\xe4'
+    b'\xf22\xf6\x81\xf5\xb2\xcb\xc8\xca\xaf\xbd\xdc\xb1T~\xcde\xbb\xf5V\xb2l\xdbFy?\xfdD\x9c\xcb\x9e\x0b\xd7?\x81c\xac\xac\xf8\x7f\x86\xacN\x9d+\xd4\xd3\xa6'
+    b'\xcd\xd5}\xfb\xed\xe3\xb9D\x93\xd2\xff\xef\xff\xd8L\x16[\xf1\x7fG)\x7f\xdf\x9a-d\xe4mw.=\xbd\xcc\xfd\xea\xf0\xfa\x1bh\x83\x7f\xc0\xb6g\x0fY\xf8y'
+    b'@j\x17\xd8\xf9\xf9E_\xbf>\xe5m\xd9R\xed\xe3\xff\xbd\xd43gvM\xb9\xf5Vv\xa7\x87\x86kR\xef\xbd\xf7\xb1\x9c\xd2\xd2\x19\x19\x9f|\xc2\xe2\xff\x15_'
+    b'O\x17<\xf7\x9c\xf0l\x96\x04\xf1l;\xfc\xc4\xfe8\xc4\x06y}/\x9d#l9\xfc\xbaw\xdc8*x\xfey*\xd8\xb9\x93\x8a\\\xfa(\x16\xe3\xffbM '
+    b'\xc6H\xac;\x14\xf9\x88\xc4\x1aB\x91\x03I\xac1\x149\x92\xc4\xdaI\x91\x97I\xac\xad,.r\xca2\x9e9C\xe6\xc7\x1f\xa7\xa2\xccL*\x91\xf1\xe3\xd2\xa2\x05'
+    b'Y{\xf7v\x8fw\xa1NG\xa6\xd1\xa3\xcb\xf8^\xec\xb0\xab6m\xba0\xa7\xa6\xa6\x92\xf1\xf3\xcf\xc9\x0c\xd96\xbb\xc0\r \xd6O\x8a\x9cGb}\xa5\xc8\x89$'
+    b'\xd6_\x8a\x9cI\xd2\x9aO\xe99\x8bu\x91\xe5\x9d\xb3(K<g\x91\xe3\xc9\xdf\xbd\x9b.\xabU\xebV\xed\x8b/>\x94\xc3q\xd0\xfb\xe2\xb68\xeb\xf7\xdf\xfb\xa7'
+    b'.Z4B\xb3q\xe3\xe0\xb4\xd5\xab\x9b){\xf6\x94%)\x14lv\xab:\xfd/\xd8\x8e\xabVQ\xa1ZM\xf9\x8f=&<\xbf\xa1\xae\x05\xa4\x9b\x05v\xff\xeb'
+    b'\xaf{\xcc\x19v\xde\x0e\xb6\xf0k\x85\xbc\xef\xbe#\xfd\xfb\xef\x93\xf9\xc3\x0f\xa9\x18\xcf\xa4\xa3z\xe9\xff\x8e\xaaa\xc3\xd6\xe7\x14\x15\x8d\xd1\xbe\xf4\x12\xbb\xd3\x83C='
+    b'E\x87\x0e\x03\xd3\x96/_\x9d}\xf6,\xe6\x90\xb1\xe9o\xbcQ\x9d\xfc\x80\xdeu[\xe1\xd6ny\xd4oY\xf8\xf53\xb8\xf4~\xfe\x99\xf4_}E&\x89\x1f\x1f'
+    b'\xfa\xa9P\xb2.\xc5_s\xf7\xeeB\xce\x7f\x99\x18\x00\xff\xac\x9b\xf9\xb5\xae\xf8Y\xf8\x07\xcd{\xf7z\xfcN\x85\x8e3B\xe7\xee\xeb7\xa2\x17\xffw\xda\\\xfaG'
+    b'\x1e\xa1"\xa5\x92\xec\x8d\x1a\x91\x99\x9f\xf3\xc0\x95"\xe4#\xf06\x11\xb7r%\x99&L\xa0b^\xd7\xfb\xb2\xab\xf2x\xdbI:\xfe\xc5\xfc\xf50\xf3k3\x03\xbf'
+    b'\x862\x8e\x1aI\x05G\xff\x88\x89\xfe\x84\xbe\xee[\x8d,7wA\xe6\xa1CR\xbd\xefo{,\xc7\xe1\x98\x9f\xf9\xe3\x8f]S\xc6\x8cQ$\xa9TR9\xd8\x97'
+    b'%\xc9d,\xfe\x1f\xfd\x98\xb6a\xcc\x18g}\xcf\xcd#\x04{\xb3"\xfa\x1f\xf1\x7f\xe3\xb6m\x02\x8f\x85w|\xa0H\xcc\x13F\xdd\x00o\xff\xe6\xcd\xb9\xcb]\x1b'
+    b"\x90\xe8\xf1\x7fe\x92Z\xbd \xf3\xd7_q\xdfO\xc9x\xff}\xa6\xd9\xfdC\x9e\x94\x9c|)?'\xdc\xa3\xdb\xbf\x7fCNq\xb1t\xce\x98\x96\xb1}{ce"
+    b'\xf7\xee\x9dT#FtV\xdd|s-E\xeb\xd6\x89\xb8\x86\xa8\x0c>=\xc3\xb7\xdf\x92\xd9Uw^\xa8\xd5\x90i\xc9\x12\xca\xe7mt\xcb\xa1Cd\xbd\xfez\xb2'
+    b'v\xe9B\xdc\x8c\x19d\xe9\xdf\xdf\xa7\x8f\x005@\x05O>\xe9\x99\x0f\xcc\xbff\x1a?\x9e\xccS\xa6\x90\xf5\xee\xbb\x85\xdf@\rq,\xc6\xffE_\xb8\xd8\x7f\x08'
+    b'\xfbb?"\x8c/\xf6\xc5\x1eH\xf8\x8b}\xb1G\x12\xae\x83\xc8\xd9+\xed\x7f$\xf6\\r\x94\xf0\xb2N\x9d\xa2\x823g\x9c\xb2\xf8}\x1b8\xf7\xf8\xb9\xb6\xc8e'
+    b'_\xf9\xcb\xaf4\xfe\xef\x7f\xee\xf7\xac\xbc\xfd`\\\xbd\x9al\xfb\xf7\x93\x81\xb7!8\xfe\xfa\xe2w\xc5\x1eG\x82\x0f\x97\xdf\x17{ \xe1\xf8\xb1/\xf6H\xc2\xb9\x8b'
+    b"}$\xc5~\x8db?$\xefs\x16\xf8\x89\xf8}\xb1G\x13~\x03\xfbb\x0f'Q\x96\xd8\x8f\xc9\xd7\xba\x7ff\xc6\xa7\x9f\x06\xa3\xfb\xbd\xb7\x15Y'O\xde\xa2y"
+    b"\xe6\x19\xf8\x05\xc6\xa6\xbf\xfe\xfa\xa2\xcc\xc3\x87\x93\x93RS\x99\xfe\x8fv\xae\x7f\x1e\xe9'O\x16trQ\x90~\xfe\xd2rr\x84L3\xf99c\xe1\xc22\xbe-"
+    b"\x0b?\xd7X\xe6\xce%\xe3\x81\x03\x94\x7f\xf8\xb0`\x13'z\xfe_\x8a,=\xbdUr\xff\xfeX\xf3o\xc8))\xc1\xbd~\xabv\xd3&\xa6\xe5}\x03v\xff\xed"
+    b'\xdaW_\xc5\xda \x98yc}Na\xe1\x1c\xdd\xd7_wI\x195\n6V\xa2\x8c\x83w\xdd\x964\xee/\xdd\x97\xaeq\xa5\xfb\xd2\xda.\xef\xda/q\xdf\x8a'
+    b'\xff\x9f{\x8e\xcc3\xee \xee\xe7\x9f=\xe3\xe7\xdf|C\xd6q\xe3\xc8\x96\x95\xe5\xf79\xb7k\xb5dz\xe1\x05\xf7\xfbE\xf0\xf3!W\xed\xea\xab\x89[\xb5\x8aL'
+    b'\xbcm \xf0\t\x048\xce`\x8e;\xd4s\x0fF\xa6\xb7\xfe\x17tv$\xf5\xbf\x98\xab/\xcaB?\xc5\xb1c\xcb\xcd\xab,\x94\xc9\xc8\xe6\x1aS\xd1\x1f\x835\x95'
+    b'\xb9Es2\xf4\xe9#\xac\xadB\xd1\xff"?\xa1T\xff\xfb\xb3y*\xa2\xff\xdb\xa9\x06\x0f^\x9e\xf5\xef\xbf\xe1\xe8~\x0f\x9f@ni\xe9\xaa\xec3g\xda&\x0f'
+    b'\x1cX\x1d\xe7\xbf\xaa\xc8g\xb3\xe3\xfa\x1e\xfd\x9d\n~\xf9\x85L\x9b7S\xa1:\xc5\xe3\x9e\xf4\x95\x13\xc0\xf5\xebG\xf6\x1a5|\xde\xc3\x96N\x9d\x84\xdc \xe9\xbd'
+    b'\x8e\xf8\x82\xf9\xf0\x91j\x93\xffWS\xd1\xb2\xe5\x90\xb4u\xeb\x96f\x1d?\x8e\xb8\xb5\xf4\x1e\x1f\xae\xd9\xb0A\xcd\xdb\x05\xd9\xf2\x8b.\xc2\xe7\xe03c\x9a?)\t'
+    b'\xfe\xbe\x1b\xd2\xd6\xae\xf5\x1e\xaf\xe0|\x89\xa5\xa5\x88/\xf6V\xcf\x9e\x9d%o\xd0\x00>\x01\xac\x1f.R^z\xe9U\xea9s\xe4IJ%\x8b\xff\x97]O;'
+    b"\\2\xc1\xaf'\xac\xa7\x1d\xa5d\xdd\xb1\x83\n\xd3\xd3\xcb\xb5\xff\xed99d}\xfa\xe9\x0b\xfe\x7f\x95\x8al7\x8f \xdb\x8a\x15dx\xfa\x19\xd2\x1f=\x1a\xd3\xf5"
+    b"\xff\xd1\xe0\xff\xf5\x97_g\xe4\xc7$\x98\xb5\x15\xfc'\xdc\x03\x0f\xb8}\xa6\x16\xd4T\xbc\xf4\x12\x19q\x9c\xb0)\\\xd77r\xfe\xff<2\xfe\xfb\xaf ;\x1c\xff"
+    b'?l\xee\xe1\x9a\xc7\x1f_\xef\xe5\xa7\x0bW\xf7\x0f\xd7<\xf6X\x9a,;\x9b\xc5\xff+9\xce\xfd\xc3\x8fd\xe2\xef5\xbb+&e\xe7\xf5\xb5i\xeaT*\xd8\xb2'
+    b'\x85\x8c\xbbw\x0b~B\xf8\x07\xac\xbc\xcd\xcfM\x9bF\xdc\xf0a~\xefg\x9bFC\xfa}{\x05\xbb\xb5\xd4+\x8eX\xf0\xf8\xe3d\xe0\xed[\xd3\xff\xfeGv~'
+    b'\xcd\x01\x1f\x80\x9bc0!\xe2\xff2Y\x0f\xf5\xd4\xa9k\xb2\xf5z\x7f\xf79|\xda\xaby\x1b\x17\xf91\x8f\xe6\xd8\xed\x0ff\xe7\xe5M\xcd\xf8\xe8\xa3\x8e\xaa\xe1\xc3'
+    b'\x13i\r\x1b\nReYY#\xb5\xff\xfb\xdf\x86 \xd7\xfd\x81\xec\x00\x8c\xe9\x9a\xec\xfc|\x8c/|.7i\x9ex"\xde\xc6C\x9a\xf3.\xf6b\xf1\xb5/\xf6'
+    b'j\x91\xe6\xbc\x8b\xbd]\xbc{\xd2\xf8\xdb\xf7\x90\xf9\xd3OBnZ0\xfe?k\xfb\xf6d[\xb6\xcc\xbdV-l\xdbF\xa8]\xb3\xdct\x13Y\x97.%n\xd6'
+    b',\xb2\x9e?\xef\xf38\xc39\xee\xb2\xe7n\x0e[fy\xf9\x7fb_\x82\xc0\xf9\x7f\xce\xbe\x8c%\xf8\xae\xcb\xce\x90\xca\x12{0\xda\xbf\xfbN\xa8\x97\x08fLm'
+    b'\xc3\x86\x91e\xc2\x04g\x9c45\x95\xccO<I\x86?\xfe\xb8 \xcb\x95\xb3\x17\xa9\xfc?=zA\xf2v\x9a\xf1\xe5\x97\x05\xfe\xc7P\xf3\xffFj\x9f}6\x1c'
+    b'{\xdd\xdf\xf6H\x8e\xd5\n_iO\xf5\x8c\x19=\xd53gf\xc8\xeb\xd4a\xfa?\xfa\xaf\xe9\x0f\x1f&\xd3U\xbd\x85\\}K\xb7nT\xf8\xeb\xaf\x9e\x9f\xe3m'
+    b'>\xf3\xbe}\xc4=\xf5\x14\x99;v\x0ch\xcbB\x86\xf1\xdb}T(\xf3]G`\xcd\xc8 \x1b/\x03\x1c\x81y\xbc\xbcD\xca\xff\xeb\x9e2a\x02r\xfc\xc2\xd3'
+    b"]\x0e\xc7\xc2\xcc\xdf~\xbb\x82\xb7\x1fTI\x1a\x8d/\xf9j\x99N\x97h\xf7|\x13\xe5\x15W \xde\x07\xfb?R\xf3\x08\xe6\xa4\x87r\xcc\xe6\x11\x9a'\x9fT%"
+    b'\xa5\xa5U\xe7\xf8\xbf#\xa8\xf5\xb4\x83\xcc\xff\x9d"[\xd3\xa6A\xc7\x00\xadcn#n\xf4\xe8\x0b>\xc1\xce\x9dI\xbfi\x93\xbb\xfe\xdf\x11\x81\xfa\x7f\xe9q{\xc4'
+    b'\xffO\x9d"\xe3\xc1\x83\xc2\xba5\xdc\xf8\x7fE\xfb\xff\xa2\xe7\x01x\xcd\x10#\xb1\x0c\x1dRf}]\x888;8\xd4\xbat\tjL\x85\xd8\xff\x9a5d\xeb\xd4'
+    b'\xd1\xed_\x01\xd7\xba\xb1m[\xd2/Y\xec<\xe7 \xfc\x13B\\\xe2\xbf\xff\xe8\xdcg\x9fQ\x89\xe0\xe3q\x08}Z\rg\xceP\xa9\xcb~A\x9f\x07A\x16\xfc'
+    b'\xfd\xf7\xce\x178\x9f\xadO<\x11r\xfd\x1f|n\x91zf\xa5\xdb\xdal\x83\xa1\x87z\xca\x94@\xeb\xacLy\xfd\xfa\x9dU#F\\\x9b\xbad\xc9\xa0\xb4U\xab'
+    b"\xfa\xa4\xce\x9d\xdb^5d\x88\xd3\xff'\x97\x07\xce1R(\xc0%\xd2%\xe5\x96[\xda$\x0f\x18\x10+\xdc\x84U\x1a\xe7\x86\x0f\x88\xbfG\x845\xb9\xfb\xb5R\xa1"
+    b'n\xdf\xb8a\x03\xd9\x94\xca\xe0\xea\x00\x91\x07\xbc\x7f\xbf\xe0/p\xe7\x04\xb4i-\xc4\x03\xad\x1f\x7f,\xf0\x8e\xe17\n\xc4~\x82\t\x12\xffG\xcc\n\xf7m$\xee'
+    b'\xff\x07\xb2\xcf\x9d\x83\xee\xea\x962~\xfce)\xb7\xdf> m\xe9\xd2\xd9\xba/\xbf\x1c\x97\xfe\xe6\x9b\x89\x93\xe7\xa7T\xa2\x1e\x08\xeb\xf5H\xcf\x1f\xf7f\xfe\xf4\x13'
+    b'xG\xe2ul\xbc\xb9\xfaD>\x17iO\xd6`9\xef\x8a\xc0\xdb\xf2\xef\xbfBM\x9a/\x99\x02\xaf\x0bx\xf4\xbc\xb8\xe9\xcb\xd3U\xe6\x8d\x1b\xc9\xea\xe2\x0f\x02_'
+    b'\xadm\xf5j\xd2\xef\xd9CF\xd7\x9a?T\xae\xbeB\xd7\x1a\xdd\xfb\xdc\xfdq!\x1a\xd1{\xf0\xa9\x8dB\x1eC8\xfc\x7f\x15\xe5\xff\xb1\xbd\xf6\xda\x85\xd8\x87\\.'
+    b"\xac\xf3\xbde\x19\xd7\xad+\x97OI\x9a;m\xda\xb5\x8b\n\x15\n\xe7:\xe9\xd2K\x89[\xb6\x8c\nO\xfd'\xd4\xfdI\x8f+(\xfe\x9f#G\x88{\xe1\x05*"
+    b'<}Z\xa8\xcb\xb2\xa9\xd5\x82_\xd7\x86\x1e-\xd3\xa7\x93q\xe7N*\xc6y\xb4oO\xa6U+\xc9\xfa\xe3\x8f!\xf3\xff`N\x92\xae_\x96g\xfd\xf3\xcf-\xda'
+    b'g\x9e\xe9\xa0\x1a:\x14k\xa1>\xa9s\xe6\xcc\xc8\xd8\xb5+\x14\x1f\xc1\x9a\xec\x82\x82N\xaa\x9bnR$%\'{?\x17\x1aYN\xcee)c\xc7"\xcf\xd0\xdf'
+    b'\xbc\x81\xf5\xd7\\\xdd\xbe}\xe0\x1cL\x93eey\xcb@\xdd\xe1,\xdd\xe7\x9f\x8b9FXw,\xcc<t\xa8\x8e\xa2m\xdbj\xad\xff}\xda\x04\xfck\xfc3\x86'
+    b"\xfb;\xd8y\xc1\x96\x9cL\x85\xdf~\xeb\x917 \xdc\xcf\xfc\xbd'\xf4\x13\xed\xdd\x8b\x0cs\xe6P\xc1\x0f?$D\xfe?\xd6\xea\x83\xd2V\xae|4\xa7\xb00\x1a"
+    b'\xb6\xf0\x85\xe7B\xafo\xa0\xec\xd2%Q\xf4\xffui\xcb\x96=VA\x7f\x7f\xa0\xf5?j\x8b0\x07`M\x80Z\x01\xac\x0b\xaaS\xfc\x1f\xeb\xbeB^\x07\x80\x8b'
+    b'\x066\xb9e\xc0\xb5\xc2\xf3\xe6k=\xad\xff\xe8\xa3\xa0\x9fq\xb1\xd6\xcf\xf8\xe5\x97dOMu>\xf3\xf5\xeb\x0b\xfa\xc5rq;\xd2\x0f\x1dJ\x05_|\x11\xb2\xbf'
+    b"\xe2\x1c\xaf\x7f\n\xbe\xd9+\xcc9B\xce\x1a\xd6\xe5'O\x92\x03\xebT\xd4\xd4\t\xfd\n\x9dcQ\xc8\xeb~\xeb\xe0\xc1B\xbc\xc1\xfa\xfe\xfb\x95\x1a\xff\x17\xf2\x00w"
+    b'\xef\xa6"\xad\xd6\x99\x1f%\x979\xd7\xebM\x1aS1oc\t\xebk\xc4\xd5\xb7l\x11z$\x05kS\xa1V\xd0\xee\xb2)\xb8\x1e=\xc82\x7f>Y7o\xa6'
+    b'\xbc\xb7\xdf\x0e\x89\x9f\x08c\x04\xdfC\x11?\x9e\xe6V-\xc9|\xdd\x00\x9f\xb9\xdb\xc2u\xabY\xd3\x99\xb7q\xc7\x1da\xf1\xff6Rv\xeb65\xe3\xc3\x0f1\xff'
+    b'5T^r\x89\xaf\xf8\xa52)%\x05\xfa6\x94\xe7\x17q\xbbeY\x7f\xff=!\xfd\xed\xb7\x87i6l\xb8I\xf3\xf8\xe3\xd33v\xecX\xcb\xcf\x81\xa1\xd8\x12'
+    b'+\xb3N\x9e\xec\xa2\x1a9\x12\xfe\x02<\xff\xc8\xbd\xf6\x97\xab\xb0*\xfb\xd4\xa9z\x8a\x8e\x1d\xab[\xfe_\xc0m\xdb6*LV\x86\xc6\x01\xd0\xb8\x91P\xef\xef\xee'
+    b'a\xc5\xdb\x03\xf6\xfe\xfd\x85^\x00\xdc\xe8Qd~\xf3M\xb2\xae]+\xf0\\\xc4{\xfe_\x03E\xe7\xce\xb05#\x19\x03\xf3\xce\x89y8\xc7b\x99\x96\xb1m['
+    b"\x03E\xe2\xe8~`~\xe6\x0f?D\xd3^\x92\xce%\x98C\xbck\x8c}\x019\x83u\x14\xed\xda\xb5J\xbe\xe6\x9a\x96\xfc\x06\xfe\x01\xac!\xca\xf3'\xfa\x9a\xf3\xb0"
+    b"V\x01oa\xa8\xdf\x15\xd7\xa6\x81z\xf5\xf9\xeb\xff'\xedyW\x84u\xe2\xcd7\x97Y\xa3\x8a=\xf0\xdc2y=\x0b\x8eYG\x08\xf5?\xd6&M\xc8\xf8\xde\x85"
+    b'g\xdc\xda\xb1\xa3s\xad\xca\xdb\x1b\x1e=\x05C\xec\xffW\xf0\xca+d\xff\xfe{\xb2\x1f?N\x96K\xbb\n>G\xf4\x18\xb5\xf2z\xca2l\x18\xe9_|Q\xe8'
+    b')f\xdd\xbb\x97\xac\xf5\xea\n=\x07l\x7f\xff\x1dT\xff?iOAi\x8dE \xae@\x9f\xbdp\x0e\x1c\xa0\xc2\xda\xb5\x9d\xbc\xe7w\xdfM\x1co\x7f\x88\xb5\xfc'
+    b'v\xe4D\xfc\xf43\x99x\xdd[\x94\x9e\x1e\x12\xffo\x11\xd6\xe7W\\!\xf0\xfe\xa3\x9f\xa2\x89\xff\x1d\xab\x8d?\x0e.\x8c\x9e=\xdf|#\xf4h\x02\x97\xab7\xc7'
+    b'\x13\xe2\n\x96\xfb\xee%\xcb=\xf7\x90\xf5\xc6\x1b\xc9<x\x10q\xbbvE\xb5\xff\x0f\xf2p\xc5\xfa\xa7\xca\xde\x90S\x04\x7f 8\x88\xb1\xde\x80\x7fa%\xaf\xeb\xe1'
+    b'?\xf0\x9e\xb7\xc13\xd2@\xd9\xb9s\xb5\xcb\xff+\xf3\x9aC\xe0\x07\xb1\xb9\xfaQ\x85\xa2\xff\xadC\x86\x90\x9e\xd7\xef\xd2\xfa\x01S\xcf\x9e\x94\xf7\xe8\xa3\x82M/\xf2'
+    b'\x0eV\xea\xb9\xf1v\xb9\xde\x15/\x8cD\xfc_&\xe4\xf9M\x9e\xbc6@\x9e_$6\xe8\xfe\x8bU7\xdc\x10\x8e\x0e\x89u\xcc\xf3\xa3\xff\x91\x0f9%\xe3\x83\x0f'
+    b'\xe0[\x9c\xcf?\xb7\xab\xb2O\x9f\x0e77\xe0n\xdd\xb7\xdf\xb6J\xee\xd7/\xd0q@Gc\x8d\x00~R\xe4\rz\xff\x16\xfc:\xe0n\xb8Q\xf3\xe8\xa3M\x95'
+    b'W^\x19\xa8\x96\x005\xd0\x83\xd3V\xad\x12\x8e\x99\x9f[\xe0\x8b\x9c\xad\xfb\xe2\x8b\xba\x8a\xf6\xed+-\xfe\xcf\xaf\x9f\xa1\xfb\xc1C\xeb\xdd\xc7\xd7\xe6Z\xa3\xe2\xf9\x13'
+    b'\xea\xb8\xce\x9e%\xf3\xb0a!?\xe3\xb6iS\xc9v\xcf\xdd\xce\x98\xf5\xb5\xfd\xc9:c\x06YW\xaf\xa6\xfc5k\x84g-,\x7f\x05\xe2\x8fO?\xcd\xeb\xf9\x1b'
+    b'y\xdd\x7f\xa9\xff5\xabFC\xb6\xb6m\x9d\xff\xbf\xf3N\x85\xe3\xff\xc1\xf2\xffb\xcc\xcc;wRan\xaeSG\xaf[G\xfa\x02g\x0e\x05b\x1f\xee>\x88\xe8'
+    b"\x8f\xea\xa7\x7fR05\xd56\xdef\x13\xfd4\xe1\xd6'\xd8n\xba) \xc7\x80]\x9bN\xe6Q\xa3\xc8v\xdf}\x02g\x13|\x06\xd1\xee\xff\x8b5LU\xe8\x7f"
+    b'q\xbb#c\xe7N\xf8O\xe5\xae\xb8\x82N^\xb7\xee\xcd\x9a\xa7\x9e\xf2\xb6\x01\x1e\xc8>\x7f\x1e\xf6\x7f\xa2\xe9\x7f\xe4\xe3H\xfd\x7f\x01\xbf\xcb?\x17\\\x9f\xabB\xe6'
+    b'\xff\x11\xd6\x02\xfcsa\x9a4\xd9\xa3\x7f@!o\xd3\x1by\xbb="\xb9\xfe\x8e\xf0\xbek\xe0m\xf2\xfc\'\x9e\x10\xf2v*\xaa\xff\x91\x9bRY\xf6,r\nP'
+    b'\x17\xd3:\xb9\x7f\x7f\xd8\xd1\xcd\x93\xaf\xba*\x9ec\xdb"\x06\xa4\xde\x7f?\xecq\xd8\xe7K\xb3\x8e\x1d\x1b\xa5}\xee9\xe4\xf3H\xeb\x7fP\xc7\x87\xf8\nj)\xc3'
+    b'\xf1\xb1\xc0\xe6\x07\x9f\x088\x97k*Z\xb4\x80\xecT\x99N\x87^B\xad\x93\xaf\xbd\xf6\x16\xed\xb3\xcf\xc2\xe6\x0fV6\xae9l\x12p9J\xed\x00\xf8=\x91\xb3'
+    b"\x8c\xba\x0e_\xb6\n\xf29p\xdd\x82\x1d\x1b\x91OV\xcc\xdb\x16s\xaf1'c_\xcc\xcd\xc6}\x89}\x91\xbbU\xc8_\xe7\xf7m\xe0\xf7\xe7u\x94PC\xb6`"
+    b'\x01\x99g\xce\xbc\xa0_\xd0\xe7\x97__c^7\xf1z\xdb\x11\x06\xcf\x97}\xc0\x00\xb2\x8b:\xf8\xca+\xc9\xf4\xde{TT\\\xe4\xce7/,\xb4\x0b\xc7%\xe6'
+    b'\xa3\xe3\xf8\xb0/\xe6\xab\xe3\xf8\xb1/\xe6\xd9\x83\xd7\x06u\xef\xe8!l\xe8\xd2\xb9\xcc1\t\xfa\xb6O\x1f\xb2\xf1k\x0b[\xeb\xd6d\xce\xc9&s\x93&d\x83\x8f'
+    b';\xc0X\x08\xb1\x02W>>\x8eM\x9a\xbb\x1e*\x87\xa0\x15\xfe\x0c~\xdd/\x9c\x7f\xebVdEn\x9f\xf8>oK\xd9k\xd6t\xc5\x03\xe4T\x12d\xae\x94O'
+    b"\xdd\xdc\xbe=Y\xff\xf8\xc3'\x1fb\xb0\\\x87\xd6\x01\x03\x02\xfeFIJ\x8a\xc0\xf5\x86~\x03\xe6\xcb.%\xe3\x9bo\x06/[\xc2\xa1\x10\n\xe0O\x8b\x96\x9f4"
+    b'8\xfd\x0f\xeepONA\xac\xabn\xd3\xbe\xf2J\xd9:\x04\x9b\ru\xda\xf5\x15\x1d;\xa2\x8fA\xae\xbci\xd3\xa6\xca\x9e=\xe36\xfe\x7f\xf80\x19\xa7O\x13\xfa'
+    b'sp\xf7\xcew\xe6}\x06\xf8\xae~\xe3\xc6\x80\xbd+\x02\xf5\x01\xd2\xf36\xb2\xb5{w\x0f\x9b\xdd\xce?\x13\xd6\xe6\xcd\xc82u*\x99\xa1\x87\xc3<\x0f\xe4\xfa\x9c'
+    b'\x05\x8fp\x88\xdcA\x0e\xccE\x9f|B\xfa\xc5\x8b\xc9\xc8\x1fCE\xf2\x0e\xbc\xf3^*s\xc3\xf3\x83\xb51\xd6\xac\xa1\xe4\xd9\x81\x87(M\x96\x93\x93*\xcb\xccL'
+    b'\xe6uUE\xfd\t\xf8~Ee \xbf\xa7M\xf2u\xd75W\xf6\xee\x9d\\N\xdd#|\xf7w\xbb\xfa\x88\x84\xbb!\xee\x87\x1c\n\xf8\x17\x1e\xce\xb1Z+\x1aS'
+    b'\x18\x97\xbee\x0b\xec\xb0\x8bU\xd7_\x1fL\x0c\x08\xbe\xa2\x16\xc9}\xfaD+\xfe/\xc4\xfb\xed62\xae]+\xf8\xfa\xb1Y\xf8\xff\x91\x8f_p\xfe<Y\xaf\xbd'
+    b'\xf6\xc2\xf3\x98\x95E\xd6G\x1e\xa1bW\xff\x9e\xd2p\xd7\xaa\xc3\x87{\xd8\xd3a\xd7+\x9c=\xcb\xeb#\xb5\xdf5+t\xaa\xa5m;2\xf2\xb6\x0c\xf7\xd9\x1e*'
+    b'<t\x888\x17oA\xa0\xfa\x7fin\xbf\x98\xeb\x1fn\xfc\xbf\x00q\x06\xa5\xd2}\xfe\xfa\xe5\xcb\x9c9\x14.\x1es\xee\xb6\xdb\x9c\xbe\x11\xf4@\xaaQ#,\xfd'
+    b'\xef\xb6\x01\xea\xd7\xa7\xc2/\xbe\x08\xbb?\x91\xd9\x8b\x7f\xadL\xfe\x06\xaf\xff\xad\xd3\xa6\x92\xfe\xddw\x85qtH\xea\xff\xa3\xd1\xffW\x9c\x87\xee\xcd\xfc\xf9\xe7\xaa\xd2'
+    b'\xff\xebrL&_\xf5SZY\x8d\x1a\x8b\xb2\x0e\x1f\xf6\xf7\x9c\xc3\x16\x80\x1f\xf6\x92\x94\xd1\xa3\xe3M\xff\x0b~v\xe8z\xdevv\xfb\xa7x[Z\xc8\x0b\xf2\xd7'
+    b'\xff\xf7\xcf?\xc3\xbe\x7f-\x99\x99d\xfa\xeb\x18\xd9R\x9c\x1cB\xd6\xda\xb5\x04\x0eQ\xd3\xe4\xc9B\xbc\x9f{\xe5\x15\xd2\xff\xdf\xff\tsR\xd8\xe7\xf6\xcf?t\xfa'
+    b'\xc1\x07\x05\x9d\x8e\xf3\x03\xaff\xc1[o\x91\x01<\x99\x0f=D\xe6\x97_"\xf3\xef\xbf_\xa8c@\r\xc3\xf6\xedB\xce\x12\xa7\xcb S\xbdz\x82\x7f\xa3"\xfa'
+    b'\x7f^\xe6\x81\x03\xe5\xd5\x9e\x81\x9b\x0e\xf7O$l^\xac\x93Wd\xfd\xfb\xef\xd5\xa9\xf3\xe7#\xb6\\\xde}\x84\xfb\xbc\xad\xea\xba\xeb\xd0k\x03\xc7\xea\xd4y\x16\xcb'
+    b'\xbal\xa3qy\xd6\x89\x13w\xe9\xbe\xfe\x1a\xefa\x1d\x8b\xfb?8}\xadR\xa1Vf\\\xfa\x1bo@\xdfA\x068;\xc1\xc1[\x19\xfe\x02\xac\xd7\xab*\x86\x18'
+    b'\xe8\xba`\xbd\x8f\xe3\x82\x0f\x03>F\xf4(\x02\x9f\xa9\xaf\xeb\x8e\xf1\x87\x1f\xa7\xbcs\x15\xf9\xe40\xe7\xc2O/\xd4\x99\xf3\xfb\x98\xdf\xb1\x0f\xfd\x84}\xe1y\xe5\xf7'
+    b'\xa1\x9f\xb0o]\xbf\xde\xed\xf3\xb7\xae[+\xe85\xbc/\xc88zT\xe0\xa4w\x04\xd9\xe77(_\x1foO\xe3w\xc5\xdf\xc0\xefa_\xc8)\xc4\x9a\xd8n\x17'
+    b'\xf6q|\xd8\x87\x8e\x11\x8e\x93\xff\x8b}\xe8\x18\xec#/\xa1$\x08{\xc3!\xe1\xc9\xe3\xf89%\xff\xe0A\xb7L\xef\xb1\x10\xea\xdb\xf9}\x1c\x0b\xf6\xa5c\x811'
+    b'\x16k\x03D\x8e\x00\xb1v@\xe4\x10\x10\xeb\x15D\xce\x01;6~\x8d/\xac\xff\xaf\xb8\x82\xec\xbc\xcd"|\x16\xbc{V\x1b\xd9\xf89\xa6P\x93&\xf4\xeb\xb3y'
+    b'\xf1\x9f\x873\xb6\xc8\x9b\xb2\xde1\x9d,\x7f\x9f\x08\xed8Q\xd3\xf0\xf57\xe5\x8e\'\xe6x\xdb\xf8\xf1\x02\xdfp Y"\xef\x82/\x0e\x85P\x01\xbfiU\xf9\x00'
+    b'\xf0\xbb\xe0[\xf3u\\\xa8%\x9c\x94\xfe\xee\xbb\x88\xf5I\xfdw\xe0j\xc1\xba\xa3yr\xef\xdeq\x9b\xff\xb7\xf5\xed\xb2\\<#F\x90\xcd\x95\xeb\xe1\xbd\xa1\x7fu'
+    b'\xb8s\x83e\xc8\x102\xb9r\xff\x8a\xc59\x82\x7ff\xb8\xc1\xd7\x93\xf5\xbdw#\xd6\x03\x98\xfb\xe1\x072\xde9\x93\xec\xb8\x17o\xbc\xb1L\x9cS\xa8A\xec\xd2E'
+    b'\xe8oj\xe5\xe7\x08\x1bo3 \x97\x08\xf9\x8c6\xfe\xb9\xadh\xfe\x1f|\xca\xdeyz\xc8+\x99\x99\xb1{7\xea\xf7s\xe4\x8d\x1b\xd7V\xb4i\x03\xaez\xe8\xad'
+    b'a\x9a\xf5\xebaG\x86\xbfv-*B\x0e[\ry\xb3fr?|\xf7\xd0\xcf\x17)/\xbb\x0c\xbf\xb5\x8c\xd7\xf1\xc1<g\xf8\x0c|\xd3\xe0\xdcE\x1d\xbe\xbf5'
+    b'=\xe2\xdew\xea>\xfd\xd4\x97\xfe\x85\xff\xbc]\xf2\xe0\xc1\xd1\xaf\x17LN\x9e\xa3\xfb\xe6\x9bX\xd2\xff\xd8\x96d\xfd\xf1\x07r\x86\xa4v\x19\xea\x89a\xab\xf9\xaaQ'
+    b'\xc2:\x04=O\x92\x02\xf47\tk=\x8d\xb5\xf0\xe5\x97\xbb\x9f[K\x8b\x16\xce\x9aoI\x1d=z\xc8;\\\xf9\xfb\xc1\xd6\xa5\x07\xac\x03\xe0\xd7\xe5F\xf4\xabu'
+    b'\xad\x83\xc3\xadW(\xf8\xe3\x0f\x81\x17\xbf<\x9dh\x1a8\x90L\xeb\x1f\xa5|\xfe\xf9\xb7\xbc\xf3\x0e\x15\xbbxk+#\xfeo\xdb\xbc\xd9\x19O\xe1\xd7\xf7\x85\xfb\xf7'
+    b"\x0b\xe7k8u\x8a\xcc\x8d\x1a\t5u\xb6\r\x1bH\xbfk\x17\x19w~Bv~\x1e\xac\xe8\xd8\x8a\xe7\\\xc4\xdb\x14\xd6Q\xa3H\xcf\x9f/'p\xf8\x96\x17\xff"
+    b'w\x90\t1\x97v\xed\x02\xfb\x18\xbau#\xdb\x96-Q\xeb\xff\xeb\x0b\xe0\xf9\x12{yU\x85\xfe\xaf\xa5h\xd5*\xd0\xf1\xc1\xcf\x8f\xde"\x98\xc3\xbb\xa4\x8c\x1c\xe9'
+    b'\\\xdbT^\x1f\xa2H\xc6\xff\xc1\xfb\xa1\xe7mR\xbb\xabNE\xaa\xd3\x85\xfb\x189z\xe0\x85,u\x08<\x90\x98?\xe0_+\xa9\xc8z\xe0\xe9\xa7\xc9z\xd7l'
+    b'\xe7\xfc\xd3\xa9\x13\xe9\xe7\xcc\x11r\xfd\xcd/\xbfB\xe7\xf9\xb5I\xde\x89\x13\x1187\x87\xd0c\x10=\xb1L+\x96\xfb\xcdqq\xf3\x92#\xf6\x90\x99\xe9<\xbe\xeb'
+    b"\xae\xabp\xdfA\\'\xe8v\xe4\xaf\xa3f\x04\xbd.Q\xef\x8a\xdc/\xff>q\x99\xec\xda\xd4\xc5\x8b+j\xfb\xc2\xaf\x80\xdfE\xdeJ\xdf\xd4{\xee\xc1}\xdaG"
+    b'=g\xce\xcd\x9a\xa7\x9f\xbe/\xf3\xe0\xc1\x8a\xd4 BW\x8dO\x7f\xeb-\xd8\xc2\xe2Q#G\x06k\xfc\xf2l\x17p\xed\xa1f7\xda\xcf\x07x\xfe\xab2\x86\xe8'
+    b'\x9b\xab\xe1\xfcy\xe4\xfa\xfb:\xde\xfe\xa9\x0b\x17\xfa:^\xac+p\xdf\xd4V\xb4m\x0b\xbb\x06\xf7\r\xf2\x1cj\xbbj\x90\xc59V\xe4\x97\x15\xf5\xbf\xbb\xfeL\xa2'
+    b'\xff=|\xb7\x92\xbc/[\xc3\x86d8rDx_\xd4s\xe0\xa1\x15|\xd4\r\x1a\x90u\xcc\xad\x15\xd6Q\xee\xfc\x7f^/\x17\xff\xfb\xaf\x8bS\xe8\x02W\xbc\xe8'
+    b'\x8f\x16\xb9\xe4=\xe2\x15.\xeeyQW[;w*\x97\x1f\x1fs\x93\xade\x0b2\xde}7\xd9]<\xfbR\xfd/r\xe3\x8b\xb1\x05\xb1\xdf\x8d\x9b\x0b\xc9\xc5\x83'
+    b'\x8b1\x16\xf2\x1f\xf8\xcf\x88<\x00\xd2Z\x01\xb1>\xc1Y\xafPDF~\xfd\x00\x8e\x1c\xb1f\xce0a\x82\xb3\xd6`\xd3\x0b\x1es+\xd6<\xb6Z5\xa9\xd8\xab'
+    b'\x8fZE|-\x1e\xfd\x95k\xd7&\xdbm\xb7\x91\x19y\x92\xe8\xd5\xe4\xe2\xf1\x97\xd6\xea\x8bu\x17\xd6\x95+}\xf6\x17\x84\xedW\xd8\xb5+YG\x8f&\xfdK\x9b'
+    b'\xc9\xec\xf3\x9c=eIkQ\xf0?\xc64\xdcg\x18\xbc&U\xf1\x9cb\x8eB\xfc3\x1ex\xbf"\xa1\xff\x8b~\xff\xdd\xed\xc7\x87\x9dn{\xf4Q\xb2\xdc0\xe4'
+    b'B\x1c@\xa1 \xeb\xf3\xcf\xbbs\x02\r\xcf>+\xdc\x1b\x15\xf2\x07.YB\xd66m\x9cz7%\x85\xb8\x1bn\x10jyJK\x1d\x11\xcbc\xb4\xbd\xfc2\x15'
+    b'\xf2\xb2M\xfc=lO\xd7\xfa\xeeM\x96\x96F\xf6\xce\x9d\xc9\xd6\xb8\x91\x90{P$\xf8\x04\x92\x84\xb8X$\xf4\xbf\x18\xbfN\x0e\x81[\x0e\x9f]\xc0\xeb\xe8X['
+    b'\xbf\xfa\xea\xc5\xd5K}\xe7\x9dC4\xeb\xd6\x85\x92\x1b\x07\xee\xceh\xdb\x00\x18C\xf8\xd9c*\x06\x90[Z\xea\xaf_\t|2w\xea\xf6\xec\xf1W\xbf\x80\xf8\xc1'
+    b'\x83\xd9\xf9\xf9\xa8G\x82mw\x95\xfa\xae\xbb\xc2\xae\xff\x87\xee\xe3\x9f7\xe1\xd9NN\xa6\xe2c\xc7\x9c|z\xbc]\xaf\x7f\xf5U!f^r\xfe<\x99G\x8f"'
+    b'c\x93&d]\xbe<"kTw\xef\x1a\xfe\x99\xb3.\xb8\x8f\x8a\xff\xfb\xcf\xcb_\xe1(7\xfe\x8fzu\xe3\x92\xfb\xcb\xd5\xff\xb6F\x17\ty\x82\xb6\xf7\xdf\''
+    b'\xfdO?U*\xff\xbf\xe5\xea\xab\x9d\xe7\xa9\xd1\x90\xe1\xc5\x17\x85\x9cy\xcb\xee\xdd\xce\xf9\x95\x9f\x8fl5\x03\xc7LK*0\xb7\xfa\xad\x85\xe0\xed\x01\xf0\xa9\xdb<'
+    b"\xea\xff\x9d\xfc\x8b\xf6\x0f>\xb8P[\x98\x9dM\xb6U\xab(\x7f\xebV\xa1'c\xa9h\x17\xe5\x95\xed\xff\x1b(\xfe\x0f\xd9\xe1\xc6\xffE4Rv\xef^\x15q<"
+    b'\xe4M\xc5\x0b\xefG\xb8\xf1\xff\xffo\xef:\xc0\x9c*\xba6\xdb\x97\xed\x05\x95" M\xba\xa8\x80\xa0(E\x11PQ@\xb1\x00\x02\x16\xc4_@P@Q\x11Q'
+    b', `A\xac\x9f~v,\xa8XPQ\xb1\xeb\xa7"XQA\x05\x15\x91"\xb2%\xf5&\xd9]\xce?\xef\xe4Nvr\xf7\xa6m\x92\xdd\xec:\xe7y\xf2\xec'
+    b'&\xb9\x99[gN{\xcf{\xe0\xcb\xf3<\x18\xb3\r\x9d-Zx\xef}Z*Y\xc1\xb3\xcb\xeeu\xd9\x9f;x\xadn\x95\xcc9u\xdey\xe4a\xb6\xbb\xc6|'
+    b'\xe4h\x9f\xcdJ\x9d\xbb\xca\x9d\x93C\xee\xff\xfd/\xe68F\xed\xfb\xef\xc9\xcd\xd6\xb6\x03:?v\xa0\xf9a\x1b8\x90,w\xddM\x16\xb6\x06z\xb0F0[\xc8'
+    b'\xf2\xf3V\x7fn\xc3:\xec\xff\xeb\xf3_\xd3\xc7\x8dK4\xff5T\xde\x01\xf1\xed\xf3s\x9ex\xe2\xf4\xac\xc5\x8b\xc1\xc3\x01<\xc1\x8a\x00\x1c\x1a\x88\x13\x84\x8amG'
+    b'+\xe0\x0cL\xb4kxr\xd3k\xae\tX\x13\x98\xdc\xbc9\xb7\x01\x02p\x1dysGee\x832/\xbf\\\xc4\x8fD\xcc\xde\xa8\xffe\x7fZ~.Q[\xe3'
+    b'\xb8\xdf\xcb\xd3\xe5\xec\xdc\x99\xca\x9fx\x82*tN\xf8\xb2\x17_\xf4\xf6\x91\x03\x86\xfe\xe4\xa1dY\xbc\x98\xc7\x05\xc1\xdf\x17+\xfd\xefg\x07\xb0\xf9\x89<C\xd9\xa3'
+    b"\xff%7p\xbaUUa\xf1\xff\x94\xfd\xf0\x03\xc7'\x04\xcd\x89\xc3\xc7h\xdd\x9a\xb4\xf5\xeb\xa3\xee\xff#c\x02\xfc8\xf1u\x0c\x81\xe0\xd7\x17\xb8\x05\xd7G\x1f\x93"
+    b'\x15v\xc7\x8e\x1d\xe4r\xeb\x9c\xf8\xcc\x9e\x82\xaf\xe1>\xe6\x18\xaa\xc4o\xd7\xac\xe1}\x11\x8c\xfe>\xcf]\xb0kr \xc6\xd7[\xc4r\xed\x97]\xc6\xfb\x03\xfb\xf5'
+    b"'x\xf0\x81\xea\x18hq1\xc7d\xa1/\xbb\xd6\xbd\x1bY\x99-`c\xd7\xa5R\xefu`v\xce\xf2X\x02\x83\x82\xf7\x02\x93R\xfb<^j\xea\xc2\xc2\xed\xdb"
+    b"\xeb\x1a\xfb\xd7*\xc2\x1a\xdc\x86\xaa\xff\x9dln\xb8\x98\xbd\xc7\xb9x\x99\x8e\xd4^}\xd5o;\xd4\xe2\x19q@\xae\xfc\xfc\x98\xfa\x02\xf6\xf3'p\xbb?\xe6u\x0c"
+    b'w\xaf\x88,.\x99\x97G\xf6.]x\xec\xce\xfa\xc1\x07\xd1\xe1\x0ec\xa0\xff\xe1\x0f\xc6\x8b3;\xf6\xf12\xbb\xbds\xda\xd0\xa1\xc6zw\xd4\xe4\x81O/\x10\xf7'
+    b'\x01\xf2\x08\xc8M\x98\xf1w\xc6BP\xbb\x87X^"]\xabQY\xb7\xdf\x1e\x9c\x0f(3\x13\xb9\x0b\xd4@\x83\x1b\x00\xc7\x0fL&z\x17\xa3\x0e\xd2X\xcf)\xe7'
+    b'\xff\xe5\xf8\xbf\xe8;k\x8c\xff\x03\xcb\x835]\xc4\xc8\xdd\xec\xb5\xff\x8d7\xbc\xba\xeb\xfc\xf3k\xe0\xe7D_\xd9H\xfazG\xea\x9b\x8a>b\x0ef\x8b#.\x80'
+    b'\\\xb3m\xfb\xf6\x80\xf1\x7f\x9e\xc7\x180\xc04\xe6\x8f\x1c\x9e6r$\xb9\xa6N\xa5rf\xbb\x94\xfe\xf9\xa7/\x17R\xdb\xf8\x7fm\xea\xff\xcd\xfa\xebi\x87\x1fN'
+    b'\xeen\xdd\xaa\xf9\xff\xc1\x7f\xbcl\x19yr\xb2\xfd\xce\xa3|\xe6\xcc\xb8\xe8\x7fq\xad\xed\xcc\xb6s\xfd\xf5\x17\x8foZq\x8dO?\xbd\x86\r\xe2f\xb6\xa1\xf3\xd1'
+    b'G\xa9\x94\xd91\x16\xe4O\x0eT\x85\xcc\xff\x1b\xcf9\x9a\xfc\xbf\x10\xf4\xf8\x89\xf5\x1cD\xee\xd3\x8c\xdb\x0f\xb1\x06p\x067\x84\x9a\xe8hqq\xe8\xe1\xe4\xe8\xde\xad'
+    b'\x1a\x8f7d0izm\xac\xfc\xb2\xebqBy=\x88\xa5/\x00^N\xed\xbb\xefc\x8ee\xb4._\x1ev/\x8d\n\xfd\x85\x1e\x1a\xce>\xbd\xc9\xc2l\x9c\x92'
+    b'\x1bo\xac\x93\xfe\xbf\xc1\x04\xb1\xf5\x86\xa0\xffQ\x97\x0f\xfd\x1f\xe8<\x10\xeb\x0f\xc4\xa5\x89975\xf7\xd5W\xd1cC\xb6\x03P\xe7W\x98\xdc\xa6M\xb4\xd7\xd0\xac'
+    b'f\xb7>_\xc3\x9a^{md\xfc\x80\xe9\xe9I1\xc6\xffY\xe6\xcd\xf3\xc6\xfe\x99\xae\x04\xe7k\xe9\xee\xdd^\xfdt\xd7]\xde\xf9\x90\x93\xc3\xfd\xbf`9>\xc1'
+    b'\xe5\x1f\x0f\xfd\xe4\x8d\x0bfs\x0c\x82C\xea\x8d\xeb\xd7+\xf7\x82\x0b\xaa\xfb\x88\x1c\xda\x8a\xf7\xa4)\xf9\xfcs*E\xeeB\xc7\x18\x8a\x1c\x88\xe0\xba\xa9-\xfeO|'
+    b'&\xdb\x08\xc2f\x90\xe3\xff\xb2\x8d!l\x0e\xb9\xff\xafv\xdc\xb1\xe4b~F9\xb0Oo\xbc^\xdd\xff\xf7\x97_8\xbf\x8e\x8b\xd9\x07\x88GZ\x97,\x8e\x8b\xfe'
+    b"7\xe6`\\}\xfa\x90\xabuk\xd3\xdc?\x9e\r\x1b\xb3C*t\xae\x04\xf9\x9c\xfdl\x1d\xc9\xc6\x146\xa7\\\xff'l\xa8\xda\n\xfc\x83X\xce\xbf\xeb\x0b\xb7n"
+    b'm\x97z\xdcq\xa7f\xddx\xa316\xe8\x8d\xfb\xd7\x1d\x86\xaf>\xf3\xff\xe0\xcb\xd6R\x92\xfd\xeey\xd9\xfc\xf95\xb6+}\xf2I\xdf\xf3\x01|\xbe}\xf8\xf0\x98'
+    b"\xc7\x0256'PwW[\xbe\x1e\xb3\xcf\xc0S\x1e6\x9fv\xf3\xe6d]\xbc\x98,?\xfc\xc0\xe3\xfeZi\x19\x1d\xa8\xac\xe2\xf8\xd9\xf8\xf5\xff\r-\xd9I\xcd"
+    b'\x9a\xd5\x17\x066\xd2\x17j\t\x82q\x00\x8c\xcf\xf9\xef\x7f\x83q\xf3!\x16\x80\xde~\xb3\xf2?\xfe\x18\xf5\x82\xc8\xdd#~\x1f\xed5D\x1d}\xa2\xd4\x02b\xbd\xe9'
+    b'\x916rd,\xd7\x01\xb9\xfe\x0f:J\xd4\xd5a\xad\xc6{\xb9\xfe\xafT\xc7\xc0\xbb\xb7l!\xc7\xab\xafQ\xe9\xf7\xdf\x93U\xaay+\xfd\xf4S\xaf/~\xfc\xf1'
+    b'T\x851\xd9{\xccw3\x9b\x9f\xf3\xf9\x9dqz\xdc\xf5\x94\xfd\xd4Sy\x8f:Q\xff\x07\x1d\xc3\xcfC_\x87\xb8.+*"\x17[\xcb\x9c\xc0\xbcu\xe8@\xf6'
+    b'\xb3\xcf\xa62\x9d_\x18\xbf\xc1o\xf1\x1b\xb9\xa6P\\\x0bQ\xffW\xaa\xe3\xe3\xf0\x1ez\x19\xef\xf1\xc25\x86m\x84\xeb+\xef\x1f\xd7\x17\xefq}\xf1\x1e\xd7W\xd4'
+    b'/\xca\xd7]\xdc\x07\x9eg?\xe3\x8c\xea||\xd7\xae\xdek.\x8d\x85\xde=e\xec\xbd\xed\x8f?\xc89y2\xb7\xbf\xaa\xe2xm\x03\xda^\xcc&\xb00\x1b\xc5'
+    b'\xfa\xde{~\xe7,\xee\x81\xb8~\xc6s\x165\x9c\x9c\x9f\x99\xbd\xc7u\xc4\xfbh\x9e\xef^\xe9g\x9e\x19K~opv{s\x0b))\xe7\x19z\x12\xdfT\xf8'
+    b'\xfb\xef9I\x07\x1f\xfco\xd0\xff\xe0\xc5q\xb4o\xefW\x9fS~\xc3\r~5\x01\\\xff\xb3\xb5\xc2\xa5\xd7\xdb8G\x8d"\xc7\xd0\x93\xe2\xf2LV\xa4\xa6\x90c'
+    b'\xe1B\xaa\xd2\xed\xe9h\xf5\xbf\x1d\xf3=\x8c\xfe\xe4r\x9f\x12Gq1Y\xa6N%WIi\xdc\xfb\xff\x86+\xd0\xab\rA\xff\x83\xe7(\x18\xcf\x0f\xb8\xf4P\xef'
+    b'\x1e\x0e?/\xf2\xdf\xa8S\x08\x87\xbf \xb4\xff\x9c\x99\xb9\xa0\xf0\x97_\x12\x05/\x19k\\qm\xf9\x7f\xcc\xfa\xe9\x96\xef\xdcI\xce\x94\x14r\xa1\xaf\xac\xe0\xffD'
+    b'\xad j\xbfZ\xb5\xf2\x9b\xf7\xf0\x0f-\xb3\xaf\x8c\xbb\xfe\xc7\xcbqd/\xb2\x7f\xfb\xad\x97\xaf\x18y\xf8m\xdb|\x1cz~\xf1\x88C\x0e!m\xf6l\xb2<\xfe'
+    b'8\x95\xb0\xed\xdd\x1e7_\xc7\xa2\xcd\xffG\xdb\xffW\xc4\xff\xad\x97\\R\xad\xff\xdb\xb5\xa3\xf2?\xff\xf4\xe1\xeb0\xb6\x17\xe3P\xe5\xab\xd1\xb4\xbd\xfd6i\xfd\xfb'
+    b'\xc7\xcd\x06\xa8`\xeb\xa3\xfb\xe8j\x0e\xc5\xca\xa4&d\x1d;\x96l\xe3\xc6\x91u\xca\xc5\xe4\x86\x1f\x8fZ/C\x0c\xa6.\xea\xff\xaa\xd7\x8d\x82\x82\x1b\x99^\xae\x8d'
+    b"\xad\xbd\xac\xc8j5\xea\xff\xa2\xe4\xb6me\xbf\x04\xbd\xc5\xe4>\xec\xd3\xf2\xdez+\x16\xebN\xc2\xf3\xff\xc0\x8e\xd3\xb9'\xf8\x1cC\xbd\x8fTwS\xbai\x13U"
+    b'\xeaXa\xfb\xc2\x1b\xc8\x99\x9dM\x8e\x93\x86\x92c\xc6\x8c\xb8\xcew\xc7am\xc9\xb1\xeai:\xa0s\x80F\x83\t\xb0\x9d}N\xf8\xfbe\xd7\xc2\xf9\xf0\xc3\xe4\\'
+    b'\xb9\x92J_z)\xae\xfd\x7f#\x11\xf4\x9a\x8c\x96\x83\xae\xaej\xdbSC\xf4\xcdIo\x92\x95\x85\xf9\xc6\xb9o\r\x187\xccW\xe4\xe5\xae\xca\xdf\xb8\x11}\x0cb'
+    b'\x19\x87\x1b\x93}\xc7\x1d\x89\xc0\xff\x83\x1e\xcd\xb1^\x07d>\x1d\x19\x83\x85\xb5\x1a\xef\x05\x9f\x0e\x9eK\xbc\x97\xf9td\x1c\x1b\xf7}Q\xdb\xc5\xe69\xe2|\xe5l'
+    b'\xfe;\xb7o\xe7\x1c\xc1\x9c\xa3g\xc7\x0e\xb2\xdfx#\xd7[\x88\x07\xd8\x98\xef\x0f\xae\xe0x\xea\x7f\xbf^\xe199\xa4\x8d=\xcb\xcb\x99\xd3\xb2\xa5\xa9N\x84\x0fc'
+    b'\xbb\xee:r\xed\xd9\xe3w-\x04>\xcdx-\x04\x9eM\\\x0b\xe8t\xe1\xeb\xe3\xbd\xe0\xff\x95\xb9\x811\xa6\xccG,\xf8\x89\x05_\xb1\xe0/\x16\\\xc3\xb8\xbe\x82'
+    b'\x97\x19}v\x81w\xac\xd4\xfd\xfa\xf2\xc5\x8b\xc9~\xd5\\\xbe\x8d<\x96\xe0%\xe6<\xc5\xe0\xd9y\xe1\x05\xd2\xfa\x1dS\xebz\xeb\x80q\xcf\xac,\xb2\xb3cB-'
+    b'\x08\xf8\x1dQ\xff\xadu\xebF\x96]\xbb\xbc\xf1\n\xb7\xcb\x8f\x1fY\x9c\xb3\xe0O6\x9e\xb3\xe0p\x16\xe7,\xf7P\x8aFZ\xa6\xf4\xec\x89~\xc1\xe1\xce\xb3\xab\n'
+    b'6m\x02\x07\x1f\xe2\xa72\x8f \xd6\x18\xf0\n\xd5\xccO\x9es\x0e8Y\xc46\xe8\xdf\x91\xe8y\x80\xa8\xf4?x\xeet\x8e\nwa\x01Y\xd9\x9c\xaa`s\x86'
+    b'\xf7\xf0\x05\xa6\xf3\x85\xd5\xe4\x06>\x98\xd9\x87\x8e+\xaf\xe4}\x1f\x80\x8f/Y\xf7\x169\x1fx n\xf6\xa8\x9f>n\xdb\x96\xac\xf3\xe6\xf1\xfa\x04\xc4\xe4yO\x82'
+    b"\x08q\x82\xa5k\xd6\x845g\xb8=\x0e\xec\xdfUWQ\xa5\xfe|'\x8a\xfe\x87\x8dzi\xee\xda\xb5\rC\xff\x87g7\xc3\xa6\xef\x99~\xfa\xe9\xc3\x9a^w\xdd"
+    b'\x98\xec\xe5\xcb\xd1\x13\x14=\xc0\xd1\xfb&)\x00gQ4\x82\x9a\xbb\xba\x88\xed\x07\xaa5\xc0\xe7\x13r\x1e}4\x1e\xe7\x86\xe7L\xae\xb5\x12\xb5W\xc6\xfc\xbf\x88K'
+    b'\x99\xe1\xe9\x05\xe6\r\xb6\xbe\xc8\x07c\xde8\xc1\r\xfc\xcf?~\xfdt\xd1_\xd7\xf2\xd5WT\xc2\xec\x01\xdb\xcb/\x93K\xd7\xc5u\xb1&\x04\x8bY\xe38\xac\xcc'
+    b">\xb1N\x99B.\xeeW\xc7>\xff_\x9b\xfe:r\xfe\x9f\xf3\x1e!\xce\xb0|9\xe7V\xd5N?\x9d\x9c\x85\x85\x9c\x83'\xa4\x7f\r\x8e\x84O?%\xeb5\xd7"
+    b'\x90v\xd4Q\xfc\xf7\xd1r3\x02sY\xc9\x9e\x0f\xc4\x83\xc0\x89Z\xfa\xd6[\xe4bz\xc1\xf5\xeb\xaf\xb4_<\x13\xd29GR\xff\x17\r\xffo \xbe\x1d\xf4\x06'
+    b'\x0eU\xcfsv\xf6\xbd\xf7\xca8d\xf0m\x80\xcf_|?+\xff\xc3\x0f\xcd\xc6\x07\xff\x9a\x88\x03 \x17)\xc7\t\x1a\x13\xfe\x0f\xbcz%\xeb\xd7\x93\xb3Y3\x1f'
+    b'\x7f\xb4\xf5\xcc39\x8f\xbf\x8f3o\xe0@\xbf\x1c\x11\xb0q\x88\x8d#\xe7\x06\xdcmU\x1d\xd8\xfb2\'\x8f\xbdo_r\xdcv+9\xbf\xf8\x9c4\x9dw",'
+    b'\x8c#{^\x1d-[\x84\xdc\x0f\xb7\x83\xd2\xd3\xc9q\xf2P*[\xfd|\\\xfa\xffF#\xe8K\xbf"@MX\xa2\xbc\x90\xb3\x8f\x87~\x8b\x85\x00G\x18O\x0c'
+    b'\x00\xd6\x0b\xd80\x88\x1d\x9a}\x0f\x1f\x04<\x7f\xf187\xd1\xf7G\xf4\xd3\x11\xbeW\xa0~:\xc2w\xf3\xf5\xd31\xf4\xbe\x01\xd7\x9f\xaf?gv6\xe7\x91\x13<'
+    b'.b\xcc\xea\xdeBlL\xd8\x01\x97N%\x0f\x9b?u\x11\x07\xa8\xd0\xeb\x86}s75\x954\xe6+\x00\xbbk\xed\xdc\x99l\xdf~\xeb\xe5\x9f\x91\xae\x85\xf0\xc5'
+    b'C\xf5\x16\x12\xbe\xbd\xb8\x16x\xe1\x1a\x0b\x1e[\xc1\x03\x8c\xedd~]\xbc\x979q\xf1^\xe6\xc4\xc5{\xfc\x0e\xef\xf9X;wr\xff\x8a\xfb\x1d\xfd\xfbG>\x96'
+    b"S#\xc7\xef\xbf\x93\xfd\x99g\xc8\xb5`\x019\xd8\xfa\xed\xe8\xd7\x8f\xd7\xf8\x87\xdb\xa7\x81\xef{\xf0`>\x16\xe7\x01\xde\xbe\x9dlV\x9c\xa3\xfe\x9e\xed'V\xe7\x1c"
+    b'\xabg=\x85\xf9\x17\xa1\xfa\x02\xcc+\xf8\xe6\x1b#^\x16<e\xe8\x8d&\xea\x94\xc1}\xea\x1f\x97\xcc\xce\x9e\x98\xf3\xc4\x13\xb0-\x10\x07\xe8\x931~|c\xce\xff'
+    b"\xc3\x06E?'?,\xcf\xfc\xf9^\x9e\n\xf0W0\x9b R\xee\xef\xba\xf0\x01xMo~\x1ei\xcc\x06qL\xbb\x8c\xca6n\x0c\xde'\x10\xf1\x8c\xf1\xe3k"
+    b'\xf2Y2\xbb\xd7\xda\xf60\xb2\x1d~8\xd9\xaf\x99G\xee/\xbf$\xcf\xaf\xdbb\xdeO8V\xf7\x1a=y\x12\x8d\xcb\xc6\xf8B\x0f\xacD\x9d+\xc0\x00\x80\xbb8'
+    b"^}\x97\x0fO;\xe9$\xec'/\xa9y\xf3\xf9\x05?\xfdd\xdc\x06\xbe\x7f\xbc\xe3\x80\xb5\xe5\xd3\x95\xf3\xff\xfc\xfd\r7\xf8bf\xbcG\xd7\xec\xd9\xe4\xf8\xfc3"
+    b'\xee\x7f\x06\xf3\xa7=[\x7f\xe6\xfdh=\x92~\x8e\x0b\x1e\xf0\xee\xbb\xc9&\xf5(\xe1\x1c\x1es\xe6\xf0\xfc\x84g\xdf>\x8e[\xf0r\x0b\xd6\xe4B\x886\xff_\x9b'
+    b'\xfe:r\xfe\x9f\xf7Y\x01\xc7"\xf0\x86\xf0\xb5\xc1O\xf0\xd0C\xe4q\xd7\xde\xbfv<\xff\x1cY\x96/\xa7\xd2g\x9f%\x0f8O\xd8x\xe1\xae\xd7\xdaSO\xfa'
+    b"\xc7'\xa4u\xcc\xef\x99\xa8\xc7\xfc\xbfQn\x90\xb0<\xe7\xe7<\xf6\x18\xf2\x85\x98\x83\x02W\x04?\xc9\xd8?\x13=N\xd0\x97[\xfc\x0e|e\xd5\xb6A\xeb\xd6\xb3"
+    b'\xf3?\xff\x1c\xba\xff\xf2\xbc\xf7\xdf\x07ozc\xc7\xff\x01\xfbgGoj<\x03\xccnv\x9cw\x1e\x95\xe9\xf5\xb6<F\x80\xbewz}\x8fm\xcc\x18n\x0fT'
+    b"\x86SS\x92\x93S'q\x81*)\x7fU\xbe\xf0\x06\xde\xd7'\xd0\xf9:\xa5\x1c%_?\x98=\xe0X\xff\x0eY\xd8zaA\xfd-\x7f\x96\xabb\xda?9\xd6"
+    b'\xfa\x1f\x82\x9cT"s\xff\xa0\xa6&Q\xe7\nr(s\xd8\x1c\x8f\xc7\xb9\xcf\xc8{\xf7]y_\xa8\xcf\x87\x8f"\xe3\x1c\x11\x1f\xe8\x1ec\xdc\xbf\x10\x9eWf/'
+    b'\xac\xcd\xd0\x0f\xd0\x15\xc2\xf7\x12\xdc\xac\xc2W\x13\xdc\xad\xc2\x97\xc3{\xe1\xdb\t>[7\xf0\x00k_#\xa7\xde\xb3\xd7\xb6\xf4v\xd2\xd8\xbc\xb6\xbc\xf7^\x8d1\x05'
+    b"\x97\xac\xf0\xff\xe0;\xb8\x7f\xf8\x81\x9c\x97^\xca1\x04\x95&\xdc6\xd1\xce\x7f'\xd3\xf5\x1e\xb6\x1f\xe4/ml\x1f\x8eQ\xa3x,\xd3\xf1\xd5W\xde\x1c\xbb\xd5R"
+    b'\xe3Z\xd48\xce\x10\xd7Bp\xfd\xe2\x85k,\xfa\xd8\xda\xf5>(\xa2\xc7m8\xef\xe5\xde\xbc~\xef\xed\x0e\xb2\xfd\xfc39\xf4\xe3\xab\xed\xd8\xb6g\x9e\xf1\xe3P'
+    b'\xb01;\xa0*\x1c\xbe\x93N\x9dxm\xa5\xd9q\xca\xbd{\xa3=\xe7X\xc6A\xd1\x97T`\xa1\xa0\xf3\x11\xa3\x87\xaf\x0f\xbb\xfb\xbc\x9c\x07\x1f\x14\xb9\x01\xccI\x81'
+    b"EF/o\xc4\x04DO-p\n\xa3\xe7\x8a\x88\x0b\x82c\x05\x1c\x1b'f\xce\x99\x13/\x1e\x92\xc4\xcb\xffW\x91\xf6\xbf\xff\x91\xed\xbd\xf7\xa9\xfc\x8f?j\xe6\xcd"
+    b'\x1fy\xd8k\x1f2\xfd\n\x9c \xf4+x,\x91\x93\x0f\xe4\xe7\xe3\xb3\xd2\x89\x13\xeb\x0c\x0f\xe4\xc7\x975z4\x95\xed\xdemz\xbe\xe0\x15\xf6\xb3y\xb3\xb3\xbd\xdc'
+    b'\xdb\xd9Y\xe48\xe8 \xb2\xb7iMe\xec\xdcJ\xf7\xc7\x88w(\xc6\xf9\x7f!\xe8\xb9\x13\x88K\xaf\xbek\xda\xbc\xb9\xed\xe8z\xfc\xc6[\xba\xa5\x8d\x18q\xa7I'
+    b'\x8f\x9dH8C\xe0C\x18\xf3\x8f\xd7\x17l\xddj<w\xf4I\x04\x7f\x8f\xb1\xf7Q\xa8\x9e"\xd1\xf8\x01\xb5\xee\xa7+\xe7\xff\xa5\xfe?e\xdf}\xc7|\xf9d\xce'
+    b'\xff\xcf\xe7\xf6\xd3O\x87\xe7O\xb3\xdfs\x1c\xdd\xde\xbdT\xf6\xe1\x07\x1c\x8f\xaf\xf5\xedC\xae\xf4\xf4\xa8\xf3\xd5\xdc~\x07G\x01\xdb\x07|\xd3}\x8f<Be\x98{'
+    b'\xc0>\xea\xc7$\xfb\xb2\t\x97\xff\x97\xfc\x04\xe0\x99b\xe1_\x97\xfe\xfd7\xc7\xec\xf9\xd6\xc2y\xf3L\xf9\x9a\xfc\xf2\x9dIIT\xbef\r\xef\xe5b\x16\x9f\xf0='
+    b'\x03\t\x94\xff\x87tL\x1d4H\xcc?\xf4\xc4\x90\xbfCo\x0c\xf4Z\xf3\xf6\xd8\xac\xaaB\xffQ\xc4\xf9\x05\xd6\x18\xdb\xcb\xfdJ Ss_{\r\xe3\xa1/w'
+    b"\x93\x06&\xb1\xe2\xff5\xc5\xcd}\xf4\x9176\x80\\\x92n7#7P\xb6s'9\xae\x9ak\xca\xbd\t\xde\xfc\xd2\x9bn\xaa\x17\xfd\xcf\xfd\x94c\x8f\xe5\xbc\xa0"
+    b'~\xfd\x89\xf7\xed#g\xfb\xf6\xa6\xb8\xa1\xca\xe4\x14n\x03\xdb\xaf\xbd\x96\xca\xe6]\xcd\xe7Q\x95\x1e\x07HD\xfd\x8f\x1c\x15\x9e\xe5D\xe3\xb3\x87m\r\x9cmC\x98'
+    b'3}3\xce?\x1f~C$\xe7\x88\xbc!z(\xa1\x1f(\xfc\x03\xe0\x87d\xdf\x1e\xb1\x8fV)G\x1eY3W\x99\x9e~F\xd6\x92%2\xef\xd1\xb5\x05\xdf\x7f'
+    b'\x1f\xebk\x05\x9d\xe1\xcb+\xeb\xbdW\xe5^\xac"\'+z\xb5\x8a\x9c\xad\xe8\x0b+r\xbar\xbfV\x97\xc6\xfcg\xf8\xc6\x1d;z\xe3z\xe0\xac\xdf\xb5+\xaa1'
+    b'=\xe0\xbf\xdd\xb8\x91\xf7\x0e)\xbb\xe1\x06\xd2.\x99B\xda\xa0Aa\xdb\x02\xa2\x0f\x89\x83\xf9\xcc|\x1f8\x0e]7\x1a\xcf]\xbc7\xf6\xa5\xad\xcdq\xe3\x1a\xf3\x1e'
+    b'9\xba/,\xfb\xb7\x91\xf8\xc2f\xbf\x8d\xc5X<f\xc1|9\xb7\xde\xb7\xcc\xdd\xa6\ry\xe0\xb7\x05\xb3\xa1\x103\xd1\xc7\x0e\xe7\xb8B\x1dg\xa0\x18\x87\xf8m\xac'
+    b"\x9e\xf5Ql>y\xe7dY\x99\x8c\xcf\x03\xcf'x\x821\xb7E|\x005\x83\xd8\x0e\x9f\xa1\x16\xc08\x16\xe6!\xfa\x90`.\xf7\x88Sl.\x11\xf1\x7f\xe1\xbc"
+    b',[\xb7\xfa\xfa\xe0\xd8~\xfb\xad&\xb7\xde\xc7\x1f\x93}\xc8`?;\xd3\xde\xa3\x07\xd9\x96-\xabs\xfd\xef\xc7#t\xf0\xc1\xe4\xbc\xe7\x1e\xd2>\xfd\x94lk\xd7'
+    b"\x92m\xc4\x88\x80\xeb\x8b\xbb\xb8\x98\x9c\xef\xbc\x13\xb3>\xc3\xf1\xc4\xff\t\x99\xc9tO]\xfa\xf5s\xf3\xbf\xfc\xf2\xa6 \xb5\xb7\xe8g'\xf84\x1a\x8atI\x1b6"
+    b'\xec\xa6\xc2?\xfe\x08\xa7/\x00z\xed\x88Xau.1/oR\xce\x93O\x8a\xdfc\xfd\x00\xf6/@\xe6!\t}zD\xad#\xb6\r\xc6\xff\x9f\x08\xf9\x7f\xaf'
+    b"-[\xc5\xfdx\xc4\xd4\xac\x13'\x92c\xd2\xa4\xa8\xf1\xf4\xbc\xc7\xdfM7\x92}\xdc8*\xbf\xfaj\xd2\x1ex\x80*\x98}\x8e\x98u\xd8\xb1\xff\x91#\xd9\x98\xee"
+    b'j\x8e^)^!|W\xd9\x97M\xd4\xfc\x7f\xac\xfdk~\\l-s\x87\xc9\xcdn\x9b1#\x8c\xf8DU\x82\xe5\xff\x93\x92D\x0e_\xe6\xd0F\xbe\xed\xe2\xdc'
+    b'\x17_\xf4\xda\xd7\x9b7#\xc6\x86\x98\x9c\x98\xc3\xa8\xed3\xc7\x12\xa6\xa7\x03\xab\x839\t\x8e\xb0\x86\xa6\xffc\x9d\xab\x96?\xabB\xfdpR\x12\x8f\x01XN=\x8d'
+    b'\xdb\x8b\x88\xbbU\xf7\xe6\xdb\xef\xb5\x9d7|I\x8e\xb9s\xc8\xce\xecx\xf0\xedY\xd8\xbc\xae\xaaG\xfd\x7f\xc0\xc0Q\x1c\xe8X*\xd2\xd2H\xcbjJn\xe6O\x94'
+    b'\xcd\x9b\xc7\xd7\xbaD\xcf\xffC\xce\xc9\xbe\xff\xfe\xba\xca\xe7\x83\x1f\x131\x87Ni\x83\x07\x83\xdf\xdfl;\xf4\xf9i\xd2\x00\x05\xf9B\xd4+\x86s\x1d\xda\xa4\xf6\xe9'
+    b'c\xfc=z\x0b\xc2\x97\x97y}p\xadjn\xd7\xb4)0J\xd5y\xc9\xf5\xeb\xd1\xfb9\x96\xe7\x12\xca_\x0b\x95\xb3\r\xe5\xf3\xa1\x86\xc6\x06\xbcP\x0c\xc6\xb4>'
+    b'\xf7\x9c_\x0e\xc0\xfe\xe8\xa3\x1c[\x14N|\x0f\xb8v\xf8\x1d\xe1\x1ew0\xff4P~\xdbl\x0c#\xc6"R,\xbc\xc0 \x888\x8d<\x96\x11g\x1f)\xae\xde'
+    b'8V\xf9\xaaU~k\x9e\xa8\x95\xa8\xc1\x93\x04\x9e\x84W_\xabQ\x97\x10\xe8\xb8B\x9d\xb3Y\x8d\x83\x8cI\x89\xd5\xb3>.\xe7\xe1\x871\x970\xf7P\xe77)'
+    b"\xe7\xa9\xa7D\xdf\xd1\xe9y\xef\xbc\x83\x1e\xe4\xd8n\x96\xe4'!\x06\x17(7\xd95m\xf8p\xe4T\x8f\x0e`#\xfc[\xf5?\xcf\xf9gg\xfb=7\xc0\x08V"
+    b'\x85\xfa-\xec\x82\x85\x0b\xc9\x9d\x91^\xefv@\xd0\xde\xd8\xe0\xd9~\xeb-*]\xbd\x9a4Ky\xec\xaf_\x9c\xf4\xff\x89M\xe7\xcc\xa9\x0b\xfd\x0f^L\x99\xff\x02'
+    b"\xf13\xe4\xbf\x8d\xdb\xcd\xc9\xff\xe2\x8bH\xfa\x1a'\x92\x80gX\xce\xed\x07\xe2\x179/\xe7\xa1\x87\xcc~?0s\xc6\x0c9\x0fr\\\xc6%\x97\xc8\xdf\x17&\xb7"
+    b'n}\x05\xdb\x07\xd6&\xd8O\xe02N\t\xc1\x8f\x94H\xf9\xffj_5v\xfet)\xf2q\xbdzUs|\x9c8\x84\x9cC\x86\x84\x97\xdf\x9b2\xc5\x8f\x8b\xce'
+    b'?^\xe1?\x07\x13-\xff\x0f>\x86X\xe1\xebE\xcf^\xd9\xbf\x16\xd7\xb8\xf4\x9bo|8m~\xcd.\xbc\x90l\x97_\xce\xec\x80\xe4\x9a\xb5\xff-[R\xe9O'
+    b"?\xc5->\x11\x8b\xfe\xbffu<\x833\xaf\xb8\x02v\xc0\xf8\x9cG\x1e\x01\x96\x0f\xdc^\xc8\xdf'\xeb\xb5\xc7\xa8\xfdG\xec\x1f\xb6\xfb\xb4\xbc\xb7\xdfF\xec\r\xdc"
+    b'\xe3\x81\xeao\x07e\xce\x9a\xd5\xd0b\x98\xb1\xc8\xff\x07\xfb\x0c\xf5\x01\xb6\xc3\xda\xfa\xc7\x8c&O\n\xf1\xdbj<A\xd9\xa7\x9f\x90c\xf8\xf0\xa08\x94\xb8\xf7\xb7\xc8'
+    b'\xcc\xaca\xf7r\x8e\x1f\xf6\xdc\xa3\xd7\x9f\r}8\x9ey&.\xd7/\x1e\xf9\x7f\x080\xf6u\xc1eo\xd4e\x10p\xf2\t\x8e,9G\x80\x98D\xa2\xd6\xfd\x07'
+    b'\x12\xe8a\xb9\xaf\x02\xf2\x1cM\x93\n\x0b\x81\x0f\x80_\x81~{roC#n\x081\x01\xc1)\x0c\xdd\x0f\xfc\xb0\x9cc\xc4z\x82\xf8\x02\xae\x0fz \x1b\xeb\x8d'
+    b'\x1bJ\x1e0\x1e/\xeb\x17_\xf0\x9e\xa3U:\xe7\xb6\xb3O\x9f\x90s\xd9\xd5\xac\x19\xd9\xff\xfa\xab^\x8e\x17\xd7\x18z\x1a:0\x12\xfe?3.<\xbc\x17|\r'
+    b'\xf8\x1f\x9fq\x9e=\x97?\xcf\x9e\x1f\xff\x9f\xc4_ x\x17x\xcf^\x93\xb1\xdc\xdb\xb6\xf9\xe9\x7f\xed\x94S\xbc|\x8f\xef\xbd\xc7\xfd7\xe0\x02\xfc\xfc\xa0\x0e\x1d\xc8'
+    b'\xf2\xe3\x8f\xfc\xf7\x82\xe3A\xf0\x1e\xd4\x86\xf30\xd09\xd7q\xb5O\x12\xfc\x12\xf4\xca\xf4\xea\xf7\x993Q\x7f\x03|\x00\xfa\x905i$\x12O\xfd\x0f;\xbb|\xc6'
+    b"\x0c\xff\x9e\x10\xd9\xd9T\xf2\xf8\xe3\xa4}\xf7\xad\x8f'0d\x8d\x01\xf3\xb1\xc1'RY\xc7\xfa\x1fXc\x07\xb3m\x05\x8f\x81o\x1dIK#\xeb\x86\rT\xc6\xd6"
+    b'\x92\n\xf4\xb4\xac\xaajP\xfa\x1f2:k\xe9\xd2{\xa2\xe4\x02\xc2\xef\xa1\x9f.\xca}\xe1\x05\xb3<8\xece\xb3}\x1f\xc6\xf4\x18\xeae\xfc\xf1o\x15\x15\x033'
+    b'\xa7OoHs\xe7\xa0\xe4N\x9d\xee\x96\xe2\x19X#\x8c\xfa]\xd8\x008W\xd88\xe2\xbb\xde\xe9\xe3\xc6\xa1\x8e\x08\xdf\xc1\x1eB\x0eD\xeeSX\x98\xdc\xb6-b'
+    b'\t\x88+\x82\xdb\xd0,/\x90\xf8\xf9\xff\xf8\xf9\xd3\xdc?`\xeb\x82[\xb7\x01\xc2\x89\x13\xdaG\x8c \x9ba\xcc@\xf1\x8a\xc6\x94\xff\x17c\x05\xcb\xff\x8b\xb1x\xcf'
+    b'\xa1\xd7_\xaf\xe6lC\x1f\xe4\xa5K\xfd\xe2\x13\xeew\xde!OF\x86_\\\xa5\xec\xa1\x87h\x7f\x897>a\xbc\x96\x89X\xff\x1f\x8e4Kn\xdf^\x8e\xf9\x1f'
+    b'\x91>f\x0clt\xbc\xc0\xa5\xd2\x18\xf4\x7f\xbc\xed^\xf0\xec\xf1>\x95m\xbc\xf5?\xe0\x9b\xb4\xbd\xf2\n9\xb2\x9a\x92\xfd\xb3\xcf\xc2\x1f\x07\xb94\xfcn\xe0\t>'
+    b'\xce\xcax\xeb\x7f\xceO\xfe\xe1\x87\xa4\xfd\xfe;\xaf\x17v7mJ\x96\xee\xdd\xf8\xe7\xf6.]\xc8\xa9c\x7f\xeb\xc2w\x88\x87\xef:6{\xe5\xca\xda\xc4\x01V\xe8'
+    b"\xdc\xd8\xe8q\x8dy\x8092%w\xcd\x1acO\x9e\x9b\x0bw\xeeD\xee\xdal\xff\xf0\x85\xc1s'\xdb\r\x98W]\xd2N>\xb9\xa1\xcc\x9d\xde\x19\xe3\xc6\x89\xe3"
+    b'\x07\xaf\x120}\xf2\xf7YIEE\x88\x81\x08\xec>0\xc4\xe0&F\xec\x11z\x1d\xd7\xf1\xc2\xdc\xe7\x9f\x07\xee\xd886j\x050\xf6\xcc\xbc\x0f>\xa8\x8bs\x89'
+    b"6\xef\x1f\xcb|z$\xd8\x02\xf4\xb6\x01\x0e'\x14\x7f\x98\x0f+\xb0reD\x18\xf5X]\x0b\\c\xe81\xe8j_\x9f\xc40\xfa\xff\x19{\xe1\x89\xbe\x8c\xa2_"
+    b'\x83<\x96\xe8;(\xfa\x10\x8a\xbe\x84\xa2g\xa3Y/A1\x16\xde\xf3\x9e\x85\xe8s\xa0\xd7:i\'\x0f%\xe7\xa7\x9f\x9a\xf6\xec\xb31}/\xf0Q\xee\xe2"r'
+    b'\xef\xda\xed\xd7?R\xf4\x93\xc4\xff\xc6\x9e\x87\xc6\xb1D?E\xd1_\xd1\xac\xff_\xb4\xfd\x7fc%=\xd2\xcf8\x03k&\xfc\x9eD\xe7\xf6\xad\xf7\xfc\xbfl\xab\xff'
+    b"\xf6\x1b\xef\x13\xa4\x15\x16\x92c\xecX>'\xcb\x98]\x19\xf1x\xc0\x13\x7f\xfd5\xe7\x99\xb6\x0f\x1dJ\xee\xd4\xd4\x1a\xf5\xc0U\xb1\xe4\t\xdc\xb8\x91\xe3\x158f\xf1"
+    b"\xd6[\xa9\x9c\xd9\xc6\xd6\x0f> \xdbc\x8f\xf1\xbeFuq\xfd\xe2\x17\xbfNK\x03\x16`y\xb1\x7f\x7f\xabP/`\xd1\x91C3b\xd9\xe0\xa7\xca\xfc\xc2\x98'"
+    b'\xa8\x9f\r\xb4\x7f\xf8\xb4\x17\xe4>\xf3\x8c\x91w\xb3\xa1\xf0gL\xce]\xb5J\xc4A\x8e\xc9\x984\xc9\x18\x1b@]\x03\xf2\x87\x88\x1b\n\xdc\x03j\x06\xa0\xfb\xf1\xfe'
+    b'\xa4\xa6s\xe7&\x9b\xe4<pmE\xbd\x04\xe2$u\xb9\x0e\xc4+\xff\x1fk\x7f\xda7&\xf4E\x87\x0e\xfe\x1c\xa4\x97\\\xc2\xe3\x8cf\xeb\x80;7\x97\xf7\x02\xa9'
+    b'\x8f\xfc\xbf\xd0\xffUz\xaf>q\xfd\xf0^\xf6\xaf\xf1^\xce\xffWI\x9c\x89B\x17\x8a\xbe\xc2F\xff\x1a\xefe\xffZ\x8eMb\x1f\xbc~B\x8a)\x08\x9eC>'
+    b"\x16\xec\x90\x0b/\xf4b*\xc6\x8c\xe6}\x9c\xc4X\xb8'\xd8\xd6\x97\xb3\xff\xeb/\xf20\xbb\x0b\xf1\x01\xcbs\xcf\xf1{\x85\xef\xe5\x98\x82\x1c\xeb\xa8\xd2\xf9\x1c\xcc\xc6"
+    b'\xc2_\xbc\x17\xcf\x988g1V"\xe9\x7f\xf4\x1c\xb9\xb3X\xd3`\x9b\x0b\xbeN\xa5\xff\xc3\xfb\xcc6c\xba\x9f\x8e.y\xfe\xf9\x88\xc7\xab:P\xe5\xf7\x99\x87='
+    b'\x87\xce\x97_&\xeb\xb4i\xe4\x1c8\x90\x9c-[\x92+9\x89\xeb\xeeh\xed\x00\xf4*p\xe1\xd9\xd5\x8f\xe5o\xa6\xf7K}<\xc1Uq\xbdVu\xa1\xff\xab\xe3'
+    b'\xd4}\xfbF\xc2k{f\xf6\x9dw\x9a\x8d\x03\xcc\x0cr\x01\xf2\xb6Sr_z)\x18\x0egb\xce\x93OVs\xe0\xda\xed\xfd2&On\x08\xf3\x06\xf6\x8e\xc0'
+    b"1\\]\xb0i\x93\x8c]\x00W\xd8\x85\xb9\xcf='8\xfbzg\x8c\x1f\x0f;K\x8e\x8f\x0c\xca\xbc\xfc\xf2\x80\x99\xc7&\xc9\xc9\x82\xf7gn\xfe\x86\ruq>"
+    b'r\xed;^r\xad;\xde\xcb\xb5\xee\xa2\x8e]\xd4\xba\x9b\xbd7\xd6\xd3\x9b\x8d\x19\xe9>L\xc7\x04\xb6\xbcGw\xbfu\xc5\xc2\xd6\x15\xfb\xf7\xdf\x93\xfd\xa4\x93\xb8~'
+    b"2\xc6\x01\x9c\x9d\x0f'\xeb\xe6\xcd\x01\xc7\x8c\xf6Z\x98\x8d\xd1\x10\xe2\xff\x96E\x8b\xb8O\xef\xea\xd2\x85\xdc\xfa:d\x86O\x04\x96S\xbb\xfb.o\x8c`\xeaT\xfe"
+    b'\xbe\xa1\xf1\xff\xd6\x1a\x15\xc0\xe6&0?\x97\xe6\xad]\xdb\x90x\xfe\xea%\xff/\x7f\xc6\x9e\x11\x1b\xeat\xfa\xf4\xf1\xce\xc1\xc2B\xaa\xd4\xe3\xdb\xb1\xd8\x07\xd7\xd1U'
+    b'\x95<O\x00.\xc2\xfd\x1b6\x90s\xedZr\xacXA\xee\x16-j\xd7;\x90\xf9\x11~\xfb\xd0}\xa3\xb8_\xab:\xc8\xff\x1b\xe5b\x83\xde\x86\xef\x1e\xa8\xb6\xfd'
+    b'\xd6\xa2={\x8c\xb1n!\xadRz\xf5\x82},\xb6\xc5\xff\xb0/\xcc\xe2\xff\x97\xe7\xbd\xf7\x9e\xe8w\x87Z\x9c\xc3R\xfb\xf7oH\xd8\xbf\xeb\n~\xfc\xd1\xdb\xb3'
+    b'\xf0\x97_\x80\xf9\xc3kD\xd3\x1bn\xe0\xb5DL\xd7\x83\xf3\xe7\xe8\xf4s\xcf\xc5\xf6\xcdS\xbau\x93\xf5\xff\t\x99\xd3\xa6\x05\x1b\x1f\xbdJa\x0f!\x87R\x97\xeb'
+    b'@C\xca\xffs\xdd\x85\xfe\xbbm\xda\xf8\xcf\xdb\x07\x1f\xf4\xea:\xe0\x8f\xbf\xf9\x86\x9c\xa3F\xd5\xc0\xf0::w\xe6\xfd@\xeb2\xff/\xf0\x7f\x18\x17c\xc9}\x93'
+    b'q\r\xf0\x9e\xe3\xa6\xd9{\x8c\x8d\xf7\x18[\xee\xc3\xcc{(\xeb}\x9a\xc5X\xf8L\x1eK\xf4!\x16=\x9aE\x9fb\xd1\xb7X\x8c%\xfa\x1a{`\xdb\\0\xd9'
+    b'\x17\xcfw\x9d{\xae\xaf\x87\xb1\x18K\xf48\xe6c\x01\x9b\xc7\xae9x\xdd][\xb6\xf8\x8d\x85\xdf\xe1\xbd\xc0\xff\xc9\xfd\x90\xc59\x8b\xb1\x8c\xe7,\xfa+\x8bs\x16'
+    b'c\xd5\x0f\xfe/\xb0\x00\x9b\xd3\x18t\x7f\x9d\xea\x7f\xe6/\x83#\xa7\xf4\xcf?\xc9v\xc2\t\x9c//,\xfc_\xb8\xfa\x1f\xf6\xc5[o\x91\xadcG\xb2\x0f\x1bF'
+    b"\xe5\x13'\x92\xb6p!y~\xff\x9d\xb4\x91##\xd6\xff\xc0\x18\xb8\xbe\xfe\xba\xa6\x8d\xd1(\xf5\x7fR\x92\xb1\xdf\x0c|\xfc\xd3\xb3n\xbbM\xf0a\xc9\xba\x0b\xfa\xfa"
+    b'\xf8\xcc\xff\xfb?\xb3\x91\xba\xa6\x8d\x18!s\xe3\xe1wF\\_\xeb\xd4\xde\xbdE\xff\r\xf8\xc7ge\xafX\x81\xb8ZC\x9b;\xb0u\x90\xaf\x00\xff\x17\xec\x1c\xfc'
+    b'\xc5\xb9/+\xb2Z\'\xe7\xacZ%\xf3\xf4"\x06 r\x05\x88\xfd\xe3\xbc\x81\x17\x0c\xc6w<8s\xd6,\xf4\x00\xa8\x8bsq\xeb\xb1^Q\x0b.\xf3\xff\xc9\xb5'
+    b'\xe32\xf7\xbd\\\xc3-j\xbc\x03\xd5\xa6\xcb\xefe>\xfd`c\xca<z\x81\xc6\xd4>\xfc\x90\xfb\xf8\x1c[\x84>#\x97]F\x9a\x8e-\xf7\x8d\t\x0c\xfc\xc0\x13'
+    b'\xfc\xf2\x84\xa8\x1f\xb4Y-A\x8f[\xee\x81\x10\xecZ\x18\x8f\xd3lL\x11k\x8d\x05\xff\xafl\xabD\xed_\xc3.\xb8\xe0\x02\x1f\xdf\x89\xeb\xf0\xc3\xc92c\x86\x1e'
+    b"\xb37\x89O\xe0\x9cg\xcd\xd4\xf1\x01'\xf3s\xf3\xf5tn \xfc\xbfJ\xea\x0e\xffg\xfa\xda\xb7\x8f\xecz]J,_N\xf4\xa1\xd0\xfb\x88\xfb0\xbf\x8b\x16\x91"
+    b'\xf5\xa2\x8b"\xf6\xfdm\xa3G\'L\xadS\xbc\x9f\x01\xf4\xb6^\xaac\xd1\xbdX|\xb7\xbb\xb5\xceW\x93\xd6$3\x13\xb9l\xf0^\xcb\xf5\x02\xc8K\xcb1\x00\xe4'
+    b'\xb1\x81\x0b\x00\x86\xaf\x9a\xab~\xef^\xd8\x11\xe0\xc9\x11\xdb\xa1\xf6\xf0V\x9d\x7f\x18\xb5o\xc1\xf0\x01\rA\xd07\x04\xb6\x0b\xb8\xfa\xb3\x92\n\x0b\xd3\x9bde\xc9}'
+    b'\xc3\x85\xf4\xd1\xf5\xff%\xb9\xaf\xbc\xe2\xad\xfb\xfb\xf9g\\\xcf\x8brW\xaf.0\xc1\xff\t\xbb,/\xa9E\x0b\x95\xff7\xcf\xffW\x02\xd3\xa6\xf7\x12A\xee\xcf\xf3'
+    b'\xeb\xafd\xb1\xd6\x8cW\xa0\x07\xbdu\xc7\x0er\xebu<\xa8\x17\xb4\xaf~\x9e\xe7\x12\x8d\xf1\n\xf9\xb8c\x9d\xff\x97{\x02\xe17\xd8^\xf4\x0c\xc2\xb9[\xf4>:'
+    b'\xa2\xc7\x10\xde\x8b\x9eC\xb8&x/\xb8p\xe4\xb1\xf0\x19\xbe\x13\xbd\x97B\x8d\x85}\xf2\xef?\xfe\x98\xb4v\xed\xc8SXH\xee1c\xc8\xb6r%\xb9\xf4\xe3\x12'
+    b"c\xd58N\xe0\xfet\xfc\xb5'7\x97\xac\xdf~\xcb\xbf\x17=\x9d\xe4\xe34\x1eW\xa8s\x16\xc7e6V,\xf9\x7f\x94\xd4O\xfe_\xe4\x8e\xf0\x8a\xd7>\xca\x99"
+    b'\xbe\xf7\xd3\xff\xbd\x8e \xdb\xf5\xd7G\xa4\xfb]\xd9Y\x1cc(\xf8\t\xeb\xe2\xba\xd4g\xfe\xdf\xcb\x07P\xcd/\x8f\xbeWF\x1d\x86\\\xfd\xa4\x9c\xa7\x9f\xf6\xf1\xd5'
+    b'\xb2\xbf\xf0OE,\xfc\xbc\xec\x07\x1f\x14\xb5\x04K\x8aJJ\x10\x077r\xd4A\x97\xddR\xb4k\x17~\x8bz\x81Xs\xd8%\xb2 \x16\x00\x1e\x1f\xc1\xdb\x0f{'
+    b'\x01<~\xa2\xfe\xaf\xbeq\x0fXgy\xed\xb7^\xbf\r\xdd"\xd6bQ;.\xd6jQ[.\xd6rQ{\x8e\xf7\xa2\xc6\x1b\xe3\x04\x1aS\xd4u\x8b1E\xdd'
+    b'\xb7\xd0SbL\xa1/\xcc\xc6\xac\x80\xfe\x18?\xde\xeb\x872_\xde\xa5\xf3\xd9\x08\x9d!\x8fY\x8e\xe3F\xdc\xfb\x90C\xbc5\x00\xb3g\xfbj\xe4\xc5q\x8b\x1az'
+    b"Qo.\x1f\xa7\x18S\\\x0bq\x9c\xc6ka\x1cS\x1c7^\xf5\x99\xff7\xf3\xaf\xb1\x06;\xe6\xce\xf5\xea\xf1\xac,\xd2\x86\x0e\xa5\x92-[\x82\xc6'\xca\xdfx"
+    b'\x83<:\x1f\x8a\xbbys\xce\xa5\xe4\xfa\xfe\xfb\xa0\xfc\xbf\x8d-\xff\xaf\xf4\x7fb\x7ff/)%\xfb\x11G\xf8q\xf8Z\x98\xfe\xaf\x8c$\xef\x7f\xcb-\tun'
+    b'\xf1~\x06N\xcc\x9c=[\xe8u\xc4\xa6\xcdx\xac\x9b%w\xecxD\xfa\xe8\xd1\xe0\xa8\xad\xe6\xb5\xff\xeb\xaf\xa2\xe4v\xed.\xd6\xeb\xff\x11\xeb\x9f\x96\xb7n]q'
+    b'r\xfb\xf6f\xfb9\xa9\xe9UW\x89\x18x\xb7\xb4SO\xfd\xb7\xcd5#o\x1f\xb8\xc4\xc09\x8ek\x07\x8e\xb1@\x98\x8a\x86\x96\xff\x07g[\xac\xf3\xff\x18S\xe0'
+    b'\xdd\xc1+j\x99}%\x9f\xd3\x9e\xfc\x02\xf2\xfc\xfcs\xd0x\x05\xc7\xab\xad^\xed\xe3\xaa\xa9\x82\x7f\xa9\x8f\x19\xebx\x05\xc6\x0c\x94\xff\x97\xb1\x81F\xdc\xa4\xc0\x12\x1a'
+    b'\xb1\x85\xe2\xbd\x113\x19\xf5X\xc8\xb1\xf4\xebG\xee\xf4t\xd2\x8a\x8b\xc8\xc6l\x01{\x00<\xa7s\xf7nr\x8e\x1b\xc7\xf1\xfe\x8e\x16-\xc8\xde\xa3;\xd9\xb6o\x0b'
+    b'\x8a\xe5\x14u\x8f\xc1\xb0\xa2\xa1\xce\xd18\x96\xd2\xd6\r9\xff_w\x9f\xa1\x7f\x9f\xb3u\xeb\xea\\~FF\xd8\xb5\x00\xf8]\xd9\xae]\tun\xf1\x8d_\xa7\xa4'
+    b'\\\xa1s\xd8B\x0f!o-s\xf6z\xf3\xdcG\x1e\x89:6\xb1\r\xfaa\t\x1b\x00\xfc6\xde^\x99\x95\x95\xa3\xb3\x96-\x0b\x86\x8b\x99\x9d\xff\xd9g\xe2w\x81'
+    b'\xf0\x03\xffF\x9b\xe0\xf2\xbc\xf7\xdf\x179\x95\xfa\xc2A@7\xcb\xf82\x81\xbd\x12X,\x81\xcd\x12X-\x81\xdd\x12X.\x81\xed\x12X/\x81\xfd\x12X0yL'
+    b'\x81\x15\x13c\n\\\x9a\xc0\xa9\x891\x05\xf6L\x8c\xc9\xfd~\xe8\xdf\xd3N\xab\xeeU\xdf\xaa\x15yt_[\xc6\xb6\xf9\x8d\t=\xd2\xeb\x08\xafm\x7f\xf7\xdd~X'
+    b'9\x81\x9d\x13X:\x81\xad\x93\xaf\x85\x18S\\\x0b\x81\xcd3^\x0b1\xa6\xb8\x16bL\x81]\x8bG\xff\xdf\xda\xf3\xff\xeav\x8d\xdbE\xe5rN\xc5$>Q\xa6'
+    b'\xf3\x01\x01\xef\xe7\x9c6\x9d\xca\xd6\xbcT/\xfd\x89\xd4j\xa1\xf4\x7f\xb8\x9f\x95m\xdaD\xce\xc3\x0e\x8b\x98\x0f\x00\xf9\xc4\xb2\xcd\x9b\xff5\xfa\x1f~\xbd\xc0\xeb!w'
+    b'\x8f\\\xbf\xfc}\x8b\x94\xee\xdd}u\xeeL\xcf#\x7f\x8d\xfa6c??o\x7f\x0c\x7f\xbb\xc1(\xe0\x1b\x12\xe3\xf4J?\xf3L5\xfb\xbc\x02\xbbI\xd8V\x87\xa4'
+    b"t\xedZ\x9fq\xc0\x84\xce\xff#'\xac\xf7\xe2\xe4\xba?'\x87\x1c\xc7\x1fO%[\xb6\x06\x8dWXn\xbd\xd5\x1b\xb3\xce\xc9&\xe7\xbe}\\\xf7\x05\xaaW\x88g"
+    b'\xfe_p\x0658\xae\xe5a\xc3\xfc\xf8[\x9d\xe0\x01n\x848(\x85\xffk\\/+\xb3\x010\xe7#\xc6\xfe\x9dt\x12\xaf#\xfc7\xe0\xff\xd0\x97V\xe6\xa1m'
+    b'\x97z\xec\xb1\xcd\x92;th\x91\xd2\xb3\xe7q\x99S\xa7\xfa\xf8k\x99nB\xacZ\xf0^\x9e\xad\xebr\xf1:2}\xec\xd8P\xfb\x02\x0eP\xf0\xe5\x83\x03O\xcd'
+    b'>\x91\x17\x99;W\xe4\x00\x82\xd5\x03\xc4S\x04\x9f\x0ct\x9e\xcc\xbd&\xb8\xd8\x04\x1f\x9d\xe0j\xf3\xf1\xc0\xe9\\n\x82\xdbMp\xbda\x1c\xe3\x98\x82\x1b\x0e\xdb\xca'
+    b'|o\xc61\x05o\x9d\xe0\xb1\xe3\xf9\xfc\xff\xfe\x97\xb4n\xdd\xa8"+\x8b\xf3\xfd8\xa6N\xe5uhbL\x8f>\xa6\xe0\xb6\x13\\w\xce5kx\xdc\xda\xd7\xaf'
+    b"n\xf5j?\xde=\xc1\x9d'\xb8\xf4d><\xc1\x8fg\x1cS\\\x0b\xc1\xd5'\xb8\xfb\xc4\x98\xc6k\x81W\xa2\xe5\xff\x03\xf5\xff5\x8bOT\x02\xab\xfd\xf9\xe7T"
+    b'\xba~=9v\xec\x88(>\xd1\x90\xf9\x7fU\xfe\xbf\xe1\x7f\xe6\x1c0\xc0\xcf\xffG]\x9f}\xc2\x04\x8e\x01\xae\n\xc2\xfb[~\xc7\x1d\xbc~\xf8\xdf\x90\xff\x1f\x92'
+    b'9{6\xe2\xfb\xf0\xcb\xf1\x17ul\xe0\xac\x15\x98\x00\xe0\xf5\xb1\x8d\xe0\xfc\x83\x8e\x92c\xf9^\xdb\xa1\xa4\x04}0C\xed\x0b\x9c\xb9\xc0\x1a\n\xec\xa0\x12`\x03\xbb'
+    b'v\x85\r\xa0\xf2\xff5\xfdi\xe4\xee+\x80\xb9\xeb\xd7\xcf\x9b\xbf\xef\xd4\x89\\\x8b\x16Q\xc9\xd6\xad\x1c\x9fk\x1a\xaf\xa8\xf2\xea\xba\xb2\r\x1b\xc8\x9d\x97W]\xf3\x87'
+    b'\x9e]\xf3\xe7\xf3ZdO\x9c\xf2\xff\xc1\xea\xff\xcdx\x86"\xcd\x89\x07\xe3,\xaa\xcb\xb1\xc4\xfb@\x9cN\xc1\xc6\xaa\xedq\xaa\x95B\xe9\xff\x88\xf5\xff\xd0\xa1\xfe\xbd'
+    b'\xac\xc1;\xc8lY\xeb\xda\xb5\xe4l}h@\x1b\x00}\xff\xca\xd7\xbd\xf9\xaf\xd0\xff\xc8\xf7\xa3\xb7\x1c8\xeaF4]\xb0`x\xd3\xf9\xf3\xf1?\xea\xf6\xc1k+'
+    b'0\xeb\xd59\xeb\xb4\xb4\xf9:\xf7\r\xea\xdfQ\xc3&\xf8\xfb\xf0;\xb3\xfa\xb7j\xbcAr\xf2\x80\xccK/\x05\xbf\x8d\x9a}\x89#\xc2\x9f\x94u\x9e\xcc\x15+\xb8'
+    b'ce\xfd/s\xcd\n\xeeY\xe1\xeb\t\xac\x9e\xe0\xaa\x95k\xd7e\xfd/s\xdd\n\xee[\xa1\xff\x057\xae\xeb\xabM\xbc\xe6\xcc\x87\xcf=\xea(*\xdb\xb3\xc7\x8f'
+    b'\xbbN\xd6\xff\xc0\x08\x80\xe7\x1f\x18u\x8e\x01f\xbf\xb52{\xbe\xec\x9f\x7f\x98>\xb1\xfaq\xd1\n>^YW\x8b1\xc5\xb5\x10\xdc\xb6\xfe\x98\xc2*?\xfd/\x8f'
+    b')\xf8n\x8d\xfa\xbf\xa1\xf4\xff\x8d4>!\x8f\xd5\x10\xfa\xff*i\xfc\xf9\x7fo\xef@6\x17\x86\x0f\xab\xc9\xff\xb9f\x8d\x17\xbb\xf3\xe7\x9fT\xbel\x19\xe7$\xac'
+    b"4\xe0\x04x~\x11\xfd~^x\xa1Q\xe7\xffke-0{aV\xfeG\x1f!_\xd0F\xe7\t\x80?\xcfy\xb1\x9b\x1d8pE\xfe'\x9f \x8f\xd0$\x04"
+    b'\x1e@I\xe2\xf9\x01\x89\x98\xffG\xef\x10\xed\xd9g\xc9\xf5\xc0\x03T\xf2\xf4\xd3T\xbas\xa7\xb7\x8e\xf8@U\xcdx\x85\xd5B\xe5\x0b\x17zs\xd5\xf9yTz\xdf'
+    b'}T\x8a\xbeaa\xf0\x15\xca:\xab6\xf1\n\xe3\xb5\xf0\xd5+\xe8\xbaK\xaea\x0cT\x13\x1f\xa8V_\xae\xfb\x175\x95b\xacp9\x05\x02\xd5\xd7\x9b\x8d\x15.'
+    b'\xa7@\xa0Z}\xb9\xf63\x10\x0f@$\\\x07x\xaff\xa9\xd2\xff\x91\xe9\x7f\xe6\xaft\xea\xe4\xef\xd7\xa3\xdeE\xef;(og\xff\xbfKMc\x01\xf6\x91\xa7q'
+    b'\xfe\x10\xa5\xff\xfd\x05\xf5\xea\x9d\r\xbd\xfaz\xa6\x8f\x1a\x85\xda\x7f/\x7fpEEC\xe2\xf3U\xfa?\xb1\xf1\x7f\xd0\xf5~\xfc?\xec}\x95I\xbe\xc2\x06|\xfeQ'
+    b'G\xf9b\xfe\x1e\xf6*\xbd\xfc\xf2z\xe7+VO\x98\x92D\x94\xc6\x8c\xffs<\xf5\x94\xcf\xaf\xc7_G\xdf\xbed\xf9\xe8#\xf3m\xc1\xa7u\xca)~\x1c\xa1\x1c'
+    b'\x0b\xc8|\x89\xc6\xce\xff\x17K\xe9\x98:h\xd0m:\xbf\xdf\xd9\xd9\xf7\xde\x0bN<5\xcbT\xfc?\x9a\xf8\xbfl[\x18}tc\xfc\xdf\xfe\xd3O\xe4\x1c1\x9c'
+    b'\\\x9d;\x93\xd6\xa5\x0b9&\x8c\xe7<\x81\x91\xc4\xea\xcdr\n\xb1\x88\xff+Q\x92\xa8v\x7fc\xcb\xff{~\xff\x83\xb4\xfc|\xee\xc3\xbbrs\xc9\xf9\xd2K\x9c'
+    b"7$\xd0o\xe1\xe3\xdb\xf7\xec!\xadSG\x9f\xeew\xb4mK\xda\xde\xbd\xdc\xd7h\xdc\xf9\xff\xd8\n\xe2\x02\x1cOX|\xe0\xc0\xec\xfc\xcf?\x07'\xae\x9ai\r"
+    b'#\x0e\x18\xcb\xfe?\xc2\xef\x8f\xa5?m\x1c\xd3<^Q\xe5\xeb\xff\x93(|\xc5\xea\tS\xa2\xf4\x7f\x1dq\x0c\x03/<d\x887\xde\x0f\xce\x8a7\xdf\xe4X\x80'
+    b'`\xbf\x85\xfew\x82\xeb\xaakW\xef\xef\x9afR\xb9^\xe7\xda\xf8\xf1\x7f\xb1\x15\xd4\xf9\tN\x01\xd4\x16\xa2\xd7\x9f\x9ai\x89-\x89^\xffg\x1cS\xd4\xd5\x19\xc7'
+    b'4\xd6\xeaa\x1e\xc9c\x1ak\xf5\xea\xb2\xfeO\x89\x92D\xb5\xfb\x1bK\xfe_\x03\xdf\xf7\x8c\xe9\xd5>\xfc\xe2\xc5a\xfd\x16x"\xe7\xa7\x9f\xf0\xfa\x00\xef\xef\x96\xf8'
+    b'\xc5;U\xfe?|A\xcf p\x04\xc2\xff\x07_P}\xd5\xb4+\x89\xcc\x0f\x90\xb1\xd6\x02{m\xcc\xff\x0b\xbb\xb4\xb6\xfe\xb4\x8c\x15\x8f\xb6\xff\x8f\x88W\xc8c\xc6'
+    b"\xaa_\xb1\x8c\xb5W\xf9\x7f%J\xff'\xf6g\xc0\x02U\xa2\xb6\xf4\xc2\x0b}\\\xff\xce\xce\x9dy\x7f\xcb\xf0\xf4?\xd3\xf5\xe7\x9c\xe3\xfd]Q\x11UZ\xbd\xb5\xc7"
+    b'J\xff\xd7N.\xcb{\xf3\xcdKr_~\x19}n\xd4,K|\x91\xf9\x7f\xa1oe\xfe_\xbc\x97\xf9\x7f\xcb\xf5\xde\x9d\x82\xab\x17\xefe\xfe_\xb9\xf7\xbb\xdc\x0b'
+    b'^\xe6\xff\x95\xc7\x84>5\x1bS\xe6\xff\xc5{\xc1\xd5+\x8f)\xb8z\xc5\x982\xff/\xde\x0b\xae^\xfc\x95\xc7\xc4v\xf2\x98\x18\xc78\xa6\xb8\x162\xff\xaf\xd9\x98'
+    b'2\xff\xaf|-\xe41\xd5\x13\xa6$\x11\xa5\xb1`\xfd\xb4\xbd{x\x1d\x9f\x8c\xdd\xf3$5!\xdb\xc6\x8d\xe1\x8d\xf1\xc1\x07\xe4I\xf6\xd6\x18\xdb\xe7\xceM\xa8sS'
+    b'O\xa9\x12%J\x94(\x89G\xdc\xaf\xc1\xe7\xff\xd1[T\xef\t"8~\x90\xc7\xb7N\x9eL%\xdf~\x17r<\xf4\xfbq\x1c\xd9\xcb\xf7[\xf7O?\xfd\xab\xfa'
+    b'\xff)Q\xa2D\x89\x12\xa5\xff\x1b\x9a\xfe\xb7]\x7f=9\xdb\xb6\xe51\x7f-/\x8f\x1c\xc5\xc5\xe4|\xe9E^\xd3\x1f\xcex\xc0\nZO?\xdd/n`\xbf\xf2'
+    b'J\xa5\xff\x95(Q\xa2DI\xa3\x96\x86\x9a\xffG\xbe\xdf\x05\xce(\x9d\xe3\xd3YXH\xce\x17^ \xfb\xd7_G4\x9e\xe5\xeay>\xbd/\xb8\xff\xad\x99\x99<'
+    b"\xa6\xf0o\xe8\xff\xa7D\x89\x12%J\x94\xfeoP\xf8?`\xf3\x9e{\xae\x06go\xf9\x94)\xbc/H\xc8:\x01\x8b\x95,K\x96\x90'%\xc5\xaf\xef_\xe9\xba"
+    b'7\xa9\xfc\x8f?x\r\xb1\xd2\xffJ\x94(Q\xa2\xa4\xb1JC\xc6\xfc\x95\xcd\x9dK\xce\xecl\xd2\x92\x93\xc9QP@\x961\xa3\xc9\xbewo\xc8\xdf\xd9\x9e\x7f\x9e'
+    b'\x9c\xed\xday\xe3\x06\xf9\xf9di}(YN:\x91\x1ce\xa5\ty\x9e\xea)U\xa2D\x89\x12%\xb1\x96\x06\x9b\xff\xdf\xaf\x7f\x86\xfad\xa7\x83\xf7\xf6\x12\xfdz'
+    b'\xabB\xfc\xd6z\xd9e>\x9f\xdf\xfe\x7f\xffG\x96U\xab\xa8t\xcb\x96\x84=_\xf5\x94*Q\xa2D\x89\x12\xa5\xff\xa3\xfb\x8c\xf7\x12+.\xf6\xe9\x7f\xbc*\x92\x9a'
+    b'P\xe9\xda\xb5J\xff+Q\xa2D\x89\x92\x7f\x8d4\xea\xfe\x7f&\x9f9^gz\xbe[7\xd2rr\xc8\x99\x91A\x8e\x96-\xc9q\xd7]\xde^\x81\tz\xcc\xea'
+    b')U\xa2D\x89\x12%J\xff\xc7\x02;XE\x9a\xcd\xc6s\x06e\xfb\xf7\xfbz\x03(\xfd\xafD\x89\x12%J\xfe-\xd2\xa8\xfb\xff6\x92\x97zJ\x95(Q\xa2'
+    b'DI\xac\xe5\xdf\x96\xffo\x88\x9f\xa9\xa7T\x89\x12%J\x94(\xfd\xaf\xf4\xbf\x12%J\x94(Q\x12\xad\xfc+\xf3\xff\r\xec3\xf5\x94*Q\xa2D\x89\x12%J'
+    b"\x94(Q\xa2D\x89\x92X\xf8\xff\xe8[\r?\x13\x7f}\x1c9V+\xff\x1f\x7f\x85_\xfao\xda\xae1\xdeg\xf4)/++\xf3\x9d'\xfa\x9bsN\x04\xf6\x19"
+    b'\xbe\x13\xd7B\xf47\xc7\xff\xe8\xbd\x8e\x17\xfe\x17=\xcf\xc5uL\xe4\xf1\x1a\xd2}A\x7fx\xf4\xbc\xc7\xb1\xe3\x9c\xab\xf4\xdeU\xa2\xaf=bA8\xc7\xd2\xd2R~'
+    b'\r\xf0\x17\xef\xf1\xb9\xe85\x8f\xed\xf1;\xfc\x1e\xe3`<\x8c+\xae\x19z\xd1\xa3\x7f=\xae#\xfe\x17\xd7\x1c\xd7\x16\xf3@\xec\xbb\xb2\xb2\x92\x7f\x87\xbfb,|/'
+    b'\xee\x8b\x18\x0b\xe3`<1\x16\xce\x05\xbf\xc1v\xf8\x0c\xbf\xc51\xe2\xf8\xf0{l\x8b\xb1\x04\xa6\x15\xff\xe33|\x87m\xb0-~\x83\xdfb\x0c1\x16\xce\r\xe7!'
+    b'\xc6\x14c\xe1\xfcp\x0cb<\xfc\x8f\xcf\xc4\x98b,\xfc\x16c`,\xb5\xda+Q\xe2/b\xeec\x0e\x8a\xb9\x8e\xff1\x9f\xf0?\xfe\x8a9\xfco\xda\xae\xb1\xdd'
+    b'g\xb1V\xe2\x9c\xf1?\xfe\xca\xff\x8b5\xd4\xec\x7f\xf9w\x81\xfeO\xa4\xf1\xa0\x07\x1a\xca}\x81~\x82\xee\xc3\xb1\x8bgP\xe8,\xe80\x9c\x0b\xe7\xac\xd6u\xad\xd0'
+    b'\xafx/\xce\x15\xdb\t=)\x9ea\xbc0\xae\x18K<\xef\xe2\xd9\x17\xba\x11\xdb\x88\xb1\x84\xde4\xdb\xb7\x18\x0b\xbf3\x8e\x85\xed\xc5\xb9\x04\xd2\xfd\xa1\xf4\xb5\xb0\x01'
+    b'\xc4\x18\xe2\xb8\xc51\x9a\xe9~\xb3\xfbo\xb4\x01\xe4k\xa0V{%J\xfc\xa5^|\xee\xaa\xc4\x8f\t4\xb6\xfb\x0c\xbd\x815\x12\xeb\xa1\xf0\xf9\x84_\x87\xcf\xf0\x9d'
+    b'\xf0\xb7\xb0\x8e\n=\x80\xb5\x14/\xa1\x13\xf0\x9d\xf0\xa7\x8c\xe3a\xed\x8d\xe5x\xd1\x1c_C\xb2\xbfe\xdfX\xe80<\x9b\xb2\xce\x94\xfd\xe5P\xdb[\xff\xfc\xb3\x86'
+    b'\x7f]\xdb\xb1\xc2\xdd\x1e\xe7"\xebi3\xdd\x1fT_\x7f\xfb-\x95\xbf\xf6\x1a9\x1e\x7f\x9c\xca?\xf9\x84<\xfaX\x81\xec\x08\xd9\xde\x93\xed\xc1@v\x05\xc6R\xab'
+    b'\xbd\x12%\xf5\xef\xff\xdb\xd8{\xdb\xce\x9d\xca\xff\xaf\xc7\xf8?\xd6\xc3P\xf1\xf5\xfd\xfb\xf7\x07\x8c\xaf#\xd6,\xc6\xab\xaa\xa8$+\xfb\xfb\xcf\xbaut@\xd7\xe5\xd1'
+    b'\x8c\x17\x8b\xe3k(\xf7%\x96<\x11\xda\x83\x0f\x92e\xd92\xb2-X@\xda\x84\tT\xbev-9\xf5\x9e\x18u\xc1Qa\xd4\xd3\x81t\xbf_\x0e\x80\xdd+\xed'
+    b"\x81\x07\xc8\xdd\xb1\x03\xb9\xdb\xb4!\xc7\xe4IT\x91\x9aJ\xb6\xf1\xe3\xc9\xb3a\x03Y\xfe\xf9'\xa0\xee7\xb3'\x02\xd9\x00\xf8\xabV{%Jj\xea\x05\xd9\xf7\x15"
+    b'\xb9G\xa3\x8f\x8c\xcf\xa3\xdd\xce\xc3l|\xcb+\xafP\x19\xd3\x13v\xf6\xd7\xf1\xfe\xfb\xb4\x7f\xd3\xa6\xb8\xef\xb76\xdb5\xb6\xfb,\xe7rElW\xc4\x8e\xe5\xfc\xaf'
+    b"\x9cW\x16\xb1a\x11\xff\x95s\xd1\xbe\xf1\x10#\x1e9\x92,\x13'\x92}\xc4pr\x8c\x18A\xf6c\x8e!\xdb\x83\x0f\x90\xe5\xab\xaf\xc8\xcd\xc6\x8eh\xbc\x18\x1d_"
+    b'C\xb9/F_[\xf8\xd3f\xbe\xb6\xac\xcbd\xdf\xdc\xf2\xf5\xd7\xe4\x992\x85<\xb9\xb9TQ\\L\xb6\xeb\xae\xa3\xca\xccL\xfe\xb2N\x9a\xc4\xf5\xa8u\xcf\x1e_'
+    b'\xcc>P\\@\xde\xb7\xf8\xce\xe8\xe7\xcb\xc7%\x8f\x85s1\xd3\xf9\x01u\xff\xbe}\xe4\xbc\xff~\xf2\xb4jE\x8e\xe1\xc3}}\xbc+\xda\xb5#\xd7\xa0AT\x95'
+    b"\x94D\xda\x80\x01d}\xfd\xf5\x1ac\x05\xb3'\xcc\xb6\x15\xc7\xa5V{%JB\xc7\xffc\xafs\x99\x8d\xb1w/9\xd9\\\xb7M\x9bN\xaef\xcd\xc8\xc2|\x14"
+    b'\xccy\xc7\xa9\xa7\x92}\xce\x1c*Y\xbd\x9a\xaa*+\xebE\xd7\x1b\xb7k\x8c\xf1\x7f\x11\xef\x10\xeb\xb8\x9c\xbf\x15\xd83\xb1\xbe\x8b\x9c\xaf\x9cK\x16\xeb\xbe\xc8\x13['
+    b'KK\xc9\xfe\xf8\xe3\xe4>\xf2H\xaaHK\xa3\x8a\xfc|\xdeKQ\x1bp\x1c\xbf\xaf\xee\x96-\xc8\xca\xee\xab\x9b\xe9\x1e\xfb\xae]\xa1\xc7\x8b\xf1\xf15\x94\xfb"\xe7'
+    b'\xda\xe5|\xba1\xcf/\xe3\x02D\x9e\xdf\xf1\xcb/\xe4<\xef<r\x1dv\x189\xce:\x8b\xebO\xbc*\x9b6%\xe7\x15\xb3\xa8\x92\xf9\xd1\xd0\xa3\x9e\xee\xdd\xc9~'
+    b'\xf3\xcdd\xf9\xf5\xd7\xa0\x18\x03\x81\x0b\x10\xfb\x16\xf6T(\x8c\x81\xc0\xd6\x99\xe9g3=\xcd_\xccf\xach\xd9\xd2\xd7\x83K\x1c;\xfew\x9dr\nU\xe6\xe4\x90'
+    b'\xa7}{\xb2\xcf\x9aE\xce7\xde\x08>\x96\xc9K\xde\xbf8\x1e\xb5\xda+QRS/\xc43\x96^\xfe\xd3O\xe4\xba|&y\xb2\xb3\xbdz\x82\xcdk\x07\xf3\x0f'
+    b'\xedw\xdeI\x95I\xde\xf9\xee\xec\xdd\x9b,\xcb\x97s]\xa1\xfd\xf5WB\xe4\x04T\xfc\xdf\x1c_\xaf9\x9cT\xfe\xdf\xff\x92\xfb\xf0\xc3\xc9\xc6\xf4\xbd\x9b\xe9\x16\x9f'
+    b'\xdea/\x8d\xf9\xa1\xaec\xfa\xfa\xd6\xf5J\xa6\x7f\x9c\xc3\x86\x91\xed\xf9\xe7y\x7f\xe6X\xc6\xff\xa3\xc1\xff\xb7N9\xfa\xe8D\xb1\xbfCa\xf3\xa1\xc7\xfc\xb0\xf9\xc0'
+    b'=\\|1\xb9\x0f=\xd4\xaf\x8f\xe5\x01\xe9\x05{L\x9b<\xd9;\xbf\xbau\xa3\xb2O>!\r6x\x9cj\x0c"\xcde\xd8_x\x81\\=\xba\x93\x87\xd9\x00'
+    b'\x1ef\xbf`]\xf04o\xee=v\xb6Vp\x1b %\x85l\xaf\xbcB6f?*\x1em%J\xe2\x1f\xff\x8f\x15\x96\xaet\xcb\x16r2]\xe0\xec\xd0\x81l'
+    b'\xd7_O\x15\xc9\xc9~6>b{\xce\x85\x0b\xb9\xce\xa8\x92^ZA>Y\xe6\xcc\xa62f7\xa8\xfa\xbf\xd8\t\xd6s\xac\xd9\xd0/\xf8_\xe0\xeb\xf0?>\xc3'
+    b'w\xf8\x1f:\x86\xdbml]\xc7\xff\xb8\x1ex\xf1\xff\xef\xbe\x9b\xb4\xbe\xd5\xba\xbd\x82\xf9\x99\x95\xcc\xa6;`\xf0\xdf\x9c\xd7\\C\x15yyT\xc9\xee\xb9s\xc8\x10'
+    b'*\x7f\xee9\xd3\xf1\xf0\x19\xf6\x85\xffcq|\xf2x\xc1\xaeE\xf7\xb4\xd3N\xbb\xae`\xf3\xe6D\xb8/\xd0\xa7\xc6\xfa?\xa1\xe7e\xdd,\xb0\x90|{\xe4\xf4\x99'
+    b'\xbe\xac(*\xaa\xa1\xf7\xe5\xf7\xceK.\xa1\x8a\xf4t\xef\xbcj\xd3\x9a\xec\x97^J\x8eo\xbe\xf1\xe9y\x8c%\xdb\x18\xb2\x9e\x0f\xb4oa\x17\x98\xd5\xff\x99\xc5\xfd'
+    b'\x03\xc6\xeaw\xef&\xc7\x7f\xfeC\x0e6\xae\xb6n\x1d\xb9\x8e:\xd2w\xec\xfc\x19:\xe3\x0c\xaa\xcc\xcc m\xecX\xb2>\xfa(9u\xbb=\x9c\x18@\xa0<\x80'
+    b'Z\xed\x95(\x89\xaf\xffo\xff\xeakr.X@\x1e\xb6\xfe\xfb|\xc2\x93N\xe2\x7fk\xe8\x89\xc1\x83}>\nl}\xfb\xf0\xe1d{\xf2I\x1e[n\x08\xfe\x7f'
+    b'~r\xabVC\x9b\xce\x9b\xd7\x10\xees\xb4\xbe\x93m\xe3F\xd2Z\xb5"\x17\xb3\xdb\x0e\x18\xee\xa5\xf1\xe5),$\xe7\xacY^\x1b\x81=\x07\x0e\xa6\x87x\x9c\xfa'
+    b'\xf6\xdb\xc9\xbewO\xbd\xf5Lj\x91\xd2\xa3\xc7\x98\xec\xe5\xcbo-\xda\xb3\xe7\xaa\x82\x8d\x1b\xd3\x9bdgg&\xe5\xe7\xd7\xe7}1\xc6\xd3\xe5\xdau9\x07/\xd7'
+    b'\xe0q\xdc\xc3w\xdf\x91v\xf2\xc9\xde\xfc9\xd3\xeb\xee\xb6m\xc9\xd5\xb5+i\x9d;W\xc7\xd1\x8f=\x96\\={\xf2\xf7\xf6\xab\xaf&\xfb\x9bo\x92\xfd\x97_\xc8'
+    b"f\xb5\x99\xd6\xff\x898\xbf\xa8\xe1\x0bT\xff'\xe7\xffE\xce\x00\xe7\x12\x08\xf7\x17,_\xef\xfc\xf2K\x1e\xeb\xf7\x8b]0\xff\xdf=l\x18\xc7\x03\xda\x96/#\xd7"
+    b'\xa7\x9f\x865&\xbf\x86\xff\xfc\xe3\x97\xf3\x97q\x80j\xb5W\xa2\xa4f\xfc1V\xbe\xb4\x1b\xf3\x94\xcdYW\xef\xa3\xfd\xf4|U\x00=\xc1m\x80[o%wq'
+    b'\xb1WW0_\xc5r\xef\xbdT\xbaa\x039\x99\xff\x7f @\xbe>Q\xea\xff.\xc9}\xe5\x95\xab\x0b\xbe\xfa\xaa!\xdcg\x11_\xc7\x1a\x8e\xff\x85\xdf,\xfcO'
+    b"|'\xfc;S?\x9c\xe9\x1b'\xb3\xcf\\\xbd{\x9b\xde\xcf\x8a\xdc\\?\xff\xcd~\xcb->\x9b\xcfu\xcc1\xe4|\xe9%*\xf9\xfe{\x8e\x074\xf3\xeb\xa3>"
+    b">\xc3x\xc6\xf3\x1f\x92y\xe5\x95w\x17WT\xaclF\x84\xd7=\xc5\x07\x0e\xdcY\xect\xdeU\xecr\xcd\xca\xff\xe8\xa3^\xe9c\xc6$5IN\x16\xdb'7"
+    b'II\xa9\x8b\xfbb\xc4\xc7\x1bu\x97\x91\x17A|\xa6\xed\xdb\xc7\xfdg\xdb\x9e=\xa4\xc1f]\xb6\x8c\xdc\xed\xda\xf9\xdd\x1bO\x97.\xe4\xea\xdf\x9fc\x00\x9c#G'
+    b"\x92\xfd\xfe\xfb\xc9\xf6\xce;>\xdc^m\xf6\x1d\x88\xc7\x07\xe7bV\xab'\xb6\xe7\xb6\xcd\xdbo\x936cF\xf5\x98\xc0\x19\xf4\xe8Q\xe3Yr1\xbf\xc0s\xe8\xa1"
+    b'\xa4\x9dx"Y\x9fz\x8a\xacf\xb5\xff\xc8\x97\xa0\xce\x11\xb9\xa1\xaf\xbf&\xfb\xdf\x7f{\x8f\xe5\xca+\xc8\xb5eK\r\xec\xbf\xaa\xffS\xa2$\xbe\xf1\xff\xf2\xbb\xee'
+    b'\xe2\xb6\xbb\x87\xf9"\xa1|D\xf1\xd2\x80]\x9a;\xd7/\x87\xecIM%\xfb\xb1\xfd\xa9\x94\xe9\x90\x03&\xd8\xbc\xfa\x8c\xff\xa76\xc9\xc8\xe8\x91~\xfa\xe9\x93s\x9f'
+    b"yf\x05\xd3'\xd3\xf3\xde~\xbb\xa1\xd8y\xe1\xe4\xcd\x03\xe6\xe1\xab\x0eP\xf9{\xef\x91v\xd4Q\xe4i\xd6\x8cl\xf3\xe7\x93}\xf9r\xees:O9\x85\xb4\xee"
+    b'\xdd\xfd\xf4\xbfc\xfatr1\x9b\x80\xaf\xe7\xec7V\xa6\x9f\\\xf7\xdd\xc7\xf1 \xc6\xbc\xbe\xc8EGu|\x06\x9c\x808o\xe8\xf4!\x99\xb3g\xcb\xba?\xd0\xeb'
+    b'\xc6\xc2\xdf\x7f\x87MwU\xc1\xa6MmS\xfb\xf5\xab\x8b\xfb\x12\n\xc7\x1e,\xa6-\xbeC\\\xc5,\x0f\xe0>\xe1\x04\xf2\x1c~8U\x14\x16\x92v\xdai\xe4X'
+    b'\xb4\x88\x1c\xcc\x063\x8e\x15r\xdf\x86\xfaz\xb3\xe3\x12\xb1\x0c#\x07\x80\xcf\xff\xfe\xe5\x17\xf20\xdf\xa0\x12\xb9\xfd\x15w{\xc7\x996\xcd\xd4\x96\xd4&N$O~'
+    b'\x1e9\xae\xb9\x86,\xdb\xb6\x05\xe6\x12\xba\xf1Fr\xb3u\x82\xfb\x0e\x19\x19\xe4\x82}:j\x14\xaf/6\xe3\x15T\xab\xbd\x12%\xfe\x12\xd3\xba\xfe\xcd\x9b\xa9\xfc\xee'
+    b'\xbby\xac\xb1"%\xa5\x86\xff\xcf\xfd\xfd\xae]\xfc\xe6<\xf4\xbd\xf5\xc1\x07}\x9fiG\x1fM\x8e\xdf~K\xc8\xfa\xff\x8e\xa9\x03\x07.,\xdc\xb6\xed\x9ef\x07\x0e'
+    b'\x08\x9d\xb1\xbc\xd8f\x9b\x99\xff\xfe\xfb\xd7\x16|\xff\xfdE\xb9\xabW\xf7H\x1b92\xb9Ijj"\xdeg\x11\xcb\x15\xeb\xa7\xec\xd3\x89<\xaf\x1c\x0b\xaeQ\xe7\x05'
+    b'\x8e\x9e\xc7\x1e\xe3k\xb2\xcb\xa5\xf1\x1a.\xd7\xe4\xc9l\xad\xce\xaf\xb1\x8e\xbb/\xbc\x904=\xae\xe3`\xfe\x9ck\xc9\x12\xce\xef\xe2\xfc\xe1\x07?\xffS\xc6\xf2G{'
+    b'|\xf2x\xde\xfcL\xcb\x96\xd3\xf3\xdey\x07\xbe~(\xdd/^\xf3\n\xbe\xfe\xba}\xea\x80\x01uu_\x84\xae4\xd6\xe0\t\x9d\xe7\xf3\xcdq\x8d\xb6o\xa7r\xa9'
+    b"\x1e\x9eo\xff\xd1G<wfj[_v\x19y\x98^\x04\xbe\xae\xec\xc9'\xb9\x1e\x17\xd7J\xd6\xd3|\xdf\xfa\xf5\x93\xf7-\xaeg9\xdb\xafs\xd3F_\xfd\xa5"
+    b'\xf1\xba\x8bzK#W\xafOo3\x9b\xcf\xdd\xb939\x9ey\x86l/\xbe\xc81\xa1\xaeSO\r\x18\x17D\xdd\x82\x87\xad#\xa2\x0eA\xd8\x15\xb2\r\xe0~\xfd'
+    b'u\xbf\xf3vw\xea\xc4\xf1\x0e\x967\xdf4\xe5\x13T\xfc\xbfJ\x94\xc47\xfe\xcf}\xb0\xa7\x9e"wA\x01yr\xb2\xc9v\xd3MT\xf2\xf9\xe7\xe4b~"b'
+    b'y\xb6\x8b."\x17\x9b\xa7\xc6z\x9fr\xe6\x1bV\x888rZ\x1a\xd9\xcf>\x9b\x1cl\xed\xd2\x98}_\xc2\xf4E"\xc4\xff[\xa6\x1cq\xc4\xd2\xa2\xb2\xb2P\xfa'
+    b'\x03\xba\x06\xb6\xc0\x80\xcc\xa9S\x8b\x93\xdb\xb7?(\xb9S\xa7~\x19\x17^X\x90|\xe8\xa1\xf5y\x9f\x05g\xbb\xc8\xd7\x8a\xbay\x91g\x16\xd8s\xac\x97\x82\x87O'
+    b"\xe0\xd2\x04\xce[\xf0\xf0\xf15\x15\xfax\xc8\x10\xd35\x9c\xe7\x9e\xaf\xbc\x92<\xec^V\xb1\xb5\xdc\xc5\xfcO\xfbI'\x91u\xde5\xa4\xed\xdfo>^\x8c\x8f\x0f"
+    b'\xe7<7\x7f\xc3\x86p\xf5\xbex!NpY\xde\x9bo\x8e\xcaZ\xba\x14\xf8\x80\x9aW2))\xb5IffJ\x93\xf4\xf4\xd0W=))\xd4\x16\x82g\xdfX'
+    b"\xff'\xf2\x19B\xcf\xbb\x99>\xe4>\xfd\xcd\x8b\xaa\xeb\xff\xf0\xb7[\xb7\x80\xf7\xc0\xca\xecpn\x7f\xf5\xefO\xce;\xee \xcb7\xdf\xf8\xd5\xec\t\xcc$\xd7\xf3l"
+    b"?e\xef\xbfO\x15\xecs\xeb\x82\x05\xe4\x9e7\x8f\xac\xabV\x91\x83\xd9\x1b\xce\xe9\xd3\xc8q\xed\xb5>N~\x19\xff'\xb0\x848\x97@|\xfdv\xe6\xc7C\xa7;"
+    b"`\xfb\xe1\\\xbaw'W\xc7\x8e\x01\xf5?\xcf]\xb0u\xc2\xc3\x8e7P?\x01\xcb\xebk\xfd\xfd\x08f\x0b8\xd8\xba\xe1d\xebM\xa0~\x02j\xb5W\xa2$~"
+    b'\xfe?\x9fw\xf0\r\xd8\xbaQ\xae\xc7\x19\xf9:\xf5\xe5\x97\x9c\xd3\x03\xbc^fs\xde\xb6x\xb1O\xff;\x8f:\x8a\xb4\xab\xae"\xeb\x9a5T\xf6\xe1\x87\xe4\x02O'
+    b'H\xbd\xfa\xffII}3&N\xbc\xbd\xa8\xa4$R]rOqU\x15\xec\x01\xf8\xa0\xe1\xe9\x8b\xba\x8f\xff\x83C/P\x1f\x1e\xf06\x98\xc7\xd7\xab\xc8\xc6\xec\xb3'
+    b"`\xb8\x0e\xd8~<\x97\xd3\xa2\x05Y\x99\xefY\x8e\xf1\x02\xc4\xeb\x83\xc5\xff\xe5\xe3\xdb\xbfs'\xb9\xf4\xd8P8\xf1\x7f\xc4j\xbc:\xdd\xe3\x99\x93\xff\xc5\x17gf"
+    b'\xdfy\xe7\x84\x9c\xc7\x1e[T\xb8cG\xb0\xfbvC\xe1\xaf\xbf6O\xe9\xdaU~\x06\x0eM9\xea(\xfc\xfe\xfa\xc2\xad[\xef,\xd6\xb4\xe5\xc5v\xfb\xfc\x82\x9f'
+    b'~:;\xfb\xde{\x0fK\xed\xdf_\xbe\xd6\x9d\xd2\x06\x0f\x9e\x9e\xb7~\xfd\xa2\xc2\x9d;\x11\x13\xcaN*.\x0ev_B\xd5\xffi\xd0\xcbM\x9bRE\x87\x0eT'
+    b'\x91\x99I\x9eO>\xe19q\xc7\xf8\xf1\x01\xf15\xf0\xb1\xb5\x993\xc9\xd5\xb2%\xd7\xfd\x98KA{\x0c!\xbe\x80\xfa\x80\x81\x03\xfdt\xaa\x1bu\x06\xcc\x9e\xd7\xbe'
+    b'\xf8"d\xfd\x9f\x99\xffo\x81\x1d3f\x0c9/\xbe\x98s\x11\xba\xc6\x8e%\xe7\x9c9\xe48\xff\xfc\xa0\xfa\xdf\x17\x07\x187\x8e\xaf\x05\x1e\xbb\xcd?\x07\x00\xdb\xf0'
+    b'\x90C\xfc\xb1D\x93&\x91u\xd7.\xe5\xff+QR\xcb\xfc\x7f\xac\xb9t<[\xb6p|\xdf\x81 \xba\xc2\xc1\xfc\x7f_\xbd8\xe6q\xf3\xe6d=\xf5T*Y'
+    b'\xb6\xb4F\xfe\xbf.\xf9\xff\x80\r\xbf0\xf7\xb9\xe7\xa0\xc7#\xd5\xfdx\xddQ\xecp\xf4\xc9\x980!\xa5IZZ}\xdfg\xe1_\x0b\x9fH\xf6\xaf\x05o\xbe\xec'
+    b'_\xbb\xe0\xf7\xcd\xbc\x9c\x9c\xf3\xe7\xd7\xf0\xaf\xad\xef\xbcC\x95\xc9I\x81\xd7m\xf6\xb2\xe8\xf7\xd4\x9d\x91A\xf6\xc1\x83\xa9\xfc\x8e\xe5\xbcn-`<\x01\xc7\xc7t\x85'
+    b'\x85\xe9\xf7@\xc7\x878\xb2u\xeaT\xd2\x98\x8f\x17\x8e\xff\xdf1u\xd0\xa0c3\xa6LA\x1e@\xbe\x16\x88\xcb o\x13\xec\xde--*/\xbf"\xff\xe3\x8f\x11'
+    b"\x0bXP\xf8\xcb/\xc1\x9e\x01|\x07=\x8f\xfc\xd0\x05\xb9\xcf>\xbb\xc2\xb0\xed\xbc\x82o\xbe\xc9I:\xe8\xa0p\xfc\x7fQ\xff'\xfc\x7f\xc7\xbau\xe4a\xfa\xd7\xb9"
+    b't)\x951\xfb\x07\xf9|\xf0\xfai\xba\xee\x0f\xaa?\xa1\xbf\xd9\xef\xe5X\x82\x99\xff\xcf1\x94O=EUl{9W\x07\xec\xa0c\xe1B\xb2>_]\xbfi'
+    b"\xf4\xff\x05\x0e3X\xfe\x1f5#\xce\xcb/'+\xbb\x7f\x95M\x99\xfd\xc2l|y?\x95\xec\x19\t\xb6>\xf0\xfc~VSr\x1fw\x1c\xd9\xdfz\xcb\x97\x1f\xf2"
+    b'\x9cu\x16\xe7:\xb2\x9fs\x0e9\x99\x8di\xdb\xbb7 \xf7\xbf\xca\xff+Q\x12^\xfc?6\xba\x94\xf9\x88\xbbw\xf3x\x7f\xd05\n\xf1\xff\xbb\xee\xf2\xae\x03\xc9'
+    b'\xc9d\x99<\x99J>\xf8\xc0\x1b\x87\xaf\xa8\x8c\x8d\xae\x07V\xfa\xef\xbf#\xe6\xff\xbb4o\xed\xda\xda\xe8}9\x17p\x03\xd3\x1d\xa3\xb3\x96/?\xa5\xe9\xc2\x85Y'
+    b'IEE\xf5u\x9f\x8d\\\xaer~]\xce=\xf3\xdc.b\xfb\xccG\x13\xf7\x045Z\xbe\xfc:0\xf7\xdd\xbb\x05\xd5=<\x17;}:\x8f\xf78\xd9\xda\xefx'
+    b'\xe0\x01\xd2\xf4\xbc|\xa0|\xbd/\xd7\xfc\xf6\xdb\xe4B\xech\xe2\xf9\xe4>\xe8 \x8eiwL\x98\xc0\xf3\xc6\xda\x8a\x15\xe4d~\xa3s\xeb\xd6\xb0\xf2\xff\xc1d\x0c'
+    b'\xf3\xe5\xa3\xb9\xb7f\xaf\x15\xc5\x95\x95gd-^\xdc-\xed\xd4S{\xa7\x8f\x1bwM\xc1\xb7\xdf\x8a\xef\xae-\xd8\xbc\xb90\xb9m\xdb`\xf9\x7fq?|yv'
+    b'\xe8\xaf\xc3\x0e\xa3\xca\xbc<\xb2\xff\xf8\xa3\xf7\xb3\xfb\xef\xf7\xdaU\xccF\x0e\xa5\xffy\xdd?j\x03\xf5\x98\x961g/\xef\xdb\xb6re\x8d\xf1\xc0\xed\xe0d\xfe\xb7'
+    b'\xfd\x8e;H\xdb\xb3\xc74\xff/t,\xce%\x10\xfe_\x93p\x83\x1a\xb3_8\x9e\xf0\xd9g9.\x01\xcf\x97\xd6\xaf_\xd8xa~L\xb7\xdd\xc6\x9fI\x8f\x9e'
+    b'C\xa8\xcc\xca"\xc7\xbd\xf7\xfap\x8af\xdc\xff\n\xff\xafDIM\x89*\xd6\x0f\xbf\xec\xfb\xefx,\xd2l;p\xc1\x85\x9a\xcf\xae\xe2"r\xdey\'\x9f\xc7\xf0'
+    b's\x1c\xc0\x88\xeb\x18\xb1\xb0b\xf86{X\xdb\x953\x9f\xd1\xb9~}D\xf5\xff\xc0\x83\x1b\xfd\xbc\xdb\x8bJK\xef*v\xbbyl\xbfYh\\\x19l\x00`\xca'
+    b':\xa5\r\x19bv\xfd\x0fI\xe9\xd2\xe5\xe4\xa6\xd7^\x0b\xdc\xf9\x95\xf9\x9f~zY\xde\xbaugg\xaf\\yt\xfay\xe7\x05\xaaM\xcfNj\xd6\xec\xe4\xa6\xd7'
+    b'\\3!\xe7\xd1GO\xcd\xba\xe9\xa6p\xec\x8ap\xf1\xf5\xc0\xf9\xa3\x8f\x0c\xe2\xc7\xee\x81\x03\xf9_\x0f\xd3\xc1\x15\xcc\xf7,g\xdf;\x82\xe0\xb6|\xfa\xff\xcc1\xe4'
+    b'\xee\xd6\x8d\xdb~\x8eW_!+\xd3\xd7e\xcc\xf7\x0f\xc9\xeb\x87{q\xc1\x05dc\xfa@\xf6\x0f\xc1k\x0f\x1c\x1brD.\xe8\xa3\x08\xf0\xff\x81\xa4(\xf9\xb0\xc3'
+    b'p\x1fc\xa9\xffq\xaf\xdb\xa4\xf6\xed+\xf6\x01\x9f\xff\x96\xa2]\xbb\xc4\xf7\x8b\x8b\xf6\xed;-k\xd1\xa2\xfe\x19\x17]\xd4/\xe3\x82\x0b\xb0M\xb0>v\x1c\xe7\xc0'
+    b'\xaeaE\x97.\xe4\xdc\xb1\x83\xec\xdb\xb6\x91\xe3\xe7\x9f\xd9u\xedH\xceQ\xa3B\xde\x07\xdf\xf5\xeb\xdb\x97\xec\xcc\xaer\x98\xf4X\xf6\xfd\xdd\xb2\x85\xdf\xeb\x1a\xf6\xc3'
+    b'\xf0\xe1d7\xe1\xe07\xc3\xff\x87S\xff\xef\xe9\xdc\x99\\\xed\xdb{\x7f\x8fx\x04\xb3\xf5\xecO<A\x15\xcd\x9a\x85m\x03\xc8|a\x95\xe9\xe9\xe4\xe8\xd5\x8b\xe7\x18'
+    b"\xcd8\xffU\xfd\xbf\x12%\xe1\xc7\xff\xc3\xc5\xc8U\xfc\xf9'\xb9\xf2\xf3\xb8\xff\xeeZ\xb5\xaa\xc6v\xe8\xf1\x13,F,^\xe0\x01w\x9c{\xae7\x7f7\xe08r"
+    b'\x8e\x1e\xcd9\xbf\xcb>\xfe8<\x0c\x1f\xd3+\xfb\xd8\xfa\x84\xde\x01n6\xd7K\xd9:\xe7\\\xb3\x86\\\x9b6Q)\xf3\xf99\x9el\xfbvr\xb05\xd0\xca\xd6'
+    b"\x9dp\xeb\tqm\xc6\xe7<\xf2\x08r\xc7s\xf3\xbf\xfc\xf2\xd4\xac\x1bol\x9d\xda\xbb7>G\r \xf4\xc7\xec\xfc\xcf>\x0bG'\x00\x8768\xf3\x8a+\x0e"
+    b'K\xed\xd7\xafYr\xfb\xf6\xe0\x9e\x1d\x94y\xf9\xe5s\xf2?\xff<\x186\x1d\xf9\x83s\xb3\x1f|0/\xb9E\x0b\xec\x17\x18\x02\xd4\xb1\xc3\x06\x91\xb7[P\xb0u'
+    b'kqr\xbbv\xc1\xees\xb8\xf5\xf5\xd6{\xee\xe1\xb5\x1b\xf0\xdfK\xff\xf9\x87\xd7`q\x1d\xc2\xd6g\xed\xff\xfe/<\x9d\xc3|:p9T0;\xcehw\x88'
+    b"z}\xb3\xba>\x8d\xed\xbbJ\xcf\xfb\xfa\xe5uO9\x85\xec\xcc.\x04gl\x89\xde\xc7&\xd4x\xe1<\xfb\x17\xe7\xbe\xf8b\xacc\x00'dN\x9b&\xef\x03\xf6"
+    b'\xc0\x82\xc2\x9f\x7f\x16\xf7\x19v\xe3\xec\xfc\xff\xfd\x0fv\x9f\x88\xcb\x18\xf5\xbf/>\xf3\xd2K\xbc\xae\xcd\xbe`\x019a\xb3\xb6m\xcb\xf5$\xb8\x94\xb4\x11#\xfcl'
+    b'\xa4pt\xa6\x8b\xe9^psi\x9f|B6vo\x8d\xf5\xff\xee\xe3\x8f\xf7\xdb\xbe\x02~\xf5\xb0adg\xd7\\>\xae@\xfa?,\xfe\xbf\x87\x1f\xe6\xfcP\x8e'
+    b'\x9bo\xf6\xfb\xbdc\xef^r\xdft\x13\xaf\x1d\xae\n\xe3\x9c\\\xec\xf9\xf40[\x14\xfc\x92\xe0\x01P\xfc\x7fJ\x94\xd4\x8d\xff\xef@^\xef\xcc3}s\x14\\\xf0'
+    b'\x1a\xd3\xb5b;\x1e\xf7\xef\xd6-\xacu\xc9\xb9r%\xb9Z\xb6\xf0\xc6y\x0f:\x88\xca\x99-`\x91\xb0\x83\xe1\x1c\x9f\x83\xf9E\xb6[n!\xc7\xd4\xa9~\xbe\x81'
+    b'\xeb\x90C\xc89\xe5br<\xf6\x18im\xdb\x90\x9b\xad1\x91\xf8\xff\xa8\x1d\xcfMj\xde<\xd0\xb5\xc3\x1a\x1ek\x1f\xd2\xecuk\xd1\xde\xbd\xa7g\xddv\xdbu'
+    b'\x05?\xfc\x00=\x02\x8c\xba\xd1nXX\xb8}{\xb3\xe4\x0e\x1d\x02\x1d\xab\x91\xcb\xc5\xe8o\xf2\xff?\xfb\xcc\x8b\xd9k~\x089\xd8=\xe4\xdb\x82\xef\x95\xe9\x1cn'
+    b'\x03dg\x87uO\x0f\xe8\\N\xda\x1bo\xd6\xd0\x15\x81\xfe\xe7\xc7q\xf5\xd5\xe61_\xa6\x03\xdd]\xbb\x92\xfd\xac\xb3\xc8\xf6\xec\xb3a\x8d\x17\xce\xb3\x8f\x98L$'
+    b'\xb5\x81\xb5\xd1\xff\x10\xd4\x83\x1e\xcal\xbe\xceiC\x87\x1e\x94\xdc\xb1c8\xf1\x7f\x9e\xafgv,\xea\xe6\xec\xcc.\xe2\xb9\x006G\xa0\xa3\x85\x8e\xf4]\xeb\x9c\xf0'
+    b'\xef\x8bO\xb7\xa3\xce\xe6\xb2\xcb\xc8\xa5\xcf\x07^_\xc9t*\xf7\xf9\xfb\xf7\xa3\xb2E\x8bH\xdb\xbc\xd9\xaf\xf7`\xa0\xf8\xbf\xc8\xad\x87\xcd\xcfx\xfb\xed\xde\x1cQ '
+    b'\xaeI\xe0\x85\xef\xba\x8b\x1c\xcc\xde\xac\x18:\xd4\x94\xdb\x00\xf9~p\xfe(\xfe\x7f%Jb\x9b\xff\x0f\xeas3?\rX\x1e\x9e\x83\x1c<\x98\xdc\x1d:xu-'
+    b'\xf3G*\xd9\xbaP\xfa\xf7^r\x9cpB\xd8>\x89\xfd\xd6[\xbdk\x0e\xf8\xbe\x98\xfe\x01?\\)p\xc2a\xc6"4`\xc0\xc6\x8e%[\xdf>~\x1c\xc3\xfc'
+    b'\xf8Z\xb5$w~>\x8f\x1b\xbb\x99/\x83\x98E,\xf9\xff \x13s\x9e|2\xde\xfa_\xbc\xc6\xe5<\xfc0\xb0\xe6\x88\x07\xb4M=\xe6\x18`\xd3d\xfduS'
+    b'\xe1\x1f\x7f\xb4J9\xf2H\xb3\xe3Dl\\\xf0\xe6\t\\\xb9\xe0u\x17\xbcy\xc8\xbdW\xe99V\xf4]\xad\xac\xf0\xf2\xeb;\x99M\x86\xf8\xbbk\xc4\xf0\x88\xf4\x0c'
+    b'\xc6q-^\xccy\xde\xca\xcb->\xac\xb9\xa8q\x13\xb8>\xd1\xef\xce\xfa\xe2\x8b\x01k\xd9\xb4\xfe\xfd\xa9l\xc5\n\xaa\xd0\xb1g\xa2\x1f\x9d\xd9x\xe1\xd6z%5'
+    b'II\x01>#v\xf1\xff\xaa*\x11#\nW\x02\xf1\xff\x1b\xeb\xff\xb8\x8d:z4y\xfe\xf3\x1f*\xff{\x1f9\x99\xaf\x8c\x9a\x00\xc1\xa3]\x19\xc1}\xf1\xbb\xae'
+    b'\xc7\x0f \xd7\xef\xbf\x93\x13\x18\xc4\xe3\x8e\xf3\xd9\xce\x88\xd3\xdb\x96.\xf5bA\xf4~\x81\x81\xf8\xff\x05\xfe/\x14\xdf\xaf\x1fW\xef\xcf?\x07\xe5=\xb2\x81+23'
+    b'\x93\x9c\x13&\xd4\xa8\x17\x86\x1d\x84gJ\xf5\xffS\xa2\xa4n\xe2\xffU\x07\xaa\xc8\r{_\xd7\xfd\xda\xa8QT\xbak\x17Y\x98\xad\x0el.\xff\x0c\xf1E\x1d7'
+    b"\x16\xb6\x8e@~\x99\xf9\xe9\x15\x7f\xfdU\xab\x1a~'\xf3S\x8c1\xe3\x03:\x1f\x98\x03v\xc1\xf3\xcf\x93m\xdd:\xb2\xe8\xe3\xc7\xba\xff\x0f\xea\xc2\x80\xfb\xaa\x0b\xfd"
+    b'\x8f\x9c\xbf\xbco\xe4!\x8c5\xee\xcb\x8a\xac\xd6\xd3\xb3n\xbd\x15\xbem\x87\xd4\x81\x03\x8fH\x1f=Z\xdc\xe7Pys\xf7\xe3\x8fs\x9d\xe2\xba\xed6\xafN~\xf9'
+    b'er\xa1\xff*\xae\xdf\xdc\xb9\xe4\xd2\xef}\xa4:\x06\xf1!\xd7\xca\x95T\xaas\xb9\x99\xe2\x0e\xd8q8\x80K(*2\xaf\x11a\xf7\xd2\xbde\x0b\x95\xa0.A'
+    b'\x8f\xff\xef\x0f\xd2O0\xdc\xfb7:k\xe9\xd2\x98\xe8\xfef\x07\x0e\x9c\x9f\xf3\xf8\xe3\xb5\xb1\xbf\xc3\xed\xff\xe7\x81\xbf\xde\xa3\x07\xb9\xee\xbc\xd3k\xebl\xdf\xce\xb95'
+    b"\xca\x91'8\xf8\xe0\x88\xef\x8d\x0f\x7f\xcf\xec4\x11\xdb\x11\xef\x1d\xa7\x8c \xd7\x8f?E\xd4\xff/\x12\xee\xff@\xb1z\xbf1`\xe3\x14\x14p\x8c\xa0\xdf\xb3\xf0\xf4"
+    b'\xd3\x14\x8a7\xd1lL\xb5\xda+Q\xe2/\x11\xd5\xcd\xdfr\x8b\xd7\xd7ow\x18\x8f\x1b\x8a\xed\x9cL7T\x19p9\x91\xacA\x88\x05F\x12\x9b\xf7\xc3\x18N\x9c'
+    b'\x18x]\x13\xfd\x87Z\xb6\xa4\xf21c\xc8\xa2\xd7\x06\xd7\x96\xff/\x80\x17\x9943\xff\x83\x0f\xeaB\xffO\xcb{\xeb-\xe3\xde\x0fJ\xe9\xd4iQ\xe1\x9f\x7f\x9a'
+    b'm\xbf\xb8\xe8\x9f\x7f\x04\xee\xd0x\xbe\xa2nN\\c\xf4M\xd1z\xf5\xe2\xeb-z\xcb\xf25X\x8f\xe3\xe0\x1a\xba[\xb4\xe0\xbdf\xc2\xe9\xeb\x100\xe6\x8c8>'
+    b'\xd3+\xce%K8\x1e\xcd\x06<\xa1\xdew\xd6w|\x17]\xe4\xff\x1b\xe0\x10\xd9q\xa0\x9fP\x19\xb35EOZ\x81a\x97\xfb\xd0\xfb\xb8rt<z8rT'
+    b"\xfa\xd9g\xd7\xc6\xcf?'\xfb\xbe\xfb\x80\xd7\xac\xe6\x0c\xd8\xb6\xcd\x9c/(\xb8\x84\xcb\xff\xc3\xef\x9bn\xebj\x83\x06\x91\xc6\xbe\x17\xd7\x81\xfb\xe0\xcc\x16p3\xfb,"
+    b"X-]\xd0|\xfa\xd1GW\xf7\xe1\x9a4\x89\x1c\x0f=\xe4\xeb\xff'\xf4\xbc\xb1\xfeO\xae%\x14\xcfX\r\xec\xbf\tf\xc0\xa8\xaf\xcd\xb0zb,\x8d\xcd[n"
+    b'C\xb6iS\x9d\xd7\x1b1\x82c\x07\x83\xf1#\x9b\x8d\xa5V{%Jj\x1f\xffw\xb0\xb9(\xd6\xe5\xb2\xfb\xee\xab\xde\xee\xd3O\xbds\x94\xe9Y\xd7\x11=k\xe5'
+    b'\x87\x00+\xee\xd9\xbc9b,\xa2M\xb7ILs\xd0YYd\x9b6\x8d\xca6l \xb7\xdd\xc1\xf9lb\x1d\xff\x87\x1c\x99>vl8\xb5\x00\xd1\xbe\xae.\xf8'
+    b'\xfak\xb3\xfd\xe7&\x1d|0\xea\x00\xae\xc8\xff\xe4\x93\xeb\n~\xfc\x11\xf6\xc8\x88\xa67\xdc\x90\x97\xe4\xc5\r\x8a<\xb3\xd0\xffB\xdf\x88\\\xb3\xb0\x89\x9c\xa7\x9f\xce'
+    b"u\xbem\xedZ\xb2\xda\x98\x8dp\xe1\x05\x1co\xa6]|\x11\xef\xe3g\x8c\xc3\x02\xc7u\xa0\x96>'_\xc7\x0f?\x9c\xec\x1f\x7f\xec\xabE\xe3>%\xf3\xf9\xb8M"
+    b"x\xd0Ad\x9b3\x87\xca\x9e}\x96\\;v\xf8b\xe3\xb1\xd6\xff-R\xbaw\x8f\x14\x0303\xef\x83\x0f\xc4uG\xff'o\xdc\xc5b\x11\x98\xbeHD\xdc\x8b"
+    b'\x90\xfc\xbf\xb0O\xd9\xf9Yo\xbb\x8d\xdb\xdf\xe0\xe9\x11|\xbe\xf2\xf6\xe0\x08\xd6\xae\xbe\x9a\\\xdd\xba\x86m\x8fs\x9b\x82\xe9{\x17\xbb\xd66\xf0\xf3\xfc\xe7?~\xfc'
+    b'\xbfr\xfe_\xe8w3\xfe_c\xed\x7f\x8d\x9e=&\xfa:P\xad\x9e\xafn_\xc7\x9c:\x9fy\x86\xac\x8f=F\x15\xed\xbd=\x8e\xd03$P\xddD \x0e\x00'
+    b'\xb5\xda+QR{\xff\x1f\xbd\xbb\xf8\xda<`\x00\xb9\xf7\xef\xe7\x98$`o\x91\x17p\xb2\xf5\x08\xbda\xd0\xbb\xab\xb6:\x81\xe3\x8d\xe7\xcf\xe7\xbc\xf2\xe1\xfa\xff\xb6'
+    b'o\xbe\t\x98\xfb\xe4:\xa6gOr^q\x05Y\xbf\xfb.j\xfe\xff@\x02>\xd8@>xl\xfd\xffpz\r\x99s\xce\x86\x13\xff\xf7\xd5\xe1\xe9\xf1u\xcb\x1d'
+    b'w\x90\xa7C\x07/\xc7\xeb\xd6\x9f\xfd8g8\xc7\x1f\xf3\xc3js\xaf\xfd\xeeyv6\x95?\xfe8\xc7\x95\xf0\xf5\x9c\xe9\x1fYo\xb9Q\xb7q\xcd5\xcc\xdf\xb3'
+    b"r\xfe\xc0p\xeb\x18#\xb9\x7fgd-Y\x12\xc8\x06\xf0\xd6o|\xf9\xe5q\x19\x97\\\x82\xfa=\xd1'H\xf4\n\xccL\xca\xcd\xbd(\xf7\x85\x17\xb0\x1d\xf8\x00\xb3"
+    b'\x92\n\x0b#\xd9w\xb8\xfd\x7f\xe4\xef\xb4\xdeG\x93\xfb\xc8#Cno\xdb\xf2\x13\xe7\xf5A\xaf&\xf7\xc5\x17Se\x00\x1e.\xaeO\xd1C\x0f\xdcO:\x86"\xd2'
+    b'\xbeD8\x17S\xee\x7fc\xcf\x1eC\x9dC \xae\x1e\xce%\xc4l\x19\xf4\x01t=\xfd4Yt\x9e"\xcbW_y\xb9\r\x99\xff\x11\xca\x9e\x10\xc7\x81\xb1\xf0l'
+    b'\xa8\xd5^\x89\x92\xe0\xf9\xff@\x1c9\xe0\xd5\xf64+&\xc71\xc7\x90\xe3\xc3\x0f\xb9/]\xf6\xf2\x1a\xf2\xa0\x97G\xff\xfed\xbf\xf3N*\x81\xaf6qb\xad\xfc'
+    b'\x7f?\xbf\x12=\xe3\xd98\xa5\xe0\xf8fkA\xb0\xe3\x83\r\xa2\xf5\xe9\x13X\xff3\xfd\xa5=\xf7l\xad\xf8\xff"\x91Q1\xca#\x07{\x9d\xd8t\xce\x9c\xda\xde'
+    b'\xe7p\xf0\x7f\x82\xbf]\xe0\xeb\\\xcf?\xcf\xf3\xc2\xf6\xfb\xef\xe3\xdc{\xf8\x0c\xfdc\xdd\xe7\x9eK\x8e!Cx\xdf\xf9\xda\xe4{\xcc0 n\xf4\xaa\xef\xdf\xdfo'
+    b'<\xd4\x108\x8f?\x9e\\\x7f\xec0=\xbe`x\xc2\xc8\xaeNR\xd2\x80\xccK/\xbd\xdb\xa4\x96\x03\xb1\x14\xa1\xeb\x0fN9\xfc\xf0\xdb\x8a\xfe\xfe\x1b\xba\x1e\xd8\n'
+    b'\xf1k\xe0\xfb\xaf)\xf8\xee;\xe0@\xd0\x1b2\x92=G\xd2\x83\xd7\xf7\x19\xb3\xbd\x1d\x9f|\x12V\xcf^\xfb\xfa\xf5\x1c\x03\xeb\x1a2\x98\xdcg\x9ca\xee\xfb\x0f\x1d'
+    b'\x1a\x93\xfe\xbf"?\x10\xc8\x060\xfb\x9d\x99\xee\xe7c\xfc\xfe;\xb9\x8f\xe8I\xee\x95+\xfd9\x85_{\x8d<\'\x0f\riO\xc8v\x84\xc0\x97\xaa\xd5^\x89\x92'
+    b'\xd0\xf1\xff\x9a:\xf2\x00\x95\xb3uD\xac\xcd6p\xf3\xe2;=6\x17,\xf7_\x1b\xfd\xe0\xe7\xff1\x9fEc\xeb\x96k\xd1"\xb2~\xf6\x99\xe9\xf1\x01\xaf\xe6W'
+    b'\x1b\x84~\xa7\x1d\xda\x93{\xc1\x02r<\xf7\x1c\x95\xfe\xf6[D<\x86\x91\xc6\xff!\xe8\x17\x1b\xebZ2\xf95\xbf\xe0\xc7\x1f3\x9a\xe4\xe4\xd4\xf6>\xdbM\xb8_'
+    b'\x8c\xfe\x9c\xf1\x7f;\xd3\xf5\xe2\xde\xa1\x86\xb2\x86n\xd9\xb5\x8b\x1c\xf0+SS\xa2\xd2\xff\x07\x0cu\xec<.\x90\x99\xc9{\xc4XV\xad\nx|f\xfe_$\xf5'
+    b'\x7fFA\xfd\x04\xae5\xf2\xfa\xe0\xf7GN\xe7\xaeb\x97\xab0\xb9uk\xb1\xcdy9\x0f>\x88m&\xe7\xaeZ\x85\xf7\x19I99\xe0\x11@\xfc\xa7K\xda\xb0'
+    b"a\x91\xeeS\xf0\xef\x8a<\x86\xc0\xda\x0b}'s\x1a\n_V\xceu\xc8\xf5\x82\x81\xc6\xd2\x86\r\xf3\xce\x0b\x13\x9e=\xf0\xe7X7m\xaa1V\xa0}\x8b~L"
+    b"f\xf5\x7f\x81\xfa\xff\x84\xe3\xff\xfb\xf9\xfd\xc8\t\x1dq\x04\xb9'\x8c'\x0b\xfc\x0e\xa1\xfb\xf7\xee\xe5\xf1(\xc7\x92%\x11\xdb\x13\xaa\xff\x8f\x12%5%l\xcc\xdd\xbb"
+    b'\xef\xf2\xbe]\x8eq\xe3x\xcc\x9dc\x83\x9ex\xc2\xbb\xae\\p\x01ig\x9d\xc9yc\x8c\xba\x1ex2O-1I58\xc0SS\xc9:g6\xb9\x1dN\xbf'
+    b'\xe3s\xde\x7f\x7fuL\x1a5\xe2\xec}\xf9\xea\xd5\xe4b\xfa\xa9\xb6=\x81"\xbd\x8e\xc0~\x85\xd3\x1f0\x14\x86\xfc\xfa\x82\xad[\xe1c\xfas\xd1[,\xcdS\xba'
+    b'u\x8b\xe6>\x0b\xfe\x1fo_\x1f\x7f\xfe\x9f@}xJ\x99\x0f\xa6u\xf1\xf6k\xb6\x8f\x1cI\xda{\xef\xf9\xf1\xf5\x88\xf1<\xdf}G.f\xa3\x19\xf9\xe3"\xbd'
+    b'\xc7\xd6\xa5K\xc9\xc3\xec=\x8c\xe3\x1c4\x88,l\xdc\n\xf4\xa5\x0b\xa3OP4\xf1\x7f\x08z\xf4\x80\xebiIQIIfR^\x1e\xee\xe7\xd8\xec{\xee\x81M'
+    b'\x07\xac\x1fb\x04\xe0\xeeC\xef\x1f\xf4\x10B\x7f \xf01\xcd\xca\xff\xe8#p\xfe\xd7\x96\xdb9P\xfd\x9f_o\x1e\x1d\xd3 \xee\x9d\xc0\xe0\x19\xb1\xf9\x02K(c'
+    b'\xf3y\xcd\xde\x1f\x7f\xf8b+5\xb0\xb7\xed\xda\xf1\xbe\xceb,\xb1o\xfc\x15\xfb\x16q\xa2@\xf5\x7f\xe2z\x0b\xdd/\xe3\x00"\xc9\xff\x8b\x98\x01\xf8\xa5\xb5\xbe}'
+    b'\xa9|\xdf\xbej\xdd\xff\xe3\x8f\x9cK\xdau\xfc\x00r\xbc\xff~\xad\xf2\tj\xb5W\xa2$x\xfc?X\xfd\x1f\xdfN\xaa\xcd/\xfd\xf2K\xaf\x8f\xcet-\xb6\xe3'
+    b'\xfd\xfa\x8e\xe9\xeb\xb7\xce`\xdd\xd1\x9a7\x8f\x89\x7f\xe8\xe3\x0c\x18=\x9al{\xf6\xf8\x8e\xcf.\xd5\xa5q[\x019\x89n]\xc92\xf5\x12\xb2a\r<P\x15q'
+    b"O\xe0\xda\\K\xc4\x80\xa3\xd1\xff\xa8\xe7\x87\xde\xe9\x92v\xf2\xc9\xe0\xfe\x13\x9fC\xc7\x84\xd3K6T\x9c'\x1c\xbd)\xebu~=\xd8g\xf6\xc9\x93ym\xb8\xb3"
+    b'\xa8\x88\x1c\xb6\xc0z\xd8\xb5y3Y\xe7\xcf\xe7Xra\x0bVEp_]\xcc\xbe\xa8`\xf7\xabt\xd1M\xa4\xad\\I\x8e\x1d;B\x1e_m\xf9\x7f\x8d\xd23'
+    b'\xfd\x8c3\xa0\xebE\x8d%b-\xe0[@\x1c\x001\x80)\xb9k\xd6\xdcT\xb8c\x078\x1c\xab\x7f3j\x14~\xd3"\xa5G\x8fh\xee\x8bY\xfd\x9f\xd0\xf3r'
+    b'\xfd\x9f\xac\x9b\xf1\xde\xa8\x9b\xc5XF\xdd\xcc\x9f\x7f)~\xe78\xed4\xbf\xf9b\x9f2\xc5gc@\xbf\xf3\xb9\xad\xeb\xf9H\xea\xff\x82\xe5\xfd\x83\xf1\x1c\xd7\xc0\x00'
+    b'\xb2\x97E\xdf\xbf\xb0#\xb4!C8\x0f5\xfa \xd4\x16O\xa8V{%Jj\xe9\xff\x9bl\xe7d:\x18\xdc:\xd6[n!;b\xec\xc0.\x83\xc7e\xc5\n'
+    b'\x1e\xbb\x05.\xcf\xce\xd6rW\xd3\xa61\xd3\xff>\xbf\x85\x8d\xef\x02/\xeae\x97\xf1<\xb1_L33\x93\xf7\x03\xd1l\xd6:\xf3\xff!g3?1R\xbex'
+    b'\xf9=0fb,\xc4\x92E\xcfal70s\xc6\x8ch\xees$\xfd\x7f\xe4x*_c\xdf}\x97\xf3\xff\xf2:<C\xbf\x9e\x80\xe3\xfd\xf5\x17\xb9\xd6\xad#'
+    b'\xeb\xb2e\x9c\x13\xc2=\xf0\x84\xa0\xf7\x93c>`k`]gk\x7f$\xc7\xe7w\xaca\xf6\xff1\xca\xe8\xace\xcb\xa0\xe7\xc1\xeb\x0c\x8e\xbe)\xb9/\xbf|['
+    b'\xd1\xbe}\x87\xa5\x1e{\xac\xe8#,\xeb~\x08b2\xe0\x7f<4\x00\xe7R8"p\x0b\xc6\xfa?\xe1\xe3\xcb\xf5\x7f"\x97-\xe2\xfcrl^\xc4\xde\xc53,'
+    b'b\xf9b,\xe7\xc7\x1fW\xeb\xff\x8d\x1b\xa9\xfc\xf5\xd7\xc9s\xe2\x89\xd59\xbd%K\xc8\xaa\xdb\x0c"\x87o\xcc1\xc8\xfb6\xab\xff\x0b\x86\xfb\x0f\xa4\xaf\x83\xe9m'
+    b'?\xec\x80\xde\xff \x9azB\xb5\xda+Q\x12:\xff\x1fvO\x00\xb6F\xb8\xd3\xd2\xbc\x9c\xb1\xd0\xc9\xdb\xb7\xfb\xf1\x04\x82\xc7\xb7\x94\xd9\x08\xda\xacY\xbc\xae\xb8*'
+    b'\x86\xfa\xbf*H\xee\x18\xbd\xe9\xad\xe0\x0e\xd1\xe7~\xa4\xbd\rj\xe3?B\x80\x05\x9f\x99\xff\xfe\xfb\xa1j\x01Q+\x86\xbe\xf1\xe0\xf0\x93{\x0cM\xcay\xfai\xa3'
+    b"~A\xde\x1f\xdf!\xee\x0c\xfe\xd8h\xf4L$\xfd\x7f\xe5\xfe\xba\xb0\xeb,_n$'\xb3\x03\xfc\xfa\xf5\x86\x18\xcf\xbej\x15\xb9\x0e=\x94\xdc\xfd\xfa\xf1z\xf2\xaa"
+    b'`\xf5gW^Y\xeb\xe3\x0b\xd4\xff7\x12)Hn\xdd\x1a\xbd\x9e\xa7\xe7\xbd\xf3\x0e\xe20\xe7d\xdf\x7f\x7far\x9b6\xc0\xfe\xddR\xb4{\xf7\x8d\x85\xbf\xfd\x86'
+    b':\x00\x19\x0b\x00\x19\x9c9k\xd6\xc1)\x9d;Gc\x7f\x9b\xd5\xff\x191s\xc2f\xf5\xf15\x18p\x812\xaf\x83l\x97\x89\xed\x81\xcb\xad`\xf7\xc2\xf1\xe8\xa3d'
+    b"\x17\xf1\xf6}\xfb\xc8}\xcc1\xde\xeb\x7f\xcf\n\xbf\xb1\x8c\xfb\xf6\xe3\x8a\x90\xf0#ro\x1dY\xe7\x87\xc3\x01\x14\x8a\xaf'\xd6|Bj\xb5W\xa2\xa4v\xf1\x7f\xb3"
+    b'\xed\xc0\xd3\xebl\xdd\xda\xc7\x11S\xfa\xe9\xa75\xfb\xeb\xe8qI\x0bz\xfa\x0e\x1c\x18S\x1b\x00\xbc`n\x9d\xb7\x84\xc7\x8f\x99\x8fj\x9f4\x91\x1c\xa3G\x93\xf6\xd3'
+    b'\x16\x8a\xc6\xb6\xa9\xed\xf5D\xfc\xfe\\\xa6;\x02\xf5\x8b\x07F\xbcUJ\xaf^b{\xf4\xa6\xbf\xb6\xe0\xfb\xef\xf1\x1d\xfa\xfa4M*(\x90\xc7C\x0f9\xf0\xf8\xe0'
+    b'{\xf4#\x8ew\xfc?P\x9d \xaf\xf7\x884\x0f\xbf{7\xb9\xdb\xb6\xe5\xf7\xca>a\x82)>\x80\xd7{\x1c|0\xe7\xaf\x89\xe6\xf8\xa2\x8d\xff\x07\x13\xe4\xff3'
+    b'\x98m\x87\x9eM\xb8\x17}2&L\x88\xd5\xd8\x91\xf0\xd7\xd7\xf6\xa5\xfd\xf7\xbfTQXH\xce\x1f~\xa8\xf1\x9dk\xfcxr\x8f\x18AN\xdd\xd7\xaf\xedK\xad\xa4'
+    b'J\x944<\x89\x88\xff\xcfl\xbb7\xde\xa8\xc6\x88M\x9bF\xf6\xa9Sy\xbfo\xd3\xf1\xe0\x9b\xbc\xf2\n\xb9\x8e?\xbeV|\xe55\xf4?|\xfd/\xbe\xe0=c'
+    b']\xd9\xd9\xe4\xc9\xc9!\xeb\x92%\xb5;\x8f(\xea\xff\xcd\x04\xfd\xde\x85\xbe7\xda\x02\xc6:\xbe\xc3\xd3N<Q\xe0\xff\xd0\xdf\xaf\xda\x96\xc8\xc9\xb9 \xf7\x99g\x10'
+    b'\xff\xbf(w\xf5j`\xd4j{<\xc2_\x17xm\xd9\xbf\x16\xe7/|\xedP<A\xc2G\x0fg\xbcrf\xf7\xe1\xbeT\xe2\x95\x96f\x8e\xfb\xbb\xf3N\x8a\xf5'
+    b'\xf1\xc5k\xbe@\xf7/*\xdc\xb9\x13y\x81X\xcd?9\x8f!\xfb\xf9f\xf5\x7f\x91\xfa\xe6\xeee\xcbx\xec\xcd=jT\x8d<\x8ak\xebV^g\xe1\xdc\xb0\xa1'
+    b'\xc6X\xc1\xf6m\x16cP+\xa9\x12%\xff\xb2\xf8\xbf\xbe])\xfa\xfdu\xeaDZ\xcf\x9e\xa4\x15\x14\x90=\xd4x\xc0\x11o\xdc\xc8\xfb\x8b \xa7\xec\xd6\xfb\x98D'
+    b'\x1a\x1b\xe0\xdc\xb0;wr|\xd3~\xf0\x95\xa27\xba^\x9bP\x9b\xf3\x886\xfe/$\xa5IZ\x9a\xe8\xd1\x8bXr\xfb\xd4\x01\x03\xce\xc8Z\xbcX\xe0\xfa\x11K'
+    b'Nk\x92\x99\x89m\xc1\xe1\x8f\x1e\xbf\xf8\x1c\xb9\xe4\x93\x9b\xce\x9b\xe7\xf5\xfb\x0f>\x18\xdc\xfe\xc0\xa3\xf7\xcd\x9881Z\xfc\x9f\x9c/6\xd6\x88\xf9q\xccJ\xf9c'
+    b"c\x9d\x97\x9c\xa3\x0e{<\x9b\x95l\xef\xbe\xeb\xd3\xfd\xc6\xfb\xcc\xebG\x86\x0c!\x97\x94\xbb\x8f\xf6\xf8\xe2\xc9\xf5\x0e\xae'\xe0\x04\xd0\xcf9\x16\xe3\x19\xf9t\xe5<"
+    b'\xbf\xb1\x06/\x92\xdc<\xb8\x95\xdd\xe8\x91\xdb\xb1#iW]E\xd6\xaf\xbe\xf2\xaf\xd9\xc3\xf5\xea\xd7\x8f\xf7{\xb0n\xd9\x126\xc6\xc0\xac\xfeOq\xeb(Q\xf2/'
+    b'\xf5\xff\xc5vs\xe7\xf2x\xbc\xeb\xb4\xd3"\x1e\x0f\\\xe6\xeeM\x9b\xc8\xf2\xc8#d\xbb\xf9frM\xbd\x84*\x99?\x1f\x12/\xde\xa7\x0f9\xf4\xf14=/\x1c'
+    b'\xf5y\xc4\xc0\xff\x07\x0f\xec\n\xe6\xf3\xc3o\x17\xfdw \x88\xfbC\x9f\xc3\xcf\x1f\x949s&j\xc6\x80\xed_Q\\Q1.\xe7?\xff\x01\xf6\x0c\xdb!\xe7\x0c'
+    b'._\xe4\xfe\x8d\xf9\xe6X\xc7\xff\xd1C\xa76\xf1\xf5H\xc7\x03^\x93\xe36\x8b\x8a\xc8\xce\xf4Q\x85\xd4\xaf\x89\xc7\x00\xd8}\x8f\xe5\xf1\xc5s\xce\xf4\xce\x187\x0e'
+    b'6^\xac\xf2o\xc6\xfa?\x91_1\xd6\xffE\x82\xcdw\xbf\xf9\xa6w\x8e\xf4\xeaE%\x7f\xfd\xe5Wc\xe0\xde\xf9\x179G\x8d\xe26\x19\xe7\x06\xfc\xed7\x8e\xeb'
+    b'\x8c\xa6\xc6@\xad\xa4J\x944<\t\x97\xff/8o^\x15\xe7\xe1+\xbf\xef>r\xa3\x06\xb0\x16\xe3\xd9W\xdc\xcd\xf3\x08\xce\x93N"\xf7SO\x91\xcb\x84\xab\xa4'
+    b'\x86\xfe\x7f\xfc\xf1\x88y\xfd\xe2\xc5\xff\'\xcb\t\x99\xd3\xa7\xc3\x9f\xbf"\xff\xe3\x8f\x85\xdf\x8e\xd8\xfd\x8c\xbc\xf5\xebo+\xda\xbb\x17u\xe6\xe0\x92E\xbd \xec\x81\xae'
+    b'i\xc3\x87\xcb\xbf\x87\x9d\x00\xfbaF\xde\xbb\xef\xc6\xea>c=\xc7\x9a-\xfa\xb8\x88\xfa\x7f\xfc\x8f\xcfD\xdf\\\xe8\x16\xc1\x13\x88\xff\x05O\xa0\xe8G\x83\xef\xf0\x7f'
+    b'\xc4\xe3u\xe8\xe0\xc5\xf9\x83\xbb\x95}V\xf6\xc5\x17\xa4]r\x89/\x16\x00l\x80\x15\xbdmct|\r)\xfe\xe6\xa7\x9bu=o\xac\xff\x8b\xb46\xdf\x82z\x9c'
+    b'\xf5\xeb\xa9\xe4\x87\x1f\xc8\xc81\x00\xbeL\xf4\xd3)\xbb\xfbnS\x1bC\x1e+\x9c\xfa?|\xa6VR%J\x1aG\xfc\xbf\xf6\xba\xf4@\xadun\xe9\xd6-\xe4\xc9'
+    b'\xca\xe2\xba\x00y\x04\xf4\xa2\t\xda\xaf\x84mS\xfa\xf7\xdf1\xd1\xf5\xb1\xe0\xff\x93ej\xeek\xafA\xff\x0b>\xb8\x82\xe4C\x0fE\xfd8p\x00#\xb3n\xb9\x05'
+    b'u~\xa2F\x00\xb9\x7f\xe3\xef\x05\xe6/<\xbe\xff\xf0\xa4.pf\x011\xd9\x1f}\xc4cC\x1e\xa6sl\x8f>\xea\xdf\x07~\xe6\xcc\xea\xba\xb4{\xef\x8d\xd9>'
+    b'\x1b\xca\xfc\x0b\xc4\xa7\x17\x8c\xe7/Rn>\xbf\xbc\x00ru\xa8\xf7\x1f?\x9e\xf36\xc5\x8acP\xad\xa4J\x944<\x89&F\x1e\xeb\xed\xecw\xdc\xc11}\\'
+    b'\x17\x0c8.(_<r\xca\xf1<\xbeh\xae)\xfa\x01\x82\xbf\x07\x9c\xb0\xd7\x15l\xde\xbc\xac\xd8j\xbd\xb5h\xf7no}\x7fRR\xef\xf4\xf3\xce\x83\xfe\x17\xb8'
+    b'\xbe\xb4&M\x9b\x1a\xc7\xe8\x97q\xe1\x85\xde\xf8Al$n~}\x88\xf1*\x903f\xbe?r5\xf8\xdf8\x9em\xd7.\xce\x15\xa4\r\x18@\x9a\xae\xafbq'
+    b"|\re\xfe\xc9x:#\xcf\xbf\x19\xce/X_\x00#'n\xa0\x1e\xbc\x91\x8e\x15\xaa/\x80\xea\xad\xabDI\xe3\x88\xffG\x82\x91\x8b\xf9v\xfb\xf7\x93\xf5\xea\xab"
+    b'Cb\x01\xd1gX\xe6\xff\x8b\xc7\xf1E{]s\x93\x0e9\xa4eJ\xcf\x9e\xcdS\xbawo\x96\xdc\xbe\xbd\xcc\xdd\x7fl\xc6\xc5\x17\x03\x1f\x08\xce\xb9\x05\x85[\xb7'
+    b'\xa2\xae\xbcuj\xef\xde\xc61\x8a\xd9\xefby\x9f#\xcd\xeb#\xf7\x1eM\x1d^%l\x84!C\xa8"\'\x87\xe7\x98\xcd\xc6s=\xf8 \xc7\x02Tl\xdb\x16\xd3'
+    b'\xe3k(\xf3/X\x1d{\xa0\xcf\x82}\x17\xe9\xf6\xb1\x1aK\xad\xa4J\x94(\xff?\x16\xdb9\xc6\x8c\xa9\xf6\xf5\x99n0\xc3\x8c;.\xba\x88c\x0e\x12\xd1\xff\x0f'
+    b"%\xd0\xeb\xedS\x8f?\x1e\xffg'5k\x06\x0c z\xcf\xc9=\xe5\xe2q\x9fc\x8a\xeb\x0f5\x1e\xf3\xeb\xddz]\xa8+3\x83lL\xbf\x1b\xc7\xb3\xa3\x9fK"
+    b'\xabV\xe4\x1e;6\xe6u\x07jf+Q\xa2DIp\xa97_?\xc8v\xc0$\x0b}\xaf\r8\x8e\xac\xf7\xdc\xc3k\xc8\x8d9\x80\xf2G\x1f\x8d\xdb\xf1\xd5\xe5'
+    b'=@l\xe0\xca\xfc\xff\xfdoa\xe1\xf6\xed-Rz\xf6\x8c\xc7>\xc2\xad\x9b\x971_"\x07,\xf2\xc22N,\xd8x\xce\xd7\xd6\x92\xa7S\'r\x0f\x1aD\x8e'
+    b'\xe5\xcb\xc9\xfe\xcf?5\xc6\xf3@\xa7\xeb<\xf4\xee\x81\x03y\x7f\xf7X\x1e\x9f\x9a\xd9J\x94(Q\x12\\\x12*\xfe\xafo\xe7^\xb8\xd0\xa7\xe7\xb5\xd6\xad\xbdy\xe0'
+    b'\xad[\xc9q\xf3"\xaa\xc8\xca\xf2\xeb\x07X\xfe\xc2\x0b\t\x19\xff\x8fTFf\xddz+\xf0\x80\xb1\xe4\x963\xde\xe7h\xea\xfa\xc2\xed\xc3\x03\x0c\xa8k\xf8p/F'
+    b"\xb3G\x0f*\xf9\xe3\x8f\x9a\xe3\x95[\xc8v\xe9\xa5\xdem\xfa\xf4\xa1\xf2\x95+9'D,\x8fO\xcdl%J\x94(\t.\xf5\x1d\xeb7n\xe7\x80\xbf\xd7\xaf\x9f"
+    b'\xd7/<\xe4\x10\xb2?\xf3\x8c\xdfv\x8e\x17_\xf4\xeb-g{\xf8\xe1\xb8\x1c_]\xdf\x87#\xd3\xcf:\x0b\xfd\xe6\xd0S6\x1e\xe3\x1by\xf3\x05\xbe\xce\xc8\x9b/'
+    b'\xf7\t\xc0\xff\xc2\xbf\x16|4\xf8N\xf0\xc3\x98\x8e\x87^3\xffy\x88\x9c\xb7\xddFe\xef\xbek:\x9e\xb3K\x17\xf24oN\xe5\xe0\xfc\xdf\xbd;\xf8x\xb5<'
+    b'>5\xb3\x95(Q\xa2$\xb8$R\xfc\x1f\xbe\xa3\xb6h\x91\xd7/\x9c4\x89\xaa\xd8Zn\xb6\x9dK\xef\xf7\xeb\xec\xd5\x8b\xdc\xe8a\xdf\xc0\xe3\xffu!F\x8c\xb7'
+    b'Y\xdf<\x81\xf3\x0e\xa7O`m\xc7\xb3\xa2\xc7\xaf\xe0\xfd;\xe5\x94\xa8\xc7\x0bt|jf+Q\xa2DI\xc3\xf1\xff\x1d\xeb\xd6QEZ\x1a\xef\x13\xe4`\xbe^'
+    b'\xa0\xed4\xf6=\xf2\x00\xae\x9f\x7f\x8e\xdb\xf15\xb6\xfb\x1cN\xfc?\xec\xbe>A\xe2\xff!\xc7C^\x7f\xdb6*\xf9\xea+\xaa\xd0\xefET\xe3\xa9\xf8\xbf\x12%'
+    b'J\x94\xd4Z/\xc4\x927\xaf\xb6\xdb\xb9\x9ez\x8a\xf3\xffp\xbc\xf8\xda\xb5\x01\xb7s\x7f\xf9%\xc7\xfei\xd3\xa7\xf1xA"\xf2\xff%j\x9c\'R\xbd\x8e\xffE'
+    b'}\xbd\xe0\xa3\x8b\xc6N\xa8\xcb\xf1\xd4\xccV\xa2D\x89\x92\xd0z\xa1\xaeu\xbd\xdfv\xec\x7f\x07\xd3\xfd\xd0\xe9\xe0\xfe\xd1:u\xa2\xf2G\x1e1\x1d\xcf\x86\xdcr\xbf'
+    b'c\xf8v\xf6\xaf\xbf\x8e\xdb\xf15\xc6\xf8\xbf\x1cC\x97k\xb8\x05\x87K\xa0\xff\xe5\xbetfc$\xeaxjf+Q\xa2DIp\xa9W\xac\x1f\xd6\xf2\xd3F\x92'
+    b'\xbbi&\xb9\xcf?\x9flO<\x11t<\xe7\xc5\x17\xfbp\x7f\xf6[nIX\xfe?%J\x94(Q\xa2$\xd1\xa5>\xeb\xff\xdc?\xfc@\x95\xc9I\xdc\xf7w'
+    b'v\xedB%\xdb\xb6\x99o\x87\xda\xef\x9bo\xf6\xd6\xfc\xa1g\xd9e\x97\x91\xfd\xed\xb7y\xec Q\xf9\xff\x94(Q\xa2D\x89\x12\xe5\xff\x9bog]\xbf\x9e\xdcg'
+    b'\x9fM\xces\xcf\xa1r\xf4\xfc3\xd9\x0e1\x7fG\xd7\xaeT\x91\x93Mv\xe6\xff[\x1e\x7f\xbcN\x8eO=\x19J\x94(Q\xa2\xa41K}\xd7\xffU\x1d\xa8\n'
+    b"\x9a\x87/[\xbb\x96\xfb\xfd\x1c\xf3\xd7\xb2%\x95l\xd8P'\xc7\xa7\x9e\x0c%J\x94(Q\xd2\x98%\x11\xf9\xff\xfcj\xfd_}\x95\xb4\x89\x13\xc9\x818\xc1C\x0f"
+    b'\xf1\x98\x7f]\xecW=\x19J\x94(Q\xa2\xa41K\xa2\xf1\xff%\xcav\xea\xc9P\xa2D\x89\x12%\x8dY\x12\xb1\xffO"l\xa7\x9e\x0c%J\x94(Q\xa2\xfc'
+    b'\x7f\xe5\xff+Q\xa2D\x89\x12%\x8dI\xfe\x1fW\xbe\x8a\xbf'
+)
+
+SOURCE_SHA256 = "9a6e62c284bab354bda3977d3350f10a48bd2bae47b68dca49da48d399e0a0bf"
@@ -0,0 +1,364 @@
+import argparse
+import math
+import os
+import random
+import time
+from multiprocessing import Pool
+from statistics import NormalDist
+
+import numpy as np
+
+import ur_ai
+import ur_engine
+import ur_royal
+from ur_dice import DiceStream
+from ur_engine import BINARY4, D6
+
+# --------------------------------------------------
+# CONSTANTS
+# --------------------------------------------------
+ROYAL = "royal"
+RACE_D6 = "race-d6"              # ur_game.py / ur_game_bet.py
+RACE_BINARY4 = "race-binary4"    # ur_game_PRO.py
+MODES = {ROYAL: BINARY4, RACE_D6: D6, RACE_BINARY4: BINARY4}
+
+ROUND_ROBIN = "round-robin"
+SWISS = "swiss"
+FORMATS = (ROUND_ROBIN, SWISS)
+
+DEFAULT_AGENTS = ["random", "greedy", "expectimax:0.01", "expectimax:0.05"]
+SEARCH_TABLE_SIZE = 1 << 16
+ELO_SCALE = 400 / math.log(10)
+PERCENTILES = (50, 90, 99)
+
+
+# --------------------------------------------------
+# AGENTS
+# --------------------------------------------------
+# An agent picks one of `moves` for the side to move after `roll`;
+# states are whatever the mode's ur_ai game adapter uses.
+class RandomAgent:
+    def __init__(self, game, rng):
+        self.rng = rng
+
+    def choose(self, state, roll, moves):
+        return self.rng.choice(moves)
+
+
+class GreedyAgent:
+    """One ply: the move whose position evaluates best for the mover."""
+
+    def __init__(self, game, rng):
+        self.game = game
+
+    def choose(self, state, roll, moves):
+        game = self.game
+        sign = 1.0 if game.maximizing(state) else -1.0
+        best_move, best_value = moves[0], -math.inf
+        for move in moves:
+            child = game.apply(state, move, roll)
+            value = game.terminal_value(child)
+            if value is None:
+                value = game.evaluate(child)
+            if sign * value > best_value:
+                best_move, best_value = move, sign * value
+        return best_move
+
+
+class SearchAgent:
+    def __init__(self, game, rng, budget):
+        self.search = ur_ai.Expectimax(
+            game, budget=budget, table_size=SEARCH_TABLE_SIZE
+        )
+
+    def choose(self, state, roll, moves):
+        return self.search.choose(state, roll, moves)[0]
+
+
+AGENTS = {
+    "random": lambda game, rng, arg: RandomAgent(game, rng),
+    "greedy": lambda game, rng, arg: GreedyAgent(game, rng),
+    "expectimax": lambda game, rng, arg: SearchAgent(
+        game, rng, float(arg or ur_ai.DEFAULT_BUDGET)
+    ),
+}
+
+
+def check_agent(spec):
+    name, _, arg = spec.partition(":")
+    if name not in AGENTS:
+        raise ValueError(f"Unknown agent: {spec!r}")
+    if arg:
+        float(arg)
+    return spec
+
+
+def make_agent(spec, game, rng):
+    name, _, arg = spec.partition(":")
+    return AGENTS[name](game, rng, arg)
+
+
+def make_game(mode, board_size):
+    if mode == ROYAL:
+        return ur_ai.RoyalGame()
+    return ur_ai.RaceGame(board_size, MODES[mode])
+
+
+# --------------------------------------------------
+# GAMES
+# --------------------------------------------------
+def _timed(agent, state, roll, moves, latencies):
+    start = time.perf_counter()
+    move = agent.choose(state, roll, moves)
+    latencies.append(time.perf_counter() - start)
+    return move
+
+
+def play_royal(agents, stream, latencies):
+    """Full rules; returns (winning seat, turns)."""
+    state = ur_royal.INITIAL
+    turns = 0
+    while ur_royal.winner(state) is None:
+        roll = stream.roll()
+        moves = ur_royal.legal_moves(state, roll)
+        if moves:
+            seat = ur_royal.side_to_move(state)
+            frm = _timed(agents[seat], state, roll, moves, latencies[seat])
+            state = ur_royal.apply_move(state, frm, roll)
+        else:
+            state = ur_royal.pass_turn(state)
+        turns += 1
+    return ur_royal.winner(state), turns
+
+
+def play_race(agents, stream, latencies, board_size, dice):
+    """The GUI race: the same roll_dice/move_piece the windows call."""
+    state = ur_engine.RaceState(board_size, dice)
+    moves = [ur_ai.RaceGame.ADVANCE]
+    turns = 0
+    while not state.winner:
+        roll = ur_engine.roll_dice(state, stream)
+        turns += 1
+        if roll == 0:
+            continue
+        seat = state.current_player - 1
+        _timed(agents[seat], ur_ai.RaceGame.from_race(state), roll, moves,
+               latencies[seat])
+        ur_engine.move_piece(state)
+    return state.winner - 1, turns
+
+
+def play_match(task):
+    """Play one pairing in a worker; seats alternate every game."""
+    mode, board_size, pair, specs, games, stream = task
+    game = make_game(mode, board_size)
+    rng = random.Random(int(stream.seed_seq.generate_state(1)[0]))
+    agents = [make_agent(spec, game, rng) for spec in specs]
+
+    wins = [0, 0]
+    latencies = ([], [])
+    turns = 0
+    for index in range(games):
+        # seat 0 moves first; swap who sits there every other game
+        order = (0, 1) if index % 2 == 0 else (1, 0)
+        seated = [agents[order[0]], agents[order[1]]]
+        seat_latencies = (latencies[order[0]], latencies[order[1]])
+        if mode == ROYAL:
+            seat, length = play_royal(seated, stream, seat_latencies)
+        else:
+            seat, length = play_race(seated, stream, seat_latencies,
+                                     board_size, MODES[mode])
+        wins[order[seat]] += 1
+        turns += length
+    return pair, wins, latencies, turns
+
+
+# --------------------------------------------------
+# RATINGS
+# --------------------------------------------------
+def bradley_terry(wins, confidence=0.95, prior=0.5, iterations=10_000):
+    """Elo ratings and confidence half-widths from a win matrix.
+
+    wins[i, j] is how often i beat j. Every pair that met gets `prior`
+    virtual wins each way so unbeaten agents keep a finite rating. The
+    fit is the usual MM iteration; the spread comes from the inverse
+    Fisher information. Ratings are centred on 0.
+    """
+    wins = np.asarray(wins, dtype=float)
+    played = wins + wins.T
+    wins = wins + prior * (played > 0)
+    games = wins + wins.T
+    strength = np.ones(len(wins))
+
+    for _ in range(iterations):
+        pair = games / (strength[:, None] + strength[None, :])
+        np.fill_diagonal(pair, 0.0)
+        updated = wins.sum(axis=1) / np.maximum(pair.sum(axis=1), 1e-300)
+        updated /= np.exp(np.log(np.maximum(updated, 1e-300)).mean())
+        done = np.abs(updated - strength).max() < 1e-12
+        strength = updated
+        if done:
+            break
+
+    theta = np.log(strength)
+    expected = 1.0 / (1.0 + np.exp(theta[None, :] - theta[:, None]))
+    information = -games * expected * (1.0 - expected)
+    np.fill_diagonal(information, 0.0)
+    np.fill_diagonal(information, -information.sum(axis=1))
+    spread = np.sqrt(np.maximum(np.diag(np.linalg.pinv(information)), 0.0))
+
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    return ELO_SCALE * theta, ELO_SCALE * z * spread
+
+
+# --------------------------------------------------
+# TOURNAMENT
+# --------------------------------------------------
+class Tournament:
+    """Collects results as pairings finish, in any order."""
+
+    def __init__(self, specs, mode, board_size=20, games=20, seed=None,
+                 workers=None):
+        self.specs = [check_agent(spec) for spec in specs]
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode: {mode!r}")
+        if len(self.specs) < 2:
+            raise ValueError("A tournament needs at least two agents")
+        self.mode = mode
+        self.board_size = board_size
+        self.games = games
+        self.workers = workers or os.cpu_count() or 1
+        self.streams = DiceStream(MODES[mode], seed)
+
+        n = len(self.specs)
+        self.wins = np.zeros((n, n), dtype=np.int64)
+        self.latencies = [[] for _ in range(n)]
+        self.turns = 0
+        self.elapsed = 0.0
+
+    @property
+    def games_played(self):
+        return int(self.wins.sum())
+
+    def run_round(self, pairs):
+        # one child stream per pairing: results do not depend on which
+        # worker plays which pairing, or in what order
+        streams = self.streams.spawn(len(pairs))
+        tasks = [
+            (self.mode, self.board_size, (i, j),
+             (self.specs[i], self.specs[j]), self.games, stream)
+            for (i, j), stream in zip(pairs, streams)
+        ]
+
+        start = time.perf_counter()
+        if self.workers == 1 or len(tasks) == 1:
+            results = map(play_match, tasks)
+            self._collect(results)
+        else:
+            with Pool(min(self.workers, len(tasks))) as pool:
+                self._collect(pool.imap_unordered(play_match, tasks))
+        self.elapsed += time.perf_counter() - start
+
+    def _collect(self, results):
+        for (i, j), (wins_i, wins_j), (lat_i, lat_j), turns in results:
+            self.wins[i, j] += wins_i
+            self.wins[j, i] += wins_j
+            self.latencies[i].extend(lat_i)
+            self.latencies[j].extend(lat_j)
+            self.turns += turns
+
+    def round_robin(self):
+        n = len(self.specs)
+        self.run_round([(i, j) for i in range(n) for j in range(i + 1, n)])
+
+    def swiss(self, rounds=None):
+        n = len(self.specs)
+        rounds = rounds or math.ceil(math.log2(n)) + 1
+        met = set()
+        for _ in range(rounds):
+            pairs = swiss_pairs(self.wins.sum(axis=1), met)
+            if not pairs:
+                break
+            met.update(pairs)
+            self.run_round(pairs)
+
+    def summary(self, confidence=0.95):
+        elo, spread = bradley_terry(self.wins, confidence)
+        rate = self.games_played / self.elapsed if self.elapsed else 0.0
+        lines = [
+            f"mode={self.mode} games={self.games_played} "
+            f"turns={self.turns} workers={self.workers} "
+            f"{self.elapsed:.1f}s ({rate:.1f} games/s)",
+            f"{'agent':<18} {'elo':>7} {'±':>6} {'w-l':>11} "
+            + " ".join(f"{'p' + str(p) + ' ms':>9}" for p in PERCENTILES),
+        ]
+        order = np.argsort(-elo)
+        for i in order:
+            won = int(self.wins[i].sum())
+            lost = int(self.wins[:, i].sum())
+            if self.latencies[i]:
+                ms = np.percentile(self.latencies[i], PERCENTILES) * 1000
+                cells = " ".join(f"{value:9.3f}" for value in ms)
+            else:
+                cells = " ".join(f"{'-':>9}" for _ in PERCENTILES)
+            lines.append(
+                f"{self.specs[i]:<18} {elo[i]:7.0f} {spread[i]:6.0f} "
+                f"{f'{won}-{lost}':>11} {cells}"
+            )
+        return "\n".join(lines)
+
+
+def swiss_pairs(scores, met):
+    """Pair neighbours in the standings, skipping rematches.
+
+    With an odd field the lowest-ranked agent left over sits out.
+    """
+    standing = sorted(range(len(scores)), key=lambda i: (-scores[i], i))
+    pairs = []
+    while len(standing) > 1:
+        first = standing.pop(0)
+        for k, other in enumerate(standing):
+            pair = (min(first, other), max(first, other))
+            if pair not in met:
+                pairs.append(pair)
+                standing.pop(k)
+                break
+    return pairs
+
+
+# --------------------------------------------------
+# CLI
+# --------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ur self-play tournament")
+    parser.add_argument("--agents", nargs="+", default=DEFAULT_AGENTS,
+                        help="random, greedy or expectimax:<seconds>")
+    parser.add_argument("--mode", choices=MODES, default=ROYAL)
+    parser.add_argument("--format", choices=FORMATS, default=ROUND_ROBIN)
+    parser.add_argument("--games", type=int, default=20,
+                        help="games per pairing")
+    parser.add_argument("--rounds", type=int, default=None,
+                        help="Swiss rounds (default log2(agents) + 1)")
+    parser.add_argument("--board-size", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--confidence", type=float, default=0.95)
+    args = parser.parse_args(argv)
+
+    tournament = Tournament(
+        args.agents,
+        args.mode,
+        board_size=args.board_size,
+        games=args.games,
+        seed=args.seed,
+        workers=args.workers,
+    )
+    if args.format == SWISS:
+        tournament.swiss(args.rounds)
+    else:
+        tournament.round_robin()
+    print(tournament.summary(args.confidence))
+
+
+if __name__ == "__main__":
+    main()
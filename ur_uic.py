@@ -0,0 +1,141 @@
+import argparse
+import hashlib
+import importlib
+import io
+import os
+import sys
+
+# --------------------------------------------------
+# CONSTANTS
+# --------------------------------------------------
+# .ui source -> generated module
+UI_MODULES = {
+    "ur_game.ui": "ur_game_ui",
+    "ur_game_bet.ui": "ur_game_bet_ui",
+}
+DEV_ENV = "UR_DEV_UI"
+HASH_MARKER = "UI_SOURCE_SHA256 = "
+
+
+# --------------------------------------------------
+# PATH HANDLING
+# --------------------------------------------------
+def resource_path(relative):
+    base = getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base, relative)
+
+
+def dev_mode():
+    return os.environ.get(DEV_ENV, "") not in ("", "0")
+
+
+# --------------------------------------------------
+# RUNTIME
+# --------------------------------------------------
+def setup_ui(window, ui_file):
+    """Build the widgets of `ui_file` onto `window`.
+
+    Uses the precompiled module; `UR_DEV_UI=1` parses the .ui file with
+    loadUi instead, so Designer edits show up without a rebuild.
+    """
+    if dev_mode():
+        from PyQt6.uic import loadUi
+
+        loadUi(resource_path(ui_file), window)
+        return
+
+    try:
+        module = importlib.import_module(UI_MODULES[ui_file])
+    except ImportError as exc:
+        raise RuntimeError(
+            f"{ui_file} has not been compiled, run: python ur_uic.py "
+            f"(or set {DEV_ENV}=1)"
+        ) from exc
+
+    ui = module.Ui_MainWindow()
+    ui.setupUi(window)
+    # expose widgets as window attributes, the way loadUi does
+    for name, value in vars(ui).items():
+        setattr(window, name, value)
+
+
+# --------------------------------------------------
+# BUILD STEP
+# --------------------------------------------------
+def source_hash(ui_path):
+    with open(ui_path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def module_path(ui_file):
+    return resource_path(UI_MODULES[ui_file] + ".py")
+
+
+def compiled_hash(py_path):
+    try:
+        with open(py_path, encoding="utf-8") as f:
+            for line in f:
+                if line.startswith(HASH_MARKER):
+                    return line[len(HASH_MARKER):].strip().strip("\"'")
+    except OSError:
+        pass
+    return None
+
+
+def is_stale(ui_file):
+    ui_path = resource_path(ui_file)
+    return compiled_hash(module_path(ui_file)) != source_hash(ui_path)
+
+
+def compile_ui(ui_file):
+    from PyQt6.uic import compileUi
+
+    ui_path = resource_path(ui_file)
+    with open(ui_path, "rb") as f:
+        source = io.BytesIO(f.read())
+    source.name = ui_file  # keep the machine path out of the header
+
+    out = io.StringIO()
+    compileUi(source, out)
+
+    code = out.getvalue()
+    code += f'\n\n{HASH_MARKER}"{source_hash(ui_path)}"\n'
+
+    py_path = module_path(ui_file)
+    tmp = py_path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(code)
+    os.replace(tmp, py_path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Compile .ui files into Python modules"
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="only report stale modules, exit 1 if any",
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="rebuild even if up to date"
+    )
+    args = parser.parse_args(argv)
+
+    stale = [ui for ui in UI_MODULES if args.force or is_stale(ui)]
+
+    if args.check:
+        for ui_file in stale:
+            print(f"stale: {ui_file} -> {UI_MODULES[ui_file]}.py")
+        return 1 if stale else 0
+
+    for ui_file in stale:
+        compile_ui(ui_file)
+        print(f"compiled {ui_file} -> {UI_MODULES[ui_file]}.py")
+    if not stale:
+        print("UI modules are up to date")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
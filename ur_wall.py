@@ -0,0 +1,349 @@
+import argparse
+import math
+import os
+import sys
+
+from PyQt6.QtCore import QRect, Qt, QTimer
+from PyQt6.QtGui import QColor, QFont, QPainter, QPen, QPixmap
+from PyQt6.QtWidgets import QApplication, QMainWindow, QWidget
+
+import ur_engine
+import ur_perf
+import ur_record
+from ur_board import TileStyle, paint_tile
+from ur_dice import DiceStream
+from ur_perf_qt import PerfMonitor
+from ur_pixmaps import PixmapCache, horse_assets
+
+# --------------------------------------------------
+# CONSTANTS
+# --------------------------------------------------
+DEFAULT_RACES = 36
+MAX_RACES = 64
+MAX_FPS = 30
+TURNS_PER_SECOND = 4        # per race
+HOLD_TURNS = 8              # a finished race stays up this many ticks
+CELL_GAP = 8
+TILE_GAP = 2
+HEADER = 16
+PIXMAP_CACHE_SIZE = 256
+WALL_TILES = TileStyle("#2c2c2c", "#777", 1)
+WALL_BACKGROUND = "#161616"
+PERF_HANDLERS = ("step",)
+
+
+def resource_path(relative):
+    base = getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base, relative)
+
+
+# --------------------------------------------------
+# FEEDS (one RaceState each, advanced a turn per step)
+# --------------------------------------------------
+class SimulatedRace:
+    """Endless races from a seeded dice stream."""
+
+    def __init__(self, board_size, dice, players, stream):
+        self.state = ur_engine.RaceState(board_size, dice, players)
+        self.rng = stream
+        self.turns = 0
+
+    def step(self):
+        ur_engine.play_turn(self.state, self.rng)
+        self.turns += 1
+
+    def next_race(self):
+        self.state.reset()
+        self.turns = 0
+
+
+class RecordedRace:
+    """Replays races from game record files, one event per step; every
+    RecordedRace on the wall draws from the same shared `records`."""
+
+    def __init__(self, records):
+        self.records = records
+        self.next_race()
+
+    def next_race(self):
+        record = next(self.records)
+        self.state = ur_engine.RaceState(record.board_size, record.dice)
+        self.events = iter(record.pairs())
+        self.turns = 0
+
+    def step(self):
+        for roll, move in self.events:
+            ur_engine.apply_roll(self.state, roll)
+            if move != ur_record.NO_MOVE:
+                ur_engine.move_piece(self.state)
+            break
+        self.turns += 1
+
+
+def race_records(paths):
+    """Every race record in `paths`, over and over."""
+    while True:
+        found = False
+        for path in paths:
+            for record in ur_record.read_records(path):
+                if record.variant != ur_record.ROYAL and record.winner:
+                    found = True
+                    yield record
+        if not found:
+            raise ValueError("No finished race records to replay")
+
+
+def simulated_races(count, board_size, dice, players, seed=None):
+    streams = DiceStream(dice, seed).spawn(count)
+    return [
+        SimulatedRace(board_size, dice, players, stream) for stream in streams
+    ]
+
+
+def recorded_races(count, paths):
+    records = race_records(paths)
+    return [RecordedRace(records) for _ in range(count)]
+
+
+# --------------------------------------------------
+# WALL WIDGET
+# --------------------------------------------------
+class WallWidget(QWidget):
+    """Every race on the wall in one widget.
+
+    All boards share one tile size, so the horse pixmaps from the shared
+    PixmapCache are decoded and scaled once for the whole wall, and one
+    pre-painted strip per board size is blitted for the tiles. Races only
+    mark their cell dirty; a MAX_FPS frame timer turns dirty cells into
+    update() calls, which Qt merges into at most one paint per frame.
+    """
+
+    def __init__(self, races, pixmaps, parent=None):
+        super().__init__(parent)
+        self.races = races
+        self.pixmaps = pixmaps
+        self.columns = math.ceil(math.sqrt(len(races)))
+        self.rows = math.ceil(len(races) / self.columns)
+        self.horses = horse_assets(
+            max(race.state.players for race in races)
+        )
+        self.dirty = set(range(len(races)))
+        self.holding = [0] * len(races)
+        self.setFont(QFont("monospace", 8))
+
+        self.cells = []
+        self.tile = 1
+        self.per_row = 1
+        self._strips = {}
+        self._board_size = 0
+
+        self._frame = QTimer(self)
+        self._frame.timeout.connect(self.flush)
+        self._frame.start(1000 // MAX_FPS)
+
+    # --------------------------------------------------
+    # LAYOUT
+    # --------------------------------------------------
+    def layout_cells(self):
+        width = max(1, (self.width() - CELL_GAP) // self.columns - CELL_GAP)
+        height = max(1, (self.height() - CELL_GAP) // self.rows - CELL_GAP)
+        self.cells = [
+            QRect(
+                CELL_GAP + column * (width + CELL_GAP),
+                CELL_GAP + row * (height + CELL_GAP),
+                width,
+                height,
+            )
+            for row, column in (
+                divmod(index, self.columns) for index in range(len(self.races))
+            )
+        ]
+
+        # the largest tile for which the longest board fits in a cell
+        size = self._board_size
+        best = 1
+        for rows in range(1, size + 1):
+            per_row = math.ceil(size / rows)
+            tile = min(width // per_row, (height - HEADER) // rows)
+            best = max(best, tile - TILE_GAP)
+        self.tile = best
+        self.per_row = max(1, width // (best + TILE_GAP))
+        self._strips = {}
+        self.dirty = set(range(len(self.races)))
+        self.update()
+
+    def resizeEvent(self, event):
+        self.layout_cells()
+        super().resizeEvent(event)
+
+    def tile_rect(self, pos, x=0, y=0):
+        """Tile `pos` of a board whose first tile is at (x, y)."""
+        row, column = divmod(pos, self.per_row)
+        pitch = self.tile + TILE_GAP
+        return QRect(x + column * pitch, y + row * pitch, self.tile, self.tile)
+
+    def _strip(self, board_size, dpr):
+        """All tiles of a board of `board_size`, painted once and shared
+        by every cell showing a board that long."""
+        strip = self._strips.get(board_size)
+        if strip is not None:
+            return strip
+        width = min(board_size, self.per_row) * (self.tile + TILE_GAP)
+        height = self.tile_rect(board_size - 1).bottom() + 1
+        strip = QPixmap(round(width * dpr), round(height * dpr))
+        strip.setDevicePixelRatio(dpr)
+        strip.fill(Qt.GlobalColor.transparent)
+
+        style = WALL_TILES
+        painter = QPainter(strip)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(QPen(style.border, style.border_width))
+        painter.setBrush(style.background)
+        for pos in range(board_size):
+            paint_tile(painter, self.tile_rect(pos), style)
+        painter.end()
+        self._strips[board_size] = strip
+        return strip
+
+    # --------------------------------------------------
+    # RACES
+    # --------------------------------------------------
+    def step(self):
+        """One turn for every running race; finished races hold for a
+        while, then start over."""
+        longest = self._board_size
+        for index, race in enumerate(self.races):
+            if race.state.winner:
+                self.holding[index] += 1
+                if self.holding[index] < HOLD_TURNS:
+                    continue
+                self.holding[index] = 0
+                race.next_race()
+            else:
+                race.step()
+            longest = max(longest, race.state.board_size)
+            self.dirty.add(index)
+        if longest != self._board_size:
+            self._board_size = longest
+            self.layout_cells()
+
+    def flush(self):
+        """At most MAX_FPS times a second: repaint the cells that changed."""
+        if not self.dirty or not self.cells:
+            return
+        for index in self.dirty:
+            self.update(self.cells[index])
+        self.dirty = set()
+
+    # --------------------------------------------------
+    # PAINTING
+    # --------------------------------------------------
+    def paintEvent(self, event):
+        dpr = self.devicePixelRatioF()
+        dirty = event.rect()
+        painter = QPainter(self)
+        painter.setFont(self.font())
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        painter.fillRect(dirty, QColor(WALL_BACKGROUND))
+
+        for index, cell in enumerate(self.cells):
+            if not dirty.intersects(cell):
+                continue
+            state = self.races[index].state
+            x, y = cell.x(), cell.y() + HEADER
+            painter.drawPixmap(x, y, self._strip(state.board_size, dpr))
+
+            crowd = {}
+            for player, pos in enumerate(state.positions, 1):
+                if 0 <= pos < state.board_size:
+                    crowd.setdefault(pos, []).append(self.horses[player])
+            for pos, assets in crowd.items():
+                painter.drawPixmap(
+                    self.tile_rect(pos, x, y),
+                    self.pixmaps.group(assets, self.tile, dpr),
+                )
+
+            race = self.races[index]
+            if state.winner:
+                text = f"Race {index + 1} · Player {state.winner} wins"
+                painter.setPen(Qt.GlobalColor.yellow)
+            else:
+                text = f"Race {index + 1} · turn {race.turns}"
+                painter.setPen(Qt.GlobalColor.lightGray)
+            painter.drawText(
+                cell.x(), cell.y(), cell.width(), HEADER,
+                Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                text,
+            )
+        painter.end()
+
+
+# --------------------------------------------------
+# WINDOW
+# --------------------------------------------------
+class SpectatorWall(QMainWindow):
+    def __init__(self, races, turns_per_second=TURNS_PER_SECOND, perf=None):
+        super().__init__()
+        self.setWindowTitle(f"Royal Game of Ur — {len(races)} races")
+        self.resize(1280, 720)
+
+        # INSTRUMENTATION (opt-in: --perf or $UR_PERF)
+        self.perf = PerfMonitor(perf, self, PERF_HANDLERS) if perf else None
+
+        # one cache for every board on the wall
+        self.pixmaps = PixmapCache(
+            resource_path("src/assets"), maxsize=PIXMAP_CACHE_SIZE
+        )
+        self.wall = WallWidget(races, self.pixmaps, self)
+        self.setCentralWidget(self.wall)
+        self.wall.step()
+        if self.perf:
+            self.perf.attach(self.wall, self.pixmaps, self.wall)
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.step)
+        self.timer.start(max(1, round(1000 / turns_per_second)))
+
+    def step(self):
+        self.wall.step()
+
+
+# --------------------------------------------------
+# RUN APP
+# --------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ur spectator wall")
+    parser.add_argument("--races", type=int, default=DEFAULT_RACES)
+    parser.add_argument("--records", nargs="+", default=None,
+                        help="replay game record files instead of "
+                             "simulating")
+    parser.add_argument("--board-size", type=int, default=20)
+    parser.add_argument("--dice", choices=ur_engine.DICE_MODELS,
+                        default=ur_engine.D6)
+    parser.add_argument("--players", type=int, default=ur_engine.PLAYERS)
+    parser.add_argument("--speed", type=float, default=TURNS_PER_SECOND,
+                        help="turns per second in every race")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--perf", nargs="?", const=ur_perf.DEFAULT_FILE,
+                        default=None, metavar="FILE")
+    args = parser.parse_args(argv)
+
+    if not 1 <= args.races <= MAX_RACES:
+        parser.error(f"--races must be between 1 and {MAX_RACES}")
+    if args.records:
+        races = recorded_races(args.races, args.records)
+    else:
+        races = simulated_races(
+            args.races, args.board_size, args.dice, args.players, args.seed
+        )
+
+    app = QApplication(sys.argv[:1])
+    window = SpectatorWall(
+        races, args.speed, args.perf or ur_perf.perf_path([])
+    )
+    window.show()
+    return app.exec()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
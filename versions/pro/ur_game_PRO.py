@@ -1,10 +1,8 @@
 from PyQt6.QtWidgets import QApplication, QMainWindow
-from PyQt6.uic import loadUi
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtCore import QTimer
+import random
 import sys
 import os
-import random
 
 
 # --------------------------------------------------
@@ -14,15 +12,46 @@ def resource_path(relative):
     return os.path.join(os.path.dirname(os.path.abspath(__file__)), relative)
 
 
+# the shared game engine lives at the repository root
+sys.path.insert(0, os.path.abspath(resource_path("../..")))
+import ur_ai  # noqa: E402
+import ur_cli  # noqa: E402
+import ur_engine  # noqa: E402
+import ur_perf  # noqa: E402
+import ur_solver  # noqa: E402
+from ur_ai_qt import AIPlayer  # noqa: E402
+from ur_autoplay_qt import AutoPlay  # noqa: E402
+from ur_board import (  # noqa: E402
+    BoardWidget, DARK_TILES, TrackView, bounding_rect, track_length,
+)
+from ur_perf_qt import PerfMonitor  # noqa: E402
+from ur_pixmaps import PixmapCache  # noqa: E402
+from ur_uic import setup_ui  # noqa: E402
+
+
+# --------------------------------------------------
+# CONSTANTS
+# --------------------------------------------------
+AI_PLAYER = 2
+AI_DELAY_MS = 600
+AI_BUDGET = 0.5
+# do_roll/do_move run for button clicks and AI turns alike
+PERF_HANDLERS = ("do_roll", "do_move", "update_board", "end_game")
+
+
 # --------------------------------------------------
 # MAIN GAME CLASS
 # --------------------------------------------------
 class UrGame(QMainWindow):
-    def __init__(self):
+    def __init__(self, ai=False, record=None, perf=None, track=None):
         super().__init__()
 
         # LOAD UI
-        loadUi(resource_path("ur_game.ui"), self)
+        setup_ui(self, "ur_game.ui")
+
+        # INSTRUMENTATION (opt-in: --perf or $UR_PERF); before the
+        # signals so the connected handlers are the timed ones
+        self.perf = PerfMonitor(perf, self, PERF_HANDLERS) if perf else None
 
         # SIGNALS
         self.startButton.clicked.connect(self.start_game)
@@ -33,52 +62,104 @@ class UrGame(QMainWindow):
         self.quitButton.clicked.connect(self.close)
         self.playAgainButton.clicked.connect(self.go_home)
 
-        # GAME STATE
-        self.current_player = 1
-        self.positions = {1: 0, 2: 0}
-        self.last_roll = 0
+        # AUTO-PLAY (both players from a timer, redrawn once per frame)
+        self.autoplay = AutoPlay(
+            self, self.do_roll, self.do_move, self.show_turn,
+            self.autoButton, self.speedBox,
+        )
+        # the computer sits out auto-play and picks up where it stopped
+        self.autoplay.stopped.connect(self.schedule_ai_turn)
 
         # LOAD HORSE IMAGES
         self.horses = {
-            1: QPixmap(resource_path("src/assets/horse_white.png")),
-            2: QPixmap(resource_path("src/assets/horse_blue.png")),
+            1: "horse_white",
+            2: "horse_blue",
         }
+        # the PNGs (used when the sprite atlas is missing) are shared
+        # with the root apps
+        self.pixmaps = PixmapCache(resource_path("../../src/assets"))
+
+        # BOARD (tile rects from the .ui, painted by one widget)
+        self.board_tiles = self.collect_tiles()
+        if not self.board_tiles:
+            raise RuntimeError("No board tiles found (tile_0, tile_1...)")
+
+        if track:
+            # generated track of any length (--track N) where the
+            # hand-placed tiles were; only the visible tiles are painted
+            self.board = TrackView(
+                track, bounding_rect(self.board_tiles), self.horses,
+                self.pixmaps, 40, DARK_TILES, self.boardWidget,
+            )
+        else:
+            self.board = BoardWidget(
+                self.board_tiles, self.horses, self.pixmaps, 40,
+                DARK_TILES, self.boardWidget,
+            )
+        self.board_size = len(self.board)
+        if self.perf:
+            self.perf.attach(self.board, self.pixmaps, self.GamePage)
+
+        # GAME STATE
+        self.state = ur_engine.RaceState(self.board_size, ur_engine.BINARY4)
+
+        # WIN ODDS (one lookup per update; exact, or approximated far
+        # from the finish on long tracks)
+        self.odds_table = ur_solver.odds_table(
+            self.board_size, ur_engine.BINARY4
+        )
 
-        # BOARD TILES (QLabel)
-        self.board_tiles = []
+        # GAME RECORDING (opt-in: --record PATH or $UR_RECORD); ur_record
+        # brings NumPy, so it is only imported when recording
+        self.recorder = None
+        if record:
+            import ur_record
+            self.recorder = ur_record.GameRecorder(record, ur_record.PRO)
+        self.rng = random
+
+        # COMPUTER OPPONENT (searches on its own thread)
+        self.ai = None
+        self.ai_game = None
+        self.ai_request = None
+        self.game_id = 0
+        if ai:
+            self.ai_game = ur_ai.RaceGame(self.board_size, ur_engine.BINARY4)
+            self.ai = AIPlayer(
+                ur_ai.Expectimax(self.ai_game, budget=AI_BUDGET), self
+            )
+            self.ai.moveReady.connect(self.ai_move_ready)
+
+        self.update_board()
+        self.stackedWidget.setCurrentWidget(self.StartPage)
+
+    # --------------------------------------------------
+    # BOARD TILES
+    # --------------------------------------------------
+    def collect_tiles(self):
+        """Tile rects from the .ui layout; the placeholder labels go."""
+        rects = []
         i = 0
         while True:
             tile = getattr(self, f"tile_{i}", None)
             if tile is None:
                 break
 
-            tile.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            tile.setScaledContents(True)
-            tile.clear()  # REMOVE DESIGNER TEXT
-
-            tile.setStyleSheet("""
-                QLabel {
-                    background-color: #2c2c2c;
-                    border: 2px solid #777;
-                }
-            """)
-
-            self.board_tiles.append(tile)
+            rects.append(tile.geometry())
+            tile.deleteLater()
+            delattr(self, f"tile_{i}")
             i += 1
 
-        self.board_size = len(self.board_tiles)
-        if self.board_size == 0:
-            raise RuntimeError("No board tiles found (tile_0, tile_1...)")
-
-        self.update_board()
-        self.stackedWidget.setCurrentWidget(self.StartPage)
+        return rects
 
     # --------------------------------------------------
     # NAVIGATION
     # --------------------------------------------------
     def start_game(self):
-        self.positions = {1: 0, 2: 0}
-        self.current_player = 1
+        self.state.reset()
+        if self.recorder:
+            self.rng = self.recorder.start(self.board_size, self.state.dice)
+        self.game_id += 1
+        self.ai_request = None
         self.statusLabel.setText("Player 1 turn")
         self.diceLabel.setText("Roll the dice")
         self.update_board()
@@ -94,57 +175,119 @@ class UrGame(QMainWindow):
     # GAME LOGIC
     # --------------------------------------------------
     def roll_dice(self):
-        self.last_roll = sum(random.choice([0, 1]) for _ in range(4))
-        self.diceLabel.setText(f"Dice Roll: {self.last_roll}")
+        if self.is_ai_turn():
+            self.statusLabel.setText("Computer is playing...")
+            return
+        self.do_roll()
+
+    def move_piece(self):
+        if self.is_ai_turn():
+            self.statusLabel.setText("Computer is playing...")
+            return
+        self.do_move()
+
+    def do_roll(self):
+        roll = ur_engine.roll_dice(self.state, self.rng)
+        if self.recorder:
+            self.recorder.rolled(roll)
+        if self.autoplay.deferring:
+            return roll
+        self.diceLabel.setText(f"Dice Roll: {roll}")
+        self.update_odds()
 
-        if self.last_roll == 0:
-            self.switch_player()
+        if roll == 0:
+            # the engine already passed the turn
+            self.statusLabel.setText(
+                f"Player {self.state.current_player} turn"
+            )
         else:
             self.statusLabel.setText(
-                f"Player {self.current_player} rolled {self.last_roll}"
+                f"Player {self.state.current_player} rolled {roll}"
             )
+            return roll
 
-    def move_piece(self):
-        if self.last_roll == 0:
-            return
+        self.schedule_ai_turn()
+        return roll
 
-        new_pos = self.positions[self.current_player] + self.last_roll
+    def do_move(self):
+        if not ur_engine.move_piece(self.state):
+            return
+        if self.recorder:
+            self.recorder.moved()
 
-        if new_pos >= self.board_size:
-            self.end_game(self.current_player)
+        if self.state.winner:
+            self.end_game(self.state.winner)
+            return
+        if self.autoplay.deferring:
             return
 
-        self.positions[self.current_player] = new_pos
-        self.last_roll = 0
         self.update_board()
-        self.switch_player()
+        self.statusLabel.setText(f"Player {self.state.current_player} turn")
+        self.schedule_ai_turn()
 
-    def switch_player(self):
-        self.current_player = 2 if self.current_player == 1 else 1
-        self.statusLabel.setText(f"Player {self.current_player} turn")
+    def show_turn(self, roll):
+        """View after whole turns; auto-play calls this once per frame."""
+        self.diceLabel.setText(f"Dice Roll: {roll}")
+        self.update_board()
+        self.statusLabel.setText(f"Player {self.state.current_player} turn")
 
     # --------------------------------------------------
-    # BOARD RENDER — QLabel + PIXMAP
+    # COMPUTER OPPONENT
+    # --------------------------------------------------
+    def is_ai_turn(self):
+        return self.ai is not None and self.state.current_player == AI_PLAYER
+
+    def schedule_ai_turn(self):
+        if not self.is_ai_turn() or self.state.winner or self.autoplay.active:
+            return
+        game_id = self.game_id
+        QTimer.singleShot(AI_DELAY_MS, lambda: self.ai_roll(game_id))
+
+    def ai_roll(self, game_id):
+        if game_id != self.game_id or not self.is_ai_turn():
+            return
+        if self.state.winner or self.ai_request is not None:
+            return
+        if self.autoplay.active:
+            return
+
+        roll = self.do_roll()
+        if roll:
+            self.statusLabel.setText(f"Computer rolled {roll}, thinking...")
+            position = ur_ai.RaceGame.from_race(self.state)
+            self.ai_request = self.ai.request(position, roll)
+
+    def ai_move_ready(self, request_id, move, info):
+        if request_id != self.ai_request:
+            return  # answer for a game that has since been restarted
+        self.ai_request = None
+        self.do_move()
+
+    def closeEvent(self, event):
+        if self.ai is not None:
+            self.ai.shutdown()
+        super().closeEvent(event)
+
+    # --------------------------------------------------
+    # BOARD RENDER — ONE PAINTED BOARD WIDGET
     # --------------------------------------------------
     def update_board(self):
-        # CLEAR ALL TILES
-        for tile in self.board_tiles:
-            tile.clear()
-
-        # DRAW HORSES
-        for player, pos in self.positions.items():
-            if 0 <= pos < self.board_size:
-                pixmap = self.horses[player].scaled(
-                    40, 40,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation
-                )
-                self.board_tiles[pos].setPixmap(pixmap)
+        self.board.render(self.state.positions, self.devicePixelRatioF())
+        self.update_odds()
+
+    def update_odds(self):
+        p1 = self.odds_table.p1_wins_state(self.state)
+        self.hintLabel.setText(
+            f"Win odds: Player 1 {p1:.0%} · Player 2 {1 - p1:.0%}"
+        )
 
     # --------------------------------------------------
     # END GAME
     # --------------------------------------------------
     def end_game(self, winner):
+        if self.recorder:
+            self.recorder.finish(winner)
+
         self.winnerLabel.setText(f"🏆 Player {winner} Wins!")
         self.stackedWidget.setCurrentWidget(self.ResultPage)
 
@@ -154,6 +297,11 @@ class UrGame(QMainWindow):
 # --------------------------------------------------
 if __name__ == "__main__":
     app = QApplication(sys.argv)
-    window = UrGame()
+    window = UrGame(
+        ai="--ai" in sys.argv[1:],
+        record=ur_cli.record_path(sys.argv[1:]),
+        perf=ur_perf.perf_path(sys.argv[1:]),
+        track=track_length(sys.argv[1:]),
+    )
     window.show()
     sys.exit(app.exec())